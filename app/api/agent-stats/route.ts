@@ -0,0 +1,83 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { executeAuthStrategies } from 'payload'
+
+import { getAgentStats, getAllAgentStats } from '@/lib/agent-stats'
+import { getPayloadClient } from '@/lib/payload'
+
+const HTTP_STATUS_BAD_REQUEST = 400
+const HTTP_STATUS_UNAUTHORIZED = 401
+const HTTP_STATUS_FORBIDDEN = 403
+const HTTP_STATUS_INTERNAL_SERVER_ERROR = 500
+const AGENT_STATS_CACHE_HEADER = 'x-agent-stats-cache'
+const ALL_AGENTS = 'all'
+const STATS_ROLES = ['admin', 'agent']
+
+const parseAgentId = (value: string): number | null => {
+  const parsedId = Number.parseInt(value, 10)
+  return Number.isSafeInteger(parsedId) && parsedId > 0 && String(parsedId) === value ? parsedId : null
+}
+
+/**
+ * Estatísticas do corretor para o dashboard do admin.
+ * GET /api/agent-stats?agentId=<id|all>
+ *
+ * Sem `agentId`, devolve as do usuário autenticado. Corretores só consultam as
+ * próprias; admins consultam qualquer corretor ou todos (`all`).
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const payload = await getPayloadClient()
+
+    // Bearer token ou cookie de sessão do admin
+    const authResult = await executeAuthStrategies({
+      headers: request.headers,
+      payload,
+    })
+
+    const { user } = authResult
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: HTTP_STATUS_UNAUTHORIZED })
+    }
+
+    if (!STATS_ROLES.includes(user.role)) {
+      return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
+    }
+
+    const agentIdParam = request.nextUrl.searchParams.get('agentId')
+
+    if (agentIdParam === ALL_AGENTS) {
+      if (user.role !== 'admin') {
+        return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
+      }
+
+      const statsByAgent = await getAllAgentStats(payload)
+
+      return NextResponse.json({
+        agents: [...statsByAgent].map(([agentId, stats]) => ({ agentId, ...stats })),
+        timestamp: new Date().toISOString(),
+      })
+    }
+
+    const agentId = agentIdParam ? parseAgentId(agentIdParam) : user.id
+    if (agentId === null) {
+      return NextResponse.json({ error: 'Invalid agentId' }, { status: HTTP_STATUS_BAD_REQUEST })
+    }
+
+    if (user.role !== 'admin' && agentId !== user.id) {
+      return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
+    }
+
+    const { stats, cached } = await getAgentStats(payload, agentId)
+
+    return NextResponse.json(
+      { agentId, ...stats, timestamp: new Date().toISOString() },
+      { headers: { [AGENT_STATS_CACHE_HEADER]: cached ? 'hit' : 'miss' } },
+    )
+  } catch (error: unknown) {
+    console.error('Failed to fetch agent stats:', error)
+    return NextResponse.json(
+      { error: 'Failed to fetch agent stats' },
+      { status: HTTP_STATUS_INTERNAL_SERVER_ERROR },
+    )
+  }
+}
@@ -0,0 +1,73 @@
+import { NextRequest, NextResponse } from 'next/server'
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { executeAuthStrategies } from 'payload'
+
+import { getPayloadClient } from '@/lib/payload'
+import { getViewsOverTime, parseViewRange } from '@/lib/view-analytics'
+
+const HTTP_STATUS_BAD_REQUEST = 400
+const HTTP_STATUS_UNAUTHORIZED = 401
+const HTTP_STATUS_FORBIDDEN = 403
+const HTTP_STATUS_INTERNAL_SERVER_ERROR = 500
+const ANALYTICS_ROLES = ['admin', 'agent']
+
+const parsePropertyId = (value: string | null): number | null | undefined => {
+  if (value === null || value === '') return null
+  const parsedId = Number.parseInt(value, 10)
+  return Number.isSafeInteger(parsedId) && parsedId > 0 ? parsedId : undefined
+}
+
+/**
+ * Visualizações por período (série temporal), de um imóvel ou de todos.
+ * GET /api/analytics/views?granularity=day&from=...&to=...&propertyId=...
+ *
+ * Lê os buckets de `property-views`; visualizações ainda no buffer de
+ * lib/view-counter.ts aparecem após o próximo flush.
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const payload = await getPayloadClient()
+
+    const authResult = await executeAuthStrategies({
+      headers: request.headers,
+      payload,
+    })
+
+    if (!authResult.user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: HTTP_STATUS_UNAUTHORIZED })
+    }
+
+    if (!ANALYTICS_ROLES.includes(authResult.user.role)) {
+      return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
+    }
+
+    const { searchParams } = request.nextUrl
+    const range = parseViewRange(searchParams)
+    if (typeof range === 'string') {
+      return NextResponse.json({ error: range }, { status: HTTP_STATUS_BAD_REQUEST })
+    }
+
+    const propertyId = parsePropertyId(searchParams.get('propertyId'))
+    if (propertyId === undefined) {
+      return NextResponse.json({ error: 'Invalid property id' }, { status: HTTP_STATUS_BAD_REQUEST })
+    }
+
+    const db = (payload.db as unknown as SQLiteAdapter).drizzle
+    const points = await getViewsOverTime(db, range, propertyId)
+
+    return NextResponse.json({
+      granularity: range.granularity,
+      from: range.from.toISOString(),
+      to: range.to.toISOString(),
+      propertyId,
+      total: points.reduce((sum, point) => sum + point.views, 0),
+      points,
+    })
+  } catch (error: unknown) {
+    console.error('Failed to fetch property views:', error)
+    return NextResponse.json(
+      { error: 'Failed to fetch property views' },
+      { status: HTTP_STATUS_INTERNAL_SERVER_ERROR },
+    )
+  }
+}
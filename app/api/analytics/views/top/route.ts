@@ -0,0 +1,63 @@
+import { NextRequest, NextResponse } from 'next/server'
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { executeAuthStrategies } from 'payload'
+
+import { getPayloadClient } from '@/lib/payload'
+import { getTopViewedProperties, parseTopLimit, parseViewRange } from '@/lib/view-analytics'
+
+const HTTP_STATUS_BAD_REQUEST = 400
+const HTTP_STATUS_UNAUTHORIZED = 401
+const HTTP_STATUS_FORBIDDEN = 403
+const HTTP_STATUS_INTERNAL_SERVER_ERROR = 500
+const ANALYTICS_ROLES = ['admin', 'agent']
+
+/**
+ * Imóveis mais visualizados no período (em alta).
+ * GET /api/analytics/views/top?granularity=day&from=...&to=...&limit=10
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const payload = await getPayloadClient()
+
+    const authResult = await executeAuthStrategies({
+      headers: request.headers,
+      payload,
+    })
+
+    if (!authResult.user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: HTTP_STATUS_UNAUTHORIZED })
+    }
+
+    if (!ANALYTICS_ROLES.includes(authResult.user.role)) {
+      return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
+    }
+
+    const { searchParams } = request.nextUrl
+    const range = parseViewRange(searchParams)
+    if (typeof range === 'string') {
+      return NextResponse.json({ error: range }, { status: HTTP_STATUS_BAD_REQUEST })
+    }
+
+    const limit = parseTopLimit(searchParams)
+    if (typeof limit === 'string') {
+      return NextResponse.json({ error: limit }, { status: HTTP_STATUS_BAD_REQUEST })
+    }
+
+    const db = (payload.db as unknown as SQLiteAdapter).drizzle
+    const properties = await getTopViewedProperties(db, range, limit)
+
+    return NextResponse.json({
+      granularity: range.granularity,
+      from: range.from.toISOString(),
+      to: range.to.toISOString(),
+      limit,
+      properties,
+    })
+  } catch (error: unknown) {
+    console.error('Failed to fetch top viewed properties:', error)
+    return NextResponse.json(
+      { error: 'Failed to fetch top viewed properties' },
+      { status: HTTP_STATUS_INTERNAL_SERVER_ERROR },
+    )
+  }
+}
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { executeAuthStrategies } from 'payload'
+import { getDashboardStats, type DashboardStats } from '@/lib/dashboard-stats'
 import { getPayloadClient } from '@/lib/payload'
 
 const AUTHORIZATION_HEADER = 'authorization'
@@ -7,16 +8,7 @@ const BEARER_PREFIX = 'Bearer '
 const HTTP_STATUS_UNAUTHORIZED = 401
 const HTTP_STATUS_FORBIDDEN = 403
 const HTTP_STATUS_INTERNAL_SERVER_ERROR = 500
-const DEALS_PAGE_LIMIT = 100
-const SIGNED_DEAL_STAGE = 'signed'
-const START_OF_DAY_HOURS = 0
-
-interface DashboardStatsResponse {
-  activeProperties: number
-  newLeadsToday: number
-  totalRevenue: number
-  timestamp: string
-}
+const DASHBOARD_STATS_CACHE_HEADER = 'x-dashboard-stats-cache'
 
 export async function GET(request: NextRequest) {
   try {
@@ -40,56 +32,12 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Forbidden' }, { status: HTTP_STATUS_FORBIDDEN })
     }
 
-    // KPIs básicos para o dashboard
-    const activeProperties = await payload.count({
-      collection: 'properties',
-      where: {
-        status: { equals: 'published' },
-      },
-    })
+    // KPIs em uma única query agregada, com cache invalidado pelos hooks
+    const { stats, cached } = await getDashboardStats(payload)
 
-    const newLeadsToday = await payload.count({
-      collection: 'leads',
-      where: {
-        createdAt: {
-          greater_than: new Date(
-            new Date().setHours(START_OF_DAY_HOURS, START_OF_DAY_HOURS, START_OF_DAY_HOURS, 0),
-          ).toISOString(),
-        },
-      },
+    return NextResponse.json<DashboardStats>(stats, {
+      headers: { [DASHBOARD_STATS_CACHE_HEADER]: cached ? 'hit' : 'miss' },
     })
-
-    let totalRevenue = 0
-    let page = 1
-    let hasMore = true
-
-    while (hasMore) {
-      const dealsResult = await payload.find({
-        collection: 'deals',
-        limit: DEALS_PAGE_LIMIT,
-        page,
-        select: {
-          finalPrice: true,
-        },
-        where: {
-          stage: { equals: SIGNED_DEAL_STAGE },
-        },
-      })
-
-      totalRevenue += dealsResult.docs.reduce((sum, deal) => sum + (deal.finalPrice ?? 0), 0)
-
-      hasMore = dealsResult.totalDocs > page * DEALS_PAGE_LIMIT
-      page++
-    }
-
-    const response: DashboardStatsResponse = {
-      activeProperties: activeProperties.totalDocs,
-      newLeadsToday: newLeadsToday.totalDocs,
-      totalRevenue,
-      timestamp: new Date().toISOString(),
-    }
-
-    return NextResponse.json<DashboardStatsResponse>(response)
   } catch (error: unknown) {
     console.error('Failed to fetch dashboard stats:', error)
     return NextResponse.json(
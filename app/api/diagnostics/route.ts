@@ -0,0 +1,82 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { timingSafeEqual } from 'node:crypto'
+
+import { getAgentStatsCacheSize } from '@/lib/agent-stats'
+import { getPropertyCacheSize } from '@/lib/mock-data'
+import { isPayloadClientReady } from '@/lib/payload'
+import { getPublishedPropertyIdsCacheSize } from '@/lib/published-properties'
+import { RATE_LIMITER_KEYS_HEADER } from '@/lib/rate-limit'
+import { getViewCountBuffer } from '@/lib/view-counter'
+
+const DIAGNOSTICS_SECRET_HEADER = 'x-diagnostics-secret'
+const HTTP_STATUS_NOT_FOUND = 404
+const HTTP_STATUS_UNAUTHORIZED = 401
+const BYTES_PER_MB = 1024 * 1024
+
+const isTimingSafeEqual = (provided: string, expected: string): boolean => {
+  const providedBuffer = Buffer.from(provided)
+  const expectedBuffer = Buffer.from(expected)
+
+  if (providedBuffer.length !== expectedBuffer.length) {
+    return false
+  }
+
+  return timingSafeEqual(providedBuffer, expectedBuffer)
+}
+
+const toMb = (bytes: number): number => Math.round((bytes / BYTES_PER_MB) * 100) / 100
+
+const countActiveResources = (): Record<string, number> => {
+  const counts: Record<string, number> = {}
+  for (const resource of process.getActiveResourcesInfo()) {
+    counts[resource] = (counts[resource] ?? 0) + 1
+  }
+  return counts
+}
+
+/**
+ * Process memory, active handles and in-memory cache sizes, for soak tests.
+ * Disabled (404) unless DIAGNOSTICS_SECRET is configured.
+ */
+export async function GET(request: NextRequest) {
+  const expectedSecret = process.env.DIAGNOSTICS_SECRET
+  if (!expectedSecret) {
+    return NextResponse.json({ message: 'Not Found' }, { status: HTTP_STATUS_NOT_FOUND })
+  }
+
+  const secret = request.headers.get(DIAGNOSTICS_SECRET_HEADER)
+  if (!secret || !isTimingSafeEqual(secret, expectedSecret)) {
+    return NextResponse.json({ message: 'Invalid secret' }, { status: HTTP_STATUS_UNAUTHORIZED })
+  }
+
+  const viewCountBuffer = getViewCountBuffer()
+  const memory = process.memoryUsage()
+  const handles = countActiveResources()
+  const rateLimiterKeys = Number.parseInt(request.headers.get(RATE_LIMITER_KEYS_HEADER) ?? '', 10)
+
+  return NextResponse.json({
+    pid: process.pid,
+    uptimeS: Math.round(process.uptime()),
+    memoryMb: {
+      rss: toMb(memory.rss),
+      heapTotal: toMb(memory.heapTotal),
+      heapUsed: toMb(memory.heapUsed),
+      external: toMb(memory.external),
+      arrayBuffers: toMb(memory.arrayBuffers),
+    },
+    handles: {
+      total: Object.values(handles).reduce((sum, count) => sum + count, 0),
+      byType: handles,
+    },
+    caches: {
+      rateLimiterKeys: Number.isNaN(rateLimiterKeys) ? null : rateLimiterKeys,
+      propertyCache: getPropertyCacheSize(),
+      payloadClientReady: isPayloadClientReady(),
+      viewBufferPending: viewCountBuffer.pendingSize,
+      viewDedupeEntries: viewCountBuffer.dedupeSize,
+      viewBufferDropped: viewCountBuffer.droppedViews,
+      publishedPropertyIds: getPublishedPropertyIdsCacheSize(),
+      agentStatsEntries: getAgentStatsCacheSize(),
+    },
+  })
+}
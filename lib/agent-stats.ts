@@ -0,0 +1,254 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { Payload } from 'payload'
+
+const DEFAULT_TTL_MS = 30_000
+const DEFAULT_MAX_ENTRIES = 1_000
+const NEW_LEAD_STATUS = 'new'
+const SIGNED_DEAL_STAGE = 'signed'
+const ACTIVE_DEAL_STAGES = ['proposal', 'contract']
+const AGENT_ROLES = ['admin', 'agent']
+
+export interface AgentStats {
+  totalLeads: number
+  newLeads: number
+  totalProperties: number
+  activeDeals: number
+  closedThisMonth: number
+}
+
+type NumericValue = number | bigint | string | null
+
+interface AgentStatsState {
+  // Insertion order is refresh order, so the first entry is the stalest.
+  entries: Map<number, { stats: AgentStats; expiresAt: number }>
+  // In-flight loads, shared by concurrent misses.
+  loading: Map<number, Promise<AgentStats>>
+  loadingAll?: Promise<Map<number, AgentStats>>
+  // Bumped on every invalidation; a load started before it is not cached.
+  generation: number
+}
+
+interface GlobalWithAgentStats {
+  agentStats?: AgentStatsState
+}
+
+const globalWithAgentStats = global as unknown as GlobalWithAgentStats
+
+const getState = (): AgentStatsState => {
+  globalWithAgentStats.agentStats ??= { entries: new Map(), loading: new Map(), generation: 0 }
+  return globalWithAgentStats.agentStats
+}
+
+const toNumber = (value: NumericValue | undefined): number =>
+  value === undefined || value === null ? 0 : Number(value)
+
+const emptyStats = (): AgentStats => ({
+  totalLeads: 0,
+  newLeads: 0,
+  totalProperties: 0,
+  activeDeals: 0,
+  closedThisMonth: 0,
+})
+
+const startOfMonth = (now: Date): Date => new Date(now.getFullYear(), now.getMonth(), 1)
+
+const startOfNextMonth = (now: Date): Date => new Date(now.getFullYear(), now.getMonth() + 1, 1)
+
+const readTtlMs = (): number => {
+  const parsed = Number.parseInt(process.env.AGENT_STATS_TTL_MS ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed >= 0 ? parsed : DEFAULT_TTL_MS
+}
+
+const readMaxEntries = (): number => {
+  const parsed = Number.parseInt(process.env.AGENT_STATS_MAX_ENTRIES ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed > 0 ? parsed : DEFAULT_MAX_ENTRIES
+}
+
+/**
+ * The five metrics for one agent, or for every agent, with one GROUP BY query
+ * per table (leads, properties, deals) instead of one count per metric and
+ * agent. All-agents loads also list admins and agents with nothing assigned.
+ */
+const loadAgentStats = async (
+  payload: Payload,
+  agentId: number | null,
+  now: Date,
+): Promise<Map<number, AgentStats>> => {
+  const db = (payload.db as unknown as SQLiteAdapter).drizzle
+  const onlyAgent = (column: string) =>
+    agentId === null ? sql`${sql.identifier(column)} IS NOT NULL` : sql`${sql.identifier(column)} = ${agentId}`
+
+  const [leadRows, propertyRows, dealRows, agentRows] = await Promise.all([
+    db.all<{ agentId: NumericValue; totalLeads: NumericValue; newLeads: NumericValue }>(sql`
+      SELECT assigned_to_id AS agentId, count(*) AS totalLeads, sum(status = ${NEW_LEAD_STATUS}) AS newLeads
+      FROM leads
+      WHERE ${onlyAgent('assigned_to_id')}
+      GROUP BY assigned_to_id
+    `),
+    db.all<{ agentId: NumericValue; totalProperties: NumericValue }>(sql`
+      SELECT agent_id AS agentId, count(*) AS totalProperties
+      FROM properties
+      WHERE ${onlyAgent('agent_id')}
+      GROUP BY agent_id
+    `),
+    db.all<{ agentId: NumericValue; activeDeals: NumericValue; closedThisMonth: NumericValue }>(sql`
+      SELECT
+        agent_id AS agentId,
+        sum(stage IN (${sql.join(
+          ACTIVE_DEAL_STAGES.map((stage) => sql`${stage}`),
+          sql`, `,
+        )})) AS activeDeals,
+        sum(stage = ${SIGNED_DEAL_STAGE} AND coalesce(closed_at, updated_at) >= ${startOfMonth(now).toISOString()}) AS closedThisMonth
+      FROM deals
+      WHERE ${onlyAgent('agent_id')}
+      GROUP BY agent_id
+    `),
+    agentId === null
+      ? db.all<{ agentId: NumericValue }>(sql`
+          SELECT id AS agentId FROM users
+          WHERE role IN (${sql.join(
+            AGENT_ROLES.map((role) => sql`${role}`),
+            sql`, `,
+          )})
+        `)
+      : Promise.resolve([{ agentId }]),
+  ])
+
+  const statsByAgent = new Map<number, AgentStats>()
+  const statsFor = (id: NumericValue): AgentStats => {
+    const key = toNumber(id)
+    let stats = statsByAgent.get(key)
+    if (!stats) {
+      stats = emptyStats()
+      statsByAgent.set(key, stats)
+    }
+    return stats
+  }
+
+  for (const row of agentRows) statsFor(row.agentId)
+  for (const row of leadRows) {
+    const stats = statsFor(row.agentId)
+    stats.totalLeads = toNumber(row.totalLeads)
+    stats.newLeads = toNumber(row.newLeads)
+  }
+  for (const row of propertyRows) {
+    statsFor(row.agentId).totalProperties = toNumber(row.totalProperties)
+  }
+  for (const row of dealRows) {
+    const stats = statsFor(row.agentId)
+    stats.activeDeals = toNumber(row.activeDeals)
+    stats.closedThisMonth = toNumber(row.closedThisMonth)
+  }
+
+  return statsByAgent
+}
+
+/**
+ * Caches the loaded stats, then drops expired entries and, past
+ * AGENT_STATS_MAX_ENTRIES (default 1000), the least recently loaded ones.
+ * Admins may ask for any id, so without the bound every unknown id would
+ * stay in the map for the life of the process.
+ */
+const storeEntries = (
+  state: AgentStatsState,
+  statsByAgent: Map<number, AgentStats>,
+  generation: number,
+  now: Date,
+): void => {
+  const ttlMs = readTtlMs()
+  if (state.generation !== generation || ttlMs === 0) return
+
+  // closedThisMonth resets at the start of the month.
+  const expiresAt = Math.min(now.getTime() + ttlMs, startOfNextMonth(now).getTime())
+  for (const [agentId, stats] of statsByAgent) {
+    state.entries.delete(agentId)
+    state.entries.set(agentId, { stats, expiresAt })
+  }
+
+  // Entries expire in refresh order, so the sweep stops at the first live one.
+  const maxEntries = readMaxEntries()
+  for (const [agentId, entry] of state.entries) {
+    if (entry.expiresAt > now.getTime() && state.entries.size <= maxEntries) break
+    state.entries.delete(agentId)
+  }
+}
+
+/**
+ * Stats of one agent, from the per-agent cache (AGENT_STATS_TTL_MS, default
+ * 30s, 0 disables it) or a filtered load. Concurrent misses for the same
+ * agent share one load.
+ * @returns The stats and whether they came from the cache
+ */
+export const getAgentStats = async (
+  payload: Payload,
+  agentId: number,
+): Promise<{ stats: AgentStats; cached: boolean }> => {
+  const state = getState()
+  const now = new Date()
+
+  const entry = state.entries.get(agentId)
+  if (entry && entry.expiresAt > now.getTime()) {
+    return { stats: entry.stats, cached: true }
+  }
+
+  let loading = state.loading.get(agentId)
+  if (!loading) {
+    const generation = state.generation
+    const started: Promise<AgentStats> = loadAgentStats(payload, agentId, now)
+      .then((statsByAgent) => {
+        storeEntries(state, statsByAgent, generation, now)
+        return statsByAgent.get(agentId) ?? emptyStats()
+      })
+      .finally(() => {
+        if (state.loading.get(agentId) === started) state.loading.delete(agentId)
+      })
+    state.loading.set(agentId, started)
+    loading = started
+  }
+
+  return { stats: await loading, cached: false }
+}
+
+/**
+ * Stats of every admin and agent (plus any other user with assigned work),
+ * loaded with the grouped queries and used to refill the per-agent cache.
+ * Concurrent calls share one load.
+ */
+export const getAllAgentStats = async (payload: Payload): Promise<Map<number, AgentStats>> => {
+  const state = getState()
+
+  if (!state.loadingAll) {
+    const now = new Date()
+    const generation = state.generation
+    const loading = loadAgentStats(payload, null, now)
+      .then((statsByAgent) => {
+        storeEntries(state, statsByAgent, generation, now)
+        return statsByAgent
+      })
+      .finally(() => {
+        if (state.loadingAll === loading) state.loadingAll = undefined
+      })
+    state.loadingAll = loading
+  }
+
+  return state.loadingAll
+}
+
+/**
+ * Drops the cached stats of the given agents (e.g. the old and new owner of
+ * a reassigned lead). Null/undefined ids are ignored.
+ */
+export const invalidateAgentStats = (agentIds: Array<number | null | undefined>): void => {
+  const state = getState()
+  state.generation += 1
+  state.loadingAll = undefined
+  for (const agentId of agentIds) {
+    if (typeof agentId !== 'number') continue
+    state.entries.delete(agentId)
+    state.loading.delete(agentId)
+  }
+}
+
+/** Cached agents (diagnostics). */
+export const getAgentStatsCacheSize = (): number => getState().entries.size
@@ -0,0 +1,129 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { Payload } from 'payload'
+
+const DEFAULT_TTL_MS = 30_000
+const PUBLISHED_PROPERTY_STATUS = 'published'
+const SIGNED_DEAL_STAGE = 'signed'
+
+export interface DashboardStats {
+  activeProperties: number
+  newLeadsToday: number
+  totalRevenue: number
+  timestamp: string
+}
+
+type NumericValue = number | bigint | string | null
+
+interface DashboardStatsRow {
+  activeProperties: NumericValue
+  newLeadsToday: NumericValue
+  totalRevenue: NumericValue
+}
+
+interface DashboardStatsState {
+  cached?: { stats: DashboardStats; expiresAt: number }
+  loading?: Promise<DashboardStats>
+  // Bumped on every invalidation; a load started before it is not cached.
+  generation: number
+}
+
+interface GlobalWithDashboardStats {
+  dashboardStats?: DashboardStatsState
+}
+
+const globalWithDashboardStats = global as unknown as GlobalWithDashboardStats
+
+const getState = (): DashboardStatsState => {
+  globalWithDashboardStats.dashboardStats ??= { generation: 0 }
+  return globalWithDashboardStats.dashboardStats
+}
+
+const toNumber = (value: NumericValue | undefined): number =>
+  value === undefined || value === null ? 0 : Number(value)
+
+const startOfToday = (now: Date): Date => new Date(new Date(now).setHours(0, 0, 0, 0))
+
+const startOfTomorrow = (now: Date): Date => {
+  const tomorrow = startOfToday(now)
+  tomorrow.setDate(tomorrow.getDate() + 1)
+  return tomorrow
+}
+
+const readTtlMs = (): number => {
+  const parsed = Number.parseInt(process.env.DASHBOARD_STATS_TTL_MS ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed >= 0 ? parsed : DEFAULT_TTL_MS
+}
+
+/**
+ * The three KPIs in a single statement: two indexed counts and a SUM over
+ * signed deals, so the work no longer grows with JavaScript-side paging.
+ */
+const loadDashboardStats = async (payload: Payload, now: Date): Promise<DashboardStats> => {
+  const db = (payload.db as unknown as SQLiteAdapter).drizzle
+
+  const [row] = await db.all<DashboardStatsRow>(sql`
+    SELECT
+      (SELECT count(*) FROM properties WHERE status = ${PUBLISHED_PROPERTY_STATUS}) AS activeProperties,
+      (SELECT count(*) FROM leads WHERE created_at > ${startOfToday(now).toISOString()}) AS newLeadsToday,
+      (SELECT coalesce(sum(final_price), 0) FROM deals WHERE stage = ${SIGNED_DEAL_STAGE}) AS totalRevenue
+  `)
+
+  return {
+    activeProperties: toNumber(row?.activeProperties),
+    newLeadsToday: toNumber(row?.newLeadsToday),
+    totalRevenue: toNumber(row?.totalRevenue),
+    timestamp: now.toISOString(),
+  }
+}
+
+/**
+ * Dashboard KPIs, served from a process-wide cache.
+ *
+ * Entries live for DASHBOARD_STATS_TTL_MS (default 30s, 0 disables the
+ * cache) and never past midnight, when "new leads today" resets. Hooks on
+ * properties, leads and deals call `invalidateDashboardStats` once the save
+ * commits (see payload/hooks/after-commit.ts); the TTL bounds
+ * staleness for writes from other processes. Concurrent misses share one load.
+ *
+ * @returns The stats and whether they came from the cache
+ */
+export const getDashboardStats = async (
+  payload: Payload,
+): Promise<{ stats: DashboardStats; cached: boolean }> => {
+  const state = getState()
+  const now = new Date()
+
+  if (state.cached && state.cached.expiresAt > now.getTime()) {
+    return { stats: state.cached.stats, cached: true }
+  }
+
+  if (!state.loading) {
+    const generation = state.generation
+    const ttlMs = readTtlMs()
+    const loading = loadDashboardStats(payload, now)
+      .then((stats) => {
+        if (state.generation === generation && ttlMs > 0) {
+          state.cached = {
+            stats,
+            expiresAt: Math.min(now.getTime() + ttlMs, startOfTomorrow(now).getTime()),
+          }
+        }
+        return stats
+      })
+      .finally(() => {
+        if (state.loading === loading) state.loading = undefined
+      })
+    state.loading = loading
+  }
+
+  return { stats: await state.loading, cached: false }
+}
+
+/** Drops the cached KPIs; the next request recomputes them. */
+export const invalidateDashboardStats = (): void => {
+  const state = getState()
+  state.generation += 1
+  state.cached = undefined
+  state.loading = undefined
+}
@@ -0,0 +1,328 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { Payload } from 'payload'
+
+import { RESEND_BATCH_LIMIT, sendEmailBatch, type SendEmailOptions } from '@/lib/resend'
+import type { Property } from '@/payload/payload-types'
+
+const NOTIFIABLE_LEAD_STATUSES = ['new', 'qualified']
+const DEFAULT_CONCURRENCY = 2
+const DEFAULT_ATTEMPTS = 3
+const DEFAULT_RETRY_DELAY_MS = 1_000
+const DEFAULT_BATCH_TIMEOUT_MS = 15_000
+
+type NumericValue = number | bigint | string
+
+interface InterestedLeadRow {
+  id: NumericValue
+  name: string | null
+  email: string
+}
+
+export interface InterestedLead {
+  id: number
+  name: string
+  email: string
+}
+
+export interface LeadNotificationProgress {
+  // Every interested lead up to this id has been notified.
+  afterLeadId: number
+  // Leads past the cursor notified by batches accepted before a page failed.
+  sentLeadIds: number[]
+}
+
+export interface LeadNotificationOptions {
+  // Prefix of the per-batch Resend idempotency key. Retries of a batch within
+  // the run reuse its key; each run needs its own prefix, since a resumed walk
+  // may split batches differently and Resend rejects a key reused with
+  // another payload.
+  idempotencyPrefix?: string
+  // Resume point saved through `onProgress` by a previous run.
+  resumeFrom?: LeadNotificationProgress
+  // Awaited after every page with the new resume point.
+  onProgress?: (progress: LeadNotificationProgress) => Promise<void>
+  batchSize?: number
+  concurrency?: number
+  attempts?: number
+  retryDelayMs?: number
+  batchTimeoutMs?: number
+}
+
+export interface LeadNotificationSummary {
+  leads: number
+  sent: number
+  batches: number
+  failedBatches: number
+}
+
+export interface NewPropertyEmail {
+  subject: string
+  render: (leadName: string) => string
+}
+
+const readPositiveInt = (value: string | undefined, fallback: number): number => {
+  const parsed = Number.parseInt(value ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed > 0 ? parsed : fallback
+}
+
+const escapeHtml = (value: string): string =>
+  value
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;')
+
+const relationId = (value: unknown): number | null => {
+  const id = value && typeof value === 'object' && 'id' in value ? value.id : value
+  const parsed = Number(id)
+  return Number.isSafeInteger(parsed) ? parsed : null
+}
+
+const sleep = (ms: number): Promise<void> => new Promise((resolve) => setTimeout(resolve, ms))
+
+/**
+ * Render the "new property" e-mail once per property. Only the greeting
+ * depends on the lead, so each recipient costs one string concatenation.
+ */
+export const renderNewPropertyEmail = (property: Property): NewPropertyEmail => {
+  const title = escapeHtml(property.title)
+  const price = typeof property.price === 'number' ? `R$ ${property.price.toLocaleString('pt-BR')}` : '—'
+  const body = `
+    <h2>${title}</h2>
+    <p>${escapeHtml(property.shortDescription ?? '')}</p>
+    <p><strong>Preço:</strong> ${price}</p>
+    <p><a href="${process.env.NEXT_PUBLIC_SERVER_URL}/imoveis/${encodeURIComponent(property.slug ?? '')}">Ver Detalhes do Imóvel</a></p>
+  `
+
+  return {
+    subject: `Nova Oportunidade: ${property.title}`,
+    render: (leadName) =>
+      `<h1>Imóvel Publicado!</h1>
+    <p>Olá ${escapeHtml(leadName)}, um novo imóvel que pode te interessar acaba de ser publicado.</p>${body}`,
+  }
+}
+
+/**
+ * One keyset page of leads interested in the property, ordered by id.
+ *
+ * Notifiable leads are new or qualified, have an e-mail and have not opted
+ * out. Each interest filter (neighborhood, property type, price band) only
+ * applies when the lead has it set.
+ */
+export const fetchInterestedLeadsPage = async (
+  payload: Payload,
+  property: Property,
+  afterId: number,
+  limit: number,
+): Promise<InterestedLead[]> => {
+  const db = (payload.db as unknown as SQLiteAdapter).drizzle
+  const neighborhoodId = relationId(property.neighborhood)
+  const price = typeof property.price === 'number' ? property.price : null
+
+  const rows = await db.all<InterestedLeadRow>(sql`
+    SELECT id, name, email
+    FROM leads
+    WHERE id > ${afterId}
+      AND status IN (${sql.join(NOTIFIABLE_LEAD_STATUSES.map((status) => sql`${status}`), sql`, `)})
+      AND email IS NOT NULL AND email <> ''
+      AND coalesce(do_not_contact, 0) = 0
+      AND (neighborhood_id IS NULL${neighborhoodId === null ? sql.empty() : sql` OR neighborhood_id = ${neighborhoodId}`})
+      AND (property_type IS NULL OR property_type = ${property.category})
+      ${
+        price === null
+          ? sql.empty()
+          : sql`AND (price_range_min IS NULL OR price_range_min <= ${price})
+      AND (price_range_max IS NULL OR price_range_max >= ${price})`
+      }
+    ORDER BY id
+    LIMIT ${limit}
+  `)
+
+  return rows.map((row) => ({ id: Number(row.id), name: row.name ?? '', email: row.email }))
+}
+
+/**
+ * Every interested lead after `afterId`, page by page. Keyset pagination
+ * (`id > last`) keeps each page an index range scan however deep the walk
+ * goes, and a lead created mid-walk is either picked up or not, never
+ * duplicated.
+ */
+export async function* streamInterestedLeads(
+  payload: Payload,
+  property: Property,
+  pageSize: number,
+  afterId = 0,
+): AsyncGenerator<InterestedLead[]> {
+  while (true) {
+    const page = await fetchInterestedLeadsPage(payload, property, afterId, pageSize)
+    if (page.length === 0) return
+
+    yield page
+
+    if (page.length < pageSize) return
+    afterId = page[page.length - 1].id
+  }
+}
+
+const withTimeout = <T>(promise: Promise<T>, ms: number): Promise<T> =>
+  new Promise<T>((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error(`Lote sem resposta em ${ms}ms`)), ms)
+    promise.then(
+      (value) => {
+        clearTimeout(timer)
+        resolve(value)
+      },
+      (error: unknown) => {
+        clearTimeout(timer)
+        reject(error)
+      },
+    )
+  })
+
+/**
+ * Send one batch, retrying failures and timeouts with exponential backoff.
+ * Retries reuse the idempotency key, so a batch that was accepted but timed
+ * out on our side is not delivered twice.
+ */
+const sendBatchWithRetry = async (
+  emails: SendEmailOptions[],
+  idempotencyKey: string | undefined,
+  attempts: number,
+  retryDelayMs: number,
+  batchTimeoutMs: number,
+): Promise<Error | null> => {
+  let lastError: Error | null = null
+
+  for (let attempt = 0; attempt < attempts; attempt++) {
+    if (attempt > 0) await sleep(retryDelayMs * 2 ** (attempt - 1))
+
+    try {
+      const { error } = await withTimeout(sendEmailBatch(emails, { idempotencyKey }), batchTimeoutMs)
+      if (!error) return null
+      lastError = error
+    } catch (error: unknown) {
+      lastError = error instanceof Error ? error : new Error('Falha no envio do lote')
+    }
+  }
+
+  return lastError
+}
+
+/** Run the tasks with at most `concurrency` in flight; results keep task order. */
+const runBounded = async <T>(tasks: Array<() => Promise<T>>, concurrency: number): Promise<T[]> => {
+  const results = new Array<T>(tasks.length)
+  let next = 0
+
+  const worker = async () => {
+    while (next < tasks.length) {
+      const index = next++
+      results[index] = await tasks[index]()
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(concurrency, tasks.length) }, worker))
+  return results
+}
+
+/**
+ * E-mail every lead interested in a newly published property.
+ *
+ * Leads are streamed in keyset pages of `batchSize * concurrency`, each page
+ * is split into Resend batches (at most 100 recipients per API call) and the
+ * batches of a page are sent with bounded concurrency and per-batch retries.
+ * Memory and in-flight requests stay constant however many leads match, and
+ * the run takes about `ceil(leads / (batchSize * concurrency))` round trips.
+ *
+ * After each page the resume point goes to `onProgress`: the last lead id
+ * of the page or, when a batch failed, the previous cursor plus the leads of
+ * the batches that were accepted. The walk stops at the first page with a
+ * failed batch, and a run given that point as `resumeFrom` skips every lead
+ * already notified. Only a batch whose acceptance was never confirmed (every
+ * attempt failed or timed out) may reach its leads twice, when the next run
+ * sends it again under a new key.
+ *
+ * Defaults come from NOTIFY_BATCH_SIZE (100), NOTIFY_BATCH_CONCURRENCY (2,
+ * Resend's default rate limit is 2 requests/s), NOTIFY_BATCH_ATTEMPTS (3) and
+ * NOTIFY_BATCH_TIMEOUT_MS (15s).
+ */
+export const notifyLeadsOfProperty = async (
+  payload: Payload,
+  property: Property,
+  options: LeadNotificationOptions = {},
+): Promise<LeadNotificationSummary> => {
+  const batchSize = Math.min(
+    options.batchSize ?? readPositiveInt(process.env.NOTIFY_BATCH_SIZE, RESEND_BATCH_LIMIT),
+    RESEND_BATCH_LIMIT,
+  )
+  const concurrency = options.concurrency ?? readPositiveInt(process.env.NOTIFY_BATCH_CONCURRENCY, DEFAULT_CONCURRENCY)
+  const attempts = options.attempts ?? readPositiveInt(process.env.NOTIFY_BATCH_ATTEMPTS, DEFAULT_ATTEMPTS)
+  const retryDelayMs = options.retryDelayMs ?? DEFAULT_RETRY_DELAY_MS
+  const batchTimeoutMs =
+    options.batchTimeoutMs ?? readPositiveInt(process.env.NOTIFY_BATCH_TIMEOUT_MS, DEFAULT_BATCH_TIMEOUT_MS)
+
+  const email = renderNewPropertyEmail(property)
+  const summary: LeadNotificationSummary = { leads: 0, sent: 0, batches: 0, failedBatches: 0 }
+  let afterLeadId = options.resumeFrom?.afterLeadId ?? 0
+  const sentLeadIds = new Set(options.resumeFrom?.sentLeadIds ?? [])
+
+  for await (const page of streamInterestedLeads(payload, property, batchSize * concurrency, afterLeadId)) {
+    // Filtered after paging, so a short page still marks the end of the walk.
+    const pending = sentLeadIds.size > 0 ? page.filter((lead) => !sentLeadIds.has(lead.id)) : page
+    const batches: InterestedLead[][] = []
+    for (let start = 0; start < pending.length; start += batchSize) {
+      batches.push(pending.slice(start, start + batchSize))
+    }
+
+    const errors = await runBounded(
+      batches.map((batch) => () => {
+        const idempotencyKey = options.idempotencyPrefix
+          ? `${options.idempotencyPrefix}/${batch[0].id}-${batch[batch.length - 1].id}`
+          : undefined
+
+        return sendBatchWithRetry(
+          batch.map((lead) => ({ to: lead.email, subject: email.subject, html: email.render(lead.name) })),
+          idempotencyKey,
+          attempts,
+          retryDelayMs,
+          batchTimeoutMs,
+        )
+      }),
+      concurrency,
+    )
+
+    summary.leads += pending.length
+    summary.batches += batches.length
+    let pageFailed = false
+    errors.forEach((error, index) => {
+      if (error) {
+        pageFailed = true
+        summary.failedBatches += 1
+        payload.logger.warn({
+          msg: 'Lote de notificação de leads falhou após as tentativas',
+          propertyCode: property.code,
+          firstLeadId: batches[index][0].id,
+          size: batches[index].length,
+          err: error,
+        })
+      } else {
+        summary.sent += batches[index].length
+        for (const lead of batches[index]) sentLeadIds.add(lead.id)
+      }
+    })
+
+    if (pageFailed) {
+      await options.onProgress?.({ afterLeadId, sentLeadIds: [...sentLeadIds] })
+      break
+    }
+
+    afterLeadId = page[page.length - 1].id
+    for (const id of sentLeadIds) {
+      if (id <= afterLeadId) sentLeadIds.delete(id)
+    }
+    await options.onProgress?.({ afterLeadId, sentLeadIds: [...sentLeadIds] })
+  }
+
+  return summary
+}
@@ -165,6 +165,9 @@ export const getPropertyBySlug = (slug: string) => {
   return _propertyCache.get(slug)
 }
 
+/** Entries in the slug lookup cache (reported by /api/diagnostics). */
+export const getPropertyCacheSize = () => _propertyCache.size
+
 // O(1) neighborhood slug index for fast lookups
 const _neighborhoodSlugIndex = new Map<string, string>()
 mockProperties.forEach(p => {
@@ -39,3 +39,9 @@ export const getPayloadClient = async (): Promise<Payload> => {
 
   return payloadCache.client
 }
+
+/**
+ * Whether the global Payload client has been initialized
+ * @returns True once `getPayloadClient` has resolved
+ */
+export const isPayloadClientReady = (): boolean => payloadCache.client !== null
@@ -0,0 +1,90 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { Payload } from 'payload'
+
+const DEFAULT_TTL_MS = 60_000
+const PUBLISHED_PROPERTY_STATUS = 'published'
+
+type NumericValue = number | bigint | string
+
+interface PublishedPropertyIdsState {
+  ids?: Set<number>
+  expiresAt: number
+  loading?: Promise<Set<number>>
+  // Bumped on every invalidation; a load started before it is not cached.
+  generation: number
+}
+
+interface GlobalWithPublishedProperties {
+  publishedPropertyIds?: PublishedPropertyIdsState
+}
+
+const globalWithPublishedProperties = global as unknown as GlobalWithPublishedProperties
+
+const getState = (): PublishedPropertyIdsState => {
+  globalWithPublishedProperties.publishedPropertyIds ??= { expiresAt: 0, generation: 0 }
+  return globalWithPublishedProperties.publishedPropertyIds
+}
+
+const readTtlMs = (): number => {
+  const parsed = Number.parseInt(process.env.PUBLISHED_PROPERTY_IDS_TTL_MS ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed >= 0 ? parsed : DEFAULT_TTL_MS
+}
+
+const loadPublishedPropertyIds = async (payload: Payload): Promise<Set<number>> => {
+  const db = (payload.db as unknown as SQLiteAdapter).drizzle
+  const rows = await db.all<{ id: NumericValue }>(sql`
+    SELECT id FROM properties WHERE status = ${PUBLISHED_PROPERTY_STATUS}
+  `)
+
+  return new Set(rows.map((row) => Number(row.id)))
+}
+
+/**
+ * IDs of published properties, served from a process-wide cache.
+ *
+ * Lets hot paths such as the view counter reject unknown or unpublished IDs
+ * without a query per request. Hooks on properties call
+ * `invalidatePublishedPropertyIds` once the save commits; entries otherwise
+ * live for PUBLISHED_PROPERTY_IDS_TTL_MS (default 60s, 0 disables the cache),
+ * which bounds staleness for writes from other processes. Concurrent misses
+ * share one load.
+ */
+export const getPublishedPropertyIds = async (payload: Payload): Promise<Set<number>> => {
+  const state = getState()
+  if (state.ids && state.expiresAt > Date.now()) return state.ids
+
+  if (!state.loading) {
+    const generation = state.generation
+    const ttlMs = readTtlMs()
+    const loading = loadPublishedPropertyIds(payload)
+      .then((ids) => {
+        if (state.generation === generation && ttlMs > 0) {
+          state.ids = ids
+          state.expiresAt = Date.now() + ttlMs
+        }
+        return ids
+      })
+      .finally(() => {
+        if (state.loading === loading) state.loading = undefined
+      })
+    state.loading = loading
+  }
+
+  return state.loading
+}
+
+/** Whether the property exists and is published. */
+export const isPublishedProperty = async (payload: Payload, propertyId: number): Promise<boolean> =>
+  (await getPublishedPropertyIds(payload)).has(propertyId)
+
+/** Drops the cached IDs; the next lookup reloads them. */
+export const invalidatePublishedPropertyIds = (): void => {
+  const state = getState()
+  state.generation += 1
+  state.ids = undefined
+  state.loading = undefined
+}
+
+/** Cached IDs (0 when nothing is cached), for diagnostics. */
+export const getPublishedPropertyIdsCacheSize = (): number => getState().ids?.size ?? 0
@@ -0,0 +1,111 @@
+import type { NextRequest } from 'next/server'
+
+const FORWARDED_FOR_HEADER = 'x-forwarded-for'
+const REAL_IP_HEADER = 'x-real-ip'
+const USER_AGENT_HEADER = 'user-agent'
+const ACCEPT_LANGUAGE_HEADER = 'accept-language'
+
+/**
+ * Request header the middleware sets on /api/diagnostics with the number of
+ * tracked keys (the limiter lives in the middleware runtime, not in routes).
+ */
+export const RATE_LIMITER_KEYS_HEADER = 'x-rate-limiter-keys'
+
+/**
+ * Rate limiter for API routes.
+ * In-memory storage suitable for single-instance deployments.
+ * For production with multiple instances, replace with Redis/Upstash.
+ */
+export class RateLimiter {
+  private requests: Map<string, number[]> = new Map()
+  private readonly limit: number
+  private readonly window: number // in milliseconds
+  private readonly cleanupInterval: ReturnType<typeof setInterval>
+
+  constructor(limit: number, windowMinutes: number) {
+    this.limit = limit
+    this.window = windowMinutes * 60 * 1000
+    this.cleanupInterval = setInterval(() => {
+      this.cleanup()
+    }, this.window)
+
+    if (
+      this.cleanupInterval &&
+      typeof this.cleanupInterval === 'object' &&
+      'unref' in this.cleanupInterval &&
+      typeof this.cleanupInterval.unref === 'function'
+    ) {
+      this.cleanupInterval.unref()
+    }
+  }
+
+  /** Number of keys currently tracked. */
+  get size(): number {
+    return this.requests.size
+  }
+
+  /**
+   * Drops expired timestamps and keys without requests in the window.
+   * @returns Number of keys removed
+   */
+  cleanup(): number {
+    const now = Date.now()
+    let removed = 0
+
+    for (const [ip, timestamps] of this.requests.entries()) {
+      const validTimestamps = timestamps.filter((timestamp) => now - timestamp < this.window)
+      if (validTimestamps.length === 0) {
+        this.requests.delete(ip)
+        removed += 1
+      } else {
+        this.requests.set(ip, validTimestamps)
+      }
+    }
+
+    return removed
+  }
+
+  /** Stops the periodic cleanup (for short-lived instances). */
+  dispose(): void {
+    clearInterval(this.cleanupInterval)
+  }
+
+  check(ip: string): { allowed: boolean; retryAfter?: number } {
+    const now = Date.now()
+    const timestamps = this.requests.get(ip) || []
+
+    // Remove timestamps outside the current window
+    const validTimestamps = timestamps.filter((timestamp) => now - timestamp < this.window)
+
+    if (validTimestamps.length >= this.limit) {
+      // Calculate when the oldest request will expire
+      const oldestRequest = validTimestamps[0] ?? now
+      const retryAfter = Math.ceil((oldestRequest + this.window - now) / 1000)
+      return { allowed: false, retryAfter }
+    }
+
+    if (validTimestamps.length === 0) {
+      this.requests.delete(ip)
+    }
+
+    // Add current request timestamp
+    validTimestamps.push(now)
+    this.requests.set(ip, validTimestamps)
+
+    return { allowed: true }
+  }
+}
+
+export const getClientIp = (request: NextRequest): string => {
+  const forwardedForIp = request.headers.get(FORWARDED_FOR_HEADER)?.split(',')[0]?.trim()
+  const realIp = request.headers.get(REAL_IP_HEADER)?.trim()
+  const fallbackFingerprint = `${request.headers.get(USER_AGENT_HEADER) ?? 'ua'}|${request.headers.get(ACCEPT_LANGUAGE_HEADER) ?? 'lang'}|${Date.now()}`
+  const randomFallback = `fallback-${crypto.randomUUID()}-${fallbackFingerprint}`
+  const resolvedIp = forwardedForIp ?? realIp ?? randomFallback
+
+  if (!forwardedForIp && !realIp) {
+    console.warn('Rate limiting fallback IP used due to missing request IP headers')
+  }
+
+  return resolvedIp
+}
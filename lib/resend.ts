@@ -1,17 +1,25 @@
 import { Resend } from 'resend'
-import type { SendEmailResult } from '@/lib/types'
+import type { SendEmailBatchResult, SendEmailResult } from '@/lib/types'
 
 const DEFAULT_EMAIL_FROM = process.env.EMAIL_FROM ?? 'PrimeUrban <contato@primeurban.com.br>'
 const SIMULATED_EMAIL_ID = 'simulated-id'
 let resendClient: Resend | null | undefined
 
-interface SendEmailOptions {
+// Limite de e-mails por chamada da API de lote do Resend.
+export const RESEND_BATCH_LIMIT = 100
+
+export interface SendEmailOptions {
   to: string | string[]
   subject: string
   html: string
   from?: string
 }
 
+interface SendEmailBatchOptions {
+  // Repetir a chamada com a mesma chave não reenvia o lote (janela de 24h do Resend).
+  idempotencyKey?: string
+}
+
 const getResendClient = (): Resend | null => {
   if (resendClient !== undefined) {
     return resendClient
@@ -71,3 +79,57 @@ export async function sendEmail({
     return { id: null, error: mappedError }
   }
 }
+
+const toError = (error: unknown, fallback: string): Error => {
+  if (error instanceof Error) return error
+  if (typeof error === 'string') return new Error(error)
+  if (error && typeof error === 'object' && 'message' in error && typeof error.message === 'string') {
+    return new Error(error.message)
+  }
+  return new Error(fallback)
+}
+
+/**
+ * Envia até RESEND_BATCH_LIMIT e-mails em uma única chamada à API de lote do
+ * Resend. O lote é aceito ou recusado por inteiro.
+ * Com RESEND_BASE_URL, o cliente do Resend usa outra URL (ex.: um stand-in
+ * local nos benchmarks).
+ */
+export async function sendEmailBatch(
+  emails: SendEmailOptions[],
+  { idempotencyKey }: SendEmailBatchOptions = {},
+): Promise<SendEmailBatchResult> {
+  if (emails.length === 0) {
+    return { ids: [], error: null }
+  }
+
+  if (emails.length > RESEND_BATCH_LIMIT) {
+    return { ids: [], error: new Error(`Lote com ${emails.length} e-mails excede o limite de ${RESEND_BATCH_LIMIT}`) }
+  }
+
+  const client = getResendClient()
+
+  if (!client) {
+    console.warn('RESEND_API_KEY não configurada. Lote de e-mails simulado no console.')
+    console.log(`--- LOTE SIMULADO: ${emails.length} e-mail(s) | Assunto: ${emails[0].subject} ---`)
+    return { ids: emails.map(() => SIMULATED_EMAIL_ID), error: null }
+  }
+
+  try {
+    const { data, error } = await client.batch.send(
+      emails.map(({ from = DEFAULT_EMAIL_FROM, to, subject, html }) => ({ from, to, subject, html })),
+      idempotencyKey ? { idempotencyKey } : undefined,
+    )
+
+    if (error) {
+      console.error('Erro no Resend (lote):', error)
+      return { ids: [], error: toError(error, 'Erro no Resend') }
+    }
+
+    return { ids: (data?.data ?? []).map((email) => email.id), error: null }
+  } catch (err: unknown) {
+    const mappedError = toError(err, 'Falha desconhecida no envio do lote de e-mails')
+    console.error('Falha no envio do lote de e-mails:', mappedError)
+    return { ids: [], error: mappedError }
+  }
+}
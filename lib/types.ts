@@ -116,6 +116,11 @@ export interface SendEmailResult {
   error: Error | null
 }
 
+export interface SendEmailBatchResult {
+  ids: string[]
+  error: Error | null
+}
+
 // ============= RICH TEXT TYPES =============
 
 export interface RichTextNodeBase {
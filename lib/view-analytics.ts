@@ -0,0 +1,253 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+
+import {
+  PROPERTY_VIEWS_TABLE_NAME,
+  VIEW_GRANULARITIES,
+  type ViewGranularity,
+} from '@/payload/collections/PropertyViews'
+
+// Buckets follow Brasília wall-clock time (UTC-3, no DST since 2019), so a
+// "day" is a local day. Bucket starts are stored as UTC ISO strings, which
+// sort chronologically as text.
+const BUCKET_UTC_OFFSET_MINUTES = -180
+const BUCKET_OFFSET_MS = BUCKET_UTC_OFFSET_MINUTES * 60 * 1000
+const HOUR_MS = 60 * 60 * 1000
+const DAY_MS = 24 * HOUR_MS
+const DEFAULT_SPAN: Record<ViewGranularity, number> = { hour: 24, day: 30, month: 12 }
+const DEFAULT_TOP_LIMIT = 10
+const MAX_TOP_LIMIT = 100
+const MAX_SERIES_POINTS = 1_000
+
+const PROPERTY_VIEWS_TABLE = sql.identifier(PROPERTY_VIEWS_TABLE_NAME)
+
+type SqlRunner = Pick<SQLiteAdapter['drizzle'], 'all' | 'run'>
+type NumericValue = number | bigint | string | null
+
+export interface ViewRange {
+  granularity: ViewGranularity
+  from: Date
+  to: Date
+}
+
+export interface ViewSeriesPoint {
+  periodStart: string
+  views: number
+}
+
+export interface TopViewedProperty {
+  propertyId: number
+  title: string | null
+  code: string | null
+  slug: string | null
+  views: number
+}
+
+export interface ViewRetention {
+  hourlyRetentionDays: number
+  dailyRetentionDays: number
+}
+
+/** Start of the bucket containing `at`. */
+export const getBucketStart = (granularity: ViewGranularity, at: Date): Date => {
+  // Shifted so the UTC getters read Brasília wall-clock time.
+  const local = new Date(at.getTime() + BUCKET_OFFSET_MS)
+
+  if (granularity === 'hour') {
+    local.setUTCMinutes(0, 0, 0)
+  } else if (granularity === 'day') {
+    local.setUTCHours(0, 0, 0, 0)
+  } else {
+    local.setUTCDate(1)
+    local.setUTCHours(0, 0, 0, 0)
+  }
+
+  return new Date(local.getTime() - BUCKET_OFFSET_MS)
+}
+
+/** Bucket start `count` buckets after `start` (negative to go back). */
+export const addBuckets = (granularity: ViewGranularity, start: Date, count: number): Date => {
+  if (granularity === 'hour') return new Date(start.getTime() + count * HOUR_MS)
+  if (granularity === 'day') return new Date(start.getTime() + count * DAY_MS)
+
+  const local = new Date(start.getTime() + BUCKET_OFFSET_MS)
+  local.setUTCMonth(local.getUTCMonth() + count)
+  return new Date(local.getTime() - BUCKET_OFFSET_MS)
+}
+
+const toNumber = (value: NumericValue | undefined): number =>
+  value === undefined || value === null ? 0 : Number(value)
+
+const isGranularity = (value: string): value is ViewGranularity =>
+  (VIEW_GRANULARITIES as readonly string[]).includes(value)
+
+/**
+ * Adds the increments to the hour, day and month buckets of `at` (one upsert
+ * per property and granularity). Meant to run inside the view flush
+ * transaction, so buckets and `viewCount` move together.
+ */
+export const writeViewBuckets = async (
+  db: SqlRunner,
+  increments: Map<number, number>,
+  at: Date,
+): Promise<void> => {
+  const now = at.toISOString()
+
+  for (const granularity of VIEW_GRANULARITIES) {
+    const periodStart = getBucketStart(granularity, at).toISOString()
+
+    for (const [propertyId, count] of increments) {
+      // SELECT from properties: views of unknown ids get no bucket (and no FK error).
+      await db.run(sql`
+        INSERT INTO ${PROPERTY_VIEWS_TABLE} (key, property_id, granularity, period_start, views, updated_at, created_at)
+        SELECT ${`${propertyId}:${granularity}:${periodStart}`}, id, ${granularity}, ${periodStart}, ${count}, ${now}, ${now}
+        FROM properties
+        WHERE id = ${propertyId}
+        ON CONFLICT (key) DO UPDATE SET
+          views = ${PROPERTY_VIEWS_TABLE}.views + excluded.views,
+          updated_at = excluded.updated_at
+      `)
+    }
+  }
+}
+
+/**
+ * Deletes hourly and daily buckets past their retention, and buckets whose
+ * property was deleted. Monthly buckets are kept.
+ * @returns Number of deleted buckets
+ */
+export const pruneViewBuckets = async (
+  db: SqlRunner,
+  { hourlyRetentionDays, dailyRetentionDays }: ViewRetention,
+  now: Date = new Date(),
+): Promise<number> => {
+  const hourlyCutoff = new Date(now.getTime() - hourlyRetentionDays * DAY_MS).toISOString()
+  const dailyCutoff = new Date(now.getTime() - dailyRetentionDays * DAY_MS).toISOString()
+
+  const rows = await db.all<{ id: NumericValue }>(sql`
+    DELETE FROM ${PROPERTY_VIEWS_TABLE}
+    WHERE property_id IS NULL
+      OR (granularity = 'hour' AND period_start < ${hourlyCutoff})
+      OR (granularity = 'day' AND period_start < ${dailyCutoff})
+    RETURNING id
+  `)
+
+  return rows.length
+}
+
+/**
+ * Views per bucket in the range, with empty buckets filled with zero.
+ * @param propertyId Property to chart, or null for all properties
+ */
+export const getViewsOverTime = async (
+  db: SqlRunner,
+  { granularity, from, to }: ViewRange,
+  propertyId: number | null,
+): Promise<ViewSeriesPoint[]> => {
+  const rows = await db.all<{ periodStart: string; views: NumericValue }>(sql`
+    SELECT period_start AS periodStart, sum(views) AS views
+    FROM ${PROPERTY_VIEWS_TABLE}
+    WHERE granularity = ${granularity}
+      AND period_start >= ${from.toISOString()}
+      AND period_start < ${to.toISOString()}
+      ${propertyId === null ? sql.empty() : sql`AND property_id = ${propertyId}`}
+    GROUP BY period_start
+  `)
+
+  const viewsByBucket = new Map(rows.map((row) => [row.periodStart, toNumber(row.views)]))
+  const points: ViewSeriesPoint[] = []
+
+  for (let bucket = from; bucket < to; bucket = addBuckets(granularity, bucket, 1)) {
+    const periodStart = bucket.toISOString()
+    points.push({ periodStart, views: viewsByBucket.get(periodStart) ?? 0 })
+  }
+
+  return points
+}
+
+/** Most viewed properties in the range, most views first. */
+export const getTopViewedProperties = async (
+  db: SqlRunner,
+  { granularity, from, to }: ViewRange,
+  limit: number,
+): Promise<TopViewedProperty[]> => {
+  const rows = await db.all<{
+    propertyId: NumericValue
+    title: string | null
+    code: string | null
+    slug: string | null
+    views: NumericValue
+  }>(sql`
+    SELECT v.property_id AS propertyId, p.title AS title, p.code AS code, p.slug AS slug, sum(v.views) AS views
+    FROM ${PROPERTY_VIEWS_TABLE} v
+    JOIN properties p ON p.id = v.property_id
+    WHERE v.granularity = ${granularity}
+      AND v.period_start >= ${from.toISOString()}
+      AND v.period_start < ${to.toISOString()}
+    GROUP BY v.property_id
+    ORDER BY views DESC, v.property_id
+    LIMIT ${limit}
+  `)
+
+  return rows.map((row) => ({
+    propertyId: toNumber(row.propertyId),
+    title: row.title,
+    code: row.code,
+    slug: row.slug,
+    views: toNumber(row.views),
+  }))
+}
+
+const parseDate = (value: string | null): Date | null | undefined => {
+  if (value === null || value === '') return undefined
+  const date = new Date(value)
+  return Number.isNaN(date.getTime()) ? null : date
+}
+
+/**
+ * Reads `granularity` (default day), `from` and `to` (ISO dates) from the
+ * query string. `from` is aligned down and `to` up to bucket boundaries; by
+ * default the range ends now and covers 24 hours, 30 days or 12 months.
+ * @returns The range, or an error message for a 400 response
+ */
+export const parseViewRange = (params: URLSearchParams, now: Date = new Date()): ViewRange | string => {
+  const granularity = params.get('granularity') ?? 'day'
+  if (!isGranularity(granularity)) {
+    return `granularity must be one of: ${VIEW_GRANULARITIES.join(', ')}`
+  }
+
+  const toParam = parseDate(params.get('to'))
+  const fromParam = parseDate(params.get('from'))
+  if (toParam === null || fromParam === null) {
+    return 'from and to must be ISO 8601 dates'
+  }
+
+  const toInstant = toParam ?? now
+  const toStart = getBucketStart(granularity, toInstant)
+  const to = toStart.getTime() < toInstant.getTime() ? addBuckets(granularity, toStart, 1) : toStart
+  const from = fromParam
+    ? getBucketStart(granularity, fromParam)
+    : addBuckets(granularity, to, -DEFAULT_SPAN[granularity])
+
+  if (from >= to) {
+    return 'from must be before to'
+  }
+  if (addBuckets(granularity, from, MAX_SERIES_POINTS) < to) {
+    return `range too long: at most ${MAX_SERIES_POINTS} ${granularity} buckets`
+  }
+
+  return { granularity, from, to }
+}
+
+/** Reads `limit` (default 10, at most 100) from the query string. */
+export const parseTopLimit = (params: URLSearchParams): number | string => {
+  const raw = params.get('limit')
+  if (raw === null || raw === '') return DEFAULT_TOP_LIMIT
+
+  const limit = Number.parseInt(raw, 10)
+  if (!Number.isSafeInteger(limit) || limit <= 0 || limit > MAX_TOP_LIMIT) {
+    return `limit must be an integer between 1 and ${MAX_TOP_LIMIT}`
+  }
+
+  return limit
+}
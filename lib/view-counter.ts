@@ -0,0 +1,289 @@
+import { createHash } from 'node:crypto'
+
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { NextRequest } from 'next/server'
+
+import { getPayloadClient } from '@/lib/payload'
+import { pruneViewBuckets, writeViewBuckets } from '@/lib/view-analytics'
+
+const DEFAULT_FLUSH_INTERVAL_MS = 5_000
+const DEFAULT_MAX_PENDING_VIEWS = 1_000
+const DEFAULT_DEDUPE_WINDOW_MINUTES = 30
+const DEFAULT_MAX_DEDUPE_ENTRIES = 50_000
+const DEFAULT_HOURLY_RETENTION_DAYS = 7
+const DEFAULT_DAILY_RETENTION_DAYS = 400
+const PRUNE_INTERVAL_MS = 60 * 60 * 1000
+const FORWARDED_FOR_HEADER = 'x-forwarded-for'
+const REAL_IP_HEADER = 'x-real-ip'
+const USER_AGENT_HEADER = 'user-agent'
+
+export type ViewIncrements = Map<number, number>
+export type ViewIncrementWriter = (increments: ViewIncrements) => Promise<void>
+
+export interface ViewCountBufferOptions {
+  flushIntervalMs?: number
+  maxPendingViews?: number
+  dedupeWindowMinutes?: number
+  maxDedupeEntries?: number
+  onError?: (error: unknown, views: number) => void
+}
+
+/**
+ * Write-behind buffer for property page views.
+ *
+ * `record` only touches memory: increments accumulate per property and are
+ * written by `flush` (every `flushIntervalMs`, or as soon as
+ * `maxPendingViews` views are waiting) with one `viewCount + n` statement per
+ * property. A crash loses at most the views of one flush interval. A failed
+ * flush puts its increments back, but only while fewer than
+ * `maxPendingViews` views are waiting: a database that keeps failing cannot
+ * grow the buffer without bound, and the views that don't fit are dropped
+ * (see `droppedViews`). Repeat views of the same visitor within the dedupe
+ * window are not counted.
+ */
+export class ViewCountBuffer {
+  private pending: ViewIncrements = new Map()
+  private pendingViews = 0
+  private dropped = 0
+  // Visitor key -> expiry. Insertion order is expiry order (constant window).
+  private readonly seen: Map<string, number> = new Map()
+  private flushing: Promise<void> | null = null
+  private readonly flushInterval: ReturnType<typeof setInterval>
+  private readonly maxPendingViews: number
+  private readonly dedupeWindow: number
+  private readonly maxDedupeEntries: number
+  private readonly onError: (error: unknown, views: number) => void
+
+  constructor(
+    private readonly write: ViewIncrementWriter,
+    {
+      flushIntervalMs = DEFAULT_FLUSH_INTERVAL_MS,
+      maxPendingViews = DEFAULT_MAX_PENDING_VIEWS,
+      dedupeWindowMinutes = DEFAULT_DEDUPE_WINDOW_MINUTES,
+      maxDedupeEntries = DEFAULT_MAX_DEDUPE_ENTRIES,
+      onError = (error, views) => console.error(`Error flushing ${views} property views:`, error),
+    }: ViewCountBufferOptions = {},
+  ) {
+    this.maxPendingViews = maxPendingViews
+    this.dedupeWindow = dedupeWindowMinutes * 60 * 1000
+    this.maxDedupeEntries = maxDedupeEntries
+    this.onError = onError
+    this.flushInterval = setInterval(() => {
+      void this.flush()
+    }, flushIntervalMs)
+
+    if (
+      this.flushInterval &&
+      typeof this.flushInterval === 'object' &&
+      'unref' in this.flushInterval &&
+      typeof this.flushInterval.unref === 'function'
+    ) {
+      this.flushInterval.unref()
+    }
+  }
+
+  /** Views waiting to be written. */
+  get pendingSize(): number {
+    return this.pendingViews
+  }
+
+  /** Views dropped because a failed flush could not requeue them. */
+  get droppedViews(): number {
+    return this.dropped
+  }
+
+  /** Visitors remembered for deduplication. */
+  get dedupeSize(): number {
+    return this.seen.size
+  }
+
+  /**
+   * Counts one view unless the visitor already viewed within the window.
+   * @param propertyId Property viewed
+   * @param visitorKey Stable visitor key, or null to skip deduplication
+   * @returns Whether the view was counted
+   */
+  record(propertyId: number, visitorKey: string | null): boolean {
+    if (visitorKey !== null && !this.remember(`${propertyId}|${visitorKey}`)) {
+      return false
+    }
+
+    this.pending.set(propertyId, (this.pending.get(propertyId) ?? 0) + 1)
+    this.pendingViews += 1
+
+    if (this.pendingViews >= this.maxPendingViews) {
+      void this.flush()
+    }
+
+    return true
+  }
+
+  /**
+   * Writes the pending increments. Failed increments go back to the buffer
+   * and are retried on the next flush, up to `maxPendingViews` waiting views.
+   */
+  flush(): Promise<void> {
+    if (this.flushing) return this.flushing
+    if (this.pendingViews === 0) {
+      this.pruneExpired()
+      return Promise.resolve()
+    }
+
+    const increments = this.pending
+    const views = this.pendingViews
+    this.pending = new Map()
+    this.pendingViews = 0
+
+    this.flushing = this.write(increments)
+      .catch((error: unknown) => {
+        this.onError(error, views)
+        this.requeue(increments)
+      })
+      .finally(() => {
+        this.flushing = null
+        this.pruneExpired()
+      })
+
+    return this.flushing
+  }
+
+  /** Stops the periodic flush (for short-lived instances). */
+  dispose(): void {
+    clearInterval(this.flushInterval)
+  }
+
+  private requeue(increments: ViewIncrements): void {
+    for (const [propertyId, count] of increments) {
+      const requeued = Math.min(count, Math.max(0, this.maxPendingViews - this.pendingViews))
+      if (requeued > 0) {
+        this.pending.set(propertyId, (this.pending.get(propertyId) ?? 0) + requeued)
+        this.pendingViews += requeued
+      }
+      this.dropped += count - requeued
+    }
+  }
+
+  private remember(key: string): boolean {
+    const now = Date.now()
+    const expiresAt = this.seen.get(key)
+    if (expiresAt !== undefined && expiresAt > now) {
+      return false
+    }
+
+    this.seen.delete(key)
+    this.seen.set(key, now + this.dedupeWindow)
+
+    // Bounded memory: under a flood of distinct visitors, forget the oldest first.
+    while (this.seen.size > this.maxDedupeEntries) {
+      const oldest = this.seen.keys().next().value
+      if (oldest === undefined) break
+      this.seen.delete(oldest)
+    }
+
+    return true
+  }
+
+  private pruneExpired(): void {
+    const now = Date.now()
+    for (const [key, expiresAt] of this.seen) {
+      if (expiresAt > now) break
+      this.seen.delete(key)
+    }
+  }
+}
+
+/**
+ * Visitor key for deduplication: a hash of the client IP and user agent.
+ * @returns Null when the request has no IP headers (view counted, not deduplicated)
+ */
+export const getVisitorKey = (request: NextRequest): string | null => {
+  const ip =
+    request.headers.get(FORWARDED_FOR_HEADER)?.split(',')[0]?.trim() ||
+    request.headers.get(REAL_IP_HEADER)?.trim()
+  if (!ip) return null
+
+  return createHash('sha1')
+    .update(`${ip}|${request.headers.get(USER_AGENT_HEADER) ?? ''}`)
+    .digest('base64url')
+}
+
+// Last bucket prune in this process (see writeViewIncrements).
+let lastPruneAt = 0
+
+/**
+ * Adds the increments to `viewCount` with one UPDATE per property, and to the
+ * hour/day/month buckets of `property-views`, in a single transaction.
+ * Bypasses Payload hooks on purpose: `updatedAt` is not touched, so view
+ * traffic does not conflict with content edits. At most once an hour, old
+ * hourly and daily buckets are pruned (VIEW_HOURLY_RETENTION_DAYS,
+ * VIEW_DAILY_RETENTION_DAYS).
+ */
+const writeViewIncrements: ViewIncrementWriter = async (increments) => {
+  const payload = await getPayloadClient()
+  const db = (payload.db as unknown as SQLiteAdapter).drizzle
+  const now = new Date()
+
+  await db.transaction(async (tx) => {
+    for (const [propertyId, count] of increments) {
+      await tx.run(sql`
+        UPDATE properties
+        SET view_count = coalesce(view_count, 0) + ${count}
+        WHERE id = ${propertyId}
+      `)
+    }
+
+    await writeViewBuckets(tx, increments, now)
+  })
+
+  if (now.getTime() - lastPruneAt < PRUNE_INTERVAL_MS) return
+  lastPruneAt = now.getTime()
+
+  // The increments are committed: a failed prune must not requeue them.
+  try {
+    await pruneViewBuckets(
+      db,
+      {
+        hourlyRetentionDays: readPositiveInt(
+          process.env.VIEW_HOURLY_RETENTION_DAYS,
+          DEFAULT_HOURLY_RETENTION_DAYS,
+        ),
+        dailyRetentionDays: readPositiveInt(
+          process.env.VIEW_DAILY_RETENTION_DAYS,
+          DEFAULT_DAILY_RETENTION_DAYS,
+        ),
+      },
+      now,
+    )
+  } catch (error: unknown) {
+    console.error('Error pruning property view buckets:', error)
+  }
+}
+
+const readPositiveInt = (value: string | undefined, fallback: number): number => {
+  const parsed = Number.parseInt(value ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed > 0 ? parsed : fallback
+}
+
+interface GlobalWithViewCountBuffer {
+  viewCountBuffer?: ViewCountBuffer
+}
+
+const globalWithViewCountBuffer = global as unknown as GlobalWithViewCountBuffer
+
+/**
+ * Process-wide view buffer (kept on `global` so dev reloads reuse it).
+ * Tuned by VIEW_COUNT_FLUSH_MS, VIEW_COUNT_MAX_PENDING and VIEW_DEDUPE_WINDOW_MINUTES.
+ */
+export const getViewCountBuffer = (): ViewCountBuffer => {
+  globalWithViewCountBuffer.viewCountBuffer ??= new ViewCountBuffer(writeViewIncrements, {
+    flushIntervalMs: readPositiveInt(process.env.VIEW_COUNT_FLUSH_MS, DEFAULT_FLUSH_INTERVAL_MS),
+    maxPendingViews: readPositiveInt(process.env.VIEW_COUNT_MAX_PENDING, DEFAULT_MAX_PENDING_VIEWS),
+    dedupeWindowMinutes: readPositiveInt(
+      process.env.VIEW_DEDUPE_WINDOW_MINUTES,
+      DEFAULT_DEDUPE_WINDOW_MINUTES,
+    ),
+  })
+
+  return globalWithViewCountBuffer.viewCountBuffer
+}
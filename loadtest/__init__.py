@@ -0,0 +1,26 @@
+"""
+Load generator for PrimeUrban.
+
+Runs weighted user journeys open-loop at a target arrival rate with asyncio,
+reusing the HTTP clients and factories from `tests/api/`:
+
+    python -m loadtest --scenario campaign --rate 20 --duration 60
+
+See `loadtest/README.md` for the scenario DSL and report format.
+"""
+
+from .dsl import Journey, PropertyRef, Scenario, SharedData, VirtualUser
+from .runner import LoadRunner
+from .stats import RunStats, StepSample, percentile
+
+__all__ = [
+    "Journey",
+    "PropertyRef",
+    "Scenario",
+    "SharedData",
+    "VirtualUser",
+    "LoadRunner",
+    "RunStats",
+    "StepSample",
+    "percentile",
+]
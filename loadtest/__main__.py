@@ -0,0 +1,66 @@
+"""
+Command line entry point: `python -m loadtest`.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .dsl import SharedData
+from .report import format_report, write_report
+from .runner import ARRIVAL_MODES, ARRIVAL_POISSON, LoadRunner
+from .scenarios import SCENARIOS
+from .trend import record_run
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description="Gerador de carga open-loop para o PrimeUrban.",
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="campaign")
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("PAYLOAD_BASE_URL", "http://localhost:3000"),
+        help="URL da aplicação (default: PAYLOAD_BASE_URL ou http://localhost:3000)",
+    )
+    parser.add_argument("--rate", type=float, default=10.0, help="Chegadas (jornadas) por segundo")
+    parser.add_argument("--duration", type=float, default=60.0, help="Duração da geração de chegadas em segundos")
+    parser.add_argument("--workers", type=int, default=64, help="Máximo de requests simultâneos")
+    parser.add_argument("--arrival", choices=ARRIVAL_MODES, default=ARRIVAL_POISSON)
+    parser.add_argument("--seed", type=int, default=None, help="Seed para chegadas e escolha de jornadas")
+    parser.add_argument("--timeout", type=int, default=30, help="Timeout por request em segundos")
+    parser.add_argument("--output", default=None, help="Arquivo JSON com o resumo da execução")
+    parser.add_argument("--store", default=None, help="Histórico de resultados (default: LOADTEST_RESULTS_STORE)")
+    parser.add_argument("--no-store", action="store_true", help="Não registra a execução no histórico")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    runner = LoadRunner(
+        SCENARIOS[args.scenario],
+        SharedData(base_url=args.base_url.rstrip("/")),
+        rate=args.rate,
+        duration=args.duration,
+        workers=args.workers,
+        arrival=args.arrival,
+        seed=args.seed,
+        timeout=args.timeout,
+    )
+    runner.run()
+
+    summary = runner.summary()
+    print(format_report(summary))
+    if args.output:
+        print(f"\nResumo salvo em {write_report(args.output, summary)}")
+    if not args.no_store:
+        dataset = {key: summary["run"][key] for key in ("rate", "duration", "arrival", "workers", "mix")}
+        path = record_run(f"load:{args.scenario}", summary, dataset, args.base_url, args.store)
+        print(f"Execução registrada em {path}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+Credentials and login for load runs.
+
+Same environment variables as the E2E suite (`tests/e2e/helpers/auth.py`),
+without importing it: that module needs Playwright.
+"""
+
+import os
+from typing import Dict
+
+from tests.api.utils import AnonymousAPIClient
+
+
+ADMIN_CREDENTIALS = {
+    "email": os.getenv("PAYLOAD_ADMIN_EMAIL", "admin@primeurban.test"),
+    "password": os.getenv("PAYLOAD_ADMIN_PASSWORD", "test-admin-pass-123"),
+}
+
+AGENT_CREDENTIALS = {
+    "email": os.getenv("PAYLOAD_AGENT_EMAIL", "agent@primeurban.test"),
+    "password": os.getenv("PAYLOAD_AGENT_PASSWORD", "test-agent-pass-123"),
+}
+
+
+def login_token(base_url: str, credentials: Dict[str, str], timeout: int = 30) -> str:
+    """
+    Log in through the REST API.
+
+    Args:
+        base_url: Base URL of the application
+        credentials: Dict with email and password
+        timeout: Request timeout in seconds
+
+    Returns:
+        JWT of the user
+    """
+    with AnonymousAPIClient(base_url, timeout=timeout) as client:
+        return client.login(credentials["email"], credentials["password"])["token"]
@@ -0,0 +1,7 @@
+"""
+Closed-loop contention benchmarks.
+
+Each module is runnable on its own (`python -m loadtest.benchmarks.<name>`)
+and can write its results as JSON with `--output`; every run is also
+appended to the results history (`loadtest.trend`).
+"""
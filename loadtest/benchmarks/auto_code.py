@@ -0,0 +1,218 @@
+"""
+Concurrency benchmark for `autoCode` (PRM-### property codes).
+
+On every property create, `autoCode` takes the next number from the `PRM`
+row of the `counters` collection with one atomic UPDATE inside the create
+transaction (the counter is seeded from the existing codes the first time).
+Partner bulk imports create many properties at once, so the benchmark creates
+properties from N concurrent clients in consecutive batches and reports, per
+batch and against the collection size at its start:
+
+- create latency percentiles and throughput;
+- queries used by code generation (`X-Auto-Code-Queries` response header);
+- failures, with duplicate-code / unique-constraint errors counted apart;
+- duplicate codes among the properties that were created.
+
+    python -m loadtest.benchmarks.auto_code --clients 16 --batches 5 --batch-size 400
+
+Created properties carry `BENCH_PREFIX` in the title; `--cleanup` deletes
+them at the end.
+"""
+
+import json
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from tests.api.fixtures import PropertyFactory
+from tests.api.utils import APIError, AuthenticatedAPIClient
+from tests.perf.admin_dataset import AdminDatasetSeeder
+
+from ..auth import ADMIN_CREDENTIALS, login_token
+from ..stats import describe_error
+from .common import base_parser, latency_summary, run_clients, save_results
+
+
+BENCH_PREFIX = "[bench]"
+QUERIES_HEADER = "x-auto-code-queries"
+
+
+@dataclass(frozen=True)
+class CreateSample:
+    """Outcome of one property create."""
+    latency_ms: float
+    code: Optional[str]
+    queries: Optional[int]
+    error: Optional[str] = None
+    property_id: Any = None
+
+
+def classify_failure(error: APIError) -> str:
+    """
+    Error key for a failed create, singling out uniqueness violations.
+
+    Args:
+        error: Exception raised by the client
+
+    Returns:
+        'duplicate-code', 'duplicate-slug', 'unique-constraint' or the generic key
+    """
+    text = f"{error.message} {json.dumps(error.response or {}, ensure_ascii=False)}".lower()
+    if "unique" in text or "duplicate" in text:
+        if "code" in text:
+            return "duplicate-code"
+        if "slug" in text:
+            return "duplicate-slug"
+        return "unique-constraint"
+    return describe_error(error)
+
+
+def create_property(client: AuthenticatedAPIClient, data: Dict[str, Any]) -> CreateSample:
+    """Create one property and read the code-generation query count."""
+    start = time.perf_counter()
+    try:
+        response = client.post("/api/properties", json_data=data)
+    except APIError as exc:
+        return CreateSample((time.perf_counter() - start) * 1000, None, None, classify_failure(exc))
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    headers = {name.lower(): value for name, value in response.headers.items()}
+    queries = headers.get(QUERIES_HEADER)
+    doc = response.data.get("doc", response.data)
+    return CreateSample(
+        latency_ms,
+        doc.get("code"),
+        int(queries) if queries and queries.isdigit() else None,
+        property_id=doc.get("id"),
+    )
+
+
+def summarize_batch(
+    batch: int,
+    collection_size: int,
+    samples: List[CreateSample],
+    elapsed_s: float
+) -> Dict[str, Any]:
+    """
+    Aggregate one batch.
+
+    Args:
+        batch: Batch number (1-based)
+        collection_size: Properties in the collection when the batch started
+        samples: Create outcomes
+        elapsed_s: Wall time of the batch
+
+    Returns:
+        JSON-serializable summary
+    """
+    created = [sample for sample in samples if not sample.error]
+    queries = [sample.queries for sample in created if sample.queries is not None]
+    codes = Counter(sample.code for sample in created if sample.code)
+
+    return {
+        "batch": batch,
+        "collection_size": collection_size,
+        "requests": len(samples),
+        "created": len(created),
+        "elapsed_s": elapsed_s,
+        "throughput_rps": len(samples) / elapsed_s if elapsed_s > 0 else 0.0,
+        "latency_ms": latency_summary([sample.latency_ms for sample in created]),
+        "queries": {
+            "mean": sum(queries) / len(queries) if queries else None,
+            "max": max(queries) if queries else None,
+            "histogram": {str(count): total for count, total in sorted(Counter(queries).items())},
+        },
+        "failures": dict(Counter(sample.error for sample in samples if sample.error)),
+        "duplicate_codes": {code: count for code, count in codes.items() if count > 1},
+    }
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Human-readable table of the batch summaries."""
+    lines = [
+        f"{'lote':>4} {'imóveis':>8} {'req':>5} {'req/s':>6} {'p50':>6} {'p90':>6} {'p99':>6} "
+        f"{'queries':>8} {'q max':>6} {'dup':>4}   falhas"
+    ]
+    for result in results:
+        latency = result["latency_ms"]
+        queries = result["queries"]
+        lines.append(
+            f"{result['batch']:>4} {result['collection_size']:>8} {result['requests']:>5} "
+            f"{result['throughput_rps']:>6.1f} {latency['p50'] or 0:>6.0f} {latency['p90'] or 0:>6.0f} "
+            f"{latency['p99'] or 0:>6.0f} {queries['mean'] or 0:>8.1f} {queries['max'] or 0:>6} "
+            f"{len(result['duplicate_codes']):>4}   {result['failures'] or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = base_parser(
+        "python -m loadtest.benchmarks.auto_code",
+        "Benchmark de concorrência da geração de códigos de imóveis (autoCode).",
+    )
+    parser.set_defaults(clients=16)
+    parser.add_argument("--batches", type=int, default=5, help="Lotes consecutivos de criação")
+    parser.add_argument("--batch-size", type=int, default=400, help="Imóveis criados por lote")
+    parser.add_argument("--cleanup", action="store_true", help="Remove os imóveis criados ao final")
+    args = parser.parse_args(argv)
+
+    token = login_token(args.base_url, ADMIN_CREDENTIALS, timeout=args.timeout)
+    seeder = AdminDatasetSeeder(args.base_url, token, timeout=args.timeout)
+    try:
+        refs = seeder.get_references()
+    finally:
+        seeder.close()
+
+    run_id = uuid.uuid4().hex[:8]
+
+    def _property_data(index: int) -> Dict[str, Any]:
+        data = PropertyFactory.minimal(refs["neighborhood"], refs["media"], refs["agent"])
+        data["title"] = f"{BENCH_PREFIX} Imóvel {run_id} {index:06d}"
+        return data
+
+    results = []
+    created_ids: List[Any] = []
+    with AuthenticatedAPIClient(args.base_url, token, timeout=args.timeout) as admin:
+        for batch in range(args.batches):
+            collection_size = int(admin.find("properties", limit=1).get("totalDocs", 0))
+            offset = batch * args.batch_size
+            samples, elapsed = run_clients(
+                args.clients,
+                args.batch_size,
+                make_state=lambda index: AuthenticatedAPIClient(args.base_url, token, timeout=args.timeout),
+                send=lambda client, index: create_property(client, _property_data(offset + index)),
+                close_state=lambda client: client.close(),
+            )
+            created_ids.extend(sample.property_id for sample in samples if sample.property_id is not None)
+            results.append(summarize_batch(batch + 1, collection_size, samples, elapsed))
+
+        print(format_results(results))
+
+        if args.cleanup:
+            for property_id in created_ids:
+                admin.delete("properties", property_id)
+            print(f"\n{len(created_ids)} imóveis removidos")
+
+    summary = {
+        "benchmark": "auto-code",
+        "settings": {
+            "base_url": args.base_url,
+            "clients": args.clients,
+            "batches": args.batches,
+            "batch_size": args.batch_size,
+        },
+        "results": results,
+    }
+    save_results(args, summary, dataset={
+        "clients": args.clients,
+        "batches": args.batches,
+        "batch_size": args.batch_size,
+    })
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Building blocks shared by the contention benchmarks.
+
+Unlike the open-loop runner, benchmarks drive a fixed number of concurrent
+clients in a closed loop: each client sends its next request as soon as the
+previous one answers, until the request budget is spent. That is the worst
+case for optimistic concurrency, which is what these benchmarks measure.
+"""
+
+import argparse
+import bisect
+import itertools
+import os
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..report import write_report
+from ..stats import PERCENTILES, percentile
+from ..trend import record_run
+
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# WORKLOAD
+# =============================================================================
+
+class ZipfSampler:
+    """Pick items with probability proportional to 1 / rank^exponent."""
+
+    def __init__(self, items: Sequence[T], exponent: float = 1.1, rng: random.Random = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            items: Items ordered from hottest to coldest
+            exponent: Zipf exponent (0 = uniform, larger = more skewed)
+            rng: Random generator
+
+        Raises:
+            ValueError: If there are no items
+        """
+        if not items:
+            raise ValueError("ZipfSampler requer ao menos um item")
+
+        self.items = list(items)
+        self.random = rng or random.Random()
+        weights = [1 / rank ** exponent for rank in range(1, len(self.items) + 1)]
+        self._cumulative = list(itertools.accumulate(weights))
+        self._lock = threading.Lock()
+
+    def sample(self) -> T:
+        """Next item (thread-safe)."""
+        with self._lock:
+            point = self.random.random() * self._cumulative[-1]
+        return self.items[bisect.bisect_left(self._cumulative, point)]
+
+
+def run_clients(
+    clients: int,
+    total_requests: int,
+    make_state: Callable[[int], Any],
+    send: Callable[[Any, int], T],
+    close_state: Callable[[Any], None] = lambda state: None
+) -> Tuple[List[T], float]:
+    """
+    Run `total_requests` requests over `clients` concurrent closed-loop clients.
+
+    Args:
+        clients: Concurrent clients (one thread each)
+        total_requests: Requests shared among the clients
+        make_state: Builds per-client state (e.g. an HTTP session) from the client index
+        send: Sends one request with the client state and request index; returns a sample
+        close_state: Releases per-client state
+
+    Returns:
+        Samples in completion order and elapsed wall time in seconds
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+    samples: List[T] = []
+
+    def _client(index: int) -> None:
+        state = make_state(index)
+        try:
+            while True:
+                with lock:
+                    request_index = next(counter)
+                if request_index >= total_requests:
+                    return
+                sample = send(state, request_index)
+                with lock:
+                    samples.append(sample)
+        finally:
+            close_state(state)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients, thread_name_prefix="bench") as pool:
+        for future in [pool.submit(_client, index) for index in range(clients)]:
+            future.result()
+    return samples, time.perf_counter() - start
+
+
+def latency_summary(values: List[float]) -> Dict[str, Any]:
+    """Percentiles and max of latencies in ms."""
+    summary: Dict[str, Any] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    summary["max"] = max(values) if values else None
+    return summary
+
+
+# =============================================================================
+# SERVER RESOURCES
+# =============================================================================
+
+def read_rss_mb(pid: int) -> Optional[float]:
+    """
+    Resident memory of a process in MB.
+
+    Reads /proc on Linux and falls back to `ps` elsewhere.
+
+    Args:
+        pid: Process id (e.g. of `next start`)
+
+    Returns:
+        RSS in MB, None if the process cannot be read
+    """
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(pid)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return int(output) / 1024 if output else None
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+class RssSampler:
+    """Samples the RSS of the server process in a background thread."""
+
+    def __init__(self, pid: Optional[int], interval: float = 0.2):
+        """
+        Initialize the sampler.
+
+        Args:
+            pid: Server process id; without it the sampler records nothing
+            interval: Seconds between samples
+        """
+        self.pid = pid
+        self.interval = interval
+        self.samples: List[float] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "RssSampler":
+        if self.pid:
+            self._sample()
+            self._thread = threading.Thread(target=self._loop, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = read_rss_mb(self.pid)
+        if rss is not None:
+            self.samples.append(rss)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def summary(self) -> Optional[Dict[str, float]]:
+        """RSS before, at peak and after the sampled block (MB), None without samples."""
+        if not self.samples:
+            return None
+        return {
+            "before_mb": self.samples[0],
+            "peak_mb": max(self.samples),
+            "after_mb": self.samples[-1],
+        }
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def base_parser(prog: str, description: str) -> argparse.ArgumentParser:
+    """Argument parser with the options every benchmark shares."""
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("PAYLOAD_BASE_URL", "http://localhost:3000"),
+        help="URL da aplicação (default: PAYLOAD_BASE_URL ou http://localhost:3000)",
+    )
+    parser.add_argument("--clients", type=int, default=32, help="Clientes concorrentes")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests por modo")
+    parser.add_argument("--seed", type=int, default=None, help="Seed da distribuição de chaves")
+    parser.add_argument("--timeout", type=int, default=30, help="Timeout por request em segundos")
+    parser.add_argument("--output", default=None, help="Arquivo JSON com os resultados")
+    parser.add_argument(
+        "--server-pid",
+        type=int,
+        default=int(os.getenv("LOADTEST_SERVER_PID", "0")) or None,
+        help="PID do servidor Next.js para amostrar memória (default: LOADTEST_SERVER_PID)",
+    )
+    parser.add_argument("--store", default=None, help="Histórico de resultados (default: LOADTEST_RESULTS_STORE)")
+    parser.add_argument("--no-store", action="store_true", help="Não registra a execução no histórico")
+    return parser
+
+
+def save_results(args: argparse.Namespace, summary: Dict[str, Any], dataset: Dict[str, Any]) -> None:
+    """
+    Write the summary to `--output` and append it to the results history.
+
+    Args:
+        args: Parsed `base_parser` options
+        summary: Benchmark summary (with its `benchmark` name)
+        dataset: What the run was measured against, the comparison key across commits
+    """
+    if args.output:
+        print(f"\nResultados salvos em {write_report(args.output, summary)}")
+    if not args.no_store:
+        path = record_run(summary["benchmark"], summary, dataset, args.base_url, args.store)
+        print(f"Execução registrada em {path}")
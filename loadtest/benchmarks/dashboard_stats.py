@@ -0,0 +1,241 @@
+"""
+Scaling benchmark for `GET /api/dashboard-stats` over deal volume.
+
+The route computes its KPIs with one aggregate query and caches them in
+memory until a hook on properties, leads or deals invalidates them (or the
+TTL expires), so latency should stay flat as the sales history grows. The
+benchmark tops the database up to each volume of signed deals (1k, 10k,
+100k by default) and, at each level, measures:
+
+- sequential latency (one admin opening the dashboard); the first request
+  after seeding is a cache miss;
+- latency and throughput with many admins polling concurrently;
+- the share of responses served from the cache (`X-Dashboard-Stats-Cache`);
+- server RSS before, at peak and after (`--server-pid`).
+
+    python -m loadtest.benchmarks.dashboard_stats --levels 1000,10000,100000 --server-pid $(pgrep -f "next start")
+
+Seeding goes through the REST API and is incremental: signed deals already
+in the database count towards each level. Run it against a dedicated
+database (DATABASE_URL).
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from tests.api.fixtures import LeadFactory, PropertyFactory
+from tests.api.utils import APIError, AuthenticatedAPIClient
+from tests.perf.admin_dataset import AdminDatasetSeeder
+
+from ..auth import ADMIN_CREDENTIALS, login_token
+from ..stats import describe_error
+from .common import RssSampler, base_parser, latency_summary, run_clients, save_results
+
+
+BENCH_PREFIX = "[bench]"
+SIGNED_STAGE = "signed"
+DASHBOARD_ENDPOINT = "/api/dashboard-stats"
+CACHE_HEADER = "x-dashboard-stats-cache"
+
+
+def count_signed_deals(admin: AuthenticatedAPIClient) -> int:
+    """Signed deals in the database (the ones the route sums)."""
+    result = admin.find("deals", where={"stage": {"equals": SIGNED_STAGE}}, limit=1)
+    return int(result.get("totalDocs", 0))
+
+
+def ensure_deal_references(admin: AuthenticatedAPIClient, refs: Dict[str, Any]) -> Dict[str, Any]:
+    """Lead and property shared by the seeded deals (created once, then reused)."""
+    leads = admin.find("leads", where={"name": {"like": f"{BENCH_PREFIX} Dashboard"}}, limit=1)["docs"]
+    if leads:
+        lead_id = leads[0]["id"]
+    else:
+        lead = LeadFactory.minimal()
+        lead["name"] = f"{BENCH_PREFIX} Dashboard {lead['name']}"
+        lead_id = admin.create("leads", lead)["id"]
+
+    properties = admin.find("properties", where={"title": {"like": f"{BENCH_PREFIX} Dashboard"}}, limit=1)["docs"]
+    if properties:
+        property_id = properties[0]["id"]
+    else:
+        data = PropertyFactory.minimal(refs["neighborhood"], refs["media"], refs["agent"])
+        data["title"] = f"{BENCH_PREFIX} Dashboard Imóvel"
+        property_id = admin.create("properties", data)["id"]
+
+    return {"lead": lead_id, "property": property_id, "agent": refs["agent"]}
+
+
+def seed_signed_deals(base_url: str, token: str, missing: int, refs: Dict[str, Any], args: Any) -> Dict[str, int]:
+    """
+    Create `missing` signed deals with a thread pool.
+
+    Returns:
+        Failures by error key (empty when every create succeeded)
+    """
+    def _create(client: AuthenticatedAPIClient, index: int) -> Optional[str]:
+        asking = random.randint(300000, 2000000)
+        try:
+            client.create("deals", {
+                "title": f"{BENCH_PREFIX} Negócio assinado {index:06d}",
+                "lead": refs["lead"],
+                "property": refs["property"],
+                "agent": refs["agent"],
+                "askingPrice": asking,
+                "offerPrice": asking,
+                "finalPrice": int(asking * random.uniform(0.9, 1.0)),
+                "stage": SIGNED_STAGE,
+            })
+        except APIError as exc:
+            return describe_error(exc)
+        return None
+
+    failures, _ = run_clients(
+        args.seed_workers,
+        missing,
+        make_state=lambda index: AuthenticatedAPIClient(base_url, token, timeout=args.timeout),
+        send=_create,
+        close_state=lambda client: client.close(),
+    )
+    return dict(Counter(failure for failure in failures if failure))
+
+
+def fetch_dashboard(client: AuthenticatedAPIClient) -> Dict[str, Any]:
+    """One dashboard request: latency, error key and whether it hit the cache."""
+    start = time.perf_counter()
+    cache_hit = False
+    try:
+        response = client.get(DASHBOARD_ENDPOINT)
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        cache_hit = headers.get(CACHE_HEADER) == "hit"
+        error = None
+    except APIError as exc:
+        error = describe_error(exc)
+    return {"latency_ms": (time.perf_counter() - start) * 1000, "error": error, "cache_hit": cache_hit}
+
+
+def cache_hit_ratio(samples: List[Dict[str, Any]]) -> float:
+    """Fraction of the samples answered from the server-side cache."""
+    return sum(1 for sample in samples if sample["cache_hit"]) / len(samples) if samples else 0.0
+
+
+def measure_level(base_url: str, token: str, signed_deals: int, args: Any) -> Dict[str, Any]:
+    """Sequential and concurrent dashboard measurements at the current volume."""
+    with AuthenticatedAPIClient(base_url, token, timeout=args.timeout) as client:
+        with RssSampler(args.server_pid) as sequential_rss:
+            sequential = [fetch_dashboard(client) for _ in range(args.samples)]
+
+    with RssSampler(args.server_pid) as concurrent_rss:
+        concurrent, elapsed = run_clients(
+            args.clients,
+            args.requests,
+            make_state=lambda index: AuthenticatedAPIClient(base_url, token, timeout=args.timeout),
+            send=lambda client, index: fetch_dashboard(client),
+            close_state=lambda client: client.close(),
+        )
+
+    return {
+        "signed_deals": signed_deals,
+        "sequential": {
+            "latency_ms": latency_summary([sample["latency_ms"] for sample in sequential]),
+            "errors": dict(Counter(sample["error"] for sample in sequential if sample["error"])),
+            "cache_hit_ratio": cache_hit_ratio(sequential),
+            "rss": sequential_rss.summary(),
+        },
+        "concurrent": {
+            "clients": args.clients,
+            "requests": len(concurrent),
+            "throughput_rps": len(concurrent) / elapsed if elapsed > 0 else 0.0,
+            "latency_ms": latency_summary([sample["latency_ms"] for sample in concurrent]),
+            "errors": dict(Counter(sample["error"] for sample in concurrent if sample["error"])),
+            "cache_hit_ratio": cache_hit_ratio(concurrent),
+            "rss": concurrent_rss.summary(),
+        },
+    }
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Human-readable table of the level summaries."""
+    lines = [
+        f"{'assinados':>9}   {'seq p50':>7} {'seq p90':>7}   {'conc p50':>8} {'conc p99':>8} "
+        f"{'req/s':>6} {'erros':>5} {'cache':>5}   {'RSS pico':>8} {'Δ RSS':>6}"
+    ]
+    for result in results:
+        sequential, concurrent = result["sequential"], result["concurrent"]
+        rss = concurrent["rss"]
+        peak = f"{rss['peak_mb']:.0f}" if rss else "-"
+        delta = f"{rss['after_mb'] - rss['before_mb']:+.0f}" if rss else "-"
+        lines.append(
+            f"{result['signed_deals']:>9}   {sequential['latency_ms']['p50'] or 0:>7.0f} "
+            f"{sequential['latency_ms']['p90'] or 0:>7.0f}   {concurrent['latency_ms']['p50'] or 0:>8.0f} "
+            f"{concurrent['latency_ms']['p99'] or 0:>8.0f} {concurrent['throughput_rps']:>6.1f} "
+            f"{sum(concurrent['errors'].values()):>5} {concurrent['cache_hit_ratio']:>5.0%}   {peak:>8} {delta:>6}"
+        )
+    lines.append("(latências em ms, RSS em MB do processo --server-pid)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = base_parser(
+        "python -m loadtest.benchmarks.dashboard_stats",
+        "Benchmark de escala do /api/dashboard-stats pelo volume de negócios assinados.",
+    )
+    parser.set_defaults(clients=16, requests=200)
+    parser.add_argument("--levels", default="1000,10000,100000", help="Volumes de negócios assinados")
+    parser.add_argument("--samples", type=int, default=10, help="Requests sequenciais por volume")
+    parser.add_argument("--seed-workers", type=int, default=8, help="Requests simultâneos ao semear")
+    parser.add_argument("--no-seed", action="store_true", help="Mede só o volume atual, sem semear")
+    args = parser.parse_args(argv)
+
+    levels = sorted(int(level) for level in args.levels.split(",") if level.strip())
+    token = login_token(args.base_url, ADMIN_CREDENTIALS, timeout=args.timeout)
+
+    refs = None
+    if not args.no_seed:
+        seeder = AdminDatasetSeeder(args.base_url, token, timeout=args.timeout)
+        try:
+            refs = seeder.get_references()
+        finally:
+            seeder.close()
+
+    results = []
+    with AuthenticatedAPIClient(args.base_url, token, timeout=args.timeout) as admin:
+        deal_refs = ensure_deal_references(admin, refs) if refs else None
+
+        for level in ([count_signed_deals(admin)] if args.no_seed else levels):
+            current = count_signed_deals(admin)
+            if deal_refs and current < level:
+                print(f"Semeando {level - current} negócios assinados ({current} → {level})...")
+                failures = seed_signed_deals(args.base_url, token, level - current, deal_refs, args)
+                if failures:
+                    print(f"Falhas ao semear: {failures}")
+                    return 1
+                current = count_signed_deals(admin)
+
+            results.append(measure_level(args.base_url, token, current, args))
+
+    print(format_results(results))
+
+    summary = {
+        "benchmark": "dashboard-stats",
+        "settings": {
+            "base_url": args.base_url,
+            "levels": levels,
+            "clients": args.clients,
+            "requests": args.requests,
+            "samples": args.samples,
+        },
+        "results": results,
+    }
+    save_results(args, summary, dataset={
+        "signed_deals": [result["signed_deals"] for result in results],
+        "clients": args.clients,
+        "requests": args.requests,
+    })
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
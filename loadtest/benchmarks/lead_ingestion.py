@@ -0,0 +1,284 @@
+"""
+Lead ingestion throughput and distribution-fairness benchmark.
+
+Every lead create runs `normalizeLeadPhone`, `updateLeadScore` and
+`distributeLead` (an atomic round-robin counter increment over a cached
+agent roster) in `beforeChange`, so the lead is inserted once, already
+scored and assigned. Leads are submitted open-loop at increasing rates, in
+two variants:
+
+- `auto`: no `assignedTo`, so `distributeLead` round-robins the lead;
+- `preassigned`: the client assigns agents round-robin and the hook skips.
+
+For each variant and rate the benchmark reports p95 create latency (service
+and coordinated-omission corrected), writes per lead and how evenly the leads
+landed across active agents. Writes come from the `X-Lead-Writes` response
+header that the old afterChange hooks set; without it a lead counts as one
+write, which is what the single-write pipeline should show.
+Each create takes its own cursor position, so concurrent creates should
+still spread evenly: a spread between agents, a Jain fairness index below 1
+or consecutive leads given to the same agent point to a distribution bug.
+
+    python -m loadtest.benchmarks.lead_ingestion --rates 1,2,5,10 --stage-duration 30
+
+Created leads carry `BENCH_PREFIX` in the name; `--cleanup` deletes them.
+"""
+
+import itertools
+import sys
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from tests.api.fixtures import LeadFactory
+from tests.api.utils import AuthenticatedAPIClient
+
+from ..auth import ADMIN_CREDENTIALS, AGENT_CREDENTIALS, login_token
+from ..dsl import Scenario, SharedData, VirtualUser
+from ..runner import ARRIVAL_MODES, ARRIVAL_POISSON, LoadRunner
+from .common import base_parser, save_results
+
+
+BENCH_PREFIX = "[bench]"
+WRITES_HEADER = "x-lead-writes"
+
+VARIANT_AUTO = "auto"
+VARIANT_PREASSIGNED = "preassigned"
+VARIANTS = (VARIANT_AUTO, VARIANT_PREASSIGNED)
+
+
+def _relation_id(value: Any) -> Any:
+    """ID of a relationship value, populated or not."""
+    return value.get("id") if isinstance(value, dict) else value
+
+
+def load_active_agents(admin: AuthenticatedAPIClient) -> List[Any]:
+    """IDs of active agents, in the order `distributeLead` rotates them."""
+    result = admin.find(
+        "users",
+        where={"role": {"equals": "agent"}, "active": {"equals": True}},
+        sort="createdAt",
+        limit=100,
+    )
+    return [doc["id"] for doc in result.get("docs", [])]
+
+
+def create_lead(client: AuthenticatedAPIClient, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a lead and return its id and the write count reported by the hooks."""
+    response = client.post("/api/leads", json_data=data)
+    headers = {name.lower(): value for name, value in response.headers.items()}
+    writes = headers.get(WRITES_HEADER)
+    doc = response.data.get("doc", response.data)
+    return {"id": doc.get("id"), "writes": int(writes) if writes and writes.isdigit() else 1}
+
+
+def ingestion_scenario(
+    variant: str,
+    stage_prefix: str,
+    agent_ids: List[Any],
+    outcomes: List[Dict[str, Any]]
+) -> Scenario:
+    """
+    Single-journey scenario creating one lead per arrival.
+
+    Args:
+        variant: 'auto' or 'preassigned'
+        stage_prefix: Name prefix identifying the leads of this stage
+        agent_ids: Active agents (used by the preassigned variant)
+        outcomes: Receives the result of every successful create
+
+    Returns:
+        Scenario for `LoadRunner`
+    """
+    scenario = Scenario(f"lead-ingestion-{variant}")
+    sequence = itertools.count()
+
+    @scenario.journey("create-lead")
+    def _create(user: VirtualUser):
+        # Journey bodies run on the event loop thread, so the counter needs no lock.
+        index = next(sequence)
+        data = LeadFactory.with_phone_and_email()
+        data["name"] = f"{stage_prefix} {index:06d}"
+        data["source"] = "website"
+        if variant == VARIANT_PREASSIGNED:
+            data["assignedTo"] = agent_ids[index % len(agent_ids)]
+
+        outcome = yield "create-lead", lambda: create_lead(user.agent, data)
+        outcomes.append(outcome)
+
+    return scenario
+
+
+def fairness(assignments: List[Any], agent_ids: List[Any]) -> Dict[str, Any]:
+    """
+    How evenly leads were spread across agents.
+
+    Args:
+        assignments: Agent id of each lead in creation order (None = unassigned)
+        agent_ids: Active agents
+
+    Returns:
+        Per-agent counts, spread, Jain index and consecutive repeats
+    """
+    counts = Counter(agent for agent in assignments if agent is not None)
+    per_agent = [counts.get(agent_id, 0) for agent_id in agent_ids]
+    total = sum(per_agent)
+    squares = sum(count * count for count in per_agent)
+    assigned = [agent for agent in assignments if agent is not None]
+
+    return {
+        "per_agent": {str(agent_id): counts.get(agent_id, 0) for agent_id in agent_ids},
+        "unassigned": sum(1 for agent in assignments if agent is None),
+        "spread": max(per_agent) - min(per_agent) if per_agent else 0,
+        "jain_index": (total * total) / (len(per_agent) * squares) if squares else None,
+        # With round-robin and more than one agent, two consecutive leads never share an agent.
+        "consecutive_repeats": (
+            sum(1 for previous, current in zip(assigned, assigned[1:]) if previous == current)
+            if len(agent_ids) > 1 else 0
+        ),
+    }
+
+
+def read_assignments(admin: AuthenticatedAPIClient, stage_prefix: str, expected: int) -> List[Any]:
+    """Agent of each lead of a stage, in creation order."""
+    result = admin.find(
+        "leads",
+        where={"name": {"like": stage_prefix}},
+        sort="createdAt",
+        limit=max(expected, 1),
+    )
+    return [_relation_id(doc.get("assignedTo")) for doc in result.get("docs", [])]
+
+
+def run_stage(
+    stage: int,
+    variant: str,
+    rate: float,
+    run_id: str,
+    agent_ids: List[Any],
+    shared: SharedData,
+    admin: AuthenticatedAPIClient,
+    args: Any
+) -> Dict[str, Any]:
+    """Run one variant at one rate and summarize it."""
+    # Zero-padded so that no stage tag is a substring of another (`like` matches substrings).
+    stage_prefix = f"{BENCH_PREFIX} {run_id}-s{stage:02d}"
+    outcomes: List[Dict[str, Any]] = []
+    runner = LoadRunner(
+        ingestion_scenario(variant, stage_prefix, agent_ids, outcomes),
+        shared,
+        rate=rate,
+        duration=args.stage_duration,
+        workers=args.clients,
+        arrival=args.arrival,
+        seed=args.seed,
+        timeout=args.timeout,
+    )
+    runner.run()
+
+    summary = runner.summary()
+    step = next((step for step in summary["steps"] if step["step"] == "create-lead"), None)
+    writes = [outcome["writes"] for outcome in outcomes]
+
+    return {
+        "variant": variant,
+        "rate": rate,
+        "requests": summary["requests"],
+        "created": len(outcomes),
+        "throughput_rps": summary["throughput_rps"],
+        "errors": summary["errors"],
+        "p95_ms": step["service_ms"]["p95"] if step else None,
+        "p95_corrected_ms": step["corrected_ms"]["p95"] if step else None,
+        "writes_per_lead": {
+            "mean": sum(writes) / len(writes) if writes else None,
+            "histogram": {str(count): total for count, total in sorted(Counter(writes).items())},
+        },
+        "fairness": fairness(read_assignments(admin, stage_prefix, len(outcomes)), agent_ids),
+        "lead_ids": [outcome["id"] for outcome in outcomes],
+    }
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Human-readable table of the stage summaries."""
+    lines = [
+        f"{'variante':<12} {'taxa':>5} {'leads':>6} {'erros':>5} {'p95':>6} {'p95*':>6} "
+        f"{'escritas':>8} {'jain':>5} {'spread':>6} {'repet.':>6} {'s/ corretor':>11}"
+    ]
+    for result in results:
+        fair = result["fairness"]
+        lines.append(
+            f"{result['variant']:<12} {result['rate']:>5g} {result['created']:>6} "
+            f"{sum(result['errors'].values()):>5} {result['p95_ms'] or 0:>6.0f} "
+            f"{result['p95_corrected_ms'] or 0:>6.0f} {result['writes_per_lead']['mean'] or 0:>8.2f} "
+            f"{fair['jain_index'] or 0:>5.3f} {fair['spread']:>6} {fair['consecutive_repeats']:>6} "
+            f"{fair['unassigned']:>11}"
+        )
+    lines.append("(ms; * = corrigido para coordinated omission)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = base_parser(
+        "python -m loadtest.benchmarks.lead_ingestion",
+        "Benchmark de ingestão de leads e justiça da distribuição entre corretores.",
+    )
+    parser.add_argument("--rates", default="1,2,5,10", help="Taxas de chegada (leads/s), separadas por vírgula")
+    parser.add_argument("--stage-duration", type=float, default=30.0, help="Segundos por taxa")
+    parser.add_argument("--variant", choices=VARIANTS, action="append", help="Variante (repetível; default: todas)")
+    parser.add_argument("--arrival", choices=ARRIVAL_MODES, default=ARRIVAL_POISSON)
+    parser.add_argument("--cleanup", action="store_true", help="Remove os leads criados ao final")
+    args = parser.parse_args(argv)
+
+    rates = [float(rate) for rate in args.rates.split(",") if rate.strip()]
+    run_id = uuid.uuid4().hex[:8]
+    admin_token = login_token(args.base_url, ADMIN_CREDENTIALS, timeout=args.timeout)
+    shared = SharedData(
+        base_url=args.base_url.rstrip("/"),
+        agent_token=login_token(args.base_url, AGENT_CREDENTIALS, timeout=args.timeout),
+    )
+
+    with AuthenticatedAPIClient(args.base_url, admin_token, timeout=args.timeout) as admin:
+        agent_ids = load_active_agents(admin)
+        if not agent_ids:
+            print("Nenhum corretor ativo; rode `pnpm db:seed` antes do benchmark.")
+            return 1
+
+        stages = itertools.product(args.variant or VARIANTS, rates)
+        results = [
+            run_stage(stage, variant, rate, run_id, agent_ids, shared, admin, args)
+            for stage, (variant, rate) in enumerate(stages, start=1)
+        ]
+        print(f"{len(agent_ids)} corretores ativos")
+        print(format_results(results))
+
+        if args.cleanup:
+            lead_ids = [lead_id for result in results for lead_id in result["lead_ids"]]
+            for lead_id in lead_ids:
+                admin.delete("leads", lead_id)
+            print(f"\n{len(lead_ids)} leads removidos")
+
+    summary = {
+        "benchmark": "lead-ingestion",
+        "settings": {
+            "base_url": args.base_url,
+            "rates": rates,
+            "stage_duration": args.stage_duration,
+            "workers": args.clients,
+            "agents": len(agent_ids),
+        },
+        "results": [
+            {key: value for key, value in result.items() if key != "lead_ids"}
+            for result in results
+        ],
+    }
+    save_results(args, summary, dataset={
+        "rates": rates,
+        "stage_duration": args.stage_duration,
+        "arrival": args.arrival,
+        "agents": len(agent_ids),
+    })
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
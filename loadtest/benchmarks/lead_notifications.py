@@ -0,0 +1,241 @@
+"""
+Lead notification fan-out benchmark against a local Resend stand-in.
+
+Publishing a property enqueues the `notifyInterestedLeads` job, which walks
+every interested lead with keyset pagination, renders the e-mail once and
+sends it through the Resend batch API (up to 100 recipients per call) with
+bounded concurrency and per-batch retries. The benchmark:
+
+1. starts the HTTP stand-in for the Resend API (`POST /emails/batch`,
+   tests/api/resend_stand_in.py) that records every recipient, the calls in
+   flight and the idempotency keys, optionally adding latency and failing a
+   fraction of the calls;
+2. seeds `--leads` leads with e-mails; a quarter have no interest set, a
+   quarter match the property's neighborhood, category and price band, a
+   quarter want another category and a quarter opted out (`doNotContact`);
+3. publishes a property and waits until the stand-in has received every
+   expected recipient (or `--wait` runs out).
+
+It reports the publish latency, the time until the last e-mail arrived,
+missing, duplicate and unexpected recipients, API calls and the most calls
+in flight at once. The application must point its Resend client at the
+stand-in, with the job worker enabled:
+
+    RESEND_API_KEY=re_test RESEND_BASE_URL=http://127.0.0.1:8025 pnpm start
+    python -m loadtest.benchmarks.lead_notifications --leads 2000 --fail-rate 0.1
+
+Delivery time includes the wait for the next worker run (JOBS_AUTORUN_CRON).
+Seeded leads and the property carry `BENCH_PREFIX`; `--cleanup` deletes them.
+"""
+
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Set
+
+from tests.api.fixtures import LeadFactory, PropertyFactory
+from tests.api.resend_stand_in import ResendStandIn
+from tests.api.utils import APIError, AuthenticatedAPIClient
+from tests.perf.admin_dataset import AdminDatasetSeeder
+
+from ..auth import ADMIN_CREDENTIALS, login_token
+from .common import base_parser, run_clients, save_results
+
+
+BENCH_PREFIX = "[bench]"
+PROPERTY_PRICE = 800_000
+PROPERTY_CATEGORY = "apartment"
+OTHER_CATEGORY = "land"
+
+SEGMENT_ANY = "any"
+SEGMENT_MATCHING = "matching"
+SEGMENT_OTHER_TYPE = "other-type"
+SEGMENT_OPTED_OUT = "opted-out"
+SEGMENTS = (SEGMENT_ANY, SEGMENT_MATCHING, SEGMENT_OTHER_TYPE, SEGMENT_OPTED_OUT)
+NOTIFIED_SEGMENTS = (SEGMENT_ANY, SEGMENT_MATCHING)
+
+
+# =============================================================================
+# DATASET
+# =============================================================================
+
+def lead_data(run_id: str, index: int, refs: Dict[str, Any]) -> Dict[str, Any]:
+    """Lead `index` of the run; its segment cycles through SEGMENTS."""
+    segment = SEGMENTS[index % len(SEGMENTS)]
+    data = LeadFactory.with_phone_and_email()
+    data["name"] = f"{BENCH_PREFIX} {run_id} {index:06d}"
+    data["email"] = f"bench-{run_id}-{index:06d}@example.com"
+    data["status"] = "new"
+    data["assignedTo"] = refs["agent"]
+
+    if segment == SEGMENT_MATCHING:
+        data.update({
+            "neighborhood": refs["neighborhood"],
+            "propertyType": PROPERTY_CATEGORY,
+            "priceRangeMin": PROPERTY_PRICE // 2,
+            "priceRangeMax": PROPERTY_PRICE * 2,
+        })
+    elif segment == SEGMENT_OTHER_TYPE:
+        data["propertyType"] = OTHER_CATEGORY
+    elif segment == SEGMENT_OPTED_OUT:
+        data["doNotContact"] = True
+    return data
+
+
+def seed_leads(args: Any, token: str, run_id: str, refs: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the leads concurrently; returns their ids and the expected recipients."""
+    def _create(client: AuthenticatedAPIClient, index: int) -> Optional[Dict[str, Any]]:
+        data = lead_data(run_id, index, refs)
+        try:
+            doc = client.create("leads", data)
+        except APIError:
+            return None
+        return {"id": doc.get("id"), "email": data["email"], "index": index}
+
+    samples, elapsed = run_clients(
+        args.clients,
+        args.leads,
+        make_state=lambda index: AuthenticatedAPIClient(args.base_url, token, timeout=args.timeout),
+        send=_create,
+        close_state=lambda client: client.close(),
+    )
+    created = [sample for sample in samples if sample]
+    return {
+        "ids": [sample["id"] for sample in created],
+        "expected": {
+            sample["email"] for sample in created
+            if SEGMENTS[sample["index"] % len(SEGMENTS)] in NOTIFIED_SEGMENTS
+        },
+        "excluded": {
+            sample["email"] for sample in created
+            if SEGMENTS[sample["index"] % len(SEGMENTS)] not in NOTIFIED_SEGMENTS
+        },
+        "failed": len(samples) - len(created),
+        "elapsed_s": elapsed,
+    }
+
+
+# =============================================================================
+# RUN
+# =============================================================================
+
+def publish_and_wait(
+    admin: AuthenticatedAPIClient,
+    stand_in: ResendStandIn,
+    property_id: Any,
+    expected: Set[str],
+    wait_s: float
+) -> Dict[str, Any]:
+    """Publish the property and poll the stand-in until every expected lead got the e-mail."""
+    start = time.perf_counter()
+    admin.update("properties", property_id, {"status": "published"})
+    publish_ms = (time.perf_counter() - start) * 1000
+
+    deadline = start + wait_s
+    while stand_in.delivered(expected) < len(expected) and time.perf_counter() < deadline:
+        time.sleep(0.25)
+
+    return {
+        "publish_ms": publish_ms,
+        "delivery_s": (stand_in.last_delivery - start) if stand_in.last_delivery else None,
+        "timed_out": stand_in.delivered(expected) < len(expected),
+    }
+
+
+def format_results(result: Dict[str, Any]) -> str:
+    """Human-readable summary."""
+    delivery = result["delivery_s"]
+    return "\n".join([
+        f"leads semeados: {result['leads']} ({result['expected']} elegíveis)",
+        f"publicação: {result['publish_ms']:.0f} ms",
+        f"último e-mail: {f'{delivery:.1f} s' if delivery is not None else '-'} após publicar"
+        f"{' (timeout)' if result['timed_out'] else ''}",
+        f"entregues: {result['delivered']}  faltando: {result['missing']}  "
+        f"duplicados: {result['duplicates']}  indevidos: {result['unexpected']}",
+        f"chamadas à API: {result['api_calls']} (falhas injetadas: {result['failed_calls']}, "
+        f"repetidas por idempotência: {result['replayed_calls']})  simultâneas (máx.): {result['max_in_flight']}",
+    ])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = base_parser(
+        "python -m loadtest.benchmarks.lead_notifications",
+        "Benchmark do envio de notificações de imóvel publicado contra um stand-in local do Resend.",
+    )
+    parser.set_defaults(clients=16)
+    parser.add_argument("--leads", type=int, default=1000, help="Leads semeados (1/2 deles elegíveis)")
+    parser.add_argument("--stand-in-host", default="127.0.0.1", help="Interface do stand-in do Resend")
+    parser.add_argument("--stand-in-port", type=int, default=8025, help="Porta do stand-in (RESEND_BASE_URL da aplicação)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Latência adicionada a cada chamada do stand-in")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fração das chamadas respondidas com HTTP 503")
+    parser.add_argument("--wait", type=float, default=120.0, help="Segundos aguardando as entregas após publicar")
+    parser.add_argument("--cleanup", action="store_true", help="Remove os leads e o imóvel criados ao final")
+    args = parser.parse_args(argv)
+
+    token = login_token(args.base_url, ADMIN_CREDENTIALS, timeout=args.timeout)
+    seeder = AdminDatasetSeeder(args.base_url, token, timeout=args.timeout)
+    try:
+        refs = seeder.get_references()
+    finally:
+        seeder.close()
+
+    run_id = uuid.uuid4().hex[:8]
+    stand_in = ResendStandIn(args.stand_in_host, args.stand_in_port, args.latency_ms, args.fail_rate, args.seed)
+
+    with stand_in, AuthenticatedAPIClient(args.base_url, token, timeout=args.timeout) as admin:
+        leads = seed_leads(args, token, run_id, refs)
+
+        property_data = PropertyFactory.minimal(refs["neighborhood"], refs["media"], refs["agent"])
+        property_data.update({
+            "title": f"{BENCH_PREFIX} Imóvel {run_id}",
+            "category": PROPERTY_CATEGORY,
+            "price": PROPERTY_PRICE,
+        })
+        property_id = admin.create("properties", property_data)["id"]
+
+        timing = publish_and_wait(admin, stand_in, property_id, leads["expected"], args.wait)
+
+        counts = stand_in.recipient_counts(run_id)
+        delivered = stand_in.delivered(leads["expected"])
+        result = {
+            "leads": len(leads["ids"]),
+            "seed_failures": leads["failed"],
+            "expected": len(leads["expected"]),
+            "delivered": delivered,
+            "missing": len(leads["expected"]) - delivered,
+            "duplicates": sum(count - 1 for count in counts.values() if count > 1),
+            "unexpected": sum(1 for address in leads["excluded"] if counts.get(address)),
+            "api_calls": stand_in.calls,
+            "failed_calls": stand_in.failed_calls,
+            "replayed_calls": stand_in.replayed_calls,
+            "max_in_flight": stand_in.max_in_flight,
+            **timing,
+        }
+        print(format_results(result))
+
+        if args.cleanup:
+            admin.delete("properties", property_id)
+            for lead_id in leads["ids"]:
+                admin.delete("leads", lead_id)
+            print(f"\n{len(leads['ids'])} leads e 1 imóvel removidos")
+
+    summary = {
+        "benchmark": "lead-notifications",
+        "settings": {
+            "base_url": args.base_url,
+            "leads": args.leads,
+            "latency_ms": args.latency_ms,
+            "fail_rate": args.fail_rate,
+        },
+        "results": [result],
+    }
+    save_results(args, summary, dataset={
+        "leads": args.leads,
+        "latency_ms": args.latency_ms,
+        "fail_rate": args.fail_rate,
+    })
+    return 0 if result["missing"] == 0 and result["duplicates"] == 0 and result["unexpected"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
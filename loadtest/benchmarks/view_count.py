@@ -0,0 +1,233 @@
+"""
+Contention benchmark for `POST /api/properties/[id]/view`.
+
+The endpoint appends the view to an in-process write-behind buffer
+(`lib/view-counter.ts`) that adds the increments to `viewCount` on every
+flush and drops repeat views of a visitor within the dedupe window. N
+concurrent clients hammer either one hot property (`hot`, a featured
+property on the home page during a burst) or a Zipf-distributed set of
+properties (`zipf`), picked among the published ones (the endpoint answers
+404 for drafts). For each mode the benchmark reports throughput,
+deduplicated views and lost increments: counted views that are missing from
+the final `viewCount`, read after waiting `--flush-wait` seconds for the
+buffer to flush.
+
+Each request comes from its own visitor (`X-Forwarded-For`) unless
+`--visitors` limits the pool, which exercises the deduplication.
+
+    python -m loadtest.benchmarks.view_count --clients 32 --requests 2000
+
+Run it against an otherwise idle server: any other view traffic on the same
+properties shows up as negative lost increments.
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from tests.api.utils import AnonymousAPIClient, APIError
+
+from ..stats import describe_error
+from .common import ZipfSampler, base_parser, latency_summary, run_clients, save_results
+
+
+MODE_HOT = "hot"
+MODE_ZIPF = "zipf"
+MODES = (MODE_HOT, MODE_ZIPF)
+
+
+@dataclass(frozen=True)
+class ViewSample:
+    """Outcome of one view-count request."""
+    property_id: Any
+    status: int
+    counted: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+
+def load_property_ids(client: AnonymousAPIClient, limit: int) -> List[Any]:
+    """Ids of the most recent published properties, hottest first."""
+    response = client.get("/api/properties", params={
+        "limit": limit,
+        "depth": 0,
+        "sort": "-createdAt",
+        "where[status][equals]": "published",
+    })
+    return [doc["id"] for doc in response.docs]
+
+
+def read_view_counts(client: AnonymousAPIClient, property_ids: List[Any]) -> Dict[Any, int]:
+    """Current `viewCount` of each property."""
+    counts = {}
+    for property_id in property_ids:
+        doc = client.get(f"/api/properties/{property_id}", params={"depth": 0}).data
+        counts[property_id] = doc.get("viewCount") or 0
+    return counts
+
+
+def visitor_ip(index: int) -> str:
+    """Client address of visitor `index` (sent as X-Forwarded-For)."""
+    return f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+
+
+def send_view(client: AnonymousAPIClient, property_id: Any, visitor: int) -> ViewSample:
+    """Register one view as `visitor` and classify the response."""
+    start = time.perf_counter()
+    try:
+        response = client.post(
+            f"/api/properties/{property_id}/view",
+            headers={"X-Forwarded-For": visitor_ip(visitor)},
+        )
+        status, body, error = response.status_code, response.data, None
+    except APIError as exc:
+        status, body, error = exc.status_code or 0, exc.response, describe_error(exc)
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    counted = status == 200 and (body.get("counted", True) if isinstance(body, dict) else True)
+    return ViewSample(property_id, status, counted, latency_ms, error)
+
+
+def summarize_mode(
+    mode: str,
+    samples: List[ViewSample],
+    elapsed_s: float,
+    before: Dict[Any, int],
+    after: Dict[Any, int]
+) -> Dict[str, Any]:
+    """
+    Aggregate the samples of one mode.
+
+    Args:
+        mode: 'hot' or 'zipf'
+        samples: Request outcomes
+        elapsed_s: Wall time of the mode
+        before: viewCount per property before the run
+        after: viewCount per property after the run
+
+    Returns:
+        JSON-serializable summary
+    """
+    successes = Counter(sample.property_id for sample in samples if sample.counted)
+    deduplicated = sum(1 for sample in samples if sample.status == 200 and not sample.counted)
+    errors = Counter(sample.error for sample in samples if sample.error)
+
+    lost_by_property = {
+        property_id: successes[property_id] - (after[property_id] - before[property_id])
+        for property_id in before
+    }
+    lost = {property_id: count for property_id, count in lost_by_property.items() if count}
+
+    return {
+        "mode": mode,
+        "requests": len(samples),
+        "elapsed_s": elapsed_s,
+        "throughput_rps": len(samples) / elapsed_s if elapsed_s > 0 else 0.0,
+        "successes": sum(successes.values()),
+        "deduplicated": deduplicated,
+        "errors": dict(errors),
+        "latency_ms": latency_summary([sample.latency_ms for sample in samples]),
+        "lost_increments": sum(lost_by_property.values()),
+        "lost_by_property": {str(property_id): count for property_id, count in lost.items()},
+    }
+
+
+def run_mode(mode: str, property_ids: List[Any], args: Any) -> Dict[str, Any]:
+    """Run one mode and summarize it."""
+    targets = property_ids[:1] if mode == MODE_HOT else property_ids
+    sampler = ZipfSampler(targets, exponent=args.zipf_exponent, rng=random.Random(args.seed))
+    # Fresh visitor addresses per mode, so earlier runs do not hit the dedupe window.
+    first_visitor = random.randrange(1 << 23)
+
+    with AnonymousAPIClient(args.base_url, timeout=args.timeout) as reader:
+        before = read_view_counts(reader, targets)
+        samples, elapsed = run_clients(
+            args.clients,
+            args.requests,
+            make_state=lambda index: AnonymousAPIClient(args.base_url, timeout=args.timeout),
+            send=lambda client, index: send_view(
+                client, sampler.sample(), first_visitor + (index % args.visitors if args.visitors else index)
+            ),
+            close_state=lambda client: client.close(),
+        )
+        # Counted views reach viewCount on the next flush of the server buffer.
+        time.sleep(args.flush_wait)
+        after = read_view_counts(reader, targets)
+
+    return summarize_mode(mode, samples, elapsed, before, after)
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Human-readable table of the mode summaries."""
+    lines = [
+        f"{'modo':<6} {'req':>6} {'req/s':>7} {'contadas':>8} {'dedup':>6} "
+        f"{'p50':>6} {'p99':>6} {'perdidos':>8}"
+    ]
+    for result in results:
+        latency = result["latency_ms"]
+        lines.append(
+            f"{result['mode']:<6} {result['requests']:>6} {result['throughput_rps']:>7.1f} "
+            f"{result['successes']:>8} {result['deduplicated']:>6} "
+            f"{latency['p50'] or 0:>6.0f} {latency['p99'] or 0:>6.0f} "
+            f"{result['lost_increments']:>8}"
+        )
+        if result["errors"]:
+            lines.append(f"       erros: {result['errors']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = base_parser(
+        "python -m loadtest.benchmarks.view_count",
+        "Benchmark de contenção do contador de visualizações.",
+    )
+    parser.add_argument("--mode", choices=MODES, action="append", help="Modo (repetível; default: todos)")
+    parser.add_argument("--properties", type=int, default=50, help="Imóveis no conjunto Zipf")
+    parser.add_argument("--zipf-exponent", type=float, default=1.1, help="Expoente da distribuição Zipf")
+    parser.add_argument("--property-id", default=None, help="Imóvel quente do modo hot, publicado (default: o publicado mais recente)")
+    parser.add_argument("--visitors", type=int, default=0, help="Visitantes distintos (default: um por request)")
+    parser.add_argument(
+        "--flush-wait",
+        type=float,
+        default=6.0,
+        help="Segundos de espera pelo flush do buffer antes de ler viewCount (VIEW_COUNT_FLUSH_MS + margem)",
+    )
+    args = parser.parse_args(argv)
+
+    with AnonymousAPIClient(args.base_url, timeout=args.timeout) as client:
+        property_ids = load_property_ids(client, args.properties)
+    if not property_ids:
+        print("Nenhum imóvel publicado encontrado; rode `pnpm db:seed` antes do benchmark.")
+        return 1
+    if args.property_id:
+        property_ids = [args.property_id] + [pid for pid in property_ids if str(pid) != args.property_id]
+
+    results = [run_mode(mode, property_ids, args) for mode in (args.mode or MODES)]
+    print(format_results(results))
+
+    summary = {
+        "benchmark": "view-count",
+        "settings": {
+            "base_url": args.base_url,
+            "clients": args.clients,
+            "requests": args.requests,
+            "properties": len(property_ids),
+            "zipf_exponent": args.zipf_exponent,
+        },
+        "results": results,
+    }
+    save_results(args, summary, dataset={
+        "properties": len(property_ids),
+        "zipf_exponent": args.zipf_exponent,
+        "visitors": args.visitors,
+        "clients": args.clients,
+        "requests": args.requests,
+    })
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
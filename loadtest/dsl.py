@@ -0,0 +1,186 @@
+"""
+Scenario DSL for the load generator.
+
+A scenario is a set of weighted journeys. A journey is a generator function
+that receives a `VirtualUser` and yields `(step_name, callable)` pairs; the
+runner executes each callable in a worker thread, times it, and sends its
+return value back into the generator so later steps can use it:
+
+    campaign = Scenario("campaign")
+
+    @campaign.journey("detail", weight=40)
+    def detail(user):
+        prop = user.pick_property()
+        yield "detail-page", lambda: user.anonymous.get(f"/imoveis/{prop.slug}")
+        yield "view-count", lambda: user.anonymous.post(f"/api/properties/{prop.id}/view")
+
+Step callables use the blocking clients from `tests.api.utils`, so the
+event loop only schedules arrivals and never blocks on I/O.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+from tests.api.utils import AnonymousAPIClient, AuthenticatedAPIClient
+
+
+StepAction = Callable[[], Any]
+JourneyGenerator = Generator[Tuple[str, StepAction], Any, None]
+JourneyFunction = Callable[["VirtualUser"], JourneyGenerator]
+
+
+# =============================================================================
+# SHARED DATA
+# =============================================================================
+
+@dataclass(frozen=True)
+class PropertyRef:
+    """Property addressable by the public site (slug) and the API (id)."""
+    id: Any
+    slug: str
+
+
+@dataclass
+class SharedData:
+    """Read-only data loaded once before the run and shared by every user."""
+    base_url: str
+    agent_token: Optional[str] = None
+    properties: List[PropertyRef] = field(default_factory=list)
+    public_slugs: List[str] = field(default_factory=list)
+
+
+# =============================================================================
+# VIRTUAL USER
+# =============================================================================
+
+class VirtualUser:
+    """
+    One arrival of the open-loop generator.
+
+    Owns its own HTTP sessions (a new visitor opens new connections) and is
+    used by a single journey, one step at a time.
+    """
+
+    def __init__(self, shared: SharedData, rng: random.Random, timeout: int = 30):
+        """
+        Initialize the user.
+
+        Args:
+            shared: Data loaded before the run
+            rng: Random generator (seeded per arrival for reproducible runs)
+            timeout: Request timeout in seconds
+        """
+        self.shared = shared
+        self.random = rng
+        self.timeout = timeout
+        self._anonymous: Optional[AnonymousAPIClient] = None
+        self._agent: Optional[AuthenticatedAPIClient] = None
+
+    @property
+    def anonymous(self) -> AnonymousAPIClient:
+        """Unauthenticated client (public pages and endpoints)."""
+        if self._anonymous is None:
+            self._anonymous = AnonymousAPIClient(self.shared.base_url, timeout=self.timeout)
+        return self._anonymous
+
+    @property
+    def agent(self) -> AuthenticatedAPIClient:
+        """Client authenticated as the load-test agent."""
+        if self._agent is None:
+            if not self.shared.agent_token:
+                raise RuntimeError("Cenário requer token de agent (credenciais de agent não configuradas)")
+            self._agent = AuthenticatedAPIClient(
+                self.shared.base_url,
+                self.shared.agent_token,
+                timeout=self.timeout,
+            )
+        return self._agent
+
+    def pick_property(self) -> PropertyRef:
+        """Random property from the shared data."""
+        if not self.shared.properties:
+            raise RuntimeError("Nenhum imóvel disponível para o cenário")
+        return self.random.choice(self.shared.properties)
+
+    def pick_public_slug(self) -> str:
+        """Random slug of a public detail page."""
+        return self.random.choice(self.shared.public_slugs)
+
+    def close(self) -> None:
+        """Close the HTTP sessions opened by this user."""
+        for client in (self._anonymous, self._agent):
+            if client is not None:
+                client.close()
+
+
+# =============================================================================
+# SCENARIO
+# =============================================================================
+
+@dataclass(frozen=True)
+class Journey:
+    """Weighted user journey."""
+    name: str
+    weight: float
+    run: JourneyFunction
+
+
+class Scenario:
+    """Named set of weighted journeys."""
+
+    def __init__(self, name: str, description: str = ""):
+        """
+        Initialize an empty scenario.
+
+        Args:
+            name: Scenario name (used on the command line and in reports)
+            description: One-line description
+        """
+        self.name = name
+        self.description = description
+        self.journeys: List[Journey] = []
+        self.setup_hooks: List[Callable[[SharedData], None]] = []
+
+    def journey(self, name: str, weight: float = 1.0) -> Callable[[JourneyFunction], JourneyFunction]:
+        """
+        Register a journey (decorator).
+
+        Args:
+            name: Journey name
+            weight: Relative arrival share
+
+        Raises:
+            ValueError: If the weight is not positive or the name is taken
+        """
+        if weight <= 0:
+            raise ValueError(f"Peso da jornada deve ser positivo: {name}={weight}")
+        if any(existing.name == name for existing in self.journeys):
+            raise ValueError(f"Jornada duplicada: {name}")
+
+        def _register(func: JourneyFunction) -> JourneyFunction:
+            self.journeys.append(Journey(name=name, weight=weight, run=func))
+            return func
+
+        return _register
+
+    def setup(self, func: Callable[[SharedData], None]) -> Callable[[SharedData], None]:
+        """Register a function that fills the shared data before the run (decorator)."""
+        self.setup_hooks.append(func)
+        return func
+
+    def pick(self, rng: random.Random) -> Journey:
+        """
+        Pick a journey according to the weights.
+
+        Raises:
+            ValueError: If the scenario has no journeys
+        """
+        if not self.journeys:
+            raise ValueError(f"Cenário sem jornadas: {self.name}")
+        return rng.choices(self.journeys, weights=[journey.weight for journey in self.journeys])[0]
+
+    def mix(self) -> Dict[str, float]:
+        """Share of arrivals per journey."""
+        total = sum(journey.weight for journey in self.journeys)
+        return {journey.name: journey.weight / total for journey in self.journeys}
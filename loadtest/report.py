@@ -0,0 +1,77 @@
+"""
+Text and JSON reports for load runs.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """
+    Human-readable report of a run summary.
+
+    Args:
+        summary: Output of `LoadRunner.summary`
+
+    Returns:
+        Multi-line report
+    """
+    run = summary["run"]
+    lines: List[str] = [
+        f"Cenário {run['scenario']} — {run['rate']:g} chegadas/s ({run['arrival']}), "
+        f"{run['duration']:g}s, {run['workers']} workers",
+        f"Requests: {summary['requests']} em {summary['elapsed_s']:.1f}s "
+        f"({summary['throughput_rps']:.1f} req/s), "
+        f"atraso máximo do gerador: {summary['max_arrival_lag_ms']:.0f} ms",
+        "",
+        f"{'step':<28} {'n':>6} {'err':>5} {'req/s':>7}   "
+        f"{'p50':>6} {'p90':>6} {'p99':>6} {'max':>6}   "
+        f"{'p50*':>6} {'p90*':>6} {'p99*':>6} {'max*':>6}",
+    ]
+
+    for step in summary["steps"]:
+        service = step["service_ms"]
+        corrected = step["corrected_ms"]
+        lines.append(
+            f"{step['journey'] + '/' + step['step']:<28} {step['count']:>6} {step['errors']:>5} "
+            f"{step['throughput_rps']:>7.1f}   "
+            f"{_ms(service['p50']):>6} {_ms(service['p90']):>6} {_ms(service['p99']):>6} {_ms(service['max']):>6}   "
+            f"{_ms(corrected['p50']):>6} {_ms(corrected['p90']):>6} {_ms(corrected['p99']):>6} {_ms(corrected['max']):>6}"
+        )
+    lines.append("(ms; * = corrigido para coordinated omission, medido desde a chegada agendada)")
+
+    lines.extend(["", "Jornadas:"])
+    for name, counts in summary["journeys"].items():
+        lines.append(
+            f"  {name:<20} iniciadas={counts['started']} "
+            f"concluídas={counts['completed']} falharam={counts['failed']}"
+        )
+
+    if summary["errors"]:
+        lines.extend(["", "Erros:"])
+        for error, count in sorted(summary["errors"].items(), key=lambda item: -item[1]):
+            lines.append(f"  {error:<20} {count}")
+
+    return "\n".join(lines)
+
+
+def write_report(path: str, summary: Dict[str, Any]) -> Path:
+    """
+    Write the summary as JSON.
+
+    Args:
+        path: Output file
+        summary: Output of `LoadRunner.summary`
+
+    Returns:
+        Path written
+    """
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    return output
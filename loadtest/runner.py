@@ -0,0 +1,198 @@
+"""
+Open-loop load runner.
+
+Arrivals are scheduled at a target rate (Poisson or constant spacing)
+independently of how fast the system answers: a slow response never delays
+the next arrival. Each arrival picks a weighted journey and runs it as an
+asyncio task whose steps are executed in a bounded thread pool. When the
+pool is saturated steps queue up, and that queueing time shows up in the
+corrected latency instead of silently lowering the offered load.
+"""
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .dsl import Journey, Scenario, SharedData, StepAction, VirtualUser
+from .stats import RunStats, StepSample, describe_error
+
+
+ARRIVAL_POISSON = "poisson"
+ARRIVAL_CONSTANT = "constant"
+ARRIVAL_MODES = (ARRIVAL_POISSON, ARRIVAL_CONSTANT)
+
+# Pseudo-step used when journey code itself raises between steps.
+JOURNEY_STEP = "(journey)"
+
+
+def _timed(action: StepAction) -> Tuple[float, float, Any, Optional[BaseException]]:
+    """Run a step in the worker thread and time it."""
+    started = time.perf_counter()
+    try:
+        result = action()
+        error = None
+    except Exception as exc:
+        result = None
+        error = exc
+    return started, time.perf_counter(), result, error
+
+
+class LoadRunner:
+    """Runs a scenario open-loop at a target arrival rate."""
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        shared: SharedData,
+        rate: float,
+        duration: float,
+        workers: int = 64,
+        arrival: str = ARRIVAL_POISSON,
+        seed: Optional[int] = None,
+        timeout: int = 30
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            scenario: Scenario to run
+            shared: Data shared by every virtual user
+            rate: Target arrivals (journeys) per second
+            duration: Seconds during which arrivals are generated
+            workers: Worker threads executing steps (max requests in flight)
+            arrival: 'poisson' (exponential gaps) or 'constant'
+            seed: Seed for arrival gaps and journey choice
+            timeout: Request timeout in seconds
+
+        Raises:
+            ValueError: If the rate, duration, workers or arrival mode are invalid
+        """
+        if rate <= 0 or duration <= 0:
+            raise ValueError(f"Taxa e duração devem ser positivas: rate={rate}, duration={duration}")
+        if workers < 1:
+            raise ValueError(f"Número de workers inválido: {workers}")
+        if arrival not in ARRIVAL_MODES:
+            raise ValueError(f"Modo de chegada inválido: {arrival} (use {', '.join(ARRIVAL_MODES)})")
+
+        self.scenario = scenario
+        self.shared = shared
+        self.rate = rate
+        self.duration = duration
+        self.workers = workers
+        self.arrival = arrival
+        self.random = random.Random(seed)
+        self.timeout = timeout
+        self.stats = RunStats()
+        self.elapsed = 0.0
+
+    def run(self) -> RunStats:
+        """
+        Run setup hooks, then the load phase until every journey finishes.
+
+        Returns:
+            Recorded statistics (wall time of the run in `self.elapsed`)
+        """
+        for hook in self.scenario.setup_hooks:
+            hook(self.shared)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="loadtest") as pool:
+            asyncio.run(self._run(pool))
+        return self.stats
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        JSON-serializable summary of the run, including its settings.
+
+        Returns:
+            Run settings, journey mix and `RunStats.summary`
+        """
+        return {
+            "run": {
+                "scenario": self.scenario.name,
+                "base_url": self.shared.base_url,
+                "rate": self.rate,
+                "duration": self.duration,
+                "workers": self.workers,
+                "arrival": self.arrival,
+                "mix": self.scenario.mix(),
+            },
+            **self.stats.summary(self.elapsed),
+        }
+
+    def _next_gap(self) -> float:
+        if self.arrival == ARRIVAL_POISSON:
+            return self.random.expovariate(self.rate)
+        return 1.0 / self.rate
+
+    async def _run(self, pool: ThreadPoolExecutor) -> None:
+        tasks: Set[asyncio.Task] = set()
+        start = time.perf_counter()
+        scheduled = start
+
+        while True:
+            scheduled += self._next_gap()
+            if scheduled - start >= self.duration:
+                break
+
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.stats.record_arrival_lag((time.perf_counter() - scheduled) * 1000)
+
+            journey = self.scenario.pick(self.random)
+            user = VirtualUser(self.shared, random.Random(self.random.random()), timeout=self.timeout)
+            task = asyncio.create_task(self._run_journey(pool, journey, user, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        self.elapsed = time.perf_counter() - start
+
+    async def _run_journey(
+        self,
+        pool: ThreadPoolExecutor,
+        journey: Journey,
+        user: VirtualUser,
+        intended: float
+    ) -> None:
+        """Drive one journey generator; `intended` is its scheduled arrival time."""
+        loop = asyncio.get_running_loop()
+        steps = journey.run(user)
+        value: Any = None
+        self.stats.journeys_started[journey.name] += 1
+
+        try:
+            while True:
+                try:
+                    step, action = steps.send(value)
+                except StopIteration:
+                    self.stats.journeys_completed[journey.name] += 1
+                    return
+                except Exception as exc:
+                    now = time.perf_counter()
+                    self.stats.record(StepSample(
+                        journey.name, JOURNEY_STEP, now, now, now, describe_error(exc)
+                    ))
+                    self.stats.journeys_failed[journey.name] += 1
+                    return
+
+                started, ended, value, error = await loop.run_in_executor(pool, _timed, action)
+                self.stats.record(StepSample(
+                    journey.name,
+                    step,
+                    intended,
+                    started,
+                    ended,
+                    describe_error(error) if error else None,
+                ))
+                if error:
+                    self.stats.journeys_failed[journey.name] += 1
+                    return
+                # Next step is due as soon as this one answered.
+                intended = ended
+        finally:
+            steps.close()
+            user.close()
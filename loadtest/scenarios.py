@@ -0,0 +1,94 @@
+"""
+Built-in load scenarios.
+
+`campaign` models traffic right after a marketing push: most visitors browse
+the listing and open property pages (each page view also hits
+`POST /api/properties/[id]/view`), some leave their contact, and agents work
+the incoming leads in parallel.
+
+The public pages are still served from `lib/mock-data.ts`, so detail pages
+are opened by mock slug while view counts and leads target real Payload
+documents. The contact form does not persist leads yet; the lead journey
+creates them through the REST API with the agent token, which runs the same
+`updateLeadScore` / `distributeLead` hooks.
+"""
+
+from typing import Dict
+
+from tests.api.fixtures import LeadFactory
+from tests.api.utils import AuthenticatedAPIClient
+
+from .auth import AGENT_CREDENTIALS, login_token
+from .dsl import PropertyRef, Scenario, SharedData, VirtualUser
+
+
+# Slugs served by the public site (lib/mock-data.ts).
+PUBLIC_SLUGS = [
+    "apartamento-asa-sul-sqn-308",
+    "cobertura-noroeste-sqnw-111",
+    "apartamento-aguas-claras-rua-37",
+    "casa-lago-sul-shis-qi-25",
+    "apartamento-sudoeste-sqsw-300",
+    "apartamento-asa-norte-sqs-405",
+]
+LEAD_STATUSES = ["contacted", "qualified", "visit_scheduled"]
+# Prefix of lead names created by load runs, so they can be found and removed.
+LOADTEST_PREFIX = "[loadtest]"
+
+
+campaign = Scenario(
+    "campaign",
+    "Listagem e detalhes de imóveis, contagem de views, novos leads e corretores atualizando leads",
+)
+
+
+@campaign.setup
+def load_campaign_data(shared: SharedData) -> None:
+    """Log in the agent and load the published properties targeted by view counts."""
+    shared.agent_token = login_token(shared.base_url, AGENT_CREDENTIALS)
+
+    with AuthenticatedAPIClient(shared.base_url, shared.agent_token) as agent:
+        # Only published properties count views; drafts answer 404.
+        docs = agent.find("properties", where={"status": {"equals": "published"}}, limit=100).get("docs", [])
+
+    shared.properties = [PropertyRef(id=doc["id"], slug=doc.get("slug", "")) for doc in docs]
+    shared.public_slugs = list(PUBLIC_SLUGS)
+
+
+@campaign.journey("browse", weight=40)
+def browse(user: VirtualUser):
+    yield "listing-page", lambda: user.anonymous.get("/imoveis", headers={"Accept": "text/html"})
+
+
+@campaign.journey("detail", weight=40)
+def detail(user: VirtualUser):
+    slug = user.pick_public_slug()
+    prop = user.pick_property()
+    yield "detail-page", lambda: user.anonymous.get(f"/imoveis/{slug}", headers={"Accept": "text/html"})
+    yield "view-count", lambda: user.anonymous.post(f"/api/properties/{prop.id}/view")
+
+
+@campaign.journey("lead", weight=15)
+def submit_lead(user: VirtualUser):
+    slug = user.pick_public_slug()
+    yield "detail-page", lambda: user.anonymous.get(f"/imoveis/{slug}", headers={"Accept": "text/html"})
+
+    lead: Dict = LeadFactory.with_phone_and_email()
+    lead["name"] = f"{LOADTEST_PREFIX} {lead['name']}"
+    lead["source"] = "website"
+    yield "create-lead", lambda: user.agent.create_lead(lead)
+
+
+@campaign.journey("agent", weight=5)
+def work_leads(user: VirtualUser):
+    leads = yield "list-leads", lambda: user.agent.find("leads", sort="-createdAt", limit=10)
+    docs = leads.get("docs", [])
+    if not docs:
+        return
+
+    lead_id = user.random.choice(docs)["id"]
+    status = user.random.choice(LEAD_STATUSES)
+    yield "update-lead", lambda: user.agent.update("leads", lead_id, {"status": status})
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (campaign,)}
@@ -0,0 +1,419 @@
+"""
+Soak mode: a scenario at a steady rate for hours while the server is sampled.
+
+The load runs in a background thread; the main thread samples the Next.js
+server every `--interval` seconds:
+
+- RSS and open file descriptors of `--server-pid` (`/proc`, RSS via `ps`
+  elsewhere);
+- V8 heap, external memory, active handles and the sizes of the in-memory
+  caches (`RateLimiter` keys, `_propertyCache` in `lib/mock-data.ts`, the
+  global Payload client) from `GET /api/diagnostics`, enabled on the server
+  with `DIAGNOSTICS_SECRET`;
+- size of the SQLite database and of its WAL file.
+
+At the end every series is tested for monotonic growth after the warm-up
+(Mann-Kendall tau and Theil-Sen slope); a series that keeps growing by more
+than `--min-growth-pct` is flagged as a suspected leak.
+
+    python -m loadtest.soak --scenario campaign --rate 5 --duration 4h --server-pid $(pgrep -f "next start")
+"""
+
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from tests.api.utils import AnonymousAPIClient, APIError
+
+from .benchmarks.common import read_rss_mb
+from .dsl import SharedData
+from .report import format_report, write_report
+from .runner import ARRIVAL_MODES, ARRIVAL_POISSON, LoadRunner
+from .scenarios import SCENARIOS
+from .trend import record_run
+
+
+DIAGNOSTICS_ENDPOINT = "/api/diagnostics"
+DIAGNOSTICS_SECRET_HEADER = "X-Diagnostics-Secret"
+BYTES_PER_MB = 1024 * 1024
+# Kendall tau above which a series counts as monotonically growing.
+MONOTONIC_TAU = 0.5
+# Minimum samples after the warm-up for a trend verdict.
+MIN_TREND_SAMPLES = 8
+
+VERDICT_LABELS = {
+    "growing": "CRESCENDO",
+    "expected": "cresce (escritas)",
+    "stable": "estável",
+    "no-data": "sem dados",
+}
+
+
+@dataclass(frozen=True)
+class Series:
+    """A sampled quantity."""
+    key: str
+    label: str
+    # Growth is expected under write load (the database file), reported but not flagged.
+    expected_growth: bool = False
+
+
+SERIES = (
+    Series("rss_mb", "RSS (MB)"),
+    Series("heap_used_mb", "heap usado (MB)"),
+    Series("external_mb", "external (MB)"),
+    Series("fds", "descritores abertos"),
+    Series("handles", "handles ativos"),
+    Series("rate_limiter_keys", "chaves do RateLimiter"),
+    Series("property_cache", "_propertyCache"),
+    Series("view_dedupe_entries", "dedupe de views"),
+    Series("agent_stats_entries", "cache de stats por corretor"),
+    Series("wal_mb", "WAL SQLite (MB)"),
+    Series("db_mb", "banco SQLite (MB)", expected_growth=True),
+)
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+def parse_duration(value: str) -> float:
+    """Seconds from '90', '90s', '30m' or '4h'."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Duração inválida: {value} (ex.: 90s, 30m, 4h)")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
+
+
+def default_db_path() -> Path:
+    """SQLite file from DATABASE_URL (`file:./payload.db` by default)."""
+    url = os.getenv("DATABASE_URL", "file:./payload.db")
+    return Path(url[len("file:"):] if url.startswith("file:") else url)
+
+
+def read_fd_count(pid: int) -> Optional[int]:
+    """Open file descriptors of a process (Linux only)."""
+    try:
+        return len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return None
+
+
+def _file_mb(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_size / BYTES_PER_MB
+    except OSError:
+        return None
+
+
+class ServerProbe:
+    """Reads one resource sample from the server process and its database."""
+
+    def __init__(
+        self,
+        base_url: str,
+        pid: Optional[int],
+        db_path: Path,
+        secret: Optional[str],
+        timeout: int = 30
+    ):
+        """
+        Initialize the probe.
+
+        Args:
+            base_url: Application base URL
+            pid: Server process id (RSS and file descriptors)
+            db_path: SQLite database file
+            secret: DIAGNOSTICS_SECRET of the server (heap, handles and caches)
+            timeout: Request timeout in seconds
+        """
+        self.pid = pid
+        self.db_path = db_path
+        self.secret = secret
+        self.client = AnonymousAPIClient(base_url, timeout=timeout)
+        self.diagnostics_error: Optional[str] = None
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _diagnostics(self) -> Dict[str, Any]:
+        if not self.secret:
+            return {}
+        try:
+            return self.client.get(
+                DIAGNOSTICS_ENDPOINT,
+                headers={DIAGNOSTICS_SECRET_HEADER: self.secret},
+            ).data
+        except APIError as exc:
+            self.diagnostics_error = f"{DIAGNOSTICS_ENDPOINT}: HTTP {exc.status_code}"
+            return {}
+
+    def sample(self) -> Dict[str, Any]:
+        """One sample; unavailable quantities are None."""
+        diagnostics = self._diagnostics()
+        memory = diagnostics.get("memoryMb", {})
+        caches = diagnostics.get("caches", {})
+
+        return {
+            "rss_mb": read_rss_mb(self.pid) if self.pid else memory.get("rss"),
+            "fds": read_fd_count(self.pid) if self.pid else None,
+            "heap_used_mb": memory.get("heapUsed"),
+            "heap_total_mb": memory.get("heapTotal"),
+            "external_mb": memory.get("external"),
+            "handles": diagnostics.get("handles", {}).get("total"),
+            "rate_limiter_keys": caches.get("rateLimiterKeys"),
+            "property_cache": caches.get("propertyCache"),
+            "view_dedupe_entries": caches.get("viewDedupeEntries"),
+            "agent_stats_entries": caches.get("agentStatsEntries"),
+            "db_mb": _file_mb(self.db_path),
+            "wal_mb": _file_mb(Path(f"{self.db_path}-wal")),
+        }
+
+
+# =============================================================================
+# TREND DETECTION
+# =============================================================================
+
+def kendall_tau(values: List[float]) -> float:
+    """Mann-Kendall tau of a series against time (-1 falling, 1 always rising)."""
+    pairs = len(values) * (len(values) - 1) / 2
+    if pairs == 0:
+        return 0.0
+    score = sum(
+        (later > earlier) - (later < earlier)
+        for index, earlier in enumerate(values)
+        for later in values[index + 1:]
+    )
+    return score / pairs
+
+
+def theil_sen_slope(times: List[float], values: List[float]) -> float:
+    """Median of the pairwise slopes (robust to GC sawtooth and outliers)."""
+    slopes = [
+        (values[j] - values[i]) / (times[j] - times[i])
+        for i in range(len(values))
+        for j in range(i + 1, len(values))
+        if times[j] > times[i]
+    ]
+    return median(slopes) if slopes else 0.0
+
+
+def detect_growth(
+    samples: List[Dict[str, Any]],
+    series: Series,
+    warmup_s: float,
+    min_growth_pct: float
+) -> Dict[str, Any]:
+    """
+    Trend of one series after the warm-up.
+
+    Growth compares the medians of the first and last fifth of the samples,
+    so a single GC pause does not decide the verdict.
+
+    Args:
+        samples: Soak samples (with `t`, seconds since start)
+        series: Series to test
+        warmup_s: Seconds discarded at the start (caches and JIT filling up)
+        min_growth_pct: Growth below which a rising series is not flagged
+
+    Returns:
+        Series summary with `verdict`: 'growing', 'expected', 'stable' or 'no-data'
+    """
+    points = [
+        (sample["t"], sample[series.key]) for sample in samples
+        if sample["t"] >= warmup_s and sample.get(series.key) is not None
+    ]
+    summary: Dict[str, Any] = {"series": series.key, "label": series.label, "samples": len(points)}
+    if len(points) < MIN_TREND_SAMPLES:
+        return {**summary, "verdict": "no-data"}
+
+    times = [point[0] for point in points]
+    values = [float(point[1]) for point in points]
+    window = max(2, len(values) // 5)
+    start, end = median(values[:window]), median(values[-window:])
+    growth_pct = (end - start) / start * 100 if start else (float("inf") if end > start else 0.0)
+    tau = kendall_tau(values)
+
+    growing = tau >= MONOTONIC_TAU and growth_pct >= min_growth_pct
+    if growing:
+        verdict = "expected" if series.expected_growth else "growing"
+    else:
+        verdict = "stable"
+
+    return {
+        **summary,
+        "start": start,
+        "end": end,
+        "max": max(values),
+        "growth_pct": growth_pct,
+        "slope_per_hour": theil_sen_slope(times, values) * 3600,
+        "tau": tau,
+        "verdict": verdict,
+    }
+
+
+def format_trends(trends: List[Dict[str, Any]]) -> str:
+    """Human-readable table of the series verdicts."""
+    lines = [f"{'série':<24} {'início':>9} {'fim':>9} {'Δ%':>8} {'/hora':>9} {'tau':>6}  veredito"]
+    for trend in trends:
+        verdict = VERDICT_LABELS[trend["verdict"]]
+        if trend["verdict"] == "no-data":
+            lines.append(f"{trend['label']:<24} {'-':>9} {'-':>9} {'-':>8} {'-':>9} {'-':>6}  {verdict}")
+            continue
+        lines.append(
+            f"{trend['label']:<24} {trend['start']:>9.1f} {trend['end']:>9.1f} "
+            f"{trend['growth_pct']:>+7.1f}% {trend['slope_per_hour']:>+9.2f} {trend['tau']:>6.2f}  {verdict}"
+        )
+    return "\n".join(lines)
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.soak",
+        description="Soak test: carga constante por horas com amostragem de memória e handles do servidor.",
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="campaign")
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("PAYLOAD_BASE_URL", "http://localhost:3000"),
+        help="URL da aplicação (default: PAYLOAD_BASE_URL ou http://localhost:3000)",
+    )
+    parser.add_argument("--rate", type=float, default=5.0, help="Chegadas (jornadas) por segundo")
+    parser.add_argument("--duration", type=parse_duration, default="4h", help="Duração (ex.: 90m, 4h)")
+    parser.add_argument("--warmup", type=parse_duration, default="10m", help="Início ignorado na detecção de tendência")
+    parser.add_argument("--interval", type=parse_duration, default="30s", help="Intervalo entre amostras")
+    parser.add_argument("--workers", type=int, default=64, help="Máximo de requests simultâneos")
+    parser.add_argument("--arrival", choices=ARRIVAL_MODES, default=ARRIVAL_POISSON)
+    parser.add_argument("--seed", type=int, default=None, help="Seed para chegadas e escolha de jornadas")
+    parser.add_argument("--timeout", type=int, default=30, help="Timeout por request em segundos")
+    parser.add_argument(
+        "--server-pid",
+        type=int,
+        default=int(os.getenv("LOADTEST_SERVER_PID", "0")) or None,
+        help="PID do servidor Next.js (default: LOADTEST_SERVER_PID)",
+    )
+    parser.add_argument("--db-path", type=Path, default=None, help="Arquivo SQLite (default: DATABASE_URL)")
+    parser.add_argument(
+        "--diagnostics-secret",
+        default=os.getenv("DIAGNOSTICS_SECRET"),
+        help="Segredo do /api/diagnostics (default: DIAGNOSTICS_SECRET)",
+    )
+    parser.add_argument("--min-growth-pct", type=float, default=10.0, help="Crescimento mínimo para sinalizar vazamento")
+    parser.add_argument("--output", default=None, help="Arquivo JSON com amostras e veredictos")
+    parser.add_argument("--store", default=None, help="Histórico de resultados (default: LOADTEST_RESULTS_STORE)")
+    parser.add_argument("--no-store", action="store_true", help="Não registra a execução no histórico")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not args.server_pid and not args.diagnostics_secret:
+        print("Informe --server-pid e/ou --diagnostics-secret: sem eles não há o que amostrar.")
+        return 2
+
+    runner = LoadRunner(
+        SCENARIOS[args.scenario],
+        SharedData(base_url=args.base_url.rstrip("/")),
+        rate=args.rate,
+        duration=args.duration,
+        workers=args.workers,
+        arrival=args.arrival,
+        seed=args.seed,
+        timeout=args.timeout,
+    )
+    load_errors: List[BaseException] = []
+
+    def _load() -> None:
+        try:
+            runner.run()
+        except Exception as exc:
+            load_errors.append(exc)
+
+    load = threading.Thread(target=_load, name="soak-load", daemon=True)
+    probe = ServerProbe(args.base_url, args.server_pid, args.db_path or default_db_path(),
+                        args.diagnostics_secret, timeout=args.timeout)
+    samples: List[Dict[str, Any]] = []
+    start = time.monotonic()
+
+    def _sample() -> Dict[str, Any]:
+        sample = {"t": time.monotonic() - start, **probe.sample()}
+        # Steps are added by the load thread; list() takes a snapshot.
+        sample["requests"] = sum(step.count for step in list(runner.stats.steps.values()))
+        samples.append(sample)
+        return sample
+
+    load.start()
+    try:
+        while load.is_alive():
+            sample = _sample()
+            print(
+                f"[{sample['t'] / 60:6.1f} min] req={sample['requests']} rss={sample['rss_mb'] or 0:.0f}MB "
+                f"heap={sample['heap_used_mb'] or 0:.0f}MB fds={sample['fds'] or '-'} "
+                f"handles={sample['handles'] or '-'} rl_keys={sample['rate_limiter_keys'] or '-'} "
+                f"wal={sample['wal_mb'] or 0:.1f}MB",
+                flush=True,
+            )
+            load.join(timeout=args.interval)
+        _sample()
+    except KeyboardInterrupt:
+        print("\nInterrompido; analisando as amostras coletadas.")
+    finally:
+        probe.close()
+
+    if load_errors:
+        print(f"A carga falhou: {load_errors[0]!r}")
+        return 1
+
+    elapsed = time.monotonic() - start
+    if probe.diagnostics_error:
+        print(f"Diagnóstico indisponível ({probe.diagnostics_error}); heap, handles e caches ficam sem dados.")
+
+    load_summary = runner.summary() if not load.is_alive() else {
+        "run": runner.summary()["run"], **runner.stats.summary(elapsed)
+    }
+    trends = [detect_growth(samples, series, args.warmup, args.min_growth_pct) for series in SERIES]
+
+    print()
+    print(format_report(load_summary))
+    print()
+    print(format_trends(trends))
+
+    growing = [trend["label"] for trend in trends if trend["verdict"] == "growing"]
+    summary = {
+        "benchmark": f"soak:{args.scenario}",
+        "settings": {
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "interval_s": args.interval,
+            "server_pid": args.server_pid,
+            "min_growth_pct": args.min_growth_pct,
+        },
+        "load": load_summary,
+        "trends": trends,
+        "samples": samples,
+    }
+    if args.output:
+        print(f"\nResultados salvos em {write_report(args.output, summary)}")
+    if not args.no_store:
+        dataset = {"rate": args.rate, "duration_s": args.duration, "arrival": args.arrival}
+        print(f"Execução registrada em {record_run(summary['benchmark'], summary, dataset, args.base_url, args.store)}")
+
+    if growing:
+        print(f"\nCrescimento monotônico em: {', '.join(growing)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Latency and error statistics for load runs.
+
+Every step records three timestamps:
+
+- `intended`: when the step should have started — the scheduled arrival
+  time for the first step of a journey, the end of the previous step for
+  the next ones;
+- `started`: when a worker thread actually started it;
+- `ended`: when it returned or raised.
+
+`service` latency (`ended - started`) is what a closed-loop tool reports.
+`corrected` latency (`ended - intended`) also counts the time the request
+waited because the generator or the system was saturated, which is what a
+real user arriving at that moment would have experienced (coordinated
+omission correction).
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Samples
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Interpolated percentile, None without samples
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def describe_error(error: BaseException) -> str:
+    """
+    Short error key for the breakdown ('HTTP 409', 'APIError', ...).
+
+    Args:
+        error: Exception raised by a step
+
+    Returns:
+        Error key
+    """
+    status = getattr(error, "status_code", None)
+    if status:
+        return f"HTTP {status}"
+    return type(error).__name__
+
+
+# =============================================================================
+# SAMPLES
+# =============================================================================
+
+@dataclass(frozen=True)
+class StepSample:
+    """Timing of one executed step (monotonic seconds)."""
+    journey: str
+    step: str
+    intended: float
+    started: float
+    ended: float
+    error: Optional[str] = None
+
+    @property
+    def service_ms(self) -> float:
+        return (self.ended - self.started) * 1000
+
+    @property
+    def corrected_ms(self) -> float:
+        return (self.ended - self.intended) * 1000
+
+
+@dataclass
+class StepStats:
+    """Aggregated samples of one journey step."""
+    journey: str
+    step: str
+    service: List[float] = field(default_factory=list)
+    corrected: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return len(self.service)
+
+    def add(self, sample: StepSample) -> None:
+        """Add one sample."""
+        self.service.append(sample.service_ms)
+        self.corrected.append(sample.corrected_ms)
+        if sample.error:
+            self.errors[sample.error] += 1
+
+    def to_dict(self, elapsed_s: float) -> Dict[str, Any]:
+        """Summary of the step over a run lasting `elapsed_s` seconds."""
+        return {
+            "journey": self.journey,
+            "step": self.step,
+            "count": self.count,
+            "errors": sum(self.errors.values()),
+            "error_breakdown": dict(self.errors),
+            "throughput_rps": self.count / elapsed_s if elapsed_s > 0 else 0.0,
+            "service_ms": _latency_summary(self.service),
+            "corrected_ms": _latency_summary(self.corrected),
+        }
+
+
+def _latency_summary(values: List[float]) -> Dict[str, Optional[float]]:
+    summary: Dict[str, Optional[float]] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    summary["max"] = max(values) if values else None
+    summary["mean"] = sum(values) / len(values) if values else None
+    return summary
+
+
+# =============================================================================
+# RUN RESULTS
+# =============================================================================
+
+@dataclass
+class RunStats:
+    """Everything recorded during a run."""
+    steps: Dict[str, StepStats] = field(default_factory=dict)
+    journeys_started: Counter = field(default_factory=Counter)
+    journeys_completed: Counter = field(default_factory=Counter)
+    journeys_failed: Counter = field(default_factory=Counter)
+    max_lag_ms: float = 0.0
+
+    def record(self, sample: StepSample) -> None:
+        """Record one step sample."""
+        key = f"{sample.journey}/{sample.step}"
+        if key not in self.steps:
+            self.steps[key] = StepStats(journey=sample.journey, step=sample.step)
+        self.steps[key].add(sample)
+
+    def record_arrival_lag(self, lag_ms: float) -> None:
+        """Track how late the scheduler launched an arrival."""
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        """
+        Summary of the run.
+
+        Args:
+            elapsed_s: Wall time of the measured phase in seconds
+
+        Returns:
+            JSON-serializable summary
+        """
+        requests = sum(step.count for step in self.steps.values())
+        errors = Counter()
+        for step in self.steps.values():
+            errors.update(step.errors)
+
+        return {
+            "elapsed_s": elapsed_s,
+            "requests": requests,
+            "throughput_rps": requests / elapsed_s if elapsed_s > 0 else 0.0,
+            "journeys": {
+                name: {
+                    "started": self.journeys_started[name],
+                    "completed": self.journeys_completed[name],
+                    "failed": self.journeys_failed[name],
+                }
+                for name in sorted(self.journeys_started)
+            },
+            "errors": dict(errors),
+            "max_arrival_lag_ms": self.max_lag_ms,
+            "steps": [self.steps[key].to_dict(elapsed_s) for key in sorted(self.steps)],
+        }
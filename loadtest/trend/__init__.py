@@ -0,0 +1,25 @@
+"""
+Results history of benchmarks and load runs.
+
+Runs are appended to a JSON-lines store keyed by git commit, dataset and
+environment fingerprint; `python -m loadtest.trend compare` prints the
+per-metric change between two revisions and fails on regressions beyond
+`loadtest/thresholds.json`.
+"""
+
+from .compare import MetricComparison, MetricRule, Thresholds, bootstrap_ci, compare_runs, format_comparison
+from .store import ResultsStore, build_record, environment_fingerprint, flatten_metrics, record_run
+
+__all__ = [
+    "MetricComparison",
+    "MetricRule",
+    "Thresholds",
+    "bootstrap_ci",
+    "compare_runs",
+    "format_comparison",
+    "ResultsStore",
+    "build_record",
+    "environment_fingerprint",
+    "flatten_metrics",
+    "record_run",
+]
@@ -0,0 +1,133 @@
+"""
+Command line entry point: `python -m loadtest.trend`.
+
+    python -m loadtest.trend list --benchmark view-count
+    python -m loadtest.trend compare --benchmark view-count --baseline main
+    python -m loadtest.trend import loadtest/results/rate-limiter.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .compare import STATUS_REGRESSION, Thresholds, compare_runs, format_comparison
+from .store import ResultsStore, build_record, dataset_key, resolve_commit
+
+
+def _list(store: ResultsStore, args: argparse.Namespace) -> int:
+    records = store.find(benchmark=args.benchmark)
+    if not records:
+        print(f"Nenhuma execução em {store.path}")
+        return 0
+
+    for record in records:
+        commit = (record.get("commit") or "?")[:10]
+        dirty = "*" if record.get("dirty") else " "
+        print(
+            f"{record.get('timestamp', '')[:19]}  {record.get('benchmark', ''):<22} "
+            f"{commit}{dirty} env={record.get('environment', {}).get('id', '?')}  "
+            f"{dataset_key(record.get('dataset', {}))}"
+        )
+    print("(* = árvore com alterações não commitadas)")
+    return 0
+
+
+def _compare(store: ResultsStore, args: argparse.Namespace) -> int:
+    thresholds = Thresholds.load(args.thresholds)
+    candidate_commit = resolve_commit(args.candidate)
+    candidates = store.find(
+        benchmark=args.benchmark,
+        commit=candidate_commit,
+        dataset=args.dataset,
+        environment=args.environment,
+    )
+    if not candidates:
+        print(f"Nenhuma execução de {args.benchmark} em {args.candidate} ({candidate_commit[:10]})")
+        return 2
+
+    # Without explicit filters, compare against the dataset and environment of the latest candidate run.
+    latest = candidates[-1]
+    dataset = args.dataset or dataset_key(latest.get("dataset", {}))
+    environment = args.environment or latest.get("environment", {}).get("id")
+    candidates = [
+        record for record in candidates
+        if dataset_key(record.get("dataset", {})) == dataset
+        and record.get("environment", {}).get("id") == environment
+    ]
+
+    baseline_commit = resolve_commit(args.baseline)
+    baselines = store.find(
+        benchmark=args.benchmark,
+        commit=baseline_commit,
+        dataset=dataset,
+        environment=environment,
+    )
+    if not baselines:
+        print(
+            f"Nenhuma execução de {args.benchmark} em {args.baseline} ({baseline_commit[:10]}) "
+            f"com dataset {dataset} e ambiente {environment}"
+        )
+        return 2
+
+    comparisons = compare_runs(baselines, candidates, thresholds)
+    print(f"{args.benchmark}: {args.baseline} ({baseline_commit[:10]}) → {args.candidate} ({candidate_commit[:10]})")
+    print(f"dataset {dataset}, ambiente {environment}\n")
+    print(format_comparison(comparisons, thresholds.confidence))
+
+    regressions = [item.metric for item in comparisons if item.status == STATUS_REGRESSION]
+    if regressions:
+        print(f"\n{len(regressions)} regressões além dos limites de {args.thresholds or 'loadtest/thresholds.json'}")
+        return 1
+    print("\nSem regressões")
+    return 0
+
+
+def _import(store: ResultsStore, args: argparse.Namespace) -> int:
+    summary = json.loads(Path(args.path).read_text(encoding="utf-8"))
+    benchmark = args.benchmark or summary.get("benchmark")
+    if not benchmark:
+        print("Informe --benchmark: o arquivo não tem o campo 'benchmark'")
+        return 2
+
+    store.append(build_record(benchmark, summary, summary.get("settings", {})))
+    print(f"{benchmark} registrado em {store.path}")
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.trend",
+        description="Histórico de benchmarks e comparação entre commits.",
+    )
+    parser.add_argument("--store", default=None, help="Arquivo do histórico (default: LOADTEST_RESULTS_STORE)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="Lista as execuções registradas")
+    list_parser.add_argument("--benchmark", default=None)
+
+    compare_parser = commands.add_parser("compare", help="Compara duas revisões de um benchmark")
+    compare_parser.add_argument("--benchmark", required=True, help="Ex.: view-count, load:campaign")
+    compare_parser.add_argument("--baseline", required=True, help="Commit, branch ou tag de referência")
+    compare_parser.add_argument("--candidate", default="HEAD", help="Revisão comparada (default: HEAD)")
+    compare_parser.add_argument("--dataset", default=None, help="Chave do dataset (default: a da última execução)")
+    compare_parser.add_argument("--environment", default=None, help="Id do ambiente (default: o da última execução)")
+    compare_parser.add_argument("--thresholds", default=None, help="Limites de regressão (default: loadtest/thresholds.json)")
+
+    import_parser = commands.add_parser("import", help="Registra um JSON de resultados (ex.: bench:rate-limiter)")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--benchmark", default=None, help="Nome do benchmark (default: campo 'benchmark')")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    store = ResultsStore(args.store)
+    handler = {"list": _list, "compare": _compare, "import": _import}[args.command]
+    return handler(store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Cross-commit comparison of stored runs.
+
+For every metric, baseline and candidate runs are compared by their means.
+With at least two runs on each side the change gets a bootstrap confidence
+interval; a metric is a regression when it moved in the bad direction by
+more than its threshold and the interval does not include zero (with a
+single run per side the point change decides alone).
+
+Thresholds live in `loadtest/thresholds.json`: an ordered list of rules
+matched by glob against metric names, the first match winning.
+"""
+
+import fnmatch
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import mean
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..stats import percentile
+
+
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parents[1] / "thresholds.json"
+BOOTSTRAP_RESAMPLES = 2000
+
+DIRECTION_LOWER = "lower"
+DIRECTION_HIGHER = "higher"
+
+
+@dataclass(frozen=True)
+class MetricRule:
+    """How a metric is judged."""
+    pattern: str = "*"
+    direction: str = DIRECTION_LOWER
+    max_regression_pct: Optional[float] = None
+    max_regression_abs: Optional[float] = None
+    # Value of the metric in runs that lack it (0 for error breakdowns, whose keys
+    # only appear once an error happens).
+    missing: Optional[float] = None
+    ignore: bool = False
+
+
+@dataclass
+class Thresholds:
+    """Ordered metric rules plus the confidence level of the intervals."""
+    confidence: float = 0.95
+    rules: List[MetricRule] = field(default_factory=list)
+    default: MetricRule = field(default_factory=MetricRule)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "Thresholds":
+        """
+        Load thresholds from JSON.
+
+        Args:
+            path: Thresholds file (default: loadtest/thresholds.json)
+
+        Returns:
+            Parsed thresholds
+        """
+        data = json.loads(Path(path or DEFAULT_THRESHOLDS).read_text(encoding="utf-8"))
+        return cls(
+            confidence=data.get("confidence", 0.95),
+            rules=[MetricRule(**rule) for rule in data.get("metrics", [])],
+            default=MetricRule(**data.get("default", {})),
+        )
+
+    def rule_for(self, metric: str) -> MetricRule:
+        """First rule whose pattern matches the metric."""
+        for rule in self.rules:
+            if fnmatch.fnmatchcase(metric, rule.pattern):
+                return rule
+        return self.default
+
+
+@dataclass(frozen=True)
+class MetricComparison:
+    """Baseline vs candidate for one metric."""
+    metric: str
+    baseline: float
+    candidate: float
+    baseline_n: int
+    candidate_n: int
+    ci: Optional[Tuple[float, float]]
+    status: str
+
+    @property
+    def delta(self) -> float:
+        return self.candidate - self.baseline
+
+    @property
+    def delta_pct(self) -> Optional[float]:
+        if self.baseline == 0:
+            return None if self.candidate == 0 else float("inf")
+        return self.delta / abs(self.baseline) * 100
+
+
+STATUS_REGRESSION = "REGRESSION"
+STATUS_IMPROVED = "improved"
+STATUS_OK = "ok"
+
+
+def bootstrap_ci(
+    baseline: List[float],
+    candidate: List[float],
+    confidence: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 0
+) -> Optional[Tuple[float, float]]:
+    """
+    Percentile-bootstrap interval of `mean(candidate) - mean(baseline)`.
+
+    Args:
+        baseline: Metric values of the baseline runs
+        candidate: Metric values of the candidate runs
+        confidence: Confidence level
+        resamples: Bootstrap resamples
+        seed: Seed (deterministic output for the same inputs)
+
+    Returns:
+        (low, high), None with fewer than two runs on either side
+    """
+    if len(baseline) < 2 or len(candidate) < 2:
+        return None
+
+    rng = random.Random(seed)
+    diffs = [
+        mean(rng.choices(candidate, k=len(candidate))) - mean(rng.choices(baseline, k=len(baseline)))
+        for _ in range(resamples)
+    ]
+    tail = (1 - confidence) / 2 * 100
+    return percentile(diffs, tail), percentile(diffs, 100 - tail)
+
+
+def judge(
+    rule: MetricRule,
+    baseline: float,
+    candidate: float,
+    ci: Optional[Tuple[float, float]]
+) -> str:
+    """
+    Status of one metric under its rule.
+
+    Returns:
+        'REGRESSION', 'improved' or 'ok'
+    """
+    delta = candidate - baseline
+    if delta == 0:
+        return STATUS_OK
+
+    significant = ci is None or ci[0] > 0 or ci[1] < 0
+    worse = delta > 0 if rule.direction == DIRECTION_LOWER else delta < 0
+    if not significant:
+        return STATUS_OK
+    if not worse:
+        return STATUS_IMPROVED
+
+    exceeds = False
+    if rule.max_regression_abs is not None and abs(delta) > rule.max_regression_abs:
+        exceeds = True
+    if rule.max_regression_pct is not None:
+        pct = float("inf") if baseline == 0 else abs(delta) / abs(baseline) * 100
+        if pct > rule.max_regression_pct:
+            exceeds = True
+    return STATUS_REGRESSION if exceeds else STATUS_OK
+
+
+def compare_runs(
+    baseline_runs: List[Dict[str, Any]],
+    candidate_runs: List[Dict[str, Any]],
+    thresholds: Thresholds
+) -> List[MetricComparison]:
+    """
+    Compare the metrics present in both sets of runs.
+
+    Args:
+        baseline_runs: Store records of the baseline
+        candidate_runs: Store records of the candidate
+        thresholds: Metric rules
+
+    Returns:
+        One comparison per non-ignored metric measured on both sides, sorted by name
+    """
+    def _values(runs: List[Dict[str, Any]], metric: str, rule: MetricRule) -> List[float]:
+        values = [run.get("metrics", {}).get(metric, rule.missing) for run in runs]
+        return [value for value in values if value is not None]
+
+    names = {
+        metric
+        for run in baseline_runs + candidate_runs
+        for metric in run.get("metrics", {})
+    }
+    comparisons = []
+
+    for metric in sorted(names):
+        rule = thresholds.rule_for(metric)
+        if rule.ignore:
+            continue
+
+        base = _values(baseline_runs, metric, rule)
+        cand = _values(candidate_runs, metric, rule)
+        if not base or not cand:
+            continue
+
+        ci = bootstrap_ci(base, cand, thresholds.confidence)
+        comparisons.append(MetricComparison(
+            metric=metric,
+            baseline=mean(base),
+            candidate=mean(cand),
+            baseline_n=len(base),
+            candidate_n=len(cand),
+            ci=ci,
+            status=judge(rule, mean(base), mean(cand), ci),
+        ))
+
+    return comparisons
+
+
+def format_comparison(comparisons: List[MetricComparison], confidence: float = 0.95) -> str:
+    """Human-readable comparison table."""
+    width = max([len("métrica")] + [len(item.metric) for item in comparisons])
+    ci_label = f"IC{confidence * 100:.0f}% Δ"
+    lines = [
+        f"{'métrica':<{width}} {'baseline':>12} {'candidato':>12} {'Δ%':>8} {ci_label:>22}  status"
+    ]
+    for item in comparisons:
+        pct = item.delta_pct
+        pct_text = "-" if pct is None else ("inf" if pct == float("inf") else f"{pct:+.1f}%")
+        ci_text = "-" if item.ci is None else f"[{item.ci[0]:+.2f}, {item.ci[1]:+.2f}]"
+        lines.append(
+            f"{item.metric:<{width}} {item.baseline:>8.2f} n={item.baseline_n:<2} "
+            f"{item.candidate:>8.2f} n={item.candidate_n:<2} {pct_text:>8} {ci_text:>22}  {item.status}"
+        )
+    return "\n".join(lines)
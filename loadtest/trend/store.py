@@ -0,0 +1,264 @@
+"""
+JSON-lines store of benchmark and load-run results.
+
+Every run appends one record keyed by git commit, dataset and environment
+fingerprint. Metrics are stored flattened (`hot.latency_ms.p99`) so runs of
+the same benchmark can be compared metric by metric across commits.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+
+DEFAULT_STORE = Path(__file__).resolve().parents[1] / "results" / "trend.jsonl"
+
+# Sub-trees of a summary that describe the run or hold unbounded keys, not metrics.
+NON_METRIC_KEYS = {
+    "settings",
+    "run",
+    "mix",
+    "histogram",
+    "per_agent",
+    "lost_by_property",
+    "duplicate_codes",
+    "attempts",
+    "error_breakdown",
+    "lead_ids",
+    "samples",
+}
+# Fields that identify an entry of a result list (`[{"mode": "hot", ...}]` -> "hot").
+LABEL_KEYS = ("journey", "step", "variant", "mode", "workload", "series", "rate", "batch", "signed_deals")
+
+
+def get_store_path() -> Path:
+    """Store path from LOADTEST_RESULTS_STORE, default loadtest/results/trend.jsonl."""
+    return Path(os.getenv("LOADTEST_RESULTS_STORE", str(DEFAULT_STORE)))
+
+
+# =============================================================================
+# RUN CONTEXT
+# =============================================================================
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def get_git_info() -> Dict[str, Any]:
+    """Commit, branch and whether the working tree has uncommitted changes."""
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+def resolve_commit(ref: str) -> str:
+    """Full hash of a git ref (branch, tag, HEAD~1), or the input unchanged."""
+    return _git("rev-parse", ref) or ref
+
+
+def environment_fingerprint(base_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describe the machine and target of a run.
+
+    Runs are only comparable within the same fingerprint: a laptop and a CI
+    runner, or a local server and a staging URL, land in different groups.
+    `LOADTEST_ENV` adds a free-form label (e.g. 'ci', 'staging').
+
+    Args:
+        base_url: Application base URL (only the host is kept)
+
+    Returns:
+        Environment details with a short `id`
+    """
+    details = {
+        "label": os.getenv("LOADTEST_ENV"),
+        "os": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "target": urlparse(base_url).netloc if base_url else None,
+    }
+    digest = hashlib.sha256(json.dumps(details, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"id": digest[:12], **details}
+
+
+def dataset_key(dataset: Dict[str, Any]) -> str:
+    """Stable string key of a dataset description."""
+    return json.dumps(dataset, sort_keys=True, separators=(",", ":"))
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def _label(entry: Dict[str, Any], index: int) -> str:
+    parts = [f"{entry[key]:g}" if isinstance(entry[key], float) else str(entry[key])
+             for key in LABEL_KEYS if key in entry]
+    return "/".join(parts) if parts else str(index)
+
+
+def flatten_metrics(summary: Any, prefix: str = "") -> Dict[str, float]:
+    """
+    Numeric leaves of a summary as dotted metric names.
+
+    Lists of result dicts are keyed by their identifying fields (`hot`,
+    `auto/5`, `browse/listing-page`) instead of their position.
+
+    Args:
+        summary: Benchmark or load-run summary
+        prefix: Name prefix (used by the recursion)
+
+    Returns:
+        {metric: value}
+    """
+    metrics: Dict[str, float] = {}
+
+    if isinstance(summary, dict):
+        for key, value in summary.items():
+            if key in NON_METRIC_KEYS:
+                continue
+            metrics.update(flatten_metrics(value, f"{prefix}{key}."))
+    elif isinstance(summary, list):
+        for index, entry in enumerate(summary):
+            if isinstance(entry, dict):
+                metrics.update(flatten_metrics(entry, f"{prefix}{_label(entry, index)}."))
+    elif isinstance(summary, (int, float)) and not isinstance(summary, bool):
+        metrics[prefix.rstrip(".")] = float(summary)
+
+    return metrics
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def build_record(
+    benchmark: str,
+    summary: Dict[str, Any],
+    dataset: Dict[str, Any],
+    base_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the store record of a run.
+
+    Args:
+        benchmark: Benchmark name (e.g. 'view-count', 'load:campaign')
+        summary: Summary printed/written by the benchmark
+        dataset: What the run was measured against (sizes, levels, rates)
+        base_url: Application base URL
+
+    Returns:
+        Store record
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "benchmark": benchmark,
+        **get_git_info(),
+        "dataset": dataset,
+        "environment": environment_fingerprint(base_url),
+        "metrics": flatten_metrics(summary),
+        "summary": summary,
+    }
+
+
+class ResultsStore:
+    """Append-only JSON-lines file of run records."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON-lines file (default: `get_store_path()`)
+        """
+        self.path = Path(path) if path else get_store_path()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """All records, oldest first (unreadable lines are skipped)."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def find(
+        self,
+        benchmark: Optional[str] = None,
+        commit: Optional[str] = None,
+        dataset: Optional[str] = None,
+        environment: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Records matching every given key.
+
+        Args:
+            benchmark: Benchmark name
+            commit: Commit hash or prefix
+            dataset: Dataset key (`dataset_key`)
+            environment: Environment fingerprint id
+
+        Returns:
+            Matching records, oldest first
+        """
+        return [
+            record for record in self.records()
+            if (benchmark is None or record.get("benchmark") == benchmark)
+            and (commit is None or (record.get("commit") or "").startswith(commit))
+            and (dataset is None or dataset_key(record.get("dataset", {})) == dataset)
+            and (environment is None or record.get("environment", {}).get("id") == environment)
+        ]
+
+
+def record_run(
+    benchmark: str,
+    summary: Dict[str, Any],
+    dataset: Dict[str, Any],
+    base_url: Optional[str] = None,
+    path: Optional[Path] = None
+) -> Path:
+    """
+    Append a run to the results store.
+
+    Args:
+        benchmark: Benchmark name
+        summary: Run summary
+        dataset: What the run was measured against
+        base_url: Application base URL
+        path: Store file (default: `get_store_path()`)
+
+    Returns:
+        Path of the store
+    """
+    store = ResultsStore(path)
+    store.append(build_record(benchmark, summary, dataset, base_url))
+    return store.path
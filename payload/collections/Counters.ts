@@ -0,0 +1,51 @@
+import type { CollectionConfig } from 'payload'
+
+import { isAdmin } from '../access'
+
+export const COUNTERS_SLUG = 'counters'
+
+// Sequence counters keyed by code prefix (PRM, ...) or purpose
+// (lead-round-robin). Written only by payload/hooks/sequence-counters.ts
+// through an atomic upsert.
+export const Counters: CollectionConfig = {
+  slug: COUNTERS_SLUG,
+  labels: {
+    singular: 'Contador',
+    plural: 'Contadores',
+  },
+  admin: {
+    useAsTitle: 'key',
+    defaultColumns: ['key', 'value', 'updatedAt'],
+    group: 'Configurações',
+    hidden: ({ user }) => user?.role !== 'admin',
+    description: 'Último número usado por prefixo de código e cursor do rodízio de leads. Atualizado automaticamente.',
+  },
+  access: {
+    read: isAdmin,
+    create: () => false,
+    update: () => false,
+    delete: () => false,
+  },
+  fields: [
+    {
+      name: 'key',
+      type: 'text',
+      required: true,
+      unique: true,
+      label: 'Chave',
+      admin: {
+        readOnly: true,
+      },
+    },
+    {
+      name: 'value',
+      type: 'number',
+      required: true,
+      defaultValue: 0,
+      label: 'Último Número',
+      admin: {
+        readOnly: true,
+      },
+    },
+  ],
+}
@@ -1,6 +1,14 @@
 import type { CollectionBeforeChangeHook, CollectionConfig, FieldHook } from 'payload'
 
 import { isOwnerOrAdmin } from '../access/is-owner-or-admin'
+import {
+  invalidateDashboardStatsOnChange,
+  invalidateDashboardStatsOnDelete,
+} from '../hooks/afterChange/invalidate-dashboard-stats'
+import {
+  invalidateAgentStatsOnChange,
+  invalidateAgentStatsOnDelete,
+} from '../hooks/afterChange/invalidate-agent-stats'
 
 export type DealStage = 'proposal' | 'contract' | 'signed' | 'cancelled'
 
@@ -26,6 +34,21 @@ const assignAgentOnCreate: CollectionBeforeChangeHook = async ({ data, req }) =>
   return data
 }
 
+// Data de assinatura: preenchida quando o negócio passa a `signed` e limpa se
+// sair desse estágio (usada no "fechados no mês" das estatísticas do corretor).
+const stampClosedAt: CollectionBeforeChangeHook = async ({ data, originalDoc }) => {
+  if (!data) return data
+
+  const stage = data.stage ?? originalDoc?.stage
+  if (stage !== 'signed') {
+    data.closedAt = null
+  } else if (originalDoc?.stage !== 'signed') {
+    data.closedAt = new Date().toISOString()
+  }
+
+  return data
+}
+
 const getRelationshipId = (value: unknown): string | null => {
   if (typeof value === 'string') return value
   if (typeof value === 'number') return String(value)
@@ -98,7 +121,12 @@ export const Deals: CollectionConfig = {
     group: 'CRM',
   },
   hooks: {
-    beforeChange: [assignAgentOnCreate],
+    beforeChange: [assignAgentOnCreate, stampClosedAt],
+    afterChange: [
+      invalidateDashboardStatsOnChange(['stage', 'finalPrice']),
+      invalidateAgentStatsOnChange('agent', ['stage', 'closedAt']),
+    ],
+    afterDelete: [invalidateDashboardStatsOnDelete, invalidateAgentStatsOnDelete('agent')],
   },
   access: {
     read: isOwnerOrAdmin,
@@ -158,9 +186,20 @@ export const Deals: CollectionConfig = {
       type: 'select',
       required: true,
       defaultValue: 'proposal',
+      index: true,
       options: DEAL_STAGE_OPTIONS,
       label: 'Estágio do Negócio',
     },
+    {
+      name: 'closedAt',
+      type: 'date',
+      label: 'Assinado em',
+      admin: {
+        position: 'sidebar',
+        readOnly: true,
+        description: 'Preenchido automaticamente quando o negócio é assinado',
+      },
+    },
     {
       name: 'agent',
       type: 'relationship',
@@ -1,8 +1,19 @@
 import type { CollectionBeforeChangeHook, CollectionConfig } from 'payload'
 
-import { distributeLead } from '../hooks/afterChange/distribute-lead'
-import { updateLeadScore } from '../hooks/afterChange/update-score'
+import {
+  invalidateDashboardStatsOnChange,
+  invalidateDashboardStatsOnDelete,
+} from '../hooks/afterChange/invalidate-dashboard-stats'
+import {
+  invalidateAgentStatsOnChange,
+  invalidateAgentStatsOnDelete,
+} from '../hooks/afterChange/invalidate-agent-stats'
+import { distributeLead } from '../hooks/beforeChange/distribute-lead'
+import { updateLeadScore } from '../hooks/beforeChange/update-score'
 import { normalizeBrazilianPhone, validateBrazilianPhone } from '../hooks/validators'
+import { PROPERTY_CATEGORIES } from './constants'
+
+const MAX_PRICE_VALUE = 999999999
 
 const normalizeLeadPhone: CollectionBeforeChangeHook = async ({ data }) => {
   if (!data) return data
@@ -40,8 +51,15 @@ export const Leads: CollectionConfig = {
     delete: ({ req }) => req.user?.role === 'admin',
   },
   hooks: {
-    beforeChange: [normalizeLeadPhone],
-    afterChange: [updateLeadScore, distributeLead],
+    // Pipeline do lead: telefone normalizado -> score -> corretor, tudo antes
+    // do insert/update, que grava o documento final em uma única escrita.
+    // afterChange fica só com efeitos colaterais.
+    beforeChange: [normalizeLeadPhone, updateLeadScore, distributeLead],
+    afterChange: [
+      invalidateDashboardStatsOnChange([]),
+      invalidateAgentStatsOnChange('assignedTo', ['status']),
+    ],
+    afterDelete: [invalidateDashboardStatsOnDelete, invalidateAgentStatsOnDelete('assignedTo')],
   },
   fields: [
     {
@@ -71,6 +89,56 @@ export const Leads: CollectionConfig = {
       },
       label: 'Último Contato',
     },
+    {
+      // Filtros da notificação de imóvel publicado: campo vazio aceita qualquer valor.
+      type: 'collapsible',
+      label: 'Interesse',
+      admin: { initCollapsed: true },
+      fields: [
+        {
+          type: 'row',
+          fields: [
+            {
+              name: 'neighborhood',
+              type: 'relationship',
+              relationTo: 'neighborhoods',
+              label: 'Bairro de Interesse',
+            },
+            {
+              name: 'propertyType',
+              type: 'select',
+              options: PROPERTY_CATEGORIES,
+              label: 'Tipo de Imóvel',
+            },
+          ],
+        },
+        {
+          type: 'row',
+          fields: [
+            {
+              name: 'priceRangeMin',
+              type: 'number',
+              min: 0,
+              max: MAX_PRICE_VALUE,
+              label: 'Preço Mínimo (R$)',
+            },
+            {
+              name: 'priceRangeMax',
+              type: 'number',
+              min: 0,
+              max: MAX_PRICE_VALUE,
+              label: 'Preço Máximo (R$)',
+            },
+          ],
+        },
+        {
+          name: 'doNotContact',
+          type: 'checkbox',
+          defaultValue: false,
+          label: 'Não enviar notificações',
+        },
+      ],
+    },
     {
       name: 'source',
       type: 'select',
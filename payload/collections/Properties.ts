@@ -3,6 +3,19 @@ import { autoCode } from '../hooks/beforeChange/auto-code'
 import { autoSlug } from '../hooks/beforeChange/auto-slug'
 import { revalidateProperty } from '../hooks/afterChange/revalidate-isr'
 import { notifyInterestedLeads } from '../hooks/afterChange/notify-leads'
+import {
+  invalidateDashboardStatsOnChange,
+  invalidateDashboardStatsOnDelete,
+} from '../hooks/afterChange/invalidate-dashboard-stats'
+import {
+  invalidateAgentStatsOnChange,
+  invalidateAgentStatsOnDelete,
+} from '../hooks/afterChange/invalidate-agent-stats'
+import {
+  invalidatePublishedPropertiesOnChange,
+  invalidatePublishedPropertiesOnDelete,
+} from '../hooks/afterChange/invalidate-published-properties'
+import { PROPERTY_CATEGORIES } from './constants'
 
 const MAX_PRICE_VALUE = 999999999
 
@@ -74,7 +87,18 @@ export const Properties: CollectionConfig = {
   },
   hooks: {
     beforeChange: [autoSlug('title'), autoCode('PRM'), syncNeighborhoodName, preserveGeneratedIdentity],
-    afterChange: [revalidateProperty, notifyInterestedLeads],
+    afterChange: [
+      revalidateProperty,
+      notifyInterestedLeads,
+      invalidateDashboardStatsOnChange(['status']),
+      invalidateAgentStatsOnChange('agent'),
+      invalidatePublishedPropertiesOnChange,
+    ],
+    afterDelete: [
+      invalidateDashboardStatsOnDelete,
+      invalidateAgentStatsOnDelete('agent'),
+      invalidatePublishedPropertiesOnDelete,
+    ],
   },
   fields: [
     {
@@ -132,14 +156,7 @@ export const Properties: CollectionConfig = {
                   name: 'category',
                   type: 'select',
                   required: true,
-                  options: [
-                    { label: 'Apartamento', value: 'apartment' },
-                    { label: 'Casa', value: 'house' },
-                    { label: 'Comercial', value: 'commercial' },
-                    { label: 'Terreno', value: 'land' },
-                    { label: 'Cobertura', value: 'penthouse' },
-                    { label: 'Studio', value: 'studio' },
-                  ],
+                  options: PROPERTY_CATEGORIES,
                 },
                 {
                   name: 'status',
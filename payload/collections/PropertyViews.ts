@@ -0,0 +1,97 @@
+import type { CollectionConfig } from 'payload'
+
+import { isAgent } from '../access'
+
+export const PROPERTY_VIEWS_SLUG = 'property-views'
+export const PROPERTY_VIEWS_TABLE_NAME = 'property_views'
+
+export const VIEW_GRANULARITIES = ['hour', 'day', 'month'] as const
+export type ViewGranularity = (typeof VIEW_GRANULARITIES)[number]
+
+// Visualizações agregadas por imóvel e período (hora, dia e mês). Escrito só
+// pelo flush de lib/view-counter.ts via upsert em `key`; consultado por
+// lib/view-analytics.ts com SQL direto, por isso o nome da tabela é fixo.
+export const PropertyViews: CollectionConfig = {
+  slug: PROPERTY_VIEWS_SLUG,
+  dbName: PROPERTY_VIEWS_TABLE_NAME,
+  labels: {
+    singular: 'Visualização por Período',
+    plural: 'Visualizações por Período',
+  },
+  admin: {
+    defaultColumns: ['property', 'granularity', 'periodStart', 'views'],
+    group: 'Imóveis',
+    hidden: ({ user }) => user?.role !== 'admin',
+    description: 'Visualizações de imóveis por hora, dia e mês. Atualizado automaticamente.',
+  },
+  access: {
+    read: isAgent,
+    create: () => false,
+    update: () => false,
+    delete: () => false,
+  },
+  indexes: [
+    {
+      fields: ['granularity', 'periodStart'],
+    },
+  ],
+  fields: [
+    {
+      // `${propertyId}:${granularity}:${periodStart}`, alvo do ON CONFLICT
+      name: 'key',
+      type: 'text',
+      required: true,
+      unique: true,
+      admin: {
+        hidden: true,
+      },
+    },
+    {
+      // Opcional: excluir o imóvel anula a referência e a poda remove a linha
+      name: 'property',
+      type: 'relationship',
+      relationTo: 'properties',
+      index: true,
+      label: 'Imóvel',
+      admin: {
+        readOnly: true,
+      },
+    },
+    {
+      name: 'granularity',
+      type: 'select',
+      required: true,
+      label: 'Granularidade',
+      options: [
+        { label: 'Hora', value: 'hour' },
+        { label: 'Dia', value: 'day' },
+        { label: 'Mês', value: 'month' },
+      ],
+      admin: {
+        readOnly: true,
+      },
+    },
+    {
+      name: 'periodStart',
+      type: 'date',
+      required: true,
+      label: 'Início do Período',
+      admin: {
+        readOnly: true,
+        date: {
+          pickerAppearance: 'dayAndTime',
+        },
+      },
+    },
+    {
+      name: 'views',
+      type: 'number',
+      required: true,
+      defaultValue: 0,
+      label: 'Visualizações',
+      admin: {
+        readOnly: true,
+      },
+    },
+  ],
+}
@@ -1,6 +1,7 @@
 import { ValidationError, type Access, type CollectionBeforeChangeHook, type CollectionConfig } from 'payload'
 
 import { isAdmin } from '../access/is-admin'
+import { invalidateAgentRosterOnChange, invalidateAgentRosterOnDelete } from '../hooks/agent-roster'
 import {
   normalizeBrazilianPhone,
   normalizeCreci,
@@ -123,6 +124,8 @@ export const Users: CollectionConfig = {
   },
   hooks: {
     beforeChange: [validatePasswordStrength, preventRoleChangeByNonAdmin, normalizeUserContactFields],
+    afterChange: [invalidateAgentRosterOnChange],
+    afterDelete: [invalidateAgentRosterOnDelete],
   },
   fields: [
     {
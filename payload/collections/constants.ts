@@ -34,3 +34,13 @@ export const BRAZILIAN_STATES = [
 ] as const satisfies BrazilianStateOption[]
 
 export type BrazilianStateCode = (typeof BRAZILIAN_STATES)[number]['value']
+
+// Categorias de imóvel: usadas pelo imóvel e pelo interesse do lead.
+export const PROPERTY_CATEGORIES = [
+  { label: 'Apartamento', value: 'apartment' },
+  { label: 'Casa', value: 'house' },
+  { label: 'Comercial', value: 'commercial' },
+  { label: 'Terreno', value: 'land' },
+  { label: 'Cobertura', value: 'penthouse' },
+  { label: 'Studio', value: 'studio' },
+]
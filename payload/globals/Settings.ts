@@ -70,13 +70,5 @@ export const SETTINGS: GlobalConfig = {
         },
       ],
     },
-    {
-      name: 'lastAssignedAgentIndex',
-      type: 'number',
-      admin: {
-        hidden: true,
-      },
-      defaultValue: 0,
-    },
   ],
 }
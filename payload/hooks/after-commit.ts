@@ -0,0 +1,39 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import type { PayloadRequest } from 'payload'
+
+/**
+ * Executa `callback` quando a transação da requisição terminar.
+ *
+ * Hooks `afterChange`/`afterDelete` rodam dentro da transação do save, antes
+ * do commit: uma consulta feita por outra conexão nesse intervalo ainda vê o
+ * estado anterior e, se for para um cache, fica lá até o TTL. Encadeado no
+ * `resolve`/`reject` da sessão do adapter, o callback roda depois do commit
+ * (ou do rollback, quando invalidar a mais é inofensivo). Sem transação
+ * aberta, roda na hora.
+ */
+export const runAfterCommit = async (req: PayloadRequest, callback: () => void): Promise<void> => {
+  const transactionID = await req.transactionID
+  const adapter = req.payload.db as unknown as SQLiteAdapter
+  const session = transactionID ? adapter.sessions?.[transactionID] : undefined
+
+  if (!session) {
+    callback()
+    return
+  }
+
+  const { resolve, reject } = session
+  session.resolve = async () => {
+    try {
+      await resolve()
+    } finally {
+      callback()
+    }
+  }
+  session.reject = async () => {
+    try {
+      await reject()
+    } finally {
+      callback()
+    }
+  }
+}
@@ -0,0 +1,51 @@
+import type { CollectionAfterChangeHook, CollectionAfterDeleteHook } from 'payload'
+
+import { invalidateAgentStats } from '@/lib/agent-stats'
+
+import { runAfterCommit } from '../after-commit'
+
+const getRelationshipId = (value: unknown): number | null => {
+  if (typeof value === 'number') return value
+  if (typeof value === 'string') {
+    const parsed = Number(value)
+    return Number.isSafeInteger(parsed) ? parsed : null
+  }
+  if (!value || typeof value !== 'object' || !('id' in value)) return null
+
+  return getRelationshipId((value as { id?: unknown }).id)
+}
+
+/**
+ * Invalida as estatísticas por corretor (lib/agent-stats.ts) do corretor
+ * atual e do anterior quando um documento é criado ou quando muda algum dos
+ * campos que entram nas métricas.
+ *
+ * Como no dashboard, a invalidação espera o commit do save.
+ * @param agentField Relacionamento com o corretor (`assignedTo`, `agent`)
+ * @param fields Demais campos que afetam as métricas (ex.: `status`)
+ */
+export const invalidateAgentStatsOnChange =
+  (agentField: string, fields: string[] = []): CollectionAfterChangeHook =>
+  async ({ doc, previousDoc, operation, req }) => {
+    const agentId = getRelationshipId(doc?.[agentField])
+    const previousAgentId = getRelationshipId(previousDoc?.[agentField])
+
+    if (
+      operation === 'create' ||
+      agentId !== previousAgentId ||
+      fields.some((field) => doc?.[field] !== previousDoc?.[field])
+    ) {
+      await runAfterCommit(req, () => invalidateAgentStats([agentId, previousAgentId]))
+    }
+
+    return doc
+  }
+
+/** @param agentField Relacionamento com o corretor (`assignedTo`, `agent`) */
+export const invalidateAgentStatsOnDelete =
+  (agentField: string): CollectionAfterDeleteHook =>
+  async ({ doc, req }) => {
+    const agentId = getRelationshipId(doc?.[agentField])
+    await runAfterCommit(req, () => invalidateAgentStats([agentId]))
+    return doc
+  }
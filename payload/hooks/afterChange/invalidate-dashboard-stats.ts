@@ -0,0 +1,31 @@
+import type { CollectionAfterChangeHook, CollectionAfterDeleteHook } from 'payload'
+
+import { invalidateDashboardStats } from '@/lib/dashboard-stats'
+
+import { runAfterCommit } from '../after-commit'
+
+/**
+ * Invalida o cache de KPIs do dashboard (lib/dashboard-stats.ts) quando um
+ * documento é criado ou quando muda algum dos campos que entram nos KPIs.
+ *
+ * A invalidação espera o commit do save: feita antes, uma carga concorrente
+ * ainda leria o estado anterior e o manteria em cache até o TTL.
+ * @param fields Campos que afetam os KPIs (ex.: `status` de imóveis)
+ */
+export const invalidateDashboardStatsOnChange =
+  (fields: string[]): CollectionAfterChangeHook =>
+  async ({ doc, previousDoc, operation, req }) => {
+    if (
+      operation === 'create' ||
+      fields.some((field) => doc?.[field] !== previousDoc?.[field])
+    ) {
+      await runAfterCommit(req, invalidateDashboardStats)
+    }
+
+    return doc
+  }
+
+export const invalidateDashboardStatsOnDelete: CollectionAfterDeleteHook = async ({ doc, req }) => {
+  await runAfterCommit(req, invalidateDashboardStats)
+  return doc
+}
@@ -0,0 +1,28 @@
+import type { CollectionAfterChangeHook, CollectionAfterDeleteHook } from 'payload'
+
+import { invalidatePublishedPropertyIds } from '@/lib/published-properties'
+
+import { runAfterCommit } from '../after-commit'
+
+/**
+ * Invalida a lista de imóveis publicados (lib/published-properties.ts),
+ * usada pelo contador de views, quando um imóvel é criado ou muda de
+ * `status`. A invalidação espera o commit do save.
+ */
+export const invalidatePublishedPropertiesOnChange: CollectionAfterChangeHook = async ({
+  doc,
+  previousDoc,
+  operation,
+  req,
+}) => {
+  if (operation === 'create' || doc?.status !== previousDoc?.status) {
+    await runAfterCommit(req, invalidatePublishedPropertyIds)
+  }
+
+  return doc
+}
+
+export const invalidatePublishedPropertiesOnDelete: CollectionAfterDeleteHook = async ({ doc, req }) => {
+  await runAfterCommit(req, invalidatePublishedPropertyIds)
+  return doc
+}
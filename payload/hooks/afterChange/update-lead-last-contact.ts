@@ -1,32 +1,38 @@
 import type { CollectionAfterChangeHook } from 'payload'
 
+import { SIDE_EFFECTS_QUEUE, UPDATE_LEAD_LAST_CONTACT_TASK } from '../../jobs/constants'
+
 interface ActivityDoc {
   id?: number | string
+  createdAt?: string
   lead?: string | number | { id: string | number }
 }
 
+/**
+ * Enfileira a atualização de `lastContactAt` do lead da atividade criada. O
+ * update do lead roda no worker da fila, com a data da atividade.
+ */
 export const updateLeadLastContact: CollectionAfterChangeHook = async ({ doc, req, operation }) => {
   if (operation !== 'create') return doc
 
   const activity = doc as ActivityDoc
 
   if (activity.lead) {
-    const leadId = typeof activity.lead === 'object' ? activity.lead.id : activity.lead
+    const leadId = Number(typeof activity.lead === 'object' ? activity.lead.id : activity.lead)
 
     try {
-      await req.payload.update({
-        collection: 'leads',
-        id: leadId,
-        data: {
-          lastContactAt: new Date().toISOString(),
-        },
-        context: {
-          internalUpdate: true,
+      await req.payload.jobs.queue({
+        task: UPDATE_LEAD_LAST_CONTACT_TASK,
+        queue: SIDE_EFFECTS_QUEUE,
+        input: {
+          leadId,
+          contactedAt: activity.createdAt ?? new Date().toISOString(),
         },
+        req,
       })
     } catch (error: unknown) {
       req.payload.logger.error({
-        msg: 'Erro ao atualizar lastContactAt do lead',
+        msg: 'Erro ao enfileirar atualização de lastContactAt do lead',
         activityId: activity.id,
         leadId,
         err: error,
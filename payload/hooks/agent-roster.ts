@@ -0,0 +1,113 @@
+import type {
+  CollectionAfterChangeHook,
+  CollectionAfterDeleteHook,
+  Payload,
+} from 'payload'
+
+import { runAfterCommit } from './after-commit'
+
+const DEFAULT_ROSTER_TTL_MS = 60_000
+
+interface AgentRosterState {
+  agentIds?: number[]
+  expiresAt: number
+  loading?: Promise<number[]>
+  // Incrementado a cada invalidação; uma carga anterior não vai para o cache.
+  generation: number
+}
+
+interface GlobalWithAgentRoster {
+  agentRoster?: AgentRosterState
+}
+
+const globalWithAgentRoster = global as unknown as GlobalWithAgentRoster
+
+const getState = (): AgentRosterState => {
+  globalWithAgentRoster.agentRoster ??= { expiresAt: 0, generation: 0 }
+  return globalWithAgentRoster.agentRoster
+}
+
+const readTtlMs = (): number => {
+  const parsed = Number.parseInt(process.env.AGENT_ROSTER_TTL_MS ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed >= 0 ? parsed : DEFAULT_ROSTER_TTL_MS
+}
+
+const loadActiveAgentIds = async (payload: Payload): Promise<number[]> => {
+  const agents = await payload.find({
+    collection: 'users',
+    where: {
+      role: { equals: 'agent' },
+      active: { equals: true },
+    },
+    depth: 0,
+    pagination: false,
+    select: { createdAt: true },
+    sort: 'createdAt',
+  })
+
+  return agents.docs.map((agent) => Number(agent.id)).filter((id) => Number.isSafeInteger(id))
+}
+
+/**
+ * IDs dos corretores ativos, em ordem de cadastro, para o rodízio de leads.
+ *
+ * Fica em memória até um hook de `users` invalidar (criação, exclusão ou
+ * mudança de `role`/`active`) ou até AGENT_ROSTER_TTL_MS (default 60s), que
+ * limita a defasagem quando outro processo altera usuários. Cargas
+ * simultâneas compartilham a mesma consulta.
+ */
+export const getActiveAgentIds = async (payload: Payload): Promise<number[]> => {
+  const state = getState()
+  if (state.agentIds && state.expiresAt > Date.now()) return state.agentIds
+
+  if (!state.loading) {
+    const generation = state.generation
+    const loading = loadActiveAgentIds(payload)
+      .then((agentIds) => {
+        if (state.generation === generation) {
+          state.agentIds = agentIds
+          state.expiresAt = Date.now() + readTtlMs()
+        }
+        return agentIds
+      })
+      .finally(() => {
+        if (state.loading === loading) state.loading = undefined
+      })
+    state.loading = loading
+  }
+
+  return state.loading
+}
+
+export const invalidateAgentRoster = (): void => {
+  const state = getState()
+  state.generation += 1
+  state.agentIds = undefined
+  state.loading = undefined
+}
+
+/**
+ * A invalidação espera o commit do save de `users`: antes dele, uma carga
+ * concorrente ainda leria a lista antiga e a manteria até o TTL.
+ */
+export const invalidateAgentRosterOnChange: CollectionAfterChangeHook = async ({
+  doc,
+  previousDoc,
+  operation,
+  req,
+}) => {
+  if (
+    operation === 'create' ||
+    doc?.role !== previousDoc?.role ||
+    doc?.active !== previousDoc?.active
+  ) {
+    await runAfterCommit(req, invalidateAgentRoster)
+  }
+
+  return doc
+}
+
+export const invalidateAgentRosterOnDelete: CollectionAfterDeleteHook = async ({ doc, req }) => {
+  await runAfterCommit(req, invalidateAgentRoster)
+  return doc
+}
@@ -1,11 +1,15 @@
-import type { CollectionBeforeChangeHook, Payload } from 'payload'
+import type { CollectionBeforeChangeHook, Payload, PayloadRequest } from 'payload'
 
-type AutoCodeCollection = 'properties' | 'leads'
+import { AUTO_CODE_QUERIES_HEADER, setResponseMetric } from '../response-metrics'
+import { nextCounterValue, raiseCounter } from '../sequence-counters'
+
+export type AutoCodeCollection = 'properties' | 'leads'
 type AutoCodeDoc = { code?: string | null }
 
 const DEFAULT_CODE_PADDING = 3
-const MAX_CODE_SCAN = 200
-const MAX_COLLISION_CHECKS = 25
+
+/** Prefixos registrados por `autoCode` e a coleção de cada um (usado pelo backfill). */
+export const AUTO_CODE_SEQUENCES = new Map<string, AutoCodeCollection>()
 
 const escapeRegExp = (value: string): string => value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')
 
@@ -31,19 +35,27 @@ const formatCode = (prefix: string, index: number): string => {
   return `${prefix}-${String(index).padStart(DEFAULT_CODE_PADDING, '0')}`
 }
 
-const getNextCodeNumber = async ({
+/**
+ * Maior número já usado com o prefixo, lendo todos os códigos da coleção.
+ * Usado só para semear o contador na primeira geração e pelo backfill.
+ */
+export const findHighestCodeNumber = async ({
   collectionSlug,
   normalizedPrefix,
   payload,
+  req,
 }: {
   collectionSlug: AutoCodeCollection
   normalizedPrefix: string
   payload: Payload
+  req?: PayloadRequest
 }): Promise<number> => {
   const existingDocs = await payload.find({
     collection: collectionSlug,
-    limit: MAX_CODE_SCAN,
-    sort: '-code',
+    depth: 0,
+    pagination: false,
+    req,
+    select: { code: true },
     where: {
       code: {
         like: `${normalizedPrefix}-%`,
@@ -51,7 +63,7 @@ const getNextCodeNumber = async ({
     },
   })
 
-  const currentMax = existingDocs.docs.reduce((max, doc) => {
+  return existingDocs.docs.reduce((max, doc) => {
     const code = getCodeFromUnknown(doc)
     if (!code) return max
 
@@ -60,49 +72,37 @@ const getNextCodeNumber = async ({
 
     return Math.max(max, suffix)
   }, 0)
-
-  let nextNumber = currentMax + 1
-
-  for (let attempt = 0; attempt < MAX_COLLISION_CHECKS; attempt += 1) {
-    const candidate = formatCode(normalizedPrefix, nextNumber)
-    const existingCandidate = await payload.find({
-      collection: collectionSlug,
-      limit: 1,
-      where: {
-        code: {
-          equals: candidate,
-        },
-      },
-    })
-
-    if (existingCandidate.totalDocs === 0) {
-      return nextNumber
-    }
-
-    nextNumber += 1
-  }
-
-  return nextNumber
 }
 
+/**
+ * Gera `code` (PREFIXO-001, PREFIXO-002, ...) no create a partir do contador
+ * atômico do prefixo (collection `counters`), dentro da transação do create.
+ */
 export const autoCode = (
   prefix: string,
   collectionSlug: AutoCodeCollection = 'properties'
 ): CollectionBeforeChangeHook => {
   const normalizedPrefix = prefix.trim().toUpperCase()
+  if (normalizedPrefix) AUTO_CODE_SEQUENCES.set(normalizedPrefix, collectionSlug)
 
   return async ({ data, operation, req }) => {
     if (!data || operation !== 'create') return data
-    if (typeof data.code === 'string' && data.code.trim() !== '') return data
     if (!normalizedPrefix) return data
 
-    const nextNumber = await getNextCodeNumber({
-      collectionSlug,
-      normalizedPrefix,
-      payload: req.payload,
-    })
+    if (typeof data.code === 'string' && data.code.trim() !== '') {
+      // Código manual no formato do prefixo: o contador não pode ficar para trás.
+      const suffix = getNumericSuffix(data.code.trim().toUpperCase(), normalizedPrefix)
+      if (suffix) await raiseCounter(req, normalizedPrefix, suffix)
+      return data
+    }
+
+    const { value, queries } = await nextCounterValue(req, normalizedPrefix, () =>
+      findHighestCodeNumber({ collectionSlug, normalizedPrefix, payload: req.payload, req }),
+    )
+
+    data.code = formatCode(normalizedPrefix, value)
 
-    data.code = formatCode(normalizedPrefix, nextNumber)
+    setResponseMetric(req, AUTO_CODE_QUERIES_HEADER, queries)
 
     return data
   }
@@ -0,0 +1,36 @@
+import type { CollectionBeforeChangeHook } from 'payload'
+import { getActiveAgentIds } from '../agent-roster'
+import { nextCounterValue } from '../sequence-counters'
+
+// Cursor do rodízio na collection `counters`: avança uma vez por lead distribuído.
+export const LEAD_ROUND_ROBIN_COUNTER_KEY = 'lead-round-robin'
+
+/**
+ * Atribui o lead criado sem `assignedTo` ao próximo corretor do rodízio, no
+ * próprio insert (sem um update posterior).
+ *
+ * Lista em cache (invalidada pelos hooks de users) + um incremento atômico do
+ * cursor na transação do create: leads simultâneos recebem posições distintas
+ * e um create que falha não consome a vez do corretor.
+ */
+export const distributeLead: CollectionBeforeChangeHook = async ({ data, req, operation }) => {
+  if (!data) return data
+
+  if (operation !== 'create' || data.assignedTo) return data
+
+  try {
+    const agentIds = await getActiveAgentIds(req.payload)
+    if (agentIds.length === 0) return data
+
+    const { value: position } = await nextCounterValue(req, LEAD_ROUND_ROBIN_COUNTER_KEY, async () => 0)
+    data.assignedTo = agentIds[(position - 1) % agentIds.length]
+  } catch (error: unknown) {
+    // Lead sem corretor é melhor que lead perdido: não trava o create.
+    req.payload.logger.error({
+      msg: 'Falha ao distribuir lead',
+      err: error,
+    })
+  }
+
+  return data
+}
@@ -0,0 +1,30 @@
+import type { CollectionBeforeChangeHook } from 'payload'
+
+const PHONE_SCORE = 20
+const EMAIL_SCORE = 20
+// Score máximo atual: phone (20) + email (20) = 40
+const MAX_SCORE = PHONE_SCORE + EMAIL_SCORE
+
+/**
+ * Calcula o score do lead antes de gravar, para que create/update saiam com o
+ * valor final em uma única escrita. Em updates parciais, campos ausentes em
+ * `data` vêm do documento original.
+ */
+export const updateLeadScore: CollectionBeforeChangeHook = async ({ data, originalDoc, operation }) => {
+  if (!data) return data
+
+  // Apenas para criação e atualização
+  if (operation !== 'create' && operation !== 'update') return data
+
+  const phone = 'phone' in data ? data.phone : originalDoc?.phone
+  const email = 'email' in data ? data.email : originalDoc?.email
+
+  // Lógica de pontuação baseada em completude de dados
+  let score = 0
+  if (phone) score += PHONE_SCORE
+  if (email) score += EMAIL_SCORE
+
+  data.score = Math.max(0, Math.min(MAX_SCORE, score))
+
+  return data
+}
@@ -0,0 +1,13 @@
+import type { PayloadRequest } from 'payload'
+
+// Queries used by autoCode to pick a code (1 counter update; 3 when the counter is seeded).
+export const AUTO_CODE_QUERIES_HEADER = 'X-Auto-Code-Queries'
+
+/**
+ * Expõe um contador da requisição como header da resposta REST
+ * (lido pelos benchmarks em loadtest/benchmarks).
+ */
+export const setResponseMetric = (req: PayloadRequest, header: string, value: number): void => {
+  req.responseHeaders = req.responseHeaders ?? new Headers()
+  req.responseHeaders.set(header, String(value))
+}
@@ -0,0 +1,103 @@
+import type { SQLiteAdapter } from '@payloadcms/db-sqlite'
+import { sql } from '@payloadcms/db-sqlite'
+import type { Payload, PayloadRequest } from 'payload'
+
+import { COUNTERS_SLUG } from '../collections/Counters'
+
+type CounterRow = { value: number | bigint | string }
+
+const COUNTERS_TABLE = sql.identifier(COUNTERS_SLUG)
+
+/**
+ * Conexão da transação da requisição (se houver), para que o contador avance
+ * e seja revertido junto com o documento que está sendo criado.
+ */
+const getDb = async (payload: Payload, req?: PayloadRequest) => {
+  const adapter = payload.db as unknown as SQLiteAdapter
+  const transactionID = req ? await req.transactionID : undefined
+  return (transactionID ? adapter.sessions?.[transactionID]?.db : undefined) ?? adapter.drizzle
+}
+
+const readValue = (rows: CounterRow[]): number | null => {
+  const value = rows[0]?.value
+  return value === undefined || value === null ? null : Number(value)
+}
+
+/**
+ * Avança o contador `key` e retorna o novo valor, com um único UPDATE atômico.
+ *
+ * Na primeira vez que o prefixo é usado (sem linha no contador), `seed` informa
+ * o maior número já existente e o contador é criado a partir dele; dois creates
+ * simultâneos nesse momento caem no ON CONFLICT e recebem números distintos.
+ *
+ * @returns Novo valor e quantas queries foram usadas
+ */
+export const nextCounterValue = async (
+  req: PayloadRequest,
+  key: string,
+  seed: () => Promise<number>,
+): Promise<{ value: number; queries: number }> => {
+  const db = await getDb(req.payload, req)
+  const now = new Date().toISOString()
+
+  const updated = readValue(
+    await db.all<CounterRow>(sql`
+      UPDATE ${COUNTERS_TABLE}
+      SET value = value + 1, updated_at = ${now}
+      WHERE key = ${key}
+      RETURNING value
+    `),
+  )
+  if (updated !== null) {
+    return { value: updated, queries: 1 }
+  }
+
+  const floor = await seed()
+  const inserted = readValue(
+    await db.all<CounterRow>(sql`
+      INSERT INTO ${COUNTERS_TABLE} (key, value, updated_at, created_at)
+      VALUES (${key}, ${floor + 1}, ${now}, ${now})
+      ON CONFLICT (key) DO UPDATE SET value = ${COUNTERS_TABLE}.value + 1, updated_at = excluded.updated_at
+      RETURNING value
+    `),
+  )
+
+  return { value: inserted ?? floor + 1, queries: 3 }
+}
+
+/**
+ * Garante que o contador `key` esteja pelo menos em `value` (códigos informados
+ * manualmente). Só atualiza contadores existentes: um contador novo é semeado
+ * pelo maior código na primeira geração.
+ */
+export const raiseCounter = async (req: PayloadRequest, key: string, value: number): Promise<void> => {
+  const db = await getDb(req.payload, req)
+
+  await db.run(sql`
+    UPDATE ${COUNTERS_TABLE}
+    SET value = ${value}, updated_at = ${new Date().toISOString()}
+    WHERE key = ${key} AND value < ${value}
+  `)
+}
+
+/**
+ * Cria ou ajusta o contador `key` para pelo menos `value` (backfill).
+ * @returns Valor do contador após o ajuste
+ */
+export const backfillCounter = async (payload: Payload, key: string, value: number): Promise<number> => {
+  const db = await getDb(payload)
+  const now = new Date().toISOString()
+
+  const result = readValue(
+    await db.all<CounterRow>(sql`
+      INSERT INTO ${COUNTERS_TABLE} (key, value, updated_at, created_at)
+      VALUES (${key}, ${value}, ${now}, ${now})
+      ON CONFLICT (key) DO UPDATE SET
+        value = max(${COUNTERS_TABLE}.value, excluded.value),
+        updated_at = excluded.updated_at
+      RETURNING value
+    `),
+  )
+
+  return result ?? value
+}
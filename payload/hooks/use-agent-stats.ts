@@ -44,7 +44,7 @@ const parseAgentStats = (value: unknown): AgentStats => {
 }
 
 async function fetchUserStats(userId: number): Promise<AgentStats> {
-  const response = await fetch(`/api/dashboard-stats?agentId=${encodeURIComponent(String(userId))}`)
+  const response = await fetch(`/api/agent-stats?agentId=${encodeURIComponent(String(userId))}`)
   if (!response.ok) {
     throw new Error('Failed to fetch stats')
   }
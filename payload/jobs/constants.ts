@@ -0,0 +1,6 @@
+// Fila dos efeitos colaterais dos hooks (e-mail, atualizações derivadas).
+// Os hooks só enfileiram; o worker do Payload processa fora da requisição.
+export const SIDE_EFFECTS_QUEUE = 'side-effects'
+
+export const NOTIFY_INTERESTED_LEADS_TASK = 'notifyInterestedLeads'
+export const UPDATE_LEAD_LAST_CONTACT_TASK = 'updateLeadLastContact'
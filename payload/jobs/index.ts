@@ -0,0 +1,61 @@
+import type { JobsConfig } from 'payload'
+
+import { SIDE_EFFECTS_QUEUE } from './constants'
+import { NotifyInterestedLeadsTask } from './notify-interested-leads'
+import { UpdateLeadLastContactTask } from './update-lead-last-contact'
+
+const DEFAULT_AUTORUN_CRON = '*/10 * * * * *'
+const DEFAULT_CONCURRENCY = 5
+
+const readConcurrency = (): number => {
+  const parsed = Number.parseInt(process.env.JOBS_CONCURRENCY ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed > 0 ? parsed : DEFAULT_CONCURRENCY
+}
+
+/**
+ * Fila durável dos efeitos colaterais dos hooks, na tabela `payload_jobs` do
+ * próprio SQLite.
+ *
+ * O worker embutido roda a cada JOBS_AUTORUN_CRON (default a cada 10s) e
+ * executa até JOBS_CONCURRENCY jobs (default 5) por rodada. Com
+ * JOBS_AUTORUN=false o processo web só enfileira e a fila é consumida por
+ * um worker separado (`payload jobs:run --queue side-effects`).
+ */
+export const jobsConfig: JobsConfig = {
+  tasks: [NotifyInterestedLeadsTask, UpdateLeadLastContactTask],
+  autoRun: [
+    {
+      cron: process.env.JOBS_AUTORUN_CRON || DEFAULT_AUTORUN_CRON,
+      queue: SIDE_EFFECTS_QUEUE,
+      limit: readConcurrency(),
+    },
+  ],
+  shouldAutoRun: () => process.env.JOBS_AUTORUN !== 'false',
+  // Concluídos saem da tabela; com erro ficam como fila de mortos.
+  deleteJobOnComplete: true,
+  access: {
+    run: ({ req }) => req.user?.role === 'admin',
+    queue: ({ req }) => req.user?.role === 'admin',
+    cancel: ({ req }) => req.user?.role === 'admin',
+  },
+  jobsCollectionOverrides: ({ defaultJobsCollection }) => ({
+    ...defaultJobsCollection,
+    labels: {
+      singular: 'Job',
+      plural: 'Fila de Jobs',
+    },
+    admin: {
+      ...defaultJobsCollection.admin,
+      hidden: ({ user }) => user?.role !== 'admin',
+      group: 'Configurações',
+      defaultColumns: ['taskSlug', 'queue', 'totalTried', 'hasError', 'waitUntil', 'createdAt'],
+      description:
+        'Efeitos colaterais pendentes (e-mails, atualizações derivadas). Jobs com erro esgotaram as tentativas.',
+    },
+    access: {
+      ...defaultJobsCollection.access,
+      read: ({ req }) => req.user?.role === 'admin',
+      delete: ({ req }) => req.user?.role === 'admin',
+    },
+  }),
+}
@@ -0,0 +1,105 @@
+import type { Payload, TaskConfig } from 'payload'
+
+import { notifyLeadsOfProperty, type LeadNotificationProgress } from '../../lib/lead-notifications'
+import type { TaskNotifyInterestedLeads } from '../payload-types'
+import { NOTIFY_INTERESTED_LEADS_TASK } from './constants'
+import { readJobRetries } from './retries'
+
+type TaskNotifyInterestedLeadsInput = TaskNotifyInterestedLeads['input']
+
+const readLeadIds = (value: unknown): number[] =>
+  Array.isArray(value) ? value.filter((id): id is number => Number.isSafeInteger(id)) : []
+
+/**
+ * Grava o ponto de retomada no `input` do job. Sem `req`, a escrita não
+ * participa da transação da execução e fica salva mesmo quando a tentativa
+ * falha.
+ */
+const saveProgress = async (
+  payload: Payload,
+  jobId: number | string,
+  input: TaskNotifyInterestedLeadsInput,
+  progress: LeadNotificationProgress,
+): Promise<void> => {
+  await payload.update({
+    collection: 'payload-jobs',
+    id: jobId,
+    data: { input: { ...input, ...progress } },
+    depth: 0,
+  })
+}
+
+/**
+ * Envia o e-mail de novo imóvel a todos os leads interessados.
+ *
+ * Enfileirado por `notifyInterestedLeads` quando o imóvel é publicado. O
+ * imóvel é relido na execução: se foi despublicado enquanto o job esperava,
+ * nada é enviado. Os leads são percorridos por keyset e enviados em lotes do
+ * Resend (lib/lead-notifications.ts); se algum lote falhar mesmo após as
+ * tentativas, o job inteiro é tentado de novo.
+ *
+ * O ponto de retomada (último lead notificado e os leads dos lotes aceitos
+ * além dele) é gravado no `input` do job a cada página, e a nova tentativa
+ * continua dali sem reenviar quem já recebeu. A chave de idempotência de cada
+ * lote inclui o ID do job e o número da tentativa: dentro da tentativa, o
+ * reenvio de um lote reaproveita a chave; entre tentativas os lotes podem ser
+ * divididos de outro jeito e precisam de chaves novas, já que o Resend
+ * recusa uma chave repetida com outro conteúdo.
+ */
+export const NotifyInterestedLeadsTask: TaskConfig<typeof NOTIFY_INTERESTED_LEADS_TASK> = {
+  slug: NOTIFY_INTERESTED_LEADS_TASK,
+  label: 'Notificar leads interessados',
+  inputSchema: [
+    {
+      name: 'propertyId',
+      type: 'number',
+      required: true,
+    },
+    // Ponto de retomada, gravado pelo próprio job (ver saveProgress).
+    { name: 'afterLeadId', type: 'number' },
+    { name: 'sentLeadIds', type: 'json' },
+  ],
+  outputSchema: [
+    { name: 'leads', type: 'number' },
+    { name: 'sent', type: 'number' },
+    { name: 'batches', type: 'number' },
+    { name: 'failedBatches', type: 'number' },
+  ],
+  retries: readJobRetries(),
+  handler: async ({ input, job, req }) => {
+    const property = await req.payload.findByID({
+      collection: 'properties',
+      id: input.propertyId,
+      depth: 0,
+      disableErrors: true,
+      req,
+    })
+
+    if (!property || property.status !== 'published') {
+      return { output: { leads: 0, sent: 0, batches: 0, failedBatches: 0 } }
+    }
+
+    const summary = await notifyLeadsOfProperty(req.payload, property, {
+      idempotencyPrefix: `notify-leads/${job.id}/${job.totalTried ?? 0}`,
+      resumeFrom: {
+        afterLeadId: input.afterLeadId ?? 0,
+        sentLeadIds: readLeadIds(input.sentLeadIds),
+      },
+      onProgress: (progress) => saveProgress(req.payload, job.id, input, progress),
+    })
+
+    req.payload.logger.info({
+      msg: 'Leads interessados notificados',
+      propertyCode: property.code,
+      ...summary,
+    })
+
+    if (summary.failedBatches > 0) {
+      throw new Error(
+        `${summary.failedBatches} de ${summary.batches} lote(s) falharam ao notificar leads do imóvel ${property.code}`,
+      )
+    }
+
+    return { output: summary }
+  },
+}
@@ -0,0 +1,23 @@
+import type { RetryConfig } from 'payload'
+
+const DEFAULT_MAX_ATTEMPTS = 5
+const DEFAULT_BACKOFF_DELAY_MS = 30_000
+
+const readPositiveInt = (value: string | undefined, fallback: number): number => {
+  const parsed = Number.parseInt(value ?? '', 10)
+  return Number.isSafeInteger(parsed) && parsed > 0 ? parsed : fallback
+}
+
+/**
+ * Política de novas tentativas das tasks: JOB_MAX_ATTEMPTS (default 5) com
+ * backoff exponencial a partir de JOB_BACKOFF_DELAY_MS (default 30s). Esgotadas
+ * as tentativas, o job fica em `payload-jobs` com `hasError` marcado (fila de
+ * mortos) até um admin excluí-lo.
+ */
+export const readJobRetries = (): RetryConfig => ({
+  attempts: readPositiveInt(process.env.JOB_MAX_ATTEMPTS, DEFAULT_MAX_ATTEMPTS),
+  backoff: {
+    type: 'exponential',
+    delay: readPositiveInt(process.env.JOB_BACKOFF_DELAY_MS, DEFAULT_BACKOFF_DELAY_MS),
+  },
+})
@@ -0,0 +1,59 @@
+import type { TaskConfig } from 'payload'
+
+import { UPDATE_LEAD_LAST_CONTACT_TASK } from './constants'
+import { readJobRetries } from './retries'
+
+/**
+ * Grava `lastContactAt` do lead com a data da atividade que o originou.
+ *
+ * Só avança a data: uma execução atrasada ou repetida não sobrescreve um
+ * contato mais recente. Lead excluído não casa com o filtro e o job termina
+ * sem erro.
+ */
+export const UpdateLeadLastContactTask: TaskConfig<typeof UPDATE_LEAD_LAST_CONTACT_TASK> = {
+  slug: UPDATE_LEAD_LAST_CONTACT_TASK,
+  label: 'Atualizar último contato do lead',
+  inputSchema: [
+    {
+      name: 'leadId',
+      type: 'number',
+      required: true,
+    },
+    {
+      name: 'contactedAt',
+      type: 'date',
+      required: true,
+    },
+  ],
+  retries: readJobRetries(),
+  handler: async ({ input, req }) => {
+    const result = await req.payload.update({
+      collection: 'leads',
+      where: {
+        and: [
+          { id: { equals: input.leadId } },
+          {
+            or: [
+              { lastContactAt: { exists: false } },
+              { lastContactAt: { less_than: input.contactedAt } },
+            ],
+          },
+        ],
+      },
+      data: {
+        lastContactAt: input.contactedAt,
+      },
+      depth: 0,
+      context: {
+        internalUpdate: true,
+      },
+      req,
+    })
+
+    if (result.errors.length > 0) {
+      throw new Error(`Falha ao atualizar lastContactAt do lead ${input.leadId}`)
+    }
+
+    return { output: {} }
+  },
+}
@@ -76,7 +76,10 @@ export interface Config {
     leads: Lead;
     deals: Deal;
     activities: Activity;
+    counters: Counter;
+    'property-views': PropertyView;
     'payload-kv': PayloadKv;
+    'payload-jobs': PayloadJob;
     'payload-locked-documents': PayloadLockedDocument;
     'payload-preferences': PayloadPreference;
     'payload-migrations': PayloadMigration;
@@ -92,7 +95,10 @@ export interface Config {
     leads: LeadsSelect<false> | LeadsSelect<true>;
     deals: DealsSelect<false> | DealsSelect<true>;
     activities: ActivitiesSelect<false> | ActivitiesSelect<true>;
+    counters: CountersSelect<false> | CountersSelect<true>;
+    'property-views': PropertyViewsSelect<false> | PropertyViewsSelect<true>;
     'payload-kv': PayloadKvSelect<false> | PayloadKvSelect<true>;
+    'payload-jobs': PayloadJobsSelect<false> | PayloadJobsSelect<true>;
     'payload-locked-documents': PayloadLockedDocumentsSelect<false> | PayloadLockedDocumentsSelect<true>;
     'payload-preferences': PayloadPreferencesSelect<false> | PayloadPreferencesSelect<true>;
     'payload-migrations': PayloadMigrationsSelect<false> | PayloadMigrationsSelect<true>;
@@ -112,7 +118,14 @@ export interface Config {
   locale: null;
   user: User;
   jobs: {
-    tasks: unknown;
+    tasks: {
+      notifyInterestedLeads: TaskNotifyInterestedLeads;
+      updateLeadLastContact: TaskUpdateLeadLastContact;
+      inline: {
+        input: unknown;
+        output: unknown;
+      };
+    };
     workflows: unknown;
   };
 }
@@ -399,6 +412,11 @@ export interface Lead {
   phone?: string | null;
   email?: string | null;
   lastContactAt?: string | null;
+  neighborhood?: (number | null) | Neighborhood;
+  propertyType?: ('apartment' | 'house' | 'commercial' | 'land' | 'penthouse' | 'studio') | null;
+  priceRangeMin?: number | null;
+  priceRangeMax?: number | null;
+  doNotContact?: boolean | null;
   source?: ('website' | 'whatsapp' | 'instagram' | 'referral' | 'other') | null;
   status:
     | 'new'
@@ -431,6 +449,10 @@ export interface Deal {
   offerPrice?: number | null;
   finalPrice?: number | null;
   stage: 'proposal' | 'contract' | 'signed' | 'cancelled';
+  /**
+   * Preenchido automaticamente quando o negócio é assinado
+   */
+  closedAt?: string | null;
   agent: number | User;
   updatedAt: string;
   createdAt: string;
@@ -448,6 +470,35 @@ export interface Activity {
   updatedAt: string;
   createdAt: string;
 }
+/**
+ * Último número usado por prefixo de código e cursor do rodízio de leads. Atualizado automaticamente.
+ *
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "counters".
+ */
+export interface Counter {
+  id: number;
+  key: string;
+  value: number;
+  updatedAt: string;
+  createdAt: string;
+}
+/**
+ * Visualizações de imóveis por hora, dia e mês. Atualizado automaticamente.
+ *
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "property-views".
+ */
+export interface PropertyView {
+  id: number;
+  key: string;
+  property?: (number | null) | Property;
+  granularity: 'hour' | 'day' | 'month';
+  periodStart: string;
+  views: number;
+  updatedAt: string;
+  createdAt: string;
+}
 /**
  * This interface was referenced by `Config`'s JSON-Schema
  * via the `definition` "payload-kv".
@@ -465,6 +516,100 @@ export interface PayloadKv {
     | boolean
     | null;
 }
+/**
+ * Efeitos colaterais pendentes (e-mails, atualizações derivadas). Jobs com erro esgotaram as tentativas.
+ *
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "payload-jobs".
+ */
+export interface PayloadJob {
+  id: number;
+  /**
+   * Input data provided to the job
+   */
+  input?:
+    | {
+        [k: string]: unknown;
+      }
+    | unknown[]
+    | string
+    | number
+    | boolean
+    | null;
+  taskStatus?:
+    | {
+        [k: string]: unknown;
+      }
+    | unknown[]
+    | string
+    | number
+    | boolean
+    | null;
+  completedAt?: string | null;
+  totalTried?: number | null;
+  /**
+   * If hasError is true this job will not be retried
+   */
+  hasError?: boolean | null;
+  /**
+   * If hasError is true, this is the error that caused it
+   */
+  error?:
+    | {
+        [k: string]: unknown;
+      }
+    | unknown[]
+    | string
+    | number
+    | boolean
+    | null;
+  /**
+   * Task execution log
+   */
+  log?:
+    | {
+        executedAt: string;
+        completedAt: string;
+        taskSlug: 'inline' | 'notifyInterestedLeads' | 'updateLeadLastContact';
+        taskID: string;
+        input?:
+          | {
+              [k: string]: unknown;
+            }
+          | unknown[]
+          | string
+          | number
+          | boolean
+          | null;
+        output?:
+          | {
+              [k: string]: unknown;
+            }
+          | unknown[]
+          | string
+          | number
+          | boolean
+          | null;
+        state: 'failed' | 'succeeded';
+        error?:
+          | {
+              [k: string]: unknown;
+            }
+          | unknown[]
+          | string
+          | number
+          | boolean
+          | null;
+        id?: string | null;
+      }[]
+    | null;
+  taskSlug?: ('inline' | 'notifyInterestedLeads' | 'updateLeadLastContact') | null;
+  queue?: string | null;
+  waitUntil?: string | null;
+  processing?: boolean | null;
+  updatedAt: string;
+  createdAt: string;
+}
 /**
  * This interface was referenced by `Config`'s JSON-Schema
  * via the `definition` "payload-locked-documents".
@@ -507,6 +652,18 @@ export interface PayloadLockedDocument {
     | ({
         relationTo: 'activities';
         value: number | Activity;
+      } | null)
+    | ({
+        relationTo: 'counters';
+        value: number | Counter;
+      } | null)
+    | ({
+        relationTo: 'property-views';
+        value: number | PropertyView;
+      } | null)
+    | ({
+        relationTo: 'payload-jobs';
+        value: number | PayloadJob;
       } | null);
   globalSlug?: string | null;
   user: {
@@ -732,6 +889,11 @@ export interface LeadsSelect<T extends boolean = true> {
   phone?: T;
   email?: T;
   lastContactAt?: T;
+  neighborhood?: T;
+  propertyType?: T;
+  priceRangeMin?: T;
+  priceRangeMax?: T;
+  doNotContact?: T;
   source?: T;
   status?: T;
   priority?: T;
@@ -752,6 +914,7 @@ export interface DealsSelect<T extends boolean = true> {
   offerPrice?: T;
   finalPrice?: T;
   stage?: T;
+  closedAt?: T;
   agent?: T;
   updatedAt?: T;
   createdAt?: T;
@@ -768,6 +931,29 @@ export interface ActivitiesSelect<T extends boolean = true> {
   updatedAt?: T;
   createdAt?: T;
 }
+/**
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "counters_select".
+ */
+export interface CountersSelect<T extends boolean = true> {
+  key?: T;
+  value?: T;
+  updatedAt?: T;
+  createdAt?: T;
+}
+/**
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "property-views_select".
+ */
+export interface PropertyViewsSelect<T extends boolean = true> {
+  key?: T;
+  property?: T;
+  granularity?: T;
+  periodStart?: T;
+  views?: T;
+  updatedAt?: T;
+  createdAt?: T;
+}
 /**
  * This interface was referenced by `Config`'s JSON-Schema
  * via the `definition` "payload-kv_select".
@@ -776,6 +962,37 @@ export interface PayloadKvSelect<T extends boolean = true> {
   key?: T;
   data?: T;
 }
+/**
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "payload-jobs_select".
+ */
+export interface PayloadJobsSelect<T extends boolean = true> {
+  input?: T;
+  taskStatus?: T;
+  completedAt?: T;
+  totalTried?: T;
+  hasError?: T;
+  error?: T;
+  log?:
+    | T
+    | {
+        executedAt?: T;
+        completedAt?: T;
+        taskSlug?: T;
+        taskID?: T;
+        input?: T;
+        output?: T;
+        state?: T;
+        error?: T;
+        id?: T;
+      };
+  taskSlug?: T;
+  queue?: T;
+  waitUntil?: T;
+  processing?: T;
+  updatedAt?: T;
+  createdAt?: T;
+}
 /**
  * This interface was referenced by `Config`'s JSON-Schema
  * via the `definition` "payload-locked-documents_select".
@@ -825,7 +1042,6 @@ export interface Settings {
         id?: string | null;
       }[]
     | null;
-  lastAssignedAgentIndex?: number | null;
   meta?: {
     title?: string | null;
     description?: string | null;
@@ -902,7 +1118,6 @@ export interface SettingsSelect<T extends boolean = true> {
         url?: T;
         id?: T;
       };
-  lastAssignedAgentIndex?: T;
   meta?:
     | T
     | {
@@ -926,6 +1141,42 @@ export interface LgpdSettingsSelect<T extends boolean = true> {
   createdAt?: T;
   globalType?: T;
 }
+/**
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "TaskNotifyInterestedLeads".
+ */
+export interface TaskNotifyInterestedLeads {
+  input: {
+    propertyId: number;
+    afterLeadId?: number | null;
+    sentLeadIds?:
+      | {
+          [k: string]: unknown;
+        }
+      | unknown[]
+      | string
+      | number
+      | boolean
+      | null;
+  };
+  output: {
+    leads?: number | null;
+    sent?: number | null;
+    batches?: number | null;
+    failedBatches?: number | null;
+  };
+}
+/**
+ * This interface was referenced by `Config`'s JSON-Schema
+ * via the `definition` "TaskUpdateLeadLastContact".
+ */
+export interface TaskUpdateLeadLastContact {
+  input: {
+    leadId: number;
+    contactedAt: string;
+  };
+  output?: unknown;
+}
 /**
  * This interface was referenced by `Config`'s JSON-Schema
  * via the `definition` "auth".
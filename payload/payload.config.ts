@@ -8,13 +8,16 @@ import type { GenerateDescription, GenerateTitle } from '@payloadcms/plugin-seo/
 import { pt } from '@payloadcms/translations/languages/pt'
 
 import { isDevBypassActive } from './access/dev-bypass'
+import { jobsConfig } from './jobs'
 import { Activities } from './collections/Activities'
 import { Amenities } from './collections/Amenities'
+import { Counters } from './collections/Counters'
 import { Deals } from './collections/Deals'
 import { Leads } from './collections/Leads'
 import { MEDIA } from './collections/Media'
 import { Neighborhoods } from './collections/Neighborhoods'
 import { Properties } from './collections/Properties'
+import { PropertyViews } from './collections/PropertyViews'
 import { Tags } from './collections/Tags'
 import { Users } from './collections/Users'
 
@@ -79,8 +82,9 @@ export default buildConfig({
       description: 'Painel Administrativo - PrimeUrban Imóveis',
     },
   },
-  collections: [Users, MEDIA, Tags, Amenities, Neighborhoods, Properties, Leads, Deals, Activities],
+  collections: [Users, MEDIA, Tags, Amenities, Neighborhoods, Properties, Leads, Deals, Activities, Counters, PropertyViews],
   globals: [SETTINGS, LGPD_SETTINGS],
+  jobs: jobsConfig,
   editor: lexicalEditor({}),
   secret: getSecret(),
   typescript: {
@@ -0,0 +1,35 @@
+/**
+ * Backfill dos contadores de código (collection `counters`).
+ *
+ * Para cada prefixo registrado por `autoCode`, lê o maior código existente e
+ * ajusta o contador para pelo menos esse número. Idempotente: pode rodar de
+ * novo a qualquer momento sem voltar contadores.
+ *
+ * Uso:
+ *   pnpm db:backfill-counters
+ */
+import config from '../payload/payload.config'
+import { getPayload } from 'payload'
+
+import { AUTO_CODE_SEQUENCES, findHighestCodeNumber } from '../payload/hooks/beforeChange/auto-code'
+import { backfillCounter } from '../payload/hooks/sequence-counters'
+
+const run = async (): Promise<void> => {
+  const payload = await getPayload({ config })
+
+  try {
+    for (const [prefix, collectionSlug] of AUTO_CODE_SEQUENCES) {
+      const highest = await findHighestCodeNumber({
+        collectionSlug,
+        normalizedPrefix: prefix,
+        payload,
+      })
+      const value = await backfillCounter(payload, prefix, highest)
+      payload.logger.info(`Contador ${prefix} (${collectionSlug}): maior código ${highest}, contador em ${value}`)
+    }
+  } finally {
+    await payload.destroy()
+  }
+}
+
+await run()
@@ -0,0 +1,263 @@
+/**
+ * Microbenchmark do rate limiter do middleware (lib/rate-limit.ts).
+ *
+ * Dirige `getClientIp` + `RateLimiter.check` (o caminho do middleware para
+ * cada request em /api) com IPs repetidos, IPs distintos e requests sem
+ * headers de IP, e mede latência por request, crescimento do heap, chaves no
+ * mapa e a pausa do `cleanup()` com entradas vivas e expiradas.
+ *
+ * Uso:
+ *   NODE_OPTIONS=--expose-gc pnpm bench:rate-limiter -- --requests=200000 --output=loadtest/results/rate-limiter.json
+ */
+import { mkdirSync, writeFileSync } from 'node:fs'
+import { dirname } from 'node:path'
+import { performance } from 'node:perf_hooks'
+
+import { NextRequest } from 'next/server'
+
+import { getClientIp, RateLimiter } from '../lib/rate-limit'
+
+const RATE_LIMIT_REQUESTS = 100
+const RATE_LIMIT_WINDOW_MINUTES = 15
+const WINDOW_MS = RATE_LIMIT_WINDOW_MINUTES * 60 * 1000
+const DEFAULT_REQUESTS = 200_000
+const REPEATING_IPS = 1_000
+const MIXED_IPS = 100
+const MIXED_NO_HEADER_EVERY = 5
+const BYTES_PER_MB = 1024 * 1024
+const PERCENTILES = [50, 90, 99, 99.9]
+
+interface Workload {
+  name: string
+  description: string
+  headersFor: (index: number) => Record<string, string>
+}
+
+interface WorkloadResult {
+  workload: string
+  requests: number
+  rejected: number
+  fallbackKeys: number
+  latencyUs: Record<string, number>
+  keys: number
+  heapGrowthMb: number
+  bytesPerKey: number | null
+  cleanupLiveMs: number
+  cleanupExpiredMs: number
+  cleanupRemoved: number
+  heapAfterCleanupMb: number
+}
+
+const ipFor = (index: number): string =>
+  `10.${(index >> 16) & 255}.${(index >> 8) & 255}.${index & 255}`
+
+const WORKLOADS: Workload[] = [
+  {
+    name: 'repeating',
+    description: `${REPEATING_IPS} IPs em rodízio (todos atingem o limite)`,
+    headersFor: (index) => ({ 'x-forwarded-for': ipFor(index % REPEATING_IPS) }),
+  },
+  {
+    name: 'distinct',
+    description: 'cada request de um IP novo (burst de crawler)',
+    headersFor: (index) => ({ 'x-forwarded-for': ipFor(index) }),
+  },
+  {
+    name: 'no-ip-headers',
+    description: 'sem headers de IP (proxy mal configurado, chave aleatória)',
+    headersFor: () => ({ 'user-agent': 'crawler/1.0', 'accept-language': 'pt-BR' }),
+  },
+  {
+    name: 'mixed',
+    description: `${MIXED_IPS} IPs em rodízio e 1 em ${MIXED_NO_HEADER_EVERY} requests sem headers de IP`,
+    headersFor: (index) =>
+      index % MIXED_NO_HEADER_EVERY === 0
+        ? { 'user-agent': 'crawler/1.0' }
+        : { 'x-forwarded-for': ipFor(index % MIXED_IPS) },
+  },
+]
+
+const parseArgs = (argv: string[]): { requests: number; output: string | null } => {
+  const options = new Map(
+    argv
+      .filter((arg) => arg.startsWith('--'))
+      .map((arg) => {
+        const [key, value = ''] = arg.slice(2).split('=')
+        return [key, value] as const
+      }),
+  )
+  const requests = Number.parseInt(options.get('requests') ?? '', 10)
+
+  return {
+    requests: Number.isSafeInteger(requests) && requests > 0 ? requests : DEFAULT_REQUESTS,
+    output: options.get('output') || null,
+  }
+}
+
+const collectGarbage = (): void => {
+  const gc = (globalThis as { gc?: () => void }).gc
+  if (gc) gc()
+}
+
+const heapUsedMb = (): number => {
+  collectGarbage()
+  return process.memoryUsage().heapUsed / BYTES_PER_MB
+}
+
+const percentile = (sorted: Float64Array, pct: number): number => {
+  if (sorted.length === 0) return 0
+  const rank = Math.min(sorted.length - 1, Math.ceil((pct / 100) * sorted.length) - 1)
+  return sorted[Math.max(0, rank)]
+}
+
+const timeMs = (action: () => unknown): { ms: number; result: unknown } => {
+  const start = performance.now()
+  const result = action()
+  return { ms: performance.now() - start, result }
+}
+
+const runWorkload = (workload: Workload, requests: number): WorkloadResult => {
+  const limiter = new RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW_MINUTES)
+  const latencies = new Float64Array(requests)
+  const originalWarn = console.warn
+  let fallbackKeys = 0
+  let rejected = 0
+
+  // getClientIp avisa a cada fallback; conta em vez de imprimir.
+  console.warn = () => {
+    fallbackKeys += 1
+  }
+
+  const heapBefore = heapUsedMb()
+
+  try {
+    for (let index = 0; index < requests; index += 1) {
+      const request = new NextRequest('http://localhost:3000/api/leads', {
+        headers: workload.headersFor(index),
+      })
+
+      const start = performance.now()
+      const result = limiter.check(getClientIp(request))
+      latencies[index] = (performance.now() - start) * 1000
+
+      if (!result.allowed) rejected += 1
+    }
+  } finally {
+    console.warn = originalWarn
+  }
+
+  const heapAfter = heapUsedMb()
+  const keys = limiter.size
+
+  const cleanupLive = timeMs(() => limiter.cleanup())
+
+  // Avança o relógio além da janela para que o cleanup remova tudo.
+  const realNow = Date.now
+  const expiredAt = realNow() + WINDOW_MS + 1
+  Date.now = () => expiredAt
+  let cleanupExpired: { ms: number; result: unknown }
+  try {
+    cleanupExpired = timeMs(() => limiter.cleanup())
+  } finally {
+    Date.now = realNow
+  }
+
+  const heapAfterCleanup = heapUsedMb()
+  limiter.dispose()
+
+  latencies.sort()
+  const heapGrowthMb = heapAfter - heapBefore
+
+  return {
+    workload: workload.name,
+    requests,
+    rejected,
+    fallbackKeys,
+    latencyUs: Object.fromEntries([
+      ...PERCENTILES.map((pct) => [`p${pct}`, percentile(latencies, pct)]),
+      ['max', latencies[latencies.length - 1] ?? 0],
+    ]),
+    keys,
+    heapGrowthMb,
+    bytesPerKey: keys > 0 ? (heapGrowthMb * BYTES_PER_MB) / keys : null,
+    cleanupLiveMs: cleanupLive.ms,
+    cleanupExpiredMs: cleanupExpired.ms,
+    cleanupRemoved: Number(cleanupExpired.result),
+    heapAfterCleanupMb: heapAfterCleanup - heapBefore,
+  }
+}
+
+const formatRow = (result: WorkloadResult): string =>
+  [
+    result.workload.padEnd(14),
+    String(result.requests).padStart(8),
+    String(result.rejected).padStart(8),
+    result.latencyUs.p50.toFixed(1).padStart(7),
+    result.latencyUs.p99.toFixed(1).padStart(7),
+    result.latencyUs.max.toFixed(0).padStart(7),
+    String(result.keys).padStart(8),
+    result.heapGrowthMb.toFixed(1).padStart(7),
+    (result.bytesPerKey === null ? '-' : result.bytesPerKey.toFixed(0)).padStart(6),
+    result.cleanupLiveMs.toFixed(1).padStart(9),
+    result.cleanupExpiredMs.toFixed(1).padStart(9),
+  ].join(' ')
+
+const run = (): void => {
+  const { requests, output } = parseArgs(process.argv.slice(2))
+  const gcExposed = typeof (globalThis as { gc?: unknown }).gc === 'function'
+
+  if (!gcExposed) {
+    console.warn('global.gc indisponível: rode com NODE_OPTIONS=--expose-gc para medir o heap com precisão')
+  }
+
+  console.log(
+    [
+      'workload'.padEnd(14),
+      'requests'.padStart(8),
+      '429'.padStart(8),
+      'p50 µs'.padStart(7),
+      'p99 µs'.padStart(7),
+      'max µs'.padStart(7),
+      'chaves'.padStart(8),
+      'heap MB'.padStart(7),
+      'B/key'.padStart(6),
+      'clean ms'.padStart(9),
+      'expir ms'.padStart(9),
+    ].join(' '),
+  )
+
+  const results = WORKLOADS.map((workload) => {
+    const result = runWorkload(workload, requests)
+    console.log(formatRow(result))
+    return result
+  })
+
+  console.log('\nclean ms = cleanup() com entradas vivas; expir ms = cleanup() com a janela expirada')
+  for (const workload of WORKLOADS) {
+    console.log(`  ${workload.name}: ${workload.description}`)
+  }
+
+  if (output) {
+    mkdirSync(dirname(output), { recursive: true })
+    writeFileSync(
+      output,
+      JSON.stringify(
+        {
+          benchmark: 'rate-limiter',
+          settings: {
+            requests,
+            limit: RATE_LIMIT_REQUESTS,
+            windowMinutes: RATE_LIMIT_WINDOW_MINUTES,
+            gcExposed,
+          },
+          results,
+        },
+        null,
+        2,
+      ),
+    )
+    console.log(`\nResultados salvos em ${output}`)
+  }
+}
+
+run()
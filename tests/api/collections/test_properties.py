@@ -1007,3 +1007,37 @@ class TestPropertiesHooks:
         assert len(neighborhood_name) > 0
         # Deve corresponder ao nome do bairro relacionado
         assert neighborhood_name == test_neighborhood["name"]
+
+
+# =============================================================================
+# TESTES DO CONTADOR DE VIEWS (POST /api/properties/:id/view)
+# =============================================================================
+
+@pytest.mark.api
+class TestPropertyViewEndpoint:
+    """Testes do registro de visualizações."""
+
+    def test_view_unknown_property_returns_404(
+        self,
+        anonymous_client: AnonymousAPIClient
+    ):
+        """ID inexistente não entra no buffer."""
+        with pytest.raises(NotFoundError):
+            anonymous_client.post("/api/properties/999999999/view")
+
+    def test_view_draft_property_returns_404_until_published(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        anonymous_client: AnonymousAPIClient,
+        created_property: Dict[str, Any]
+    ):
+        """Rascunho não conta views; publicado passa a contar na hora."""
+        view_path = f"/api/properties/{created_property['id']}/view"
+
+        with pytest.raises(NotFoundError):
+            anonymous_client.post(view_path)
+
+        admin_client.update("properties", created_property["id"], {"status": "published"})
+
+        response = anonymous_client.post(view_path)
+        assert response.data["success"] is True
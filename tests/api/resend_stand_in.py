@@ -0,0 +1,176 @@
+"""
+Stand-in local da API do Resend.
+
+Servidor HTTP em processo que responde `POST /emails` e `POST /emails/batch`
+como o Resend: registra cada destinatário, as chamadas simultâneas e as
+chaves de idempotência (uma chave repetida devolve a resposta original sem
+enviar de novo). Falhas podem ser sorteadas (`fail_rate`) ou escolhidas
+(`fail_marker` + `fail_calls`).
+
+Uso:
+    from tests.api.resend_stand_in import ResendStandIn
+
+    with ResendStandIn("127.0.0.1", 8025) as stand_in:
+        ...  # aplicação com RESEND_BASE_URL=http://127.0.0.1:8025
+        stand_in.recipient_counts("marcador")
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class ResendStandIn:
+    """Servidor HTTP em processo que responde os endpoints de e-mail do Resend."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        latency_ms: float = 0.0,
+        fail_rate: float = 0.0,
+        seed: int = None,
+        fail_marker: Optional[str] = None,
+        fail_calls: Iterable[int] = (),
+    ):
+        """
+        Inicializa o stand-in.
+
+        Args:
+            host: Interface onde escutar
+            port: Porta onde escutar
+            latency_ms: Atraso somado a cada chamada
+            fail_rate: Fração das chamadas respondidas com HTTP 503
+            seed: Semente do sorteio das falhas
+            fail_marker: Trecho de endereço que identifica as chamadas contadas em `fail_calls`
+            fail_calls: Quais chamadas com `fail_marker` entre os destinatários
+                (1 = a primeira) respondem HTTP 503
+        """
+        self.latency_ms = latency_ms
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        self.fail_marker = fail_marker
+        self.fail_calls = set(fail_calls)
+        self.recipients: Counter = Counter()
+        self.calls = 0
+        self.marker_calls = 0
+        self.failed_calls = 0
+        self.replayed_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.last_delivery: Optional[float] = None
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ResendStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="resend-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"null")
+                except ValueError:
+                    self._reply(422, {"name": "validation_error", "message": "Invalid JSON", "statusCode": 422})
+                    return
+
+                if self.path.rstrip("/") == "/emails/batch":
+                    emails = body if isinstance(body, list) else []
+                elif self.path.rstrip("/") == "/emails":
+                    emails = [body] if isinstance(body, dict) else []
+                else:
+                    self._reply(404, {"name": "not_found", "message": "Not Found", "statusCode": 404})
+                    return
+
+                status, payload = stand_in.handle(emails, self.headers.get("Idempotency-Key"))
+                self._reply(status, payload)
+
+            def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @staticmethod
+    def _addresses(emails: List[Dict[str, Any]]) -> List[str]:
+        addresses = []
+        for email in emails:
+            to = email.get("to")
+            addresses.extend(to if isinstance(to, list) else [to])
+        return addresses
+
+    def handle(self, emails: List[Dict[str, Any]], idempotency_key: Optional[str]):
+        """
+        Registra uma chamada e responde como o Resend responderia.
+
+        Uma chave já vista devolve a resposta original sem enviar de novo.
+
+        Returns:
+            Status HTTP e corpo JSON
+        """
+        addresses = self._addresses(emails)
+        with self._lock:
+            self.calls += 1
+            if idempotency_key and idempotency_key in self._responses:
+                self.replayed_calls += 1
+                return 200, self._responses[idempotency_key]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.random.random() < self.fail_rate
+            if self.fail_marker and any(self.fail_marker in str(address) for address in addresses):
+                self.marker_calls += 1
+                fail = fail or self.marker_calls in self.fail_calls
+
+        try:
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            if fail:
+                with self._lock:
+                    self.failed_calls += 1
+                return 503, {"name": "application_error", "message": "stand-in failure", "statusCode": 503}
+
+            payload = {"data": [{"id": str(uuid.uuid4())} for _ in emails]}
+            with self._lock:
+                for address in addresses:
+                    self.recipients[address] += 1
+                if idempotency_key:
+                    self._responses[idempotency_key] = payload
+                self.last_delivery = time.perf_counter()
+            return 200, payload
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def delivered(self, addresses: Set[str]) -> int:
+        """Quantos dos endereços receberam ao menos um e-mail."""
+        with self._lock:
+            return sum(1 for address in addresses if self.recipients[address] > 0)
+
+    def recipient_counts(self, marker: str) -> Dict[str, int]:
+        """E-mails recebidos por endereço, para os endereços que contêm `marker`."""
+        with self._lock:
+            return {address: count for address, count in self.recipients.items() if marker in address}
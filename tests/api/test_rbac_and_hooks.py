@@ -3,8 +3,8 @@ Testes de RBAC (Role-Based Access Control) e Hooks do Payload CMS.
 
 Este módulo testa:
 1. Controle de acesso por role (admin, agent, assistant)
-2. Hooks de beforeValidate (autoSlug, autoCode, normalizePhone)
-3. Hooks de afterChange (revalidateProperty, distributeLead, updateLeadScore)
+2. Hooks de beforeChange (autoSlug, autoCode, normalizePhone, updateLeadScore, distributeLead)
+3. Hooks de afterChange (revalidateProperty) e a fila de jobs dos efeitos colaterais
 
 Marcadores:
     @pytest.mark.rbac: Testes de controle de acesso
@@ -12,7 +12,11 @@ Marcadores:
 """
 
 import json
+import os
+import uuid
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 from tests.api.utils import (
@@ -27,6 +31,7 @@ from tests.api.fixtures import (
     LeadFactory,
     UserFactory,
 )
+from tests.api.resend_stand_in import ResendStandIn
 
 
 # =============================================================================
@@ -419,6 +424,225 @@ class TestUsersRBAC:
             agent_client.delete(f"/api/users/{user_id}")
 
 
+# =============================================================================
+# TESTES DE RBAC - ANALYTICS DE VISUALIZAÇÕES
+# =============================================================================
+
+@pytest.mark.rbac
+class TestViewAnalyticsRBAC:
+    """Testa acesso e validação de /api/analytics/views."""
+
+    def test_agent_can_read_views_over_time(
+        self,
+        agent_client: AuthenticatedAPIClient,
+    ):
+        """Corretor deve receber a série com um ponto por bucket."""
+        response = agent_client.get("/api/analytics/views", params={
+            "granularity": "hour",
+            "from": "2025-02-15T12:00:00.000Z",
+            "to": "2025-02-15T18:00:00.000Z",
+        })
+
+        assert response.status_code == 200
+        assert response.data["granularity"] == "hour"
+        assert len(response.data["points"]) == 6
+        assert response.data["total"] == sum(point["views"] for point in response.data["points"])
+
+    def test_agent_can_read_top_viewed_properties(
+        self,
+        agent_client: AuthenticatedAPIClient,
+    ):
+        """Corretor deve receber no máximo `limit` imóveis, do mais visto ao menos visto."""
+        response = agent_client.get("/api/analytics/views/top", params={"limit": 5})
+
+        views = [item["views"] for item in response.data["properties"]]
+        assert len(views) <= 5
+        assert views == sorted(views, reverse=True)
+
+    def test_anonymous_cannot_read_view_analytics(
+        self,
+        anonymous_client: AnonymousAPIClient,
+    ):
+        """Usuário anônimo NÃO deve acessar analytics de visualizações."""
+        with pytest.raises(AuthenticationError):
+            anonymous_client.get("/api/analytics/views/top")
+
+    def test_invalid_granularity_returns_400(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Granularidade desconhecida deve ser rejeitada."""
+        with pytest.raises(ValidationError):
+            admin_client.get("/api/analytics/views", params={"granularity": "week"})
+
+
+# =============================================================================
+# TESTES DE RBAC - ESTATÍSTICAS POR CORRETOR
+# =============================================================================
+
+@pytest.mark.rbac
+class TestAgentStatsRBAC:
+    """Testa acesso, formato e invalidação de /api/agent-stats."""
+
+    STATS_FIELDS = ("totalLeads", "newLeads", "totalProperties", "activeDeals", "closedThisMonth")
+
+    def test_agent_reads_own_stats(
+        self,
+        agent_client: AuthenticatedAPIClient,
+        agent_user_data: Dict[str, Any],
+    ):
+        """Corretor deve receber as cinco métricas usadas por useAgentStats."""
+        agent_id = agent_user_data["user"]["id"]
+
+        response = agent_client.get("/api/agent-stats", params={"agentId": agent_id})
+
+        assert response.data["agentId"] == agent_id
+        for field in self.STATS_FIELDS:
+            assert isinstance(response.data[field], int)
+
+    def test_agent_cannot_read_all_agents(
+        self,
+        agent_client: AuthenticatedAPIClient,
+    ):
+        """Corretor NÃO deve consultar as estatísticas de todos."""
+        with pytest.raises(AuthorizationError):
+            agent_client.get("/api/agent-stats", params={"agentId": "all"})
+
+    def test_admin_reads_all_agents(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        agent_user_data: Dict[str, Any],
+    ):
+        """Admin deve receber uma linha por corretor, incluindo o de teste."""
+        response = admin_client.get("/api/agent-stats", params={"agentId": "all"})
+
+        agent_ids = [item["agentId"] for item in response.data["agents"]]
+        assert agent_user_data["user"]["id"] in agent_ids
+
+    def test_new_assigned_lead_invalidates_cached_stats(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        agent_user_data: Dict[str, Any],
+    ):
+        """Lead atribuído ao corretor deve aparecer mesmo com as métricas em cache."""
+        agent_id = agent_user_data["user"]["id"]
+        before = admin_client.get("/api/agent-stats", params={"agentId": agent_id}).data
+
+        lead_data = LeadFactory.minimal()
+        lead_data["assignedTo"] = agent_id
+        admin_client.create("leads", lead_data)
+
+        after = admin_client.get("/api/agent-stats", params={"agentId": agent_id}).data
+        assert after["totalLeads"] == before["totalLeads"] + 1
+        assert after["newLeads"] == before["newLeads"] + 1
+
+
+# =============================================================================
+# TESTES DE RBAC - KPIs DO DASHBOARD
+# =============================================================================
+
+@pytest.mark.rbac
+class TestDashboardStats:
+    """Testa acesso, valores e invalidação de /api/dashboard-stats."""
+
+    @staticmethod
+    def _signed_revenue(admin_client: AuthenticatedAPIClient) -> float:
+        """Soma de finalPrice dos negócios assinados, página a página."""
+        total, page = 0, 1
+        while True:
+            result = admin_client.find(
+                "deals", where={"stage": {"equals": "signed"}}, limit=100, page=page
+            )
+            total += sum(deal.get("finalPrice") or 0 for deal in result["docs"])
+            if not result.get("hasNextPage"):
+                return total
+            page += 1
+
+    @staticmethod
+    def _create_signed_deal(
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+        final_price: int,
+    ) -> Dict[str, Any]:
+        """Imóvel, lead e negócio assinado com o valor informado."""
+        media_response = admin_client.post("/api/media", json_data={
+            "file": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+        })
+        property_doc = admin_client.create("properties", PropertyFactory.minimal(
+            neighborhood_id=test_neighborhood["id"],
+            media_id=media_response["id"],
+            agent_id=admin_user_data["user"]["id"],
+        ))
+        lead = admin_client.create("leads", LeadFactory.minimal())
+
+        return admin_client.create("deals", {
+            "lead": lead["id"],
+            "property": property_doc["id"],
+            "stage": "signed",
+            "finalPrice": final_price,
+            "agent": admin_user_data["user"]["id"],
+        })
+
+    def test_agent_cannot_read_dashboard_stats(
+        self,
+        agent_client: AuthenticatedAPIClient,
+    ):
+        """KPIs do dashboard são só para admin."""
+        with pytest.raises(AuthorizationError):
+            agent_client.get("/api/dashboard-stats")
+
+    def test_kpis_match_stored_data(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Os três KPIs devem bater com o que as collections devolvem."""
+        start_of_today = datetime.now().astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        stats = admin_client.get("/api/dashboard-stats").data
+
+        published = admin_client.find(
+            "properties", where={"status": {"equals": "published"}}, limit=1
+        )["totalDocs"]
+        leads_today = admin_client.find(
+            "leads",
+            where={"createdAt": {"greater_than": start_of_today.astimezone(timezone.utc).isoformat()}},
+            limit=1,
+        )["totalDocs"]
+
+        assert stats["activeProperties"] == published
+        assert stats["newLeadsToday"] == leads_today
+        assert stats["totalRevenue"] == self._signed_revenue(admin_client)
+
+    def test_new_lead_shows_up_immediately(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Lead criado deve entrar em newLeadsToday mesmo com os KPIs em cache."""
+        admin_client.get("/api/dashboard-stats")
+        before = admin_client.get("/api/dashboard-stats").data
+
+        admin_client.create("leads", LeadFactory.minimal())
+
+        after = admin_client.get("/api/dashboard-stats").data
+        assert after["newLeadsToday"] == before["newLeadsToday"] + 1
+
+    def test_signed_deal_shows_up_immediately(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+    ):
+        """Negócio assinado deve entrar em totalRevenue na requisição seguinte."""
+        admin_client.get("/api/dashboard-stats")
+        before = admin_client.get("/api/dashboard-stats").data
+
+        self._create_signed_deal(admin_client, test_neighborhood, admin_user_data, 123_456)
+
+        after = admin_client.get("/api/dashboard-stats").data
+        assert after["totalRevenue"] == before["totalRevenue"] + 123_456
+
+
 # =============================================================================
 # TESTES DE HOOKS - AUTO SLUG
 # =============================================================================
@@ -564,6 +788,87 @@ class TestAutoCodeHook:
 
         assert response["code"] == "CUSTOM-123"
 
+    def test_auto_code_numbers_are_consecutive(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+    ):
+        """Creates seguidos recebem números consecutivos do contador."""
+        media_response = admin_client.post("/api/media", json_data={
+            "file": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+        })
+        media_id = media_response["id"]
+
+        numbers = []
+        for _ in range(3):
+            property_data = PropertyFactory.minimal(
+                neighborhood_id=test_neighborhood["id"],
+                media_id=media_id,
+                agent_id=admin_user_data["user"]["id"],
+            )
+            property_data["code"] = ""
+            response = admin_client.create("properties", property_data)
+            numbers.append(int(response["code"].split("-")[1]))
+
+        assert numbers == list(range(numbers[0], numbers[0] + 3))
+
+    def test_auto_code_concurrent_creates_get_unique_codes(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+    ):
+        """Creates simultâneos não podem receber o mesmo código."""
+        media_response = admin_client.post("/api/media", json_data={
+            "file": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+        })
+        media_id = media_response["id"]
+
+        def _create(_: int) -> str:
+            property_data = PropertyFactory.minimal(
+                neighborhood_id=test_neighborhood["id"],
+                media_id=media_id,
+                agent_id=admin_user_data["user"]["id"],
+            )
+            property_data["code"] = ""
+            with AuthenticatedAPIClient(admin_client.base_url, admin_client.token) as client:
+                return client.create("properties", property_data)["code"]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            codes = list(pool.map(_create, range(8)))
+
+        assert len(set(codes)) == len(codes)
+
+    def test_auto_code_continues_after_explicit_prefixed_code(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+    ):
+        """Código manual no formato PRM-### avança o contador."""
+        media_response = admin_client.post("/api/media", json_data={
+            "file": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+        })
+        media_id = media_response["id"]
+
+        def _property_data(code: str) -> Dict[str, Any]:
+            property_data = PropertyFactory.minimal(
+                neighborhood_id=test_neighborhood["id"],
+                media_id=media_id,
+                agent_id=admin_user_data["user"]["id"],
+            )
+            property_data["code"] = code
+            return property_data
+
+        generated = admin_client.create("properties", _property_data(""))
+        explicit_number = int(generated["code"].split("-")[1]) + 50
+        admin_client.create("properties", _property_data(f"PRM-{explicit_number}"))
+
+        response = admin_client.create("properties", _property_data(""))
+
+        assert int(response["code"].split("-")[1]) == explicit_number + 1
+
 
 # =============================================================================
 # TESTES DE HOOKS - NORMALIZE PHONE
@@ -675,6 +980,36 @@ class TestLeadScoreHook:
         # Score deve ser maior que apenas telefone
         assert response["score"] > 10  # Assumindo score máximo > 10
 
+    def test_lead_created_in_a_single_write(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        agent_user_data: Dict[str, Any],
+    ):
+        """Score e corretor saem no próprio insert, sem updates posteriores."""
+        lead_data = LeadFactory.with_phone_and_email()
+
+        response = admin_client.create("leads", lead_data)
+
+        # O documento devolvido pelo create já traz o que os hooks calculam
+        assert response["score"] == 40
+        assert response.get("assignedTo") is not None
+
+        # Nenhuma escrita posterior ao create alterou o lead
+        stored = admin_client.find_by_id("leads", response["id"])
+        assert stored["updatedAt"] == response["updatedAt"]
+        assert stored["score"] == response["score"]
+
+    def test_lead_score_recomputed_on_partial_update(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Update só com email deve considerar o telefone já gravado."""
+        created = admin_client.create("leads", LeadFactory.with_phone())
+
+        updated = admin_client.update("leads", created["id"], {"email": "lead.score@example.com"})
+
+        assert updated["score"] == 40
+
 
 # =============================================================================
 # TESTES DE HOOKS - LEAD DISTRIBUTION
@@ -698,6 +1033,27 @@ class TestLeadDistributionHook:
         # Deve ter sido atribuído a algum agente
         assert response.get("assignedTo") is not None
 
+    def test_sequential_leads_rotate_through_all_active_agents(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """N leads seguidos (N = corretores ativos) devem cair em N corretores distintos."""
+        agents = admin_client.find(
+            "users",
+            where={"role": {"equals": "agent"}, "active": {"equals": True}},
+            limit=100,
+        )["docs"]
+        if len(agents) < 2:
+            pytest.skip("Requer pelo menos dois corretores ativos")
+
+        assigned = []
+        for _ in agents:
+            lead = admin_client.create("leads", LeadFactory.minimal())
+            agent = lead["assignedTo"]
+            assigned.append(agent["id"] if isinstance(agent, dict) else agent)
+
+        assert sorted(assigned) == sorted(agent["id"] for agent in agents)
+
 
 # =============================================================================
 # TESTES DE HOOKS - ISR REVALIDATION
@@ -762,6 +1118,162 @@ class TestISRRevalidationHook:
         assert updated["status"] == "published"
 
 
+# =============================================================================
+# TESTES - FILA DE JOBS DOS HOOKS
+# =============================================================================
+
+@pytest.mark.hooks
+class TestSideEffectsJobQueue:
+    """Testa acesso à fila de jobs que recebe os efeitos colaterais dos hooks."""
+
+    def test_admin_reads_job_queue(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Admin deve listar os jobs pendentes da fila side-effects."""
+        response = admin_client.find("payload-jobs", where={"queue": {"equals": "side-effects"}})
+
+        assert isinstance(response["docs"], list)
+        assert response["totalDocs"] >= 0
+
+    def test_agent_cannot_read_job_queue(
+        self,
+        agent_client: AuthenticatedAPIClient,
+    ):
+        """Corretor NÃO deve ver a fila de jobs."""
+        with pytest.raises(AuthorizationError):
+            agent_client.find("payload-jobs")
+
+
+@pytest.mark.hooks
+class TestLeadNotificationInterest:
+    """Testa os campos de interesse usados na notificação de imóveis publicados."""
+
+    def test_lead_interest_fields_persisted(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+    ):
+        """Bairro, tipo e faixa de preço de interesse devem ser gravados no lead."""
+        lead_data = LeadFactory.with_phone_and_email()
+        lead_data.update({
+            "neighborhood": test_neighborhood["id"],
+            "propertyType": "apartment",
+            "priceRangeMin": 400000,
+            "priceRangeMax": 900000,
+        })
+
+        response = admin_client.create("leads", lead_data)
+
+        neighborhood = response["neighborhood"]
+        assert (neighborhood["id"] if isinstance(neighborhood, dict) else neighborhood) == test_neighborhood["id"]
+        assert response["propertyType"] == "apartment"
+        assert response["priceRangeMin"] == 400000
+        assert response["priceRangeMax"] == 900000
+
+    def test_lead_accepts_notifications_by_default(
+        self,
+        admin_client: AuthenticatedAPIClient,
+    ):
+        """Lead sem `doNotContact` informado deve continuar elegível."""
+        response = admin_client.create("leads", LeadFactory.with_email())
+
+        assert response["doNotContact"] is False
+
+
+@pytest.mark.hooks
+@pytest.mark.skipif(
+    not os.getenv("RESEND_STAND_IN_PORT"),
+    reason="RESEND_STAND_IN_PORT não definida (servidor sem stand-in do Resend)",
+)
+class TestLeadNotificationRetry:
+    """
+    Testa a nova tentativa do job `notifyInterestedLeads` contra o stand-in do Resend.
+
+    O servidor precisa apontar o Resend para o stand-in e enviar lotes pequenos
+    sem repetir o lote dentro da tentativa, para que a falha injetada derrube
+    a tentativa inteira:
+
+        RESEND_API_KEY=re_test RESEND_BASE_URL=http://127.0.0.1:8025 \\
+        NOTIFY_BATCH_SIZE=5 NOTIFY_BATCH_ATTEMPTS=1 pnpm start
+        RESEND_STAND_IN_PORT=8025 pytest tests/api -k LeadNotificationRetry
+
+    JOB_BACKOFF_DELAY_MS deve deixar alguns segundos entre as tentativas (o
+    default de 30s serve); RESEND_STAND_IN_WAIT limita a espera (default 120s).
+    """
+
+    LEADS = 16
+    # Preço que só os leads do teste pedem, para não disputar com outros dados
+    PRICE = 7_654_321
+
+    def test_retry_resumes_without_duplicate_emails(
+        self,
+        admin_client: AuthenticatedAPIClient,
+        test_neighborhood: Dict[str, Any],
+        admin_user_data: Dict[str, Any],
+        cleanup_test_data: Dict[str, list],
+        wait_for_condition,
+    ):
+        """Lote que falha é reenviado na nova tentativa; quem já recebeu não recebe de novo."""
+        marker = f"retry-{uuid.uuid4().hex[:8]}"
+        wait_s = float(os.getenv("RESEND_STAND_IN_WAIT", "120"))
+
+        leads = []
+        for index in range(self.LEADS):
+            lead_data = LeadFactory.minimal()
+            lead_data.update({
+                "email": f"{marker}-{index:03d}@example.com",
+                "priceRangeMin": self.PRICE,
+                "priceRangeMax": self.PRICE,
+            })
+            leads.append(admin_client.create("leads", lead_data))
+        cleanup_test_data["leads"].extend(lead["id"] for lead in leads)
+
+        media_response = admin_client.post("/api/media", json_data={
+            "file": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750",
+        })
+        property_data = PropertyFactory.minimal(
+            neighborhood_id=test_neighborhood["id"],
+            media_id=media_response["id"],
+            agent_id=admin_user_data["user"]["id"],
+        )
+        property_data["price"] = self.PRICE
+        property_doc = admin_client.create("properties", property_data)
+        cleanup_test_data["properties"].append(property_doc["id"])
+
+        # A segunda chamada com leads do teste falha: a primeira já foi aceita
+        stand_in = ResendStandIn(
+            "127.0.0.1",
+            int(os.environ["RESEND_STAND_IN_PORT"]),
+            fail_marker=marker,
+            fail_calls={2},
+        )
+        with stand_in:
+            admin_client.update("properties", property_doc["id"], {"status": "published"})
+            wait_for_condition(
+                lambda: stand_in.failed_calls >= 1 and stand_in.recipient_counts(marker),
+                timeout=wait_s,
+            )
+
+            # Excluir um lead já notificado desloca os lotes de quem vem depois:
+            # recomeçar do zero mudaria as chaves e duplicaria os e-mails
+            notified = stand_in.recipient_counts(marker)
+            removed = next(lead for lead in leads if lead["email"] in notified)
+            admin_client.delete("leads", removed["id"])
+            cleanup_test_data["leads"].remove(removed["id"])
+
+            expected = {lead["email"] for lead in leads}
+            wait_for_condition(
+                lambda: stand_in.delivered(expected - {removed["email"]}) == len(expected) - 1,
+                timeout=wait_s,
+                interval=1,
+            )
+            counts = stand_in.recipient_counts(marker)
+
+        assert set(counts) == expected
+        assert {address: count for address, count in counts.items() if count != 1} == {}
+
+
 # =============================================================================
 # TESTES DE HOOKS - NEIGHBORHOOD NAME SYNC
 # =============================================================================
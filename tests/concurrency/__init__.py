@@ -0,0 +1,6 @@
+"""
+Multi-actor concurrency tests for PrimeUrban.
+
+Drive several browsers at once through the async page objects in
+`tests/e2e/pages/aio/`. Run with `pytest tests/concurrency`.
+"""
@@ -0,0 +1,113 @@
+"""
+Pytest conftest for multi-actor concurrency tests.
+
+These tests use the async Playwright API (pytest-asyncio) and live outside
+`tests/e2e/` so they do not pull in its sync `page` autouse fixtures: the
+sync and async Playwright drivers should not share an event loop.
+"""
+
+import os
+from typing import AsyncGenerator, Callable, Dict
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import APIRequestContext, Browser, Playwright, async_playwright
+
+from tests.e2e.helpers.auth import DEFAULT_ADMIN_CREDENTIALS, ROLE_CREDENTIALS, api_login, write_storage_state
+
+
+# =============================================================================
+# SETTINGS FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    """Base URL for the application (same variable as the E2E suite)."""
+    return os.getenv("E2E_BASE_URL", "http://localhost:3000")
+
+
+@pytest.fixture(scope="session")
+def visitor_count() -> int:
+    """Concurrent visitors per scenario (E2E_CONCURRENT_VISITORS, default 20)."""
+    return max(1, int(os.getenv("E2E_CONCURRENT_VISITORS", "20")))
+
+
+@pytest.fixture(scope="session")
+def auth_storage_state(
+    base_url: str,
+    tmp_path_factory: pytest.TempPathFactory
+) -> Callable[[str], str]:
+    """
+    Storage state files with an authenticated session, one per role.
+
+    Returns:
+        Function mapping a role ('admin' or 'agent') to its storage state path
+    """
+    state_dir = tmp_path_factory.mktemp("concurrency-auth")
+    paths: Dict[str, str] = {}
+
+    def _storage_state_for(role: str) -> str:
+        if role not in paths:
+            paths[role] = write_storage_state(
+                str(state_dir / f"{role}.json"),
+                base_url,
+                ROLE_CREDENTIALS[role],
+            )
+        return paths[role]
+
+    return _storage_state_for
+
+
+# =============================================================================
+# ASYNC PLAYWRIGHT FIXTURES
+# =============================================================================
+
+@pytest_asyncio.fixture
+async def async_playwright_instance() -> AsyncGenerator[Playwright, None]:
+    """
+    Async Playwright driver for the test.
+
+    Yields:
+        Async Playwright instance
+    """
+    async with async_playwright() as playwright:
+        yield playwright
+
+
+@pytest_asyncio.fixture
+async def async_browser(
+    async_playwright_instance: Playwright,
+    pytestconfig: pytest.Config
+) -> AsyncGenerator[Browser, None]:
+    """
+    Chromium launched through the async API.
+
+    Honours pytest-playwright's `--headed` flag when it is installed.
+
+    Yields:
+        Async Browser instance
+    """
+    headed = bool(pytestconfig.getoption("headed", default=False))
+    browser = await async_playwright_instance.chromium.launch(headless=not headed)
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture
+async def admin_api(
+    async_playwright_instance: Playwright,
+    base_url: str
+) -> AsyncGenerator[APIRequestContext, None]:
+    """
+    Async API request context authenticated as admin.
+
+    Yields:
+        APIRequestContext bound to the application base URL
+    """
+    token = api_login(base_url, DEFAULT_ADMIN_CREDENTIALS)["token"]
+    request_context = await async_playwright_instance.request.new_context(
+        base_url=base_url,
+        extra_http_headers={"Authorization": f"Bearer {token}"},
+    )
+    yield request_context
+    await request_context.dispose()
@@ -0,0 +1,155 @@
+"""
+Monday-morning lead spike: many visitors and one agent at the same time.
+
+N visitors (E2E_CONCURRENT_VISITORS, default 20) submit the contact form on
+property pages concurrently while an agent keeps reloading and sorting the
+leads list in the admin. Every visitor's lead is created through the REST API
+at the moment of submission — the public form does not persist leads yet —
+so `updateLeadScore` and `distributeLead` run under true concurrency.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+import pytest
+from playwright.async_api import APIRequestContext, Browser
+
+from tests.e2e.helpers.vitals import VITALS_INIT_SCRIPT
+from tests.e2e.pages.aio import AsyncAdminPage, AsyncContactFormPage
+
+
+# =============================================================================
+# MARKERS
+# =============================================================================
+
+pytestmark = [pytest.mark.e2e, pytest.mark.slow, pytest.mark.asyncio]
+
+
+# =============================================================================
+# SCENARIO
+# =============================================================================
+
+PROPERTY_SLUGS = [
+    "apartamento-asa-sul-sqn-308",
+    "cobertura-noroeste-sqnw-111",
+    "casa-lago-sul-shis-qi-25",
+]
+VIEWPORT = {"width": 1920, "height": 1080}
+# Score given by updateLeadScore to a lead with phone and email.
+FULL_CONTACT_SCORE = 40
+
+
+async def _visitor(
+    browser: Browser,
+    admin_api: APIRequestContext,
+    base_url: str,
+    run_id: str,
+    index: int
+) -> Dict[str, Any]:
+    """Fill and submit the contact form, creating the matching lead."""
+    context = await browser.new_context(viewport=VIEWPORT, locale="pt-BR")
+    await context.add_init_script(VITALS_INIT_SCRIPT)
+    try:
+        form = AsyncContactFormPage(await context.new_page(), base_url)
+        await form.goto_property_with_form(PROPERTY_SLUGS[index % len(PROPERTY_SLUGS)])
+
+        email = f"visitante.{run_id}.{index}@example.com"
+        await form.fill_form(
+            name=f"Visitante {run_id} {index}",
+            email=email,
+            phone=f"(61) 9{index:04d}-{index:04d}",
+        )
+        await form.submit_form()
+
+        response = await admin_api.post(
+            "/api/leads",
+            data={
+                "name": f"Visitante {run_id} {index}",
+                "email": email,
+                "phone": f"(61) 9{index:04d}-{index:04d}",
+                "source": "website",
+            },
+        )
+        await form.wait_for_success()
+
+        return {"index": index, "status": response.status, "email": email}
+    finally:
+        await context.close()
+
+
+async def _agent(
+    browser: Browser,
+    base_url: str,
+    storage_state: str,
+    stop: asyncio.Event
+) -> List[float]:
+    """Work the leads list until the visitors are done; returns list load times (ms)."""
+    context = await browser.new_context(storage_state=storage_state, viewport=VIEWPORT, locale="pt-BR")
+    await context.add_init_script(VITALS_INIT_SCRIPT)
+    durations: List[float] = []
+    try:
+        admin = AsyncAdminPage(await context.new_page(), base_url)
+        while not stop.is_set() or not durations:
+            start = time.perf_counter()
+            await admin.goto_collection_page("leads", 1, sort="-createdAt")
+            await admin.wait_for_list()
+            durations.append((time.perf_counter() - start) * 1000)
+    finally:
+        await context.close()
+    return durations
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+async def test_lead_spike_with_agent_working_leads_list(
+    async_browser: Browser,
+    admin_api: APIRequestContext,
+    base_url: str,
+    visitor_count: int,
+    auth_storage_state: Callable[[str], str],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: Concurrent contact form submissions while an agent uses the admin.
+
+    Expected: Every visitor sees the success state, every lead is created,
+    scored and assigned to an agent, and the agent's list keeps loading.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    stop = asyncio.Event()
+
+    agent_task = asyncio.create_task(
+        _agent(async_browser, base_url, auth_storage_state("agent"), stop)
+    )
+    try:
+        visitors = await asyncio.gather(*(
+            _visitor(async_browser, admin_api, base_url, run_id, index)
+            for index in range(visitor_count)
+        ))
+    finally:
+        stop.set()
+        agent_durations = await agent_task
+
+    created = await admin_api.get(
+        "/api/leads",
+        params={"where[email][like]": run_id, "limit": str(visitor_count), "depth": "0"},
+    )
+    leads = (await created.json()).get("docs", [])
+
+    try:
+        record_property("agent_list_load_ms", agent_durations)
+        assert all(visitor["status"] in (200, 201) for visitor in visitors), visitors
+        assert len(leads) == visitor_count, f"{len(leads)}/{visitor_count} leads criados"
+
+        unassigned = [lead["email"] for lead in leads if not lead.get("assignedTo")]
+        assert not unassigned, f"Leads sem corretor após o pico: {unassigned}"
+
+        unscored = [lead["email"] for lead in leads if lead.get("score") != FULL_CONTACT_SCORE]
+        assert not unscored, f"Leads sem score completo após o pico: {unscored}"
+    finally:
+        for lead in leads:
+            await admin_api.delete(f"/api/leads/{lead['id']}")
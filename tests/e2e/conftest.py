@@ -4,13 +4,27 @@ Pytest conftest for E2E tests.
 Provides fixtures for Playwright browser, pages, and test configuration.
 """
 
+import json
 import os
-from typing import Generator
-from pathlib import Path
+from typing import Callable, Dict, Generator, Optional
 
 import pytest
 from playwright.sync_api import Browser, BrowserContext, Page
 
+from tests.e2e.helpers.auth import ROLE_CREDENTIALS, write_storage_state
+from tests.e2e.helpers.context_pool import ContextPool
+from tests.e2e.helpers.tracing import FailureTracer, failure_artifact_path
+from tests.e2e.helpers.vitals import COLLECTOR as VITALS_COLLECTOR, install_vitals_observers
+from tests.e2e.helpers.network import (
+    PROFILE_LOCAL,
+    route_remote_images,
+    route_third_party_from_har,
+)
+
+
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+DEFAULT_LOCALE = "pt-BR"
+
 
 # =============================================================================
 # BASE URL FIXTURE
@@ -33,61 +47,269 @@ def base_url() -> str:
 # PLAYWRIGHT FIXTURES
 # =============================================================================
 
-@pytest.fixture(scope="function")
-def page(browser: Browser) -> Generator[Page, None, None]:
+def _pool_setup(base_url: str) -> Callable[[BrowserContext], None]:
+    """Setup callback shared by every context pool (vitals observers, HAR routing)."""
+    har_path = os.getenv("E2E_HAR_PATH")
+    update_har = os.getenv("E2E_HAR_UPDATE", "").lower() == "true"
+
+    def _setup(context: BrowserContext) -> None:
+        install_vitals_observers(context)
+        if har_path:
+            route_third_party_from_har(context, har_path, base_url, update=update_har)
+
+    return _setup
+
+
+def _pool_size() -> int:
+    """Idle contexts kept per pool (E2E_CONTEXT_POOL_SIZE, default 2)."""
+    return int(os.getenv("E2E_CONTEXT_POOL_SIZE", "2"))
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, base_url: str) -> Generator[ContextPool, None, None]:
     """
-    Playwright Page fixture.
+    Worker-scoped pool of warm browser contexts.
 
-    Provides a new page instance for each test.
+    Each xdist worker runs its own session, so the pool is per worker.
+    Contexts keep the default viewport and `pt-BR` locale and are reset
+    between tests instead of being recreated.
 
     Args:
         browser: Playwright Browser fixture from pytest-playwright
+        base_url: Base URL fixture
 
     Yields:
-        Page instance
+        ContextPool instance
     """
-    page = browser.new_page()
+    pool = ContextPool(
+        browser,
+        base_url,
+        size=_pool_size(),
+        setup=_pool_setup(base_url),
+        viewport=DEFAULT_VIEWPORT,
+        locale=DEFAULT_LOCALE,
+    )
+    yield pool
+    pool.close()
 
-    # Cleanup any open dropdowns/modals before starting test
-    try:
-        page.keyboard.press("Escape")
-        page.wait_for_timeout(100)
-        page.evaluate("() => { document.body.click() }")
-        page.wait_for_timeout(100)
-    except Exception:
-        pass
 
-    yield page
+@pytest.fixture(scope="function")
+def network_profile(request: pytest.FixtureRequest) -> str:
+    """
+    Network profile for remote images in the current test.
+
+    Defaults to E2E_NETWORK_PROFILE (or `local`) and can be overridden
+    per test with `@pytest.mark.network_profile("block")`.
+
+    Returns:
+        One of 'local', 'block' or 'live'
+    """
+    marker = request.node.get_closest_marker("network_profile")
+    if marker and marker.args:
+        return marker.args[0]
+    return os.getenv("E2E_NETWORK_PROFILE", PROFILE_LOCAL)
 
-    # Cleanup after test - close any open modals/dropdowns
-    try:
-        page.keyboard.press("Escape")
-        page.wait_for_timeout(100)
-    except Exception:
-        pass
 
-    page.close()
+@pytest.fixture(scope="function")
+def page(
+    context_pool: ContextPool,
+    network_profile: str
+) -> Generator[Page, None, None]:
+    """
+    Playwright Page fixture.
+
+    Provides the blank page of a pooled context for each test, with remote
+    images routed according to the network profile. Cookies, storage and
+    service-worker caches are cleared when the test ends.
+
+    Args:
+        context_pool: Worker-scoped ContextPool fixture
+        network_profile: Network profile fixture
+
+    Yields:
+        Page instance
+    """
+    context = context_pool.acquire()
+    remove_image_route = route_remote_images(context, network_profile)
+    yield ContextPool.get_page(context)
+    remove_image_route()
+    context_pool.release(context)
 
 
 @pytest.fixture(scope="function")
-def context(browser: Browser) -> Generator[BrowserContext, None, None]:
+def context(
+    context_pool: ContextPool,
+    network_profile: str
+) -> Generator[BrowserContext, None, None]:
     """
     Playwright BrowserContext fixture.
 
-    Provides a new browser context for each test.
+    Provides a clean pooled browser context for each test, with remote
+    images routed according to the network profile.
 
     Args:
-        browser: Playwright Browser fixture from pytest-playwright
+        context_pool: Worker-scoped ContextPool fixture
+        network_profile: Network profile fixture
 
     Yields:
         BrowserContext instance
     """
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        locale="pt-BR",
-    )
+    context = context_pool.acquire()
+    remove_image_route = route_remote_images(context, network_profile)
     yield context
-    context.close()
+    remove_image_route()
+    context_pool.release(context)
+
+
+# =============================================================================
+# AUTHENTICATED CONTEXT FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def auth_storage_state(
+    base_url: str,
+    tmp_path_factory: pytest.TempPathFactory
+) -> Callable[[str], str]:
+    """
+    Storage state files with an authenticated session, one per role.
+
+    The token is obtained via the API the first time a role is requested
+    and the resulting storage state is reused for the rest of the session,
+    so no test pays for the UI login flow.
+
+    Args:
+        base_url: Base URL fixture
+        tmp_path_factory: Pytest temporary directory factory
+
+    Returns:
+        Function mapping a role ('admin' or 'agent') to its storage state path
+    """
+    state_dir = tmp_path_factory.mktemp("auth-state")
+    paths: Dict[str, str] = {}
+
+    def _storage_state_for(role: str) -> str:
+        if role not in paths:
+            paths[role] = write_storage_state(
+                str(state_dir / f"{role}.json"),
+                base_url,
+                ROLE_CREDENTIALS[role],
+            )
+        return paths[role]
+
+    return _storage_state_for
+
+
+@pytest.fixture(scope="session")
+def authenticated_pools(
+    browser: Browser,
+    base_url: str,
+    auth_storage_state: Callable[[str], str]
+) -> Generator[Callable[[str], ContextPool], None, None]:
+    """
+    Worker-scoped context pools pre-loaded with a role's storage state.
+
+    One pool per role, created the first time the role is requested. The
+    pool restores the auth cookie after each reset, so contexts stay
+    logged in and warm across tests.
+
+    Args:
+        browser: Playwright Browser fixture from pytest-playwright
+        base_url: Base URL fixture
+        auth_storage_state: Storage state fixture
+
+    Yields:
+        Function mapping a role ('admin' or 'agent') to its ContextPool
+    """
+    pools: Dict[str, ContextPool] = {}
+
+    def _pool_for(role: str) -> ContextPool:
+        if role not in pools:
+            pools[role] = ContextPool(
+                browser,
+                base_url,
+                size=_pool_size(),
+                setup=_pool_setup(base_url),
+                storage_state=auth_storage_state(role),
+                viewport=DEFAULT_VIEWPORT,
+                locale=DEFAULT_LOCALE,
+            )
+        return pools[role]
+
+    yield _pool_for
+
+    for pool in pools.values():
+        pool.close()
+
+
+def _authenticated_context(
+    authenticated_pools: Callable[[str], ContextPool],
+    network_profile: str,
+    role: str
+) -> Generator[BrowserContext, None, None]:
+    """Check out a pooled context of `role` for one test."""
+    pool = authenticated_pools(role)
+    context = pool.acquire()
+    remove_image_route = route_remote_images(context, network_profile)
+    yield context
+    remove_image_route()
+    pool.release(context)
+
+
+@pytest.fixture(scope="function")
+def admin_context(
+    authenticated_pools: Callable[[str], ContextPool],
+    network_profile: str
+) -> Generator[BrowserContext, None, None]:
+    """
+    Pooled BrowserContext logged in as admin.
+
+    Drive it through its existing page (`ContextPool.get_page`), which is
+    the page failure screenshots and traces capture.
+
+    Yields:
+        Authenticated BrowserContext
+    """
+    yield from _authenticated_context(authenticated_pools, network_profile, "admin")
+
+
+@pytest.fixture(scope="function")
+def agent_context(
+    authenticated_pools: Callable[[str], ContextPool],
+    network_profile: str
+) -> Generator[BrowserContext, None, None]:
+    """
+    Pooled BrowserContext logged in as agent.
+
+    Yields:
+        Authenticated BrowserContext
+    """
+    yield from _authenticated_context(authenticated_pools, network_profile, "agent")
+
+
+# Context fixtures checked in order when looking for what a test drives;
+# authenticated contexts win over the anonymous `page`.
+DRIVEN_CONTEXT_FIXTURES = ("admin_context", "agent_context", "context", "page")
+
+
+def _driven_context(request: pytest.FixtureRequest) -> BrowserContext:
+    """
+    The BrowserContext the current test drives.
+
+    Resolved from the fixtures the test (directly or through other
+    fixtures) requests, so failure artifacts capture that context and
+    tests that don't use the anonymous `page` don't check one out.
+    Falls back to `page` for tests that request no browser fixture.
+    """
+    for name in DRIVEN_CONTEXT_FIXTURES:
+        if name in request.fixturenames:
+            value = request.getfixturevalue(name)
+            return value.context if name == "page" else value
+    return request.getfixturevalue("page").context
+
+
+def _driven_page(context: BrowserContext) -> Optional[Page]:
+    """The most recently opened page of a context, if any is still open."""
+    return context.pages[-1] if context.pages else None
 
 
 # =============================================================================
@@ -95,40 +317,104 @@ def context(browser: Browser) -> Generator[BrowserContext, None, None]:
 # =============================================================================
 
 @pytest.fixture(autouse=True)
-def screenshot_on_failure(
-    request: pytest.FixtureRequest,
-    page: Page
-) -> Generator[None, None, None]:
+def screenshot_on_failure(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """
     Automatically take screenshot on test failure.
 
+    The screenshot is of the page the test drives (see `_driven_context`),
+    e.g. the admin context's page in admin tests.
+
     Args:
         request: Pytest request fixture
-        page: Playwright Page fixture
 
     Yields:
         None
     """
+    context = _driven_context(request)
     yield
 
     # Check if test failed - handle missing rep_call attribute
     if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:  # type: ignore
         try:
-            # Create screenshots directory if it doesn't exist
-            screenshot_dir = Path(__file__).parent / "screenshots"
-            screenshot_dir.mkdir(exist_ok=True)
-
-            # Generate screenshot filename
-            test_name = request.node.name.replace("/", "_").replace("\\", "_")
-            screenshot_path = screenshot_dir / f"{test_name}-failed.png"
+            screenshot_path = failure_artifact_path(request.node.name, ".png")
 
             # Take screenshot
-            page.screenshot(path=str(screenshot_path), full_page=True)
+            page = _driven_page(context)
+            if page is not None:
+                page.screenshot(path=str(screenshot_path), full_page=True)
         except Exception:
             # Ignore screenshot errors
             pass
 
 
+# =============================================================================
+# TRACING FIXTURE (for failures)
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def trace_on_failure(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """
+    Record a Playwright trace chunk and a console/network ring buffer per test.
+
+    Both cover the context the test drives (see `_driven_context`) and are
+    written to `tests/e2e/screenshots/` only when the test fails
+    (`<test>-failed.trace.zip`, open with `playwright show-trace`, and
+    `<test>-failed.events.json`). E2E_TRACE=off disables it, E2E_TRACE=always
+    keeps every chunk (`<test>-passed.*` for passing tests).
+
+    Args:
+        request: Pytest request fixture
+
+    Yields:
+        None
+    """
+    tracer = FailureTracer(_driven_context(request))
+    try:
+        tracer.start(request.node.nodeid)
+    except Exception:
+        # Tracing must never break a test; just drop the event listeners
+        tracer.stop(request.node.name, failed=False)
+
+    yield
+
+    failed = hasattr(request.node, 'rep_call') and request.node.rep_call.failed  # type: ignore
+    try:
+        for artifact in tracer.stop(request.node.name, failed):
+            name = "failure_artifact" if failed else "trace_artifact"
+            request.node.user_properties.append((name, str(artifact)))
+    except Exception:
+        pass
+
+
+# =============================================================================
+# WEB VITALS FIXTURE
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def web_vitals_report(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """
+    Attach web vitals recorded by page objects to the test report.
+
+    Vitals are recorded by `BasePage.goto` when E2E_WEB_VITALS is set and
+    end up in the report's user properties (JUnit XML / JSON report) and,
+    with pytest-html, as a JSON extra.
+
+    Args:
+        request: Pytest request fixture
+
+    Yields:
+        None
+    """
+    VITALS_COLLECTOR.drain()
+    yield
+
+    entries = VITALS_COLLECTOR.drain()
+    if entries:
+        request.node.user_properties.append(
+            ("web_vitals", json.dumps([entry.to_dict() for entry in entries]))
+        )
+
+
 # =============================================================================
 # PYTEST HOOKS
 # =============================================================================
@@ -150,3 +436,13 @@ def pytest_runtest_makereport(item: pytest.Item):  # type: ignore
 
     # Set a report attribute for each phase of a call
     setattr(item, "rep_" + rep.when, rep)
+
+    # Expose recorded web vitals as a pytest-html extra
+    if rep.when == "teardown" and item.config.pluginmanager.hasplugin("html"):
+        vitals = [value for name, value in item.user_properties if name == "web_vitals"]
+        if vitals:
+            import pytest_html
+
+            rep.extras = getattr(rep, "extras", []) + [
+                pytest_html.extras.json(json.loads(vitals[-1]), name="Web vitals")
+            ]
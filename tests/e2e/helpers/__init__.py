@@ -9,14 +9,40 @@ from .auth import (
     login_as_agent,
     login_with_credentials,
     create_authenticated_context,
+    build_storage_state,
+    write_storage_state,
     save_storage_state,
     load_storage_state,
+    api_login,
     get_auth_token,
     set_auth_token_in_browser,
     is_authenticated,
     logout,
     DEFAULT_ADMIN_CREDENTIALS,
     DEFAULT_AGENT_CREDENTIALS,
+    ROLE_CREDENTIALS,
+)
+from .context_pool import ContextPool
+from .vitals import (
+    WebVitals,
+    collect_web_vitals,
+    install_vitals_observers,
+    load_budgets,
+    match_route,
+    check_budget,
+    assert_within_budget,
+)
+from .network import (
+    route_remote_images,
+    route_third_party_from_har,
+    PROFILE_LOCAL,
+    PROFILE_BLOCK,
+    PROFILE_LIVE,
+)
+from .tracing import (
+    EventRingBuffer,
+    FailureTracer,
+    failure_artifact_path,
 )
 
 __all__ = [
@@ -24,12 +50,32 @@ __all__ = [
     "login_as_agent",
     "login_with_credentials",
     "create_authenticated_context",
+    "build_storage_state",
+    "write_storage_state",
     "save_storage_state",
     "load_storage_state",
+    "api_login",
     "get_auth_token",
     "set_auth_token_in_browser",
     "is_authenticated",
     "logout",
     "DEFAULT_ADMIN_CREDENTIALS",
     "DEFAULT_AGENT_CREDENTIALS",
+    "ROLE_CREDENTIALS",
+    "ContextPool",
+    "WebVitals",
+    "collect_web_vitals",
+    "install_vitals_observers",
+    "load_budgets",
+    "match_route",
+    "check_budget",
+    "assert_within_budget",
+    "route_remote_images",
+    "route_third_party_from_har",
+    "PROFILE_LOCAL",
+    "PROFILE_BLOCK",
+    "PROFILE_LIVE",
+    "EventRingBuffer",
+    "FailureTracer",
+    "failure_artifact_path",
 ]
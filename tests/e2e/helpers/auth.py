@@ -5,8 +5,10 @@ Provides helper functions to authenticate users in Payload CMS admin
 during end-to-end testing.
 """
 
+import json
 import os
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 import requests
 from playwright.sync_api import Page, BrowserContext
 from dotenv import load_dotenv
@@ -22,6 +24,8 @@ if env_path.exists():
 # DEFAULT CREDENTIALS
 # =============================================================================
 
+AUTH_TOKEN_KEY = "payload-token"
+
 DEFAULT_ADMIN_CREDENTIALS = {
     "email": os.getenv("PAYLOAD_ADMIN_EMAIL", "admin@primeurban.test"),
     "password": os.getenv("PAYLOAD_ADMIN_PASSWORD", "test-admin-pass-123"),
@@ -32,6 +36,11 @@ DEFAULT_AGENT_CREDENTIALS = {
     "password": os.getenv("PAYLOAD_AGENT_PASSWORD", "test-agent-pass-123"),
 }
 
+ROLE_CREDENTIALS = {
+    "admin": DEFAULT_ADMIN_CREDENTIALS,
+    "agent": DEFAULT_AGENT_CREDENTIALS,
+}
+
 
 # =============================================================================
 # AUTHENTICATION FUNCTIONS
@@ -254,42 +263,107 @@ def _perform_login(
 def create_authenticated_context(
     browser,
     base_url: str = "http://localhost:3000",
-    credentials: Optional[Dict[str, str]] = None
+    credentials: Optional[Dict[str, str]] = None,
+    storage_state_path: Optional[str] = None,
+    **context_options: Any
 ) -> BrowserContext:
     """
     Create a browser context with authenticated session.
 
     This is useful for running multiple tests with the same authentication
-    without re-logging in each time.
+    without re-logging in each time. When a storage state file is given
+    (see `write_storage_state`), the context is loaded from it and no login
+    request is made at all; otherwise the token is obtained via the API.
 
     Args:
         browser: Playwright Browser instance
         base_url: Base URL of the application
         credentials: Dict with 'email' and 'password' keys (optional)
+        storage_state_path: Previously written storage state file (optional)
+        **context_options: Extra options for `browser.new_context`
 
     Returns:
         Authenticated BrowserContext
     """
-    context = browser.new_context()
-    page = context.new_page()
+    if storage_state_path:
+        return load_storage_state(browser, storage_state_path, **context_options)
 
-    try:
-        _perform_login(page, base_url, credentials or DEFAULT_ADMIN_CREDENTIALS)
+    session = api_login(base_url, credentials or DEFAULT_ADMIN_CREDENTIALS)
+    storage_state = build_storage_state(session["token"], base_url, session.get("exp"))
+
+    return browser.new_context(storage_state=storage_state, **context_options)
+
+
+def build_storage_state(
+    token: str,
+    base_url: str = "http://localhost:3000",
+    expires: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Build a Playwright storage state carrying a Payload auth token.
+
+    The admin panel authenticates through the `payload-token` cookie; the
+    same token is mirrored in localStorage for helpers such as
+    `is_authenticated` that inspect it.
+
+    Args:
+        token: JWT token returned by the login endpoint
+        base_url: Base URL of the application
+        expires: Cookie expiry as a Unix timestamp (session cookie if omitted)
 
-        # Save storage state (includes cookies, localStorage, etc.)
-        storage_state = context.storage_state()
+    Returns:
+        Storage state dict accepted by `browser.new_context(storage_state=...)`
+    """
+    parsed = urlparse(base_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+
+    return {
+        "cookies": [
+            {
+                "name": AUTH_TOKEN_KEY,
+                "value": token,
+                "domain": parsed.hostname or "localhost",
+                "path": "/",
+                "expires": float(expires) if expires else -1,
+                "httpOnly": True,
+                "secure": parsed.scheme == "https",
+                "sameSite": "Lax",
+            }
+        ],
+        "origins": [
+            {
+                "origin": origin,
+                "localStorage": [{"name": AUTH_TOKEN_KEY, "value": token}],
+            }
+        ],
+    }
+
+
+def write_storage_state(
+    path: str,
+    base_url: str = "http://localhost:3000",
+    credentials: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Log in via the API and write the resulting storage state to a file.
 
-        # Close and recreate context with saved state
-        page.close()
-        context.close()
+    No browser is involved, so this is cheap enough to run once per role
+    per test session.
 
-        authenticated_context = browser.new_context(storage_state=storage_state)
-        return authenticated_context
+    Args:
+        path: Destination path of the storage state JSON file
+        base_url: Base URL of the application
+        credentials: Dict with 'email' and 'password' keys (optional)
+
+    Returns:
+        The path the storage state was written to
+    """
+    session = api_login(base_url, credentials or DEFAULT_ADMIN_CREDENTIALS)
+    storage_state = build_storage_state(session["token"], base_url, session.get("exp"))
 
-    except Exception as e:
-        page.close()
-        context.close()
-        raise e
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(storage_state), encoding="utf-8")
+    return path
 
 
 def save_storage_state(
@@ -308,7 +382,8 @@ def save_storage_state(
 
 def load_storage_state(
     browser,
-    path: str = "auth-state.json"
+    path: str = "auth-state.json",
+    **context_options: Any
 ) -> BrowserContext:
     """
     Load a previously saved storage state to create an authenticated context.
@@ -316,6 +391,7 @@ def load_storage_state(
     Args:
         browser: Playwright Browser instance
         path: Path to the saved storage state JSON file
+        **context_options: Extra options for `browser.new_context`
 
     Returns:
         Authenticated BrowserContext
@@ -323,40 +399,33 @@ def load_storage_state(
     Raises:
         FileNotFoundError: If the storage state file doesn't exist
     """
-    from pathlib import Path
-
     if not Path(path).exists():
         raise FileNotFoundError(f"Storage state file not found: {path}")
 
-    return browser.new_context(storage_state=path)
+    return browser.new_context(storage_state=path, **context_options)
 
 
 # =============================================================================
 # TOKEN HELPERS (API Authentication)
 # =============================================================================
 
-def get_auth_token(
+def api_login(
     base_url: str = "http://localhost:3000",
     credentials: Optional[Dict[str, str]] = None
-) -> str:
+) -> Dict[str, Any]:
     """
-    Get JWT authentication token via API.
-
-    Useful for tests that need to make authenticated API requests
-    outside of browser context.
+    Log in through the Payload REST API.
 
     Args:
         base_url: Base URL of the application
         credentials: Dict with 'email' and 'password' keys (optional)
 
     Returns:
-        JWT token string
+        Login response body (contains 'token', 'exp' and 'user')
 
     Raises:
         AssertionError: If login fails
     """
-    import requests
-
     creds = credentials or DEFAULT_ADMIN_CREDENTIALS
 
     response = requests.post(
@@ -375,7 +444,30 @@ def get_auth_token(
     data = response.json()
     assert "token" in data, "Login response doesn't contain token"
 
-    return data["token"]
+    return data
+
+
+def get_auth_token(
+    base_url: str = "http://localhost:3000",
+    credentials: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Get JWT authentication token via API.
+
+    Useful for tests that need to make authenticated API requests
+    outside of browser context.
+
+    Args:
+        base_url: Base URL of the application
+        credentials: Dict with 'email' and 'password' keys (optional)
+
+    Returns:
+        JWT token string
+
+    Raises:
+        AssertionError: If login fails
+    """
+    return api_login(base_url, credentials)["token"]
 
 
 def set_auth_token_in_browser(
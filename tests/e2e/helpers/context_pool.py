@@ -0,0 +1,248 @@
+"""
+Browser context pool for E2E tests.
+
+Keeps a small set of warm BrowserContexts per worker and resets their state
+between tests instead of recreating them.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+
+# =============================================================================
+# RESET SCRIPTS
+# =============================================================================
+
+# Runs inside the app origin: clears Web Storage, Cache Storage and
+# unregisters the service worker registered by components/service-worker-register.tsx.
+CLEAR_ORIGIN_STATE_SCRIPT = """async () => {
+    try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}
+    if ('caches' in self) {
+        for (const key of await caches.keys()) { await caches.delete(key); }
+    }
+    if (navigator.serviceWorker) {
+        for (const registration of await navigator.serviceWorker.getRegistrations()) {
+            await registration.unregister();
+        }
+    }
+}"""
+
+CDP_STORAGE_TYPES = "local_storage,indexeddb,cache_storage,service_workers,file_systems,websql"
+
+# Init script of pools created with a storage state: re-seeds the state's
+# localStorage entries (e.g. the mirrored auth token) that the reset cleared.
+# Entries the page set itself are left alone.
+SEED_LOCAL_STORAGE_SCRIPT = """(() => {
+    const seeds = %s;
+    const entries = seeds[location.origin];
+    if (!entries) return;
+    try {
+        for (const [name, value] of entries) {
+            if (localStorage.getItem(name) === null) localStorage.setItem(name, value);
+        }
+    } catch (e) {}
+})();"""
+
+
+# =============================================================================
+# CONTEXT POOL
+# =============================================================================
+
+class ContextPool:
+    """Pool of reusable BrowserContexts with fast state reset."""
+
+    def __init__(
+        self,
+        browser: Browser,
+        base_url: str = "http://localhost:3000",
+        size: int = 2,
+        warm_up: bool = True,
+        setup: Optional[Callable[[BrowserContext], None]] = None,
+        **context_options: Any
+    ):
+        """
+        Initialize the pool.
+
+        Contexts are created lazily, up to `size` idle contexts are kept.
+
+        Args:
+            browser: Playwright Browser instance
+            base_url: Base URL of the application (origin whose state is reset)
+            size: Maximum number of idle contexts kept warm
+            warm_up: Whether to navigate new contexts to the app once
+            setup: Called once on every new context (e.g. to install routes)
+            **context_options: Options for `browser.new_context` (viewport, locale...).
+                A `storage_state` (path or dict) survives resets: its cookies
+                are restored after each reset and its localStorage entries are
+                re-seeded on the next visit to their origin.
+        """
+        self.browser = browser
+        self.base_url = base_url
+        self.size = max(1, size)
+        self.warm_up = warm_up
+        self.setup = setup
+        self.context_options = context_options
+
+        parsed = urlparse(base_url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+
+        self._storage_state = self._read_storage_state(context_options.get("storage_state"))
+
+        self._idle: List[BrowserContext] = []
+        self._in_use: List[BrowserContext] = []
+
+    # -------------------------------------------------------------------------
+    # ACQUIRE / RELEASE
+    # -------------------------------------------------------------------------
+
+    def acquire(self) -> BrowserContext:
+        """
+        Get a clean context from the pool, creating one if none is idle.
+
+        Returns:
+            BrowserContext with exactly one blank page
+        """
+        context = self._idle.pop() if self._idle else self._create_context()
+        self._in_use.append(context)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Reset a context and return it to the pool.
+
+        Contexts that fail to reset, or exceed the pool size, are closed.
+
+        Args:
+            context: Context previously returned by `acquire`
+        """
+        if context in self._in_use:
+            self._in_use.remove(context)
+
+        try:
+            self.reset(context)
+        except Exception:
+            self._close_quietly(context)
+            return
+
+        if len(self._idle) >= self.size:
+            self._close_quietly(context)
+            return
+
+        self._idle.append(context)
+
+    def close(self) -> None:
+        """Close every context owned by the pool."""
+        for context in self._idle + self._in_use:
+            self._close_quietly(context)
+        self._idle.clear()
+        self._in_use.clear()
+
+    # -------------------------------------------------------------------------
+    # RESET
+    # -------------------------------------------------------------------------
+
+    def reset(self, context: BrowserContext) -> None:
+        """
+        Clear cookies, storage and service-worker caches of a context.
+
+        Leaves a single page parked on `about:blank`. Pools created with a
+        `storage_state` get its cookies back, so authenticated contexts stay
+        logged in across tests.
+
+        Args:
+            context: Context to reset
+        """
+        for extra_page in context.pages[1:]:
+            extra_page.close()
+
+        page = self.get_page(context)
+
+        if page.url.startswith(self.origin):
+            page.evaluate(CLEAR_ORIGIN_STATE_SCRIPT)
+
+        self._clear_origin_via_cdp(context, page)
+
+        context.clear_cookies()
+        if self._storage_state.get("cookies"):
+            context.add_cookies(self._storage_state["cookies"])
+        context.clear_permissions()
+        page.goto("about:blank")
+
+    @staticmethod
+    def get_page(context: BrowserContext) -> Page:
+        """
+        Return the context's page, opening one if it has none.
+
+        Args:
+            context: BrowserContext from the pool
+
+        Returns:
+            Page instance
+        """
+        return context.pages[0] if context.pages else context.new_page()
+
+    # -------------------------------------------------------------------------
+    # INTERNALS
+    # -------------------------------------------------------------------------
+
+    def _create_context(self) -> BrowserContext:
+        """Create a context and run a first navigation to warm it up."""
+        context = self.browser.new_context(**self.context_options)
+
+        seeds = {
+            entry["origin"]: [[item["name"], item["value"]] for item in entry.get("localStorage", [])]
+            for entry in self._storage_state.get("origins", [])
+        }
+        if seeds:
+            context.add_init_script(SEED_LOCAL_STORAGE_SCRIPT % json.dumps(seeds))
+
+        if self.setup:
+            self.setup(context)
+
+        page = context.new_page()
+
+        if self.warm_up:
+            try:
+                page.goto(self.base_url, wait_until="domcontentloaded", timeout=60000)
+            except Exception:
+                pass
+
+            self.reset(context)
+
+        return context
+
+    def _clear_origin_via_cdp(self, context: BrowserContext, page: Optional[Page]) -> None:
+        """Clear origin storage through CDP (Chromium only)."""
+        if page is None or self.browser.browser_type.name != "chromium":
+            return
+
+        try:
+            session = context.new_cdp_session(page)
+            session.send(
+                "Storage.clearDataForOrigin",
+                {"origin": self.origin, "storageTypes": CDP_STORAGE_TYPES},
+            )
+            session.detach()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _read_storage_state(storage_state: Any) -> Dict[str, Any]:
+        """Load a storage state given as a path or dict (empty if none)."""
+        if not storage_state:
+            return {}
+        if isinstance(storage_state, dict):
+            return storage_state
+        return json.loads(Path(storage_state).read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _close_quietly(context: BrowserContext) -> None:
+        """Close a context ignoring errors (e.g. already closed)."""
+        try:
+            context.close()
+        except Exception:
+            pass
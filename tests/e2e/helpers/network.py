@@ -0,0 +1,171 @@
+"""
+Network routing helpers for E2E tests.
+
+Serves remote placeholder images (images.unsplash.com, used by
+lib/mock-data.ts and MediaFactory.image_url) from a local fixture directory,
+or blocks them, and replays recorded HAR files for third-party requests.
+"""
+
+import mimetypes
+import re
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from playwright.sync_api import BrowserContext, Route
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PROFILE_LOCAL = "local"
+PROFILE_BLOCK = "block"
+PROFILE_LIVE = "live"
+NETWORK_PROFILES = (PROFILE_LOCAL, PROFILE_BLOCK, PROFILE_LIVE)
+
+REMOTE_IMAGE_HOSTS = ("images.unsplash.com",)
+NEXT_IMAGE_PATH = "/_next/image"
+
+IMAGE_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "images"
+DEFAULT_IMAGE_FIXTURE = "placeholder.png"
+
+
+# =============================================================================
+# URL MATCHING
+# =============================================================================
+
+def get_remote_image_url(url: str) -> Optional[str]:
+    """
+    Resolve the remote image a request points to.
+
+    Matches direct requests to the remote hosts and `next/image` optimizer
+    requests (`/_next/image?url=...`) whose source is a remote host.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Remote image URL, or None if the request is not a remote image
+    """
+    parsed = urlparse(url)
+
+    if parsed.hostname in REMOTE_IMAGE_HOSTS:
+        return url
+
+    if parsed.path == NEXT_IMAGE_PATH:
+        source = parse_qs(parsed.query).get("url", [""])[0]
+        if urlparse(source).hostname in REMOTE_IMAGE_HOSTS:
+            return source
+
+    return None
+
+
+def is_remote_image(url: str) -> bool:
+    """Route predicate matching remote image requests."""
+    return get_remote_image_url(url) is not None
+
+
+def get_image_fixture(image_url: str, fixtures_dir: Path = IMAGE_FIXTURES_DIR) -> Path:
+    """
+    Pick the local fixture that stands in for a remote image.
+
+    A file named after the Unsplash photo id (e.g. `photo-1600596542815-ffad4c1539a9.jpg`)
+    takes precedence; otherwise the default placeholder is used.
+
+    Args:
+        image_url: Remote image URL
+        fixtures_dir: Directory holding image fixtures
+
+    Returns:
+        Path of the fixture file
+    """
+    photo_id = Path(urlparse(image_url).path).name
+
+    if photo_id:
+        for candidate in sorted(fixtures_dir.glob(f"{photo_id}.*")):
+            return candidate
+
+    return fixtures_dir / DEFAULT_IMAGE_FIXTURE
+
+
+# =============================================================================
+# ROUTING
+# =============================================================================
+
+def route_remote_images(
+    context: BrowserContext,
+    profile: str = PROFILE_LOCAL,
+    fixtures_dir: Path = IMAGE_FIXTURES_DIR
+) -> Callable[[], None]:
+    """
+    Route remote image requests of a context according to a profile.
+
+    - `local`: fulfil them from `fixtures_dir`
+    - `block`: abort them
+    - `live`: leave them untouched
+
+    Args:
+        context: BrowserContext to route
+        profile: One of NETWORK_PROFILES
+        fixtures_dir: Directory holding image fixtures
+
+    Returns:
+        Function that removes the route (no-op for `live`)
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in NETWORK_PROFILES:
+        raise ValueError(f"Unknown network profile: {profile}")
+
+    if profile == PROFILE_LIVE:
+        return lambda: None
+
+    def _handle(route: Route) -> None:
+        if profile == PROFILE_BLOCK:
+            route.abort("blockedbyclient")
+            return
+
+        fixture = get_image_fixture(get_remote_image_url(route.request.url) or "", fixtures_dir)
+        content_type = mimetypes.guess_type(fixture.name)[0] or "application/octet-stream"
+        route.fulfill(
+            path=str(fixture),
+            content_type=content_type,
+            headers={"cache-control": "public, max-age=31536000, immutable"},
+        )
+
+    context.route(is_remote_image, _handle)
+
+    return lambda: context.unroute(is_remote_image, _handle)
+
+
+def route_third_party_from_har(
+    context: BrowserContext,
+    har_path: str,
+    base_url: str = "http://localhost:3000",
+    update: bool = False
+) -> None:
+    """
+    Replay (or record) third-party requests from a HAR file.
+
+    Requests to the application origin always go to the live server;
+    everything else is answered from the HAR, and aborted when missing
+    so runs never depend on the network.
+
+    Args:
+        context: BrowserContext to route
+        har_path: HAR file path
+        base_url: Base URL of the application
+        update: Record into the HAR instead of replaying (written on context close)
+    """
+    parsed = urlparse(base_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    third_party = re.compile(rf"^(?!{re.escape(origin)}).*")
+
+    context.route_from_har(
+        har_path,
+        url=third_party,
+        not_found="fallback" if update else "abort",
+        update=update,
+    )
@@ -0,0 +1,323 @@
+"""
+On-failure tracing for E2E tests.
+
+Playwright tracing is started once per (pooled) context and recorded in
+chunks, one per test; a chunk is only written to disk when its test fails.
+Alongside it, a bounded ring buffer keeps the latest console messages, page
+errors and network events of the context's pages so failures come with
+context.
+
+Artifacts go to `tests/e2e/screenshots/`, next to the failure screenshot.
+"""
+
+import json
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from playwright.sync_api import BrowserContext, ConsoleMessage, Page, Request, Response
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+TRACE_MODE_OFF = "off"
+TRACE_MODE_ON_FAILURE = "on-failure"
+TRACE_MODE_ALWAYS = "always"
+
+ARTIFACTS_DIR = Path(__file__).parent.parent / "screenshots"
+DEFAULT_EVENT_BUFFER_SIZE = 200
+
+
+def get_trace_mode() -> str:
+    """
+    Tracing mode from E2E_TRACE.
+
+    Returns:
+        'on-failure' (default), 'always' (keep every chunk) or 'off'
+    """
+    mode = os.getenv("E2E_TRACE", TRACE_MODE_ON_FAILURE).lower()
+    if mode not in (TRACE_MODE_OFF, TRACE_MODE_ON_FAILURE, TRACE_MODE_ALWAYS):
+        return TRACE_MODE_ON_FAILURE
+    return mode
+
+
+def failure_artifact_path(
+    test_name: str,
+    suffix: str,
+    directory: Path = ARTIFACTS_DIR,
+    outcome: str = "failed"
+) -> Path:
+    """
+    Path of a test artifact (e.g. `<test>-failed.png`).
+
+    Args:
+        test_name: Test node name
+        suffix: File suffix including the extension (e.g. '.trace.zip')
+        directory: Artifacts directory (created if missing)
+        outcome: Test outcome in the file name ('failed', or 'passed' for
+            artifacts kept with E2E_TRACE=always)
+
+    Returns:
+        Artifact path
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    safe_name = test_name.replace("/", "_").replace("\\", "_")
+    return directory / f"{safe_name}-{outcome}{suffix}"
+
+
+# =============================================================================
+# EVENT RING BUFFER
+# =============================================================================
+
+@dataclass
+class PageEvent:
+    """One console, error or network event seen by a page."""
+    kind: str
+    timestamp: float
+    text: str
+    details: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict."""
+        return asdict(self)
+
+
+class EventRingBuffer:
+    """Keeps the latest console and network events of a page or context."""
+
+    def __init__(self, size: int = DEFAULT_EVENT_BUFFER_SIZE):
+        """
+        Initialize the buffer.
+
+        Args:
+            size: Maximum number of events retained (oldest are dropped)
+        """
+        self.events: Deque[PageEvent] = deque(maxlen=max(1, size))
+        self._request_starts: Dict[Request, float] = {}
+
+    def attach(self, page: Page) -> Callable[[], None]:
+        """
+        Start recording events of a page.
+
+        Args:
+            page: Playwright Page instance
+
+        Returns:
+            Function that stops recording
+        """
+        listeners = {
+            "console": self._on_console,
+            "pageerror": self._on_page_error,
+            "request": self._on_request,
+            "requestfailed": self._on_request_failed,
+            "response": self._on_response,
+        }
+        for event, handler in listeners.items():
+            page.on(event, handler)
+
+        def _detach() -> None:
+            for event, handler in listeners.items():
+                page.remove_listener(event, handler)
+            self._request_starts.clear()
+
+        return _detach
+
+    def attach_context(self, context: BrowserContext) -> Callable[[], None]:
+        """
+        Start recording events of every page of a context.
+
+        Pages opened after this call (popups, `context.new_page()`) are
+        recorded too.
+
+        Args:
+            context: Playwright BrowserContext instance
+
+        Returns:
+            Function that stops recording
+        """
+        detachers = [self.attach(page) for page in context.pages]
+
+        def _on_page(page: Page) -> None:
+            detachers.append(self.attach(page))
+
+        context.on("page", _on_page)
+
+        def _detach() -> None:
+            context.remove_listener("page", _on_page)
+            for detach in detachers:
+                try:
+                    detach()
+                except Exception:
+                    # The page may already be closed
+                    pass
+            self._request_starts.clear()
+
+        return _detach
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self.events.clear()
+        self._request_starts.clear()
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Recorded events, oldest first."""
+        return [event.to_dict() for event in self.events]
+
+    def dump(self, path: Path) -> Path:
+        """
+        Write the recorded events as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            The written path
+        """
+        path.write_text(json.dumps(self.to_list(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+    # -------------------------------------------------------------------------
+    # HANDLERS
+    # -------------------------------------------------------------------------
+
+    def _add(self, kind: str, text: str, **details: Any) -> None:
+        self.events.append(PageEvent(kind=kind, timestamp=time.time(), text=text, details=details))
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        self._add("console", message.text, type=message.type, location=message.location)
+
+    def _on_page_error(self, error: Exception) -> None:
+        self._add("pageerror", str(error))
+
+    def _on_request(self, request: Request) -> None:
+        self._request_starts[request] = time.time()
+
+    def _on_request_failed(self, request: Request) -> None:
+        started = self._request_starts.pop(request, None)
+        self._add(
+            "requestfailed",
+            f"{request.method} {request.url}",
+            failure=request.failure,
+            resource_type=request.resource_type,
+            duration_ms=self._elapsed_ms(started),
+        )
+
+    def _on_response(self, response: Response) -> None:
+        request = response.request
+        started = self._request_starts.pop(request, None)
+        self._add(
+            "response",
+            f"{response.status} {request.method} {response.url}",
+            status=response.status,
+            resource_type=request.resource_type,
+            duration_ms=self._elapsed_ms(started),
+        )
+
+    @staticmethod
+    def _elapsed_ms(started: Optional[float]) -> Optional[float]:
+        return round((time.time() - started) * 1000, 1) if started else None
+
+
+# =============================================================================
+# TRACER
+# =============================================================================
+
+# Contexts are pooled across tests: tracing is started once per context and
+# each test only opens a chunk.
+_TRACED_CONTEXTS: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+class FailureTracer:
+    """Per-test trace chunk plus event buffer, persisted only on failure."""
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        mode: Optional[str] = None,
+        buffer_size: Optional[int] = None,
+        screenshots: Optional[bool] = None
+    ):
+        """
+        Initialize the tracer.
+
+        Args:
+            context: Context the test drives (traced, and its pages buffered)
+            mode: Tracing mode (defaults to E2E_TRACE)
+            buffer_size: Events kept (defaults to E2E_TRACE_EVENTS or 200)
+            screenshots: Record screencast frames (defaults to E2E_TRACE_SCREENSHOTS);
+                off by default since DOM snapshots are enough to replay most failures
+        """
+        self.context = context
+        self.mode = mode or get_trace_mode()
+        self.screenshots = (
+            screenshots
+            if screenshots is not None
+            else os.getenv("E2E_TRACE_SCREENSHOTS", "").lower() == "true"
+        )
+        self.buffer = EventRingBuffer(
+            buffer_size or int(os.getenv("E2E_TRACE_EVENTS", str(DEFAULT_EVENT_BUFFER_SIZE)))
+        )
+        self._detach: Optional[Callable[[], None]] = None
+        self._chunk_open = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tracing is on at all."""
+        return self.mode != TRACE_MODE_OFF
+
+    def start(self, title: str) -> None:
+        """
+        Open a trace chunk and start buffering events.
+
+        Args:
+            title: Chunk title shown in the trace viewer (the test id)
+        """
+        if not self.enabled:
+            return
+
+        self._detach = self.buffer.attach_context(self.context)
+
+        if self.context not in _TRACED_CONTEXTS:
+            self.context.tracing.start(screenshots=self.screenshots, snapshots=True, sources=False)
+            _TRACED_CONTEXTS.add(self.context)
+
+        self.context.tracing.start_chunk(title=title)
+        self._chunk_open = True
+
+    def stop(self, test_name: str, failed: bool) -> List[Path]:
+        """
+        Close the chunk, writing artifacts only when needed.
+
+        Args:
+            test_name: Test node name (artifact file names)
+            failed: Whether the test failed
+
+        Returns:
+            Paths of the written artifacts (empty when discarded)
+        """
+        if self._detach:
+            self._detach()
+            self._detach = None
+
+        if not self._chunk_open:
+            return []
+        self._chunk_open = False
+
+        keep = failed or self.mode == TRACE_MODE_ALWAYS
+        if not keep:
+            # No path: the chunk is discarded without serializing anything.
+            self.context.tracing.stop_chunk()
+            return []
+
+        outcome = "failed" if failed else "passed"
+        trace_path = failure_artifact_path(test_name, ".trace.zip", outcome=outcome)
+        events_path = failure_artifact_path(test_name, ".events.json", outcome=outcome)
+        self.context.tracing.stop_chunk(path=str(trace_path))
+        self.buffer.dump(events_path)
+        return [trace_path, events_path]
@@ -0,0 +1,292 @@
+"""
+Web-vitals capture and performance budgets for E2E tests.
+
+Collects navigation timing, TTFB, FCP, LCP, CLS, transferred bytes, JS heap
+size, long tasks and the slowest interaction for a page through
+PerformanceObserver (and CDP on Chromium), and checks them against
+per-route budgets declared in `tests/e2e/performance_budgets.json`.
+"""
+
+import json
+import os
+import re
+import weakref
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.sync_api import BrowserContext, Page
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+VITALS_MODE_OFF = "off"
+VITALS_MODE_COLLECT = "collect"
+VITALS_MODE_ENFORCE = "enforce"
+
+BUDGETS_PATH = Path(__file__).parent.parent / "performance_budgets.json"
+
+
+def get_vitals_mode() -> str:
+    """
+    Web-vitals mode from E2E_WEB_VITALS.
+
+    Returns:
+        'off' (default), 'collect' (record only) or 'enforce' (record and assert budgets)
+    """
+    mode = os.getenv("E2E_WEB_VITALS", VITALS_MODE_OFF).lower()
+    if mode not in (VITALS_MODE_OFF, VITALS_MODE_COLLECT, VITALS_MODE_ENFORCE):
+        return VITALS_MODE_OFF
+    return mode
+
+
+# =============================================================================
+# BROWSER SCRIPTS
+# =============================================================================
+
+# Installed before navigation; buffered observers also pick up entries
+# emitted before the script ran.
+VITALS_INIT_SCRIPT = """(() => {
+    if (window.__primeurbanVitals) return;
+    const vitals = { lcp: null, cls: 0, longTasks: [], interaction: null };
+    window.__primeurbanVitals = vitals;
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true });
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', (entry) => { vitals.lcp = entry.startTime; });
+    observe('layout-shift', (entry) => { if (!entry.hadRecentInput) vitals.cls += entry.value; });
+    observe('longtask', (entry) => { vitals.longTasks.push(entry.duration); });
+    observe('event', (entry) => {
+        if (entry.interactionId) vitals.interaction = Math.max(vitals.interaction || 0, entry.duration);
+    });
+})();"""
+
+READ_VITALS_SCRIPT = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    const resources = performance.getEntriesByType('resource');
+    const observed = window.__primeurbanVitals || { lcp: null, cls: 0, longTasks: [], interaction: null };
+    const transferred = resources.reduce((sum, r) => sum + (r.transferSize || 0), nav ? nav.transferSize || 0 : 0);
+    return {
+        ttfb: nav ? nav.responseStart - nav.startTime : null,
+        fcp: fcp ? fcp.startTime : null,
+        lcp: observed.lcp,
+        cls: observed.cls,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        transferred_bytes: transferred,
+        resource_count: resources.length,
+        long_tasks_count: observed.longTasks.length,
+        long_tasks_total: observed.longTasks.reduce((sum, d) => sum + d, 0),
+        interaction: observed.interaction,
+        js_heap_used: performance.memory ? performance.memory.usedJSHeapSize : null,
+    };
+}"""
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class WebVitals:
+    """Performance metrics of one navigation (times in ms, sizes in bytes)."""
+    url: str
+    route: Optional[str] = None
+    ttfb: Optional[float] = None
+    fcp: Optional[float] = None
+    lcp: Optional[float] = None
+    cls: Optional[float] = None
+    dom_content_loaded: Optional[float] = None
+    load: Optional[float] = None
+    transferred_bytes: Optional[int] = None
+    resource_count: Optional[int] = None
+    long_tasks_count: Optional[int] = None
+    long_tasks_total: Optional[float] = None
+    interaction: Optional[float] = None
+    js_heap_used: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict."""
+        return asdict(self)
+
+
+@dataclass
+class VitalsCollector:
+    """Accumulates the vitals recorded during the current test."""
+    entries: List[WebVitals] = field(default_factory=list)
+
+    def record(self, vitals: WebVitals) -> None:
+        """Record one navigation."""
+        self.entries.append(vitals)
+
+    def drain(self) -> List[WebVitals]:
+        """Return and clear the recorded entries."""
+        entries, self.entries = self.entries, []
+        return entries
+
+
+# Shared per worker; sync tests in a worker run sequentially.
+COLLECTOR = VitalsCollector()
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+
+# Init scripts accumulate on a context (one more copy runs on every
+# navigation), so the observers are registered once per context.
+_OBSERVED_CONTEXTS: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+def install_vitals_observers(context: BrowserContext) -> None:
+    """
+    Install the PerformanceObserver script on every page of a context.
+
+    Call it once when the context is created (pool setup, perf factories),
+    before its first navigation; later calls on the same context are no-ops.
+    The observers are passive, so contexts get them even when
+    E2E_WEB_VITALS is off and `goto(collect_vitals=True)` still works.
+
+    Args:
+        context: Playwright BrowserContext instance
+    """
+    if context in _OBSERVED_CONTEXTS:
+        return
+    context.add_init_script(VITALS_INIT_SCRIPT)
+    _OBSERVED_CONTEXTS.add(context)
+
+
+def _read_js_heap_via_cdp(page: Page) -> Optional[int]:
+    """Read JSHeapUsedSize through CDP (Chromium only)."""
+    if page.context.browser is None or page.context.browser.browser_type.name != "chromium":
+        return None
+
+    try:
+        session = page.context.new_cdp_session(page)
+        session.send("Performance.enable")
+        metrics = session.send("Performance.getMetrics")["metrics"]
+        session.detach()
+    except Exception:
+        return None
+
+    for metric in metrics:
+        if metric["name"] == "JSHeapUsedSize":
+            return int(metric["value"])
+    return None
+
+
+def collect_web_vitals(page: Page, route: Optional[str] = None) -> WebVitals:
+    """
+    Collect web vitals for the current document of a page.
+
+    Args:
+        page: Playwright Page instance (observers installed before navigation)
+        route: Route pattern the URL matched, if known
+
+    Returns:
+        WebVitals for the current navigation
+    """
+    data = page.evaluate(READ_VITALS_SCRIPT)
+
+    heap = _read_js_heap_via_cdp(page)
+    if heap is not None:
+        data["js_heap_used"] = heap
+
+    return WebVitals(url=page.url, route=route, **data)
+
+
+# =============================================================================
+# BUDGETS
+# =============================================================================
+
+def load_budgets(path: Path = BUDGETS_PATH) -> Dict[str, Dict[str, float]]:
+    """
+    Load per-route budgets.
+
+    Args:
+        path: JSON file mapping route patterns to metric limits
+
+    Returns:
+        Dict of route pattern -> {metric: max value}
+    """
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {route: limits for route, limits in data.items() if not route.startswith("_")}
+
+
+def _route_regex(pattern: str) -> "re.Pattern[str]":
+    """Convert a Next.js route pattern ('/imoveis/[slug]') to a regex."""
+    parts = []
+    for segment in pattern.strip("/").split("/"):
+        if segment.startswith("[...") or segment.startswith("[[..."):
+            parts.append(".+")
+        elif segment.startswith("["):
+            parts.append("[^/]+")
+        else:
+            parts.append(re.escape(segment))
+    return re.compile("^/" + "/".join(parts).rstrip("/") + "/?$")
+
+
+def match_route(path: str, budgets: Dict[str, Dict[str, float]]) -> Optional[str]:
+    """
+    Find the route pattern a path belongs to.
+
+    Static patterns win over dynamic ones.
+
+    Args:
+        path: URL path (query string is ignored)
+        budgets: Budgets as returned by `load_budgets`
+
+    Returns:
+        Matching route pattern or None
+    """
+    path = path.split("?", 1)[0].split("#", 1)[0] or "/"
+    routes = sorted(budgets, key=lambda route: route.count("["))
+    for route in routes:
+        if _route_regex(route).match(path):
+            return route
+    return None
+
+
+def check_budget(vitals: WebVitals, budget: Dict[str, float]) -> List[Tuple[str, float, float]]:
+    """
+    Compare vitals against a budget.
+
+    Metrics that could not be measured are not reported as violations.
+
+    Args:
+        vitals: Collected vitals
+        budget: {metric: max value}
+
+    Returns:
+        List of (metric, measured, limit) for every exceeded limit
+    """
+    violations = []
+    values = vitals.to_dict()
+    for metric, limit in budget.items():
+        measured = values.get(metric)
+        if measured is not None and measured > limit:
+            violations.append((metric, measured, limit))
+    return violations
+
+
+def assert_within_budget(vitals: WebVitals, budget: Dict[str, float]) -> None:
+    """
+    Assert that vitals are within budget.
+
+    Raises:
+        AssertionError: Listing every exceeded metric
+    """
+    violations = check_budget(vitals, budget)
+    details = ", ".join(
+        f"{metric}={measured:.2f} (budget {limit})" for metric, measured, limit in violations
+    )
+    assert not violations, f"Performance budget exceeded for {vitals.route} ({vitals.url}): {details}"
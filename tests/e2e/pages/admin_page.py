@@ -224,6 +224,89 @@ class AdminPage(BasePage):
         # Fallback: click the row itself
         self.click_row(row_index)
 
+    def goto_collection_page(
+        self,
+        collection_slug: str,
+        page_number: int,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> None:
+        """
+        Navigate straight to a page of a collection list.
+
+        Args:
+            collection_slug: Collection slug
+            page_number: Page number (1-based)
+            limit: Rows per page (Payload default when omitted)
+            sort: Sort field, prefixed with '-' for descending
+        """
+        query = [f"page={page_number}"]
+        if limit:
+            query.append(f"limit={limit}")
+        if sort:
+            query.append(f"sort={sort}")
+        self.goto(f"{self.collections_path}/{collection_slug}?{'&'.join(query)}")
+
+    def wait_for_list(self, timeout: int = 30000) -> None:
+        """
+        Wait until the list view shows rows (or its empty state).
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        self.page.locator('table tbody tr').or_(
+            self.page.locator('.collection-list__no-results')
+        ).first.wait_for(state='visible', timeout=timeout)
+        self.page.wait_for_load_state('networkidle', timeout=timeout)
+
+    def search_list(self, query: str, timeout: int = 30000) -> None:
+        """
+        Type into the list search box and wait for the filtered rows.
+
+        Args:
+            query: Search text
+            timeout: Timeout in milliseconds
+        """
+        search_input = self.page.locator('#search-filter-input').or_(
+            self.page.locator('input[placeholder*="Search"]')
+        ).or_(
+            self.page.locator('input[placeholder*="Pesquisar"]')
+        ).first
+
+        search_input.fill(query)
+        self.page.wait_for_url('**search=*', timeout=timeout)
+        self.wait_for_list(timeout)
+
+    def sort_by_column(self, field_name: str, descending: bool = False, timeout: int = 30000) -> None:
+        """
+        Sort the list by a column through its header buttons.
+
+        Args:
+            field_name: Field name of the column (e.g., 'price')
+            descending: Sort descending instead of ascending
+            timeout: Timeout in milliseconds
+        """
+        direction = 'desc' if descending else 'asc'
+        self.page.locator(
+            f'#heading-{field_name} .sort-column__{direction}'
+        ).first.click()
+        self.page.wait_for_url(f'**sort={"-" if descending else ""}{field_name}*', timeout=timeout)
+        self.wait_for_list(timeout)
+
+    def go_to_next_page(self, timeout: int = 30000) -> None:
+        """
+        Click the paginator's next-page control.
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        current_url = self.get_url()
+        self.page.locator('.paginator .clickable-arrow--right').or_(
+            self.page.locator('button[aria-label="Next page"]')
+        ).first.click()
+        self.page.wait_for_url(lambda url: url != current_url, timeout=timeout)
+        self.wait_for_list(timeout)
+
     # =============================================================================
     # CREATE/EDIT FORM
     # =============================================================================
@@ -0,0 +1,18 @@
+"""
+Async Page Objects for E2E Tests
+
+Async (playwright.async_api) counterparts of the sync page objects, used
+by tests that drive several browser actors at once.
+"""
+
+from .base_page import AsyncBasePage
+from .properties_page import AsyncPropertiesPage
+from .contact_form_page import AsyncContactFormPage
+from .admin_page import AsyncAdminPage
+
+__all__ = [
+    "AsyncBasePage",
+    "AsyncPropertiesPage",
+    "AsyncContactFormPage",
+    "AsyncAdminPage",
+]
@@ -0,0 +1,355 @@
+"""
+Async Admin Page Object for Payload CMS
+
+Async counterpart of `tests.e2e.pages.admin_page.AdminPage`, covering the
+navigation, list view and edit form interactions an agent performs while
+other actors run concurrently.
+"""
+
+from typing import List, Optional
+
+from playwright.async_api import Page
+
+from .base_page import AsyncBasePage
+
+
+class AsyncAdminPage(AsyncBasePage):
+    """Async page object for Payload CMS Admin panel."""
+
+    def __init__(self, page: Page, base_url: str = "http://localhost:3000"):
+        """
+        Initialize admin page.
+
+        Args:
+            page: Playwright async Page instance
+            base_url: Base URL of the application
+        """
+        super().__init__(page, base_url)
+        self.admin_path = "/admin"
+        self.collections_path = f"{self.admin_path}/collections"
+
+    # =============================================================================
+    # NAVIGATION
+    # =============================================================================
+
+    async def goto_admin(self) -> None:
+        """Navigate to admin panel."""
+        await self.goto(self.admin_path)
+
+    async def goto_collection(self, collection_slug: str) -> None:
+        """
+        Navigate to a specific collection.
+
+        Args:
+            collection_slug: Collection slug (e.g., 'properties', 'leads', 'users')
+        """
+        await self.goto(f"{self.collections_path}/{collection_slug}")
+
+    async def goto_create_new(self, collection_slug: str) -> None:
+        """
+        Navigate to create new document page.
+
+        Args:
+            collection_slug: Collection slug
+        """
+        await self.goto(f"{self.collections_path}/{collection_slug}/create")
+
+    async def goto_edit_document(self, collection_slug: str, doc_id: str) -> None:
+        """
+        Navigate to edit document page.
+
+        Args:
+            collection_slug: Collection slug
+            doc_id: Document ID
+        """
+        await self.goto(f"{self.collections_path}/{collection_slug}/{doc_id}")
+
+    async def goto_collection_page(
+        self,
+        collection_slug: str,
+        page_number: int,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> None:
+        """
+        Navigate straight to a page of a collection list.
+
+        Args:
+            collection_slug: Collection slug
+            page_number: Page number (1-based)
+            limit: Rows per page (Payload default when omitted)
+            sort: Sort field, prefixed with '-' for descending
+        """
+        query = [f"page={page_number}"]
+        if limit:
+            query.append(f"limit={limit}")
+        if sort:
+            query.append(f"sort={sort}")
+        await self.goto(f"{self.collections_path}/{collection_slug}?{'&'.join(query)}")
+
+    # =============================================================================
+    # LOGIN
+    # =============================================================================
+
+    async def is_logged_in(self) -> bool:
+        """
+        Check if user is logged in.
+
+        Returns:
+            True if logged in, False otherwise
+        """
+        if "/admin/login" in self.get_url().lower():
+            return False
+
+        try:
+            if await self.page.evaluate("localStorage.getItem('payload-token')"):
+                return True
+        except Exception:
+            pass
+
+        has_collections_nav = await self.page.locator('a[href*="/admin/collections/"]').count() > 0
+        has_login_form = (
+            await self.page.locator('input[type="email"]').count() > 0
+            and await self.page.locator('input[type="password"]').count() > 0
+        )
+
+        return has_collections_nav and not has_login_form
+
+    async def wait_for_dashboard(self, timeout: int = 10000) -> None:
+        """
+        Wait for dashboard to load after login.
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        await self.page.wait_for_function(
+            """() => {
+                return document.querySelector('[data-testid="dashboard"]') !== null ||
+                       document.querySelector('.collection-list') !== null ||
+                       document.querySelector('[class*="dashboard"]') !== null ||
+                       window.location.pathname.includes('/collections');
+            }""",
+            timeout=timeout
+        )
+
+    # =============================================================================
+    # LIST VIEW
+    # =============================================================================
+
+    async def wait_for_list(self, timeout: int = 30000) -> None:
+        """
+        Wait until the list view shows rows (or its empty state).
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        await self.page.locator('table tbody tr').or_(
+            self.page.locator('.collection-list__no-results')
+        ).first.wait_for(state='visible', timeout=timeout)
+        await self.page.wait_for_load_state('networkidle', timeout=timeout)
+
+    async def get_table_row_count(self) -> int:
+        """
+        Get number of rows in the collection list table.
+
+        Returns:
+            Number of rows
+        """
+        table_selectors = [
+            'table tbody tr',
+            '[class*="List"][class*="table"] tr',
+            '[role="table"] tbody tr',
+            '[data-testid="collection-list"] tr',
+        ]
+
+        for selector in table_selectors:
+            count = await self.page.locator(selector).count()
+            if count > 0:
+                return count
+
+        return 0
+
+    async def get_cell_text(self, row_index: int, col_index: int) -> str:
+        """
+        Get text from a specific table cell.
+
+        Args:
+            row_index: Row index (0-based)
+            col_index: Column index (0-based)
+
+        Returns:
+            Cell text content
+        """
+        cell = self.page.locator(f'table tbody tr:nth-child({row_index + 1}) td:nth-child({col_index + 1})')
+        return await cell.text_content() or ''
+
+    async def get_column_texts(self, col_index: int) -> List[str]:
+        """
+        Get the text of one column for every visible row.
+
+        Args:
+            col_index: Column index (0-based)
+
+        Returns:
+            Cell texts, top to bottom
+        """
+        cells = self.page.locator(f'table tbody tr td:nth-child({col_index + 1})')
+        return [text.strip() for text in await cells.all_text_contents()]
+
+    async def click_row(self, row_index: int) -> None:
+        """
+        Click a row in the table to navigate to edit.
+
+        Args:
+            row_index: Row index (0-based)
+        """
+        row = self.page.locator(f'table tbody tr:nth-child({row_index + 1})')
+        row_link = row.locator('a[href*="/admin/collections/"]').first
+
+        if await row_link.count() > 0:
+            await row_link.click()
+        else:
+            await row.click()
+
+        await self.page.wait_for_load_state('networkidle')
+
+    async def search_list(self, query: str, timeout: int = 30000) -> None:
+        """
+        Type into the list search box and wait for the filtered rows.
+
+        Args:
+            query: Search text
+            timeout: Timeout in milliseconds
+        """
+        search_input = self.page.locator('#search-filter-input').or_(
+            self.page.locator('input[placeholder*="Search"]')
+        ).or_(
+            self.page.locator('input[placeholder*="Pesquisar"]')
+        ).first
+
+        await search_input.fill(query)
+        await self.page.wait_for_url('**search=*', timeout=timeout)
+        await self.wait_for_list(timeout)
+
+    async def sort_by_column(self, field_name: str, descending: bool = False, timeout: int = 30000) -> None:
+        """
+        Sort the list by a column through its header buttons.
+
+        Args:
+            field_name: Field name of the column (e.g., 'createdAt')
+            descending: Sort descending instead of ascending
+            timeout: Timeout in milliseconds
+        """
+        direction = 'desc' if descending else 'asc'
+        await self.page.locator(
+            f'#heading-{field_name} .sort-column__{direction}'
+        ).first.click()
+        await self.page.wait_for_url(f'**sort={"-" if descending else ""}{field_name}*', timeout=timeout)
+        await self.wait_for_list(timeout)
+
+    async def go_to_next_page(self, timeout: int = 30000) -> None:
+        """
+        Click the paginator's next-page control.
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        current_url = self.get_url()
+        await self.page.locator('.paginator .clickable-arrow--right').or_(
+            self.page.locator('button[aria-label="Next page"]')
+        ).first.click()
+        await self.page.wait_for_url(lambda url: url != current_url, timeout=timeout)
+        await self.wait_for_list(timeout)
+
+    # =============================================================================
+    # CREATE/EDIT FORM
+    # =============================================================================
+
+    async def fill_field(self, label: str, value: str) -> None:
+        """
+        Fill a field by its label.
+
+        Args:
+            label: Field label
+            value: Value to fill
+        """
+        input_locator = (
+            self.page.get_by_label(label, exact=False)
+            .or_(self.page.locator(f'[data-label="{label}"] input'))
+            .or_(self.page.locator(f'label:has-text("{label}") + input'))
+            .or_(self.page.locator(f'[placeholder="{label}"]'))
+            .first
+        )
+
+        await input_locator.fill(value)
+
+    async def click_save(self) -> None:
+        """Click the save button."""
+        save_selectors = [
+            'button[type="submit"]',
+            'button:has-text("Save")',
+            'button:has-text("Salvar")',
+            '[data-testid="save-button"]',
+            '[class*="save"][class*="button"]',
+        ]
+
+        for selector in save_selectors:
+            button = self.page.locator(selector).first
+            if await button.is_visible():
+                await button.click()
+                return
+
+        raise AssertionError("Could not find save button")
+
+    async def wait_for_save_success(self, timeout: int = 5000) -> None:
+        """
+        Wait for save success notification.
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        success_selectors = [
+            '[data-testid="save-success"]',
+            '[class*="success"][class*="toast"]',
+            '[role="alert"]:has-text("saved")',
+            '[role="alert"]:has-text("salvo")',
+        ]
+
+        for selector in success_selectors:
+            try:
+                await self.page.locator(selector).wait_for(state='visible', timeout=timeout)
+                return
+            except Exception:
+                continue
+
+    # =============================================================================
+    # VERIFICATION
+    # =============================================================================
+
+    def is_on_collection_list(self, collection_slug: str) -> bool:
+        """
+        Check if on collection list page.
+
+        Args:
+            collection_slug: Collection slug
+
+        Returns:
+            True if on collection list page
+        """
+        return f'/collections/{collection_slug}' in self.get_url()
+
+    def is_on_edit_page(self, collection_slug: str, doc_id: Optional[str] = None) -> bool:
+        """
+        Check if on edit page.
+
+        Args:
+            collection_slug: Collection slug
+            doc_id: Optional document ID
+
+        Returns:
+            True if on edit page
+        """
+        url = self.get_url()
+        has_collection = f'/collections/{collection_slug}/' in url
+        has_id = doc_id is None or doc_id in url
+        return has_collection and has_id and '/create' not in url
@@ -0,0 +1,178 @@
+"""
+Async Base Page Object for E2E Tests
+
+Async counterpart of `tests.e2e.pages.base_page.BasePage`, for tests that
+drive several browser actors concurrently with `asyncio.gather`.
+"""
+
+from typing import Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Locator, Page
+
+from tests.e2e.helpers.vitals import (
+    COLLECTOR,
+    READ_VITALS_SCRIPT,
+    VITALS_MODE_ENFORCE,
+    VITALS_MODE_OFF,
+    WebVitals,
+    assert_within_budget,
+    get_vitals_mode,
+    load_budgets,
+    match_route,
+)
+
+
+class AsyncBasePage:
+    """Async base page object with common methods."""
+
+    def __init__(self, page: Page, base_url: str = "http://localhost:3000"):
+        """
+        Initialize base page.
+
+        Args:
+            page: Playwright async Page instance
+            base_url: Base URL of the application
+        """
+        self.page = page
+        self.base_url = base_url
+        self.vitals_mode = get_vitals_mode()
+        self.last_vitals: Optional[WebVitals] = None
+
+    async def goto(self, path: str = "", collect_vitals: Optional[bool] = None) -> None:
+        """
+        Navigate to a path.
+
+        Same semantics as `BasePage.goto`; vitals come from the
+        PerformanceObserver script only (no CDP heap reading), which the
+        caller installs once on the context (`VITALS_INIT_SCRIPT`).
+
+        Args:
+            path: Path to navigate to (e.g., '/imoveis')
+            collect_vitals: Override the E2E_WEB_VITALS mode for this visit
+        """
+        if collect_vitals is None:
+            collect_vitals = self.vitals_mode != VITALS_MODE_OFF
+
+        url = f"{self.base_url}{path}" if path else self.base_url
+        # networkidle can be flaky with dev overlays/websockets.
+        await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=5000)
+        except Exception:
+            await self.page.wait_for_load_state("load", timeout=10000)
+
+        if collect_vitals:
+            await self._record_vitals()
+
+    async def _record_vitals(self) -> None:
+        """Collect vitals for the current page and check its route budget."""
+        budgets = load_budgets()
+        route = match_route(urlparse(self.page.url).path, budgets)
+
+        data = await self.page.evaluate(READ_VITALS_SCRIPT)
+        self.last_vitals = WebVitals(url=self.page.url, route=route, **data)
+        COLLECTOR.record(self.last_vitals)
+
+        if self.vitals_mode == VITALS_MODE_ENFORCE and route:
+            assert_within_budget(self.last_vitals, budgets[route])
+
+    async def wait_for_content_visible(self, selector: str, timeout: int = 5000) -> Locator:
+        """
+        Wait for an element to be visible.
+
+        Args:
+            selector: CSS selector
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Locator for the element
+        """
+        locator = self.page.locator(selector)
+        await locator.wait_for(state="visible", timeout=timeout)
+        return locator
+
+    async def get_text_content(self, selector: str) -> str:
+        """
+        Get text content of an element.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Text content
+        """
+        return await self.page.locator(selector).text_content()
+
+    async def is_visible(self, selector: str) -> bool:
+        """
+        Check if element is visible.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            True if visible, False otherwise
+        """
+        return await self.page.locator(selector).is_visible()
+
+    async def click_button(self, name: str, exact: bool = True) -> None:
+        """
+        Click a button by role.
+
+        Args:
+            name: Button text/name
+            exact: Whether to match exact text
+        """
+        await self.page.get_by_role("button", name=name, exact=exact).click()
+
+    async def fill_input(self, label: str, value: str) -> None:
+        """
+        Fill an input by label.
+
+        Args:
+            label: Input label
+            value: Value to fill
+        """
+        await self.page.get_by_label(label).fill(value)
+
+    async def select_option(self, label: str, value: str) -> None:
+        """
+        Select an option from a select by label.
+
+        Args:
+            label: Select label
+            value: Option value to select
+        """
+        await self.page.get_by_label(label).select_option(value)
+
+    async def wait_for_timeout(self, milliseconds: int) -> None:
+        """
+        Wait for a specified time.
+
+        Args:
+            milliseconds: Time to wait in milliseconds
+        """
+        await self.page.wait_for_timeout(milliseconds)
+
+    async def take_screenshot(self, path: str, full_page: bool = False) -> None:
+        """
+        Take a screenshot.
+
+        Args:
+            path: Path to save screenshot
+            full_page: Whether to capture full page
+        """
+        await self.page.screenshot(path=path, full_page=full_page)
+
+    def get_url(self) -> str:
+        """Get current page URL."""
+        return self.page.url
+
+    async def reload(self) -> None:
+        """Reload the current page."""
+        await self.page.reload(wait_until="domcontentloaded")
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=5000)
+        except Exception:
+            await self.page.wait_for_load_state("load", timeout=10000)
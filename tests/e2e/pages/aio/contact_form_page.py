@@ -0,0 +1,220 @@
+"""
+Async Contact Form Page Object
+
+Async counterpart of `tests.e2e.pages.contact_form_page.ContactFormPage`.
+Selectors are shared with the sync page object.
+"""
+
+from playwright.async_api import Locator, Page
+
+from tests.e2e.pages.contact_form_page import ContactFormPage
+from .base_page import AsyncBasePage
+
+
+class AsyncContactFormPage(AsyncBasePage):
+    """Async page object for contact form functionality."""
+
+    # Selectors
+    CONTACT_FORM = ContactFormPage.CONTACT_FORM
+    INPUT_NAME = ContactFormPage.INPUT_NAME
+    INPUT_EMAIL = ContactFormPage.INPUT_EMAIL
+    INPUT_PHONE = ContactFormPage.INPUT_PHONE
+    TEXTAREA_MESSAGE = ContactFormPage.TEXTAREA_MESSAGE
+    BUTTON_SUBMIT = ContactFormPage.BUTTON_SUBMIT
+    ERROR_MESSAGE = ContactFormPage.ERROR_MESSAGE
+    SUCCESS_MESSAGE = ContactFormPage.SUCCESS_MESSAGE
+
+    def __init__(self, page: Page, base_url: str = "http://localhost:3000"):
+        """
+        Initialize contact form page.
+
+        Args:
+            page: Playwright async Page instance
+            base_url: Base URL of the application
+        """
+        super().__init__(page, base_url)
+
+    async def goto_property_with_form(self, slug: str) -> None:
+        """
+        Navigate to a property page that has a contact form.
+
+        Args:
+            slug: Property slug
+        """
+        await self.goto(f"/imoveis/{slug}")
+        await self.get_name_input().wait_for(state="visible", timeout=10000)
+
+    async def is_form_visible(self) -> bool:
+        """
+        Check if contact form is visible.
+
+        Returns:
+            True if form is visible
+        """
+        return await self.page.locator(self.CONTACT_FORM).count() > 0
+
+    def get_name_input(self) -> Locator:
+        """Get name input field."""
+        return self.page.locator(self.INPUT_NAME).first
+
+    def get_email_input(self) -> Locator:
+        """Get email input field."""
+        return self.page.locator(self.INPUT_EMAIL).first
+
+    def get_phone_input(self) -> Locator:
+        """Get phone input field (optional)."""
+        return self.page.locator(self.INPUT_PHONE).first
+
+    def get_message_input(self) -> Locator:
+        """Get message textarea field."""
+        return self.page.locator(self.TEXTAREA_MESSAGE).first
+
+    def get_submit_button(self) -> Locator:
+        """Get submit button."""
+        return self.page.locator(self.BUTTON_SUBMIT).first
+
+    async def _fill_if_visible(self, field: Locator, value: str) -> None:
+        """Fill a field when it is rendered."""
+        if await field.is_visible():
+            await field.fill(value)
+
+    async def fill_name(self, name: str) -> None:
+        """
+        Fill name field.
+
+        Args:
+            name: Name value
+        """
+        await self._fill_if_visible(self.get_name_input(), name)
+
+    async def fill_email(self, email: str) -> None:
+        """
+        Fill email field.
+
+        Args:
+            email: Email value
+        """
+        await self._fill_if_visible(self.get_email_input(), email)
+
+    async def fill_phone(self, phone: str) -> None:
+        """
+        Fill phone field.
+
+        Args:
+            phone: Phone value
+        """
+        await self._fill_if_visible(self.get_phone_input(), phone)
+
+    async def fill_message(self, message: str) -> None:
+        """
+        Fill message field.
+
+        Args:
+            message: Message value
+        """
+        await self._fill_if_visible(self.get_message_input(), message)
+
+    async def fill_form(
+        self,
+        name: str,
+        email: str,
+        phone: str = "",
+        message: str = ""
+    ) -> None:
+        """
+        Fill all form fields.
+
+        Args:
+            name: Name value (required)
+            email: Email value (required)
+            phone: Phone value (optional)
+            message: Message value (optional)
+        """
+        await self.fill_name(name)
+        await self.fill_email(email)
+        if phone:
+            await self.fill_phone(phone)
+        if message:
+            await self.fill_message(message)
+
+    async def submit_form(self) -> None:
+        """Submit the contact form."""
+        submit_btn = self.get_submit_button()
+        if await submit_btn.is_visible():
+            await submit_btn.click()
+
+    async def wait_for_success(self, timeout: int = 10000) -> None:
+        """
+        Wait for the success state after submitting.
+
+        Args:
+            timeout: Timeout in milliseconds
+        """
+        await self.page.locator(
+            "text=/enviado|enviada|sucesso|success/i"
+        ).or_(
+            self.page.locator(self.SUCCESS_MESSAGE)
+        ).first.wait_for(state="visible", timeout=timeout)
+
+    async def has_error_message(self) -> bool:
+        """
+        Check if error message is displayed.
+
+        Returns:
+            True if error message is visible
+        """
+        error_locator = self.page.locator(self.ERROR_MESSAGE)
+        # Also check for HTML5 validation messages
+        if await error_locator.count() > 0 and await error_locator.first.is_visible():
+            return True
+        return await self._has_validation_errors()
+
+    async def _has_validation_errors(self) -> bool:
+        """
+        Check if HTML5 validation errors are present.
+
+        Returns:
+            True if validation errors are present
+        """
+        email_input = self.get_email_input()
+        if await email_input.is_visible():
+            if not await email_input.evaluate("el => el.checkValidity()"):
+                return True
+
+        name_input = self.get_name_input()
+        if await name_input.is_visible():
+            is_required = await name_input.evaluate("el => el.required")
+            if is_required and not await name_input.input_value():
+                return True
+
+        return False
+
+    async def has_success_message(self) -> bool:
+        """
+        Check if success message is displayed.
+
+        Returns:
+            True if success message is visible
+        """
+        success_locator = self.page.locator(
+            "text=/enviado|enviada|sucesso|success/i"
+        ).or_(
+            self.page.locator(self.SUCCESS_MESSAGE)
+        )
+
+        return (
+            await success_locator.count() > 0 and
+            await success_locator.first.is_visible()
+        )
+
+    async def is_submit_button_disabled(self) -> bool:
+        """
+        Check if submit button is disabled.
+
+        Returns:
+            True if button is disabled
+        """
+        submit_btn = self.get_submit_button()
+        if await submit_btn.is_visible():
+            return await submit_btn.is_disabled()
+        return False
@@ -0,0 +1,238 @@
+"""
+Async Properties Page Object
+
+Async counterpart of `tests.e2e.pages.properties_page.PropertiesPage`
+(listing page with Radix UI Select filters).
+"""
+
+import re
+from typing import List, Optional
+
+from playwright.async_api import Locator, Page
+
+from .base_page import AsyncBasePage
+
+
+class AsyncPropertiesPage(AsyncBasePage):
+    """Async page object for the properties listing page."""
+
+    TRANSACTION_TYPE_LABELS = {
+        "venda": "Comprar",
+        "aluguel": "Alugar",
+        "": "Comprar/Alugar",
+    }
+
+    def __init__(self, page: Page, base_url: str = "http://localhost:3000"):
+        """
+        Initialize properties page.
+
+        Args:
+            page: Playwright async Page instance
+            base_url: Base URL of the application
+        """
+        super().__init__(page, base_url)
+
+    async def goto_properties(self) -> None:
+        """Navigate to properties listing page."""
+        await self.goto("/imoveis")
+        # Wait for client-side rendering
+        await self.wait_for_timeout(1000)
+
+    async def _visible_property_links(self) -> List[Locator]:
+        """Visible links to property detail pages."""
+        links = []
+        for link in await self.page.locator("a[href*='/imoveis/']").all():
+            if not await link.is_visible():
+                continue
+            href = await link.get_attribute("href") or ""
+            if "/imoveis/" in href and href.split("/imoveis/")[-1]:
+                links.append(link)
+        return links
+
+    async def get_property_count(self) -> int:
+        """
+        Get the number of property cards visible.
+
+        Returns:
+            Number of property cards
+        """
+        return len(await self._visible_property_links())
+
+    async def _close_any_open_dropdowns(self) -> None:
+        """Close any open Radix UI dropdowns."""
+        await self.page.keyboard.press("Escape")
+        await self.wait_for_timeout(150)
+
+        try:
+            await self.page.locator("body").click(force=True, timeout=1000)
+        except Exception:
+            pass
+
+        await self.wait_for_timeout(100)
+
+    async def _find_select_trigger_by_placeholder(self, placeholder: str) -> Optional[Locator]:
+        """
+        Find a Select trigger by its placeholder text.
+
+        Args:
+            placeholder: Placeholder text to search for
+
+        Returns:
+            Locator for the trigger or None
+        """
+        for trigger in await self.page.locator("[role='combobox']").all():
+            if await trigger.is_visible():
+                text = await trigger.text_content() or ""
+                if placeholder.lower() in text.lower():
+                    return trigger
+        return None
+
+    async def _select_radix_option_by_placeholder(self, placeholder: str, option_value: str) -> None:
+        """
+        Select an option from a Radix UI Select component by placeholder.
+
+        Args:
+            placeholder: Placeholder text of the select (e.g., "Comprar/Alugar", "Tipo de imóvel")
+            option_value: The value/label to select (e.g., "apartamento", "Comprar")
+
+        Raises:
+            ValueError: If the select or the option is not found
+        """
+        await self._close_any_open_dropdowns()
+
+        trigger = await self._find_select_trigger_by_placeholder(placeholder)
+        if not trigger:
+            raise ValueError(f"Select with placeholder '{placeholder}' not found")
+
+        await trigger.click()
+        await self.wait_for_timeout(200)
+
+        option = self.page.locator(f"[data-value='{option_value}']").or_(
+            self.page.get_by_role("option", name=option_value)
+        ).first
+
+        if await option.count() > 0 and await option.is_visible():
+            await option.click()
+        else:
+            await trigger.click()
+            raise ValueError(f"Option '{option_value}' not found in select with placeholder '{placeholder}'")
+
+        await self.wait_for_timeout(500)
+
+    async def filter_by_transaction_type(self, value: str) -> None:
+        """
+        Filter by transaction type.
+
+        Args:
+            value: Transaction type value ("venda", "aluguel", or "" for all)
+        """
+        display_value = self.TRANSACTION_TYPE_LABELS.get(value, value)
+        await self._select_radix_option_by_placeholder("Comprar/Alugar", display_value)
+        await self.wait_for_timeout(500)  # Wait for debounce
+
+    async def filter_by_property_type(self, value: str) -> None:
+        """
+        Filter by property type.
+
+        Args:
+            value: Property type value ("apartamento", "casa", "cobertura", etc.)
+        """
+        await self._select_radix_option_by_placeholder("Tipo de imóvel", value)
+        await self.wait_for_timeout(500)
+
+    async def filter_by_neighborhood(self, value: str) -> None:
+        """
+        Filter by neighborhood.
+
+        Args:
+            value: Neighborhood value (e.g., "Asa Sul", "Sudoeste")
+        """
+        await self._select_radix_option_by_placeholder("Bairro", value)
+        await self.wait_for_timeout(500)
+
+    async def search_by_neighborhood(self, neighborhood: str) -> None:
+        """
+        Search by neighborhood text.
+
+        Args:
+            neighborhood: Neighborhood name to search for
+        """
+        search_input = self.page.locator("input[placeholder*='Buscar']").or_(
+            self.page.locator("input[type='search']")
+        ).or_(
+            self.page.locator("input[placeholder*='endereço']")
+        ).first
+
+        if await search_input.count() > 0 and await search_input.is_visible():
+            await search_input.fill(neighborhood)
+            await self.wait_for_timeout(500)  # Wait for debounce
+
+    async def search_by_text(self, search_term: str) -> None:
+        """
+        Search by text (alias for search_by_neighborhood).
+
+        Args:
+            search_term: Text to search for
+        """
+        await self.search_by_neighborhood(search_term)
+
+    async def clear_filters(self) -> None:
+        """Clear all filters."""
+        clear_button = self.page.locator("button:has-text('Limpar filtros')").or_(
+            self.page.locator(".text-muted-foreground.hover\\3Atext-destructive")  # X button
+        ).first
+
+        if await clear_button.count() > 0 and await clear_button.is_visible():
+            await clear_button.click()
+            await self.wait_for_timeout(500)
+
+    async def get_filtered_properties(self) -> List[str]:
+        """
+        Get list of property slugs from filtered results.
+
+        Returns:
+            List of property slugs
+        """
+        slugs = []
+        for link in await self._visible_property_links():
+            href = await link.get_attribute("href") or ""
+            slug = href.split("/imoveis/")[-1].split("?")[0].split("#")[0]
+            if slug and slug not in slugs:
+                slugs.append(slug)
+        return slugs
+
+    async def is_no_results_message_visible(self) -> bool:
+        """
+        Check if no results message is visible.
+
+        Returns:
+            True if no results message is shown
+        """
+        no_results = self.page.locator("text=/Nenhum imóvel encontrado|No results found/i").first
+        return await no_results.is_visible()
+
+    async def get_property_prices(self) -> List[float]:
+        """
+        Get list of property prices from visible property cards only.
+
+        Returns:
+            List of property prices as floats
+        """
+        prices = []
+        for link in await self._visible_property_links():
+            parent = link.locator("xpath=../..").or_(link.locator("xpath=../../.."))
+            if await parent.count() == 0:
+                continue
+
+            price_elem = parent.first.locator("p.text-secondary").first
+            if not await price_elem.is_visible():
+                continue
+
+            text = await price_elem.text_content() or ""
+            match = re.search(r"R\$\s*([\d\.]+)", text)
+            if match:
+                try:
+                    prices.append(float(match.group(1).replace(".", "").replace(",", ".")))
+                except ValueError:
+                    pass
+        return prices
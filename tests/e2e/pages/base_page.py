@@ -5,8 +5,22 @@ Provides common functionality for all page objects.
 """
 
 from typing import Optional
+from urllib.parse import urlparse
+
 from playwright.sync_api import Page, Locator
 
+from tests.e2e.helpers.vitals import (
+    COLLECTOR,
+    VITALS_MODE_ENFORCE,
+    VITALS_MODE_OFF,
+    WebVitals,
+    assert_within_budget,
+    collect_web_vitals,
+    get_vitals_mode,
+    load_budgets,
+    match_route,
+)
+
 
 class BasePage:
     """Base page object with common methods."""
@@ -21,14 +35,27 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url
+        self.vitals_mode = get_vitals_mode()
+        self.last_vitals: Optional[WebVitals] = None
 
-    def goto(self, path: str = "") -> None:
+    def goto(self, path: str = "", collect_vitals: Optional[bool] = None) -> None:
         """
         Navigate to a path.
 
+        When vitals are collected (E2E_WEB_VITALS=collect|enforce, or
+        `collect_vitals=True`), they are stored in `last_vitals`, attached to
+        the test report and, in `enforce` mode, asserted against the budget
+        of the matching route. LCP, CLS, long tasks and interactions come from
+        the observers installed once on the page's context
+        (`install_vitals_observers`).
+
         Args:
             path: Path to navigate to (e.g., '/imoveis')
+            collect_vitals: Override the E2E_WEB_VITALS mode for this visit
         """
+        if collect_vitals is None:
+            collect_vitals = self.vitals_mode != VITALS_MODE_OFF
+
         url = f"{self.base_url}{path}" if path else self.base_url
         # networkidle can be flaky with dev overlays/websockets.
         self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -37,6 +64,20 @@ class BasePage:
         except Exception:
             self.page.wait_for_load_state("load", timeout=10000)
 
+        if collect_vitals:
+            self._record_vitals()
+
+    def _record_vitals(self) -> None:
+        """Collect vitals for the current page and check its route budget."""
+        budgets = load_budgets()
+        route = match_route(urlparse(self.page.url).path, budgets)
+
+        self.last_vitals = collect_web_vitals(self.page, route)
+        COLLECTOR.record(self.last_vitals)
+
+        if self.vitals_mode == VITALS_MODE_ENFORCE and route:
+            assert_within_budget(self.last_vitals, budgets[route])
+
     def wait_for_content_visible(self, selector: str, timeout: int = 5000) -> Locator:
         """
         Wait for an element to be visible.
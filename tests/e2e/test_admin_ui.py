@@ -11,10 +11,11 @@ Tests cover:
 
 import pytest
 import requests
-from playwright.sync_api import Page, expect
+from playwright.sync_api import BrowserContext, Page, expect
 
 from tests.e2e.pages.admin_page import AdminPage
 from tests.e2e.helpers.auth import login_as_admin, logout
+from tests.e2e.helpers.context_pool import ContextPool
 
 
 # =============================================================================
@@ -29,23 +30,24 @@ pytestmark = pytest.mark.e2e
 # =============================================================================
 
 @pytest.fixture(scope="function")
-def admin_page(page: Page, base_url: str) -> AdminPage:
+def admin_page(admin_context: BrowserContext, base_url: str) -> AdminPage:
     """
     Create an AdminPage instance for testing.
 
-    This fixture ensures an authenticated admin session.
-    In dev bypass mode, Payload may auto-login without token.
+    The page is the existing page of a pooled context logged in with the
+    admin storage state, so no login flow runs per test and failure
+    screenshots capture it.
 
     Args:
-        page: Playwright Page fixture
+        admin_context: Authenticated admin BrowserContext fixture
         base_url: Base URL fixture
 
     Yields:
         AdminPage instance
     """
+    page = ContextPool.get_page(admin_context)
     admin = AdminPage(page, base_url)
     admin.goto_admin()
-    login_as_admin(page, base_url)
     admin.wait_for_dashboard()
     yield admin
 
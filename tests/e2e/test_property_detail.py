@@ -395,6 +395,28 @@ def test_property_gallery_images_load(
     assert loaded_count > 0, "No images loaded successfully"
 
 
+@pytest.mark.e2e
+@pytest.mark.regression
+@pytest.mark.network_profile("block")
+def test_property_page_renders_with_remote_images_blocked(
+    property_detail_page: PropertyDetailPage
+) -> None:
+    """
+    Test: Property page still renders when remote images are unavailable.
+
+    Steps:
+        1. Block images.unsplash.com via the network profile
+        2. Navigate to property detail page
+        3. Verify title and gallery markup are present
+
+    Expected: Page content does not depend on remote image fetches
+    """
+    property_detail_page.goto_property("apartamento-asa-sul-sqn-308")
+
+    assert property_detail_page.get_property_title(), "Title should render without images"
+    assert property_detail_page.get_gallery_images_count() > 0, "Gallery markup should render"
+
+
 # =============================================================================
 # TESTS: WHATSAPP BUTTON
 # =============================================================================
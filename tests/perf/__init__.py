@@ -0,0 +1,6 @@
+"""
+Performance tests for PrimeUrban.
+
+Throttled-device measurements of public pages, kept apart from the
+functional E2E suite. Run with `pytest tests/perf -m perf`.
+"""
@@ -0,0 +1,248 @@
+"""
+Synthetic admin dataset for the performance suite.
+
+Tops `properties`, `leads` and `deals` up to realistic volumes through the
+REST API (so hooks run as in production) using the factories of the API
+suite. Seeded documents carry `PERF_PREFIX` in their title/name, which makes
+seeding idempotent: a second run only creates what is missing.
+
+Run it against a dedicated database (DATABASE_URL) — 100k leads is not
+something to leave in a development database.
+"""
+
+import base64
+import json
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import cycle
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from tests.api.fixtures import LeadFactory, PropertyFactory
+from tests.api.utils import AuthenticatedAPIClient
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PERF_PREFIX = "[perf]"
+
+PROPERTY_STATUSES = ["draft", "published", "published", "published", "sold", "rented", "paused"]
+DEAL_STAGES = ["proposal", "contract", "signed", "cancelled"]
+
+# One pixel PNG, same fallback upload as the API suite.
+PLACEHOLDER_MEDIA_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO5n7NwAAAAASUVORK5CYII="
+)
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """Target number of seeded documents per collection."""
+    properties: int = 10000
+    leads: int = 100000
+    deals: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "DatasetSize":
+        """Sizes from PERF_ADMIN_PROPERTIES / PERF_ADMIN_LEADS / PERF_ADMIN_DEALS."""
+        defaults = cls()
+        return cls(
+            properties=int(os.getenv("PERF_ADMIN_PROPERTIES", str(defaults.properties))),
+            leads=int(os.getenv("PERF_ADMIN_LEADS", str(defaults.leads))),
+            deals=int(os.getenv("PERF_ADMIN_DEALS", str(defaults.deals))),
+        )
+
+    def to_dict(self) -> Dict[str, int]:
+        """Serialize to a plain dict."""
+        return asdict(self)
+
+
+# =============================================================================
+# SEEDER
+# =============================================================================
+
+class AdminDatasetSeeder:
+    """Creates the synthetic dataset through the REST API with a thread pool."""
+
+    def __init__(self, base_url: str, token: str, workers: int = 8, timeout: int = 60):
+        """
+        Initialize the seeder.
+
+        Args:
+            base_url: Base URL of the application
+            token: Admin JWT
+            workers: Concurrent requests while seeding
+            timeout: Request timeout in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.client = AuthenticatedAPIClient(self.base_url, token, timeout=timeout)
+        # requests.Session is not thread-safe: one client per worker thread.
+        self._local = threading.local()
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    def ensure(self, size: DatasetSize) -> Dict[str, int]:
+        """
+        Seed every collection up to `size`.
+
+        Properties go first (deals reference them) and are created before
+        leads, so creation never fans out to interested leads.
+
+        Args:
+            size: Target volumes
+
+        Returns:
+            Number of seeded documents per collection after the run
+        """
+        refs = self.get_references()
+
+        self._top_up(
+            "properties",
+            "title",
+            size.properties,
+            lambda index: self._property_data(index, refs),
+        )
+        self._top_up("leads", "name", size.leads, self._lead_data)
+
+        lead_ids = cycle(self._sample_ids("leads", "name"))
+        property_ids = cycle(self._sample_ids("properties", "title"))
+        lock = threading.Lock()
+
+        def _deal_data(index: int) -> Dict[str, Any]:
+            with lock:
+                lead_id, property_id = next(lead_ids), next(property_ids)
+            return self._deal_data(index, lead_id, property_id, refs["agent"])
+
+        self._top_up("deals", "title", size.deals, _deal_data)
+
+        return {
+            "properties": self.count("properties", "title"),
+            "leads": self.count("leads", "name"),
+            "deals": self.count("deals", "title"),
+        }
+
+    def count(self, collection: str, field: str) -> int:
+        """Number of seeded documents in a collection."""
+        result = self.client.find(collection, where={field: {"like": PERF_PREFIX}}, limit=1)
+        return int(result.get("totalDocs", 0))
+
+    def get_references(self) -> Dict[str, Any]:
+        """Neighborhood, media and agent IDs shared by seeded properties and deals."""
+        me = self.client.get("/api/users/me").data
+        user = me.get("user", me)
+
+        neighborhoods = self.client.find("neighborhoods", limit=1).get("docs", [])
+        if neighborhoods:
+            neighborhood_id = neighborhoods[0]["id"]
+        else:
+            neighborhood_id = self.client.create(
+                "neighborhoods",
+                {"name": f"{PERF_PREFIX} Bairro", "zone": "Norte"},
+            )["id"]
+
+        media = self.client.find("media", limit=1).get("docs", [])
+        media_id = media[0]["id"] if media else self._upload_placeholder_media()
+
+        return {"neighborhood": neighborhood_id, "media": media_id, "agent": user["id"]}
+
+    def close(self) -> None:
+        """Close the main client."""
+        self.client.close()
+
+    # -------------------------------------------------------------------------
+    # INTERNALS
+    # -------------------------------------------------------------------------
+
+    def _thread_client(self) -> AuthenticatedAPIClient:
+        """Client bound to the current thread."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = AuthenticatedAPIClient(self.base_url, self.token, timeout=self.timeout)
+            self._local.client = client
+        return client
+
+    def _top_up(
+        self,
+        collection: str,
+        field: str,
+        target: int,
+        build: Callable[[int], Dict[str, Any]]
+    ) -> None:
+        """Create the documents missing to reach `target`."""
+        existing = self.count(collection, field)
+        if existing >= target:
+            return
+
+        def _create(index: int) -> None:
+            self._thread_client().create(collection, build(index))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # list() re-raises the first failure instead of swallowing it.
+            list(pool.map(_create, range(existing, target)))
+
+    def _sample_ids(self, collection: str, field: str, limit: int = 1000) -> List[Any]:
+        """IDs of up to `limit` seeded documents."""
+        result = self.client.find(collection, where={field: {"like": PERF_PREFIX}}, limit=limit)
+        ids = [doc["id"] for doc in result.get("docs", [])]
+        if not ids:
+            raise RuntimeError(f"Nenhum documento de performance em {collection} para relacionar")
+        return ids
+
+    def _upload_placeholder_media(self) -> Any:
+        """Upload a placeholder image and return its ID."""
+        response = requests.post(
+            f"{self.base_url}/api/media",
+            headers={"Authorization": f"Bearer {self.token}"},
+            data={"_payload": json.dumps({"alt": f"{PERF_PREFIX} placeholder"})},
+            files={
+                "file": ("perf-placeholder.png", base64.b64decode(PLACEHOLDER_MEDIA_BASE64), "image/png"),
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        return payload.get("doc", payload)["id"]
+
+    # -------------------------------------------------------------------------
+    # DOCUMENT BUILDERS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _property_data(index: int, refs: Dict[str, Any]) -> Dict[str, Any]:
+        data = PropertyFactory.minimal(refs["neighborhood"], refs["media"], refs["agent"])
+        data["title"] = f"{PERF_PREFIX} {random.choice(['Apartamento', 'Casa', 'Cobertura'])} {index:06d}"
+        data["status"] = random.choice(PROPERTY_STATUSES)
+        return data
+
+    @staticmethod
+    def _lead_data(index: int) -> Dict[str, Any]:
+        data = LeadFactory.complete()
+        data["name"] = f"{PERF_PREFIX} {data['name']} {index:06d}"
+        data.pop("assignedTo", None)
+        data.pop("lastContactAt", None)
+        return data
+
+    @staticmethod
+    def _deal_data(index: int, lead_id: Any, property_id: Any, agent_id: Any) -> Dict[str, Any]:
+        asking = random.randint(300000, 2000000)
+        return {
+            # Rewritten by the title hook as "<lead> - <property>", which keeps the prefix.
+            "title": f"{PERF_PREFIX} Negócio {index:06d}",
+            "lead": lead_id,
+            "property": property_id,
+            "askingPrice": asking,
+            "offerPrice": int(asking * random.uniform(0.85, 1.0)),
+            "stage": random.choice(DEAL_STAGES),
+            "agent": agent_id,
+        }
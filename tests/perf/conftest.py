@@ -0,0 +1,271 @@
+"""
+Pytest conftest for performance tests.
+
+Provides throttled browser pages, authenticated admin pages over a seeded
+dataset, run settings and the trend reports written at the end of the session.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Generator, Iterable, Iterator
+
+import pytest
+from playwright.sync_api import Browser, Page
+
+from tests.e2e.helpers.auth import (
+    DEFAULT_ADMIN_CREDENTIALS,
+    api_login,
+    create_authenticated_context,
+    write_storage_state,
+)
+from tests.e2e.helpers.network import route_remote_images
+from tests.e2e.helpers.vitals import install_vitals_observers
+from tests.perf.admin_dataset import AdminDatasetSeeder, DatasetSize
+from tests.perf.helpers import (
+    DEFAULT_DEVICE_PROFILE,
+    DEVICE_PROFILES,
+    DeviceProfile,
+    append_trend,
+    apply_device_throttling,
+    build_trend_record,
+    format_summary,
+)
+
+
+DEFAULT_TREND_FILE = Path(__file__).parent / "results" / "trend.jsonl"
+DEFAULT_ADMIN_TREND_FILE = Path(__file__).parent / "results" / "admin-trend.jsonl"
+SUMMARY_METRICS = ("ttfb", "fcp", "lcp", "long_tasks_total", "interaction", "transferred_bytes")
+ADMIN_SUMMARY_METRICS = ("duration", "js_heap_used")
+ADMIN_VIEWPORT = {"width": 1920, "height": 1080}
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """
+    Skip performance tests unless explicitly selected.
+
+    They run with `-m perf` (or PERF_TESTS=true), never as part of a plain
+    `pytest tests/` run.
+    """
+    selected = "perf" in (config.getoption("markexpr") or "")
+    if selected or os.getenv("PERF_TESTS", "").lower() == "true":
+        return
+
+    skip_perf = pytest.mark.skip(reason="Testes de performance rodam apenas com -m perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+# =============================================================================
+# SETTINGS FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    """Base URL for the application (same variable as the E2E suite)."""
+    return os.getenv("E2E_BASE_URL", "http://localhost:3000")
+
+
+@pytest.fixture(scope="session")
+def device_profile() -> DeviceProfile:
+    """Device profile selected by PERF_DEVICE_PROFILE."""
+    name = os.getenv("PERF_DEVICE_PROFILE", DEFAULT_DEVICE_PROFILE)
+    if name not in DEVICE_PROFILES:
+        raise pytest.UsageError(
+            f"PERF_DEVICE_PROFILE inválido: {name} (opções: {', '.join(DEVICE_PROFILES)})"
+        )
+    return DEVICE_PROFILES[name]
+
+
+@pytest.fixture(scope="session")
+def perf_iterations() -> int:
+    """Iterations per scenario (PERF_ITERATIONS, default 5)."""
+    return max(1, int(os.getenv("PERF_ITERATIONS", "5")))
+
+
+# =============================================================================
+# BROWSER FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def throttled_page(
+    browser: Browser,
+    browser_name: str,
+    device_profile: DeviceProfile
+) -> Callable[[], ContextManager[Page]]:
+    """
+    Factory of cold, throttled pages.
+
+    Every call opens a fresh context (empty caches, no service worker), with
+    remote images served locally and CPU/network throttled through CDP.
+
+    Returns:
+        Function returning a context manager that yields the page
+    """
+    if browser_name != "chromium":
+        pytest.skip("CPU/network throttling requires Chromium (CDP)")
+
+    @contextmanager
+    def _open() -> Iterator[Page]:
+        context = browser.new_context(**device_profile.context_options())
+        install_vitals_observers(context)
+        route_remote_images(context)
+        page = context.new_page()
+        apply_device_throttling(context, page, device_profile)
+        try:
+            yield page
+        finally:
+            context.close()
+
+    return _open
+
+
+@pytest.fixture(scope="session")
+def admin_dataset(base_url: str) -> Dict[str, int]:
+    """
+    Seed the synthetic admin dataset (PERF_ADMIN_* sizes) once per session.
+
+    Set PERF_ADMIN_SEED=false to measure whatever the database already holds.
+
+    Returns:
+        Number of seeded documents per collection
+    """
+    token = api_login(base_url, DEFAULT_ADMIN_CREDENTIALS)["token"]
+    seeder = AdminDatasetSeeder(
+        base_url,
+        token,
+        workers=int(os.getenv("PERF_ADMIN_SEED_WORKERS", "8")),
+    )
+    try:
+        if os.getenv("PERF_ADMIN_SEED", "true").lower() == "false":
+            return {
+                "properties": seeder.count("properties", "title"),
+                "leads": seeder.count("leads", "name"),
+                "deals": seeder.count("deals", "title"),
+            }
+        return seeder.ensure(DatasetSize.from_env())
+    finally:
+        seeder.close()
+
+
+@pytest.fixture(scope="session")
+def admin_perf_page(
+    browser: Browser,
+    base_url: str,
+    tmp_path_factory: pytest.TempPathFactory
+) -> Callable[[], ContextManager[Page]]:
+    """
+    Factory of admin pages logged in through the API (desktop, unthrottled).
+
+    Every call opens a fresh context so list views start without client
+    cache; the login happens once and its storage state is reused.
+
+    Returns:
+        Function returning a context manager that yields the page
+    """
+    state_path = tmp_path_factory.mktemp("perf-auth") / "admin.json"
+    write_storage_state(str(state_path), base_url, DEFAULT_ADMIN_CREDENTIALS)
+
+    @contextmanager
+    def _open() -> Iterator[Page]:
+        context = create_authenticated_context(
+            browser,
+            base_url,
+            DEFAULT_ADMIN_CREDENTIALS,
+            storage_state_path=str(state_path),
+            viewport=ADMIN_VIEWPORT,
+            locale="pt-BR",
+        )
+        install_vitals_observers(context)
+        route_remote_images(context)
+        page = context.new_page()
+        try:
+            yield page
+        finally:
+            context.close()
+
+    return _open
+
+
+# =============================================================================
+# REPORT FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def perf_results(
+    request: pytest.FixtureRequest,
+    base_url: str,
+    device_profile: DeviceProfile,
+    perf_iterations: int
+) -> Generator[Dict[str, Dict[str, Any]], None, None]:
+    """
+    Scenario summaries of the run.
+
+    Tests store `summarize()` output under their scenario name; the run is
+    appended to the trend file (PERF_TREND_FILE) at the end of the session.
+
+    Yields:
+        Dict of scenario -> summary
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    yield results
+
+    if not results:
+        return
+
+    trend_path = Path(os.getenv("PERF_TREND_FILE", str(DEFAULT_TREND_FILE)))
+    append_trend(
+        trend_path,
+        build_trend_record(device_profile, perf_iterations, results, base_url),
+    )
+    _report(request, f"performance ({device_profile.name}, median / p90)", results, SUMMARY_METRICS, trend_path)
+
+
+@pytest.fixture(scope="session")
+def admin_perf_results(
+    request: pytest.FixtureRequest,
+    base_url: str,
+    perf_iterations: int,
+    admin_dataset: Dict[str, int]
+) -> Generator[Dict[str, Dict[str, Any]], None, None]:
+    """
+    Scenario summaries of the admin suite.
+
+    Appended to PERF_ADMIN_TREND_FILE together with the dataset sizes.
+
+    Yields:
+        Dict of scenario -> summary
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    yield results
+
+    if not results:
+        return
+
+    trend_path = Path(os.getenv("PERF_ADMIN_TREND_FILE", str(DEFAULT_ADMIN_TREND_FILE)))
+    append_trend(
+        trend_path,
+        build_trend_record(None, perf_iterations, results, base_url, dataset=admin_dataset),
+    )
+    _report(request, "admin performance (ms, median / p90)", results, ADMIN_SUMMARY_METRICS, trend_path)
+
+
+def _report(
+    request: pytest.FixtureRequest,
+    title: str,
+    results: Dict[str, Dict[str, Any]],
+    metrics: Iterable[str],
+    trend_path: Path
+) -> None:
+    """Print the summary table of a run to the terminal."""
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter:
+        reporter.write_sep("=", title)
+        for line in format_summary(results, metrics):
+            reporter.write_line(line)
+        reporter.write_line(f"trend: {trend_path}")
@@ -0,0 +1,261 @@
+"""
+Helpers for the throttled-device performance suite.
+
+Device/network profiles applied through CDP, sample statistics and the
+JSON-lines trend file written at the end of each run.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from playwright.sync_api import BrowserContext, Page
+
+
+# =============================================================================
+# DEVICE PROFILES
+# =============================================================================
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    """Emulated device: viewport, CPU slowdown and network conditions."""
+    name: str
+    viewport_width: int
+    viewport_height: int
+    device_scale_factor: float
+    cpu_slowdown: float
+    latency_ms: float
+    download_kbps: float
+    upload_kbps: float
+    connection_type: str
+
+    def context_options(self) -> Dict[str, Any]:
+        """Options for `browser.new_context`."""
+        return {
+            "viewport": {"width": self.viewport_width, "height": self.viewport_height},
+            "device_scale_factor": self.device_scale_factor,
+            "is_mobile": True,
+            "has_touch": True,
+            "locale": "pt-BR",
+        }
+
+
+# Values follow Lighthouse's mobile presets (mid-tier Android on 4G / slow 4G).
+DEVICE_PROFILES = {
+    "mobile-4g": DeviceProfile(
+        name="mobile-4g",
+        viewport_width=412,
+        viewport_height=823,
+        device_scale_factor=1.75,
+        cpu_slowdown=4,
+        latency_ms=70,
+        download_kbps=9000,
+        upload_kbps=9000,
+        connection_type="cellular4g",
+    ),
+    "mobile-slow-4g": DeviceProfile(
+        name="mobile-slow-4g",
+        viewport_width=412,
+        viewport_height=823,
+        device_scale_factor=1.75,
+        cpu_slowdown=4,
+        latency_ms=150,
+        download_kbps=1600,
+        upload_kbps=750,
+        connection_type="cellular4g",
+    ),
+}
+
+DEFAULT_DEVICE_PROFILE = "mobile-slow-4g"
+
+
+def apply_device_throttling(context: BrowserContext, page: Page, profile: DeviceProfile) -> None:
+    """
+    Throttle CPU and network of a page through CDP.
+
+    Args:
+        context: Context owning the page
+        page: Page to throttle (before navigating)
+        profile: Device profile to emulate
+    """
+    session = context.new_cdp_session(page)
+    session.send("Network.enable")
+    session.send(
+        "Network.emulateNetworkConditions",
+        {
+            "offline": False,
+            "latency": profile.latency_ms,
+            "downloadThroughput": profile.download_kbps * 1024 / 8,
+            "uploadThroughput": profile.upload_kbps * 1024 / 8,
+            "connectionType": profile.connection_type,
+        },
+    )
+    session.send("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_slowdown})
+
+
+# =============================================================================
+# STATISTICS
+# =============================================================================
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Samples (non-empty)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Interpolated percentile
+    """
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def measure_ms(action: Callable[[], None]) -> float:
+    """
+    Wall-clock duration of an action.
+
+    Args:
+        action: Callable that returns once the measured state is reached
+
+    Returns:
+        Duration in milliseconds
+    """
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(samples: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    Median and p90 of every numeric metric across iterations.
+
+    Metrics missing in some iterations are summarized over the iterations
+    that measured them.
+
+    Args:
+        samples: One dict of metrics per iteration
+
+    Returns:
+        {metric: {"median": ..., "p90": ..., "n": ...}}
+    """
+    values: Dict[str, List[float]] = {}
+    for sample in samples:
+        for metric, value in sample.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                values.setdefault(metric, []).append(float(value))
+
+    return {
+        metric: {
+            "median": statistics.median(measured),
+            "p90": percentile(measured, 90),
+            "n": len(measured),
+        }
+        for metric, measured in values.items()
+    }
+
+
+# =============================================================================
+# TREND FILE
+# =============================================================================
+
+def get_git_commit(cwd: Optional[Path] = None) -> Optional[str]:
+    """Current git commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=cwd or Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def append_trend(path: Path, record: Dict[str, Any]) -> None:
+    """
+    Append one run to the JSON-lines trend file.
+
+    Args:
+        path: Trend file path (created if missing)
+        record: Run record
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as trend:
+        trend.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def build_trend_record(
+    profile: Optional[DeviceProfile],
+    iterations: int,
+    scenarios: Dict[str, Dict[str, Dict[str, float]]],
+    base_url: str,
+    **extra: Any
+) -> Dict[str, Any]:
+    """
+    Build the trend record of a run.
+
+    Args:
+        profile: Device profile used (None for unthrottled desktop runs)
+        iterations: Iterations per scenario
+        scenarios: {scenario: summary} as returned by `summarize`
+        base_url: Application base URL
+        **extra: Additional run context (e.g. dataset sizes)
+
+    Returns:
+        Trend record
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": get_git_commit(),
+        "release": os.getenv("PERF_RELEASE"),
+        "base_url": base_url,
+        "profile": asdict(profile) if profile else None,
+        "iterations": iterations,
+        "python": platform.python_version(),
+        **extra,
+        "scenarios": scenarios,
+    }
+
+
+def format_summary(scenarios: Dict[str, Dict[str, Dict[str, float]]], metrics: Iterable[str]) -> List[str]:
+    """
+    Render scenario summaries as text table lines (median / p90).
+
+    Args:
+        scenarios: {scenario: summary} as returned by `summarize`
+        metrics: Metrics to show, in order
+
+    Returns:
+        Table lines
+    """
+    metrics = list(metrics)
+    width = max([len("scenario")] + [len(name) for name in scenarios])
+    lines = ["scenario".ljust(width) + "".join(f" | {metric:>21}" for metric in metrics)]
+
+    for name, summary in sorted(scenarios.items()):
+        cells = []
+        for metric in metrics:
+            stats = summary.get(metric)
+            cell = f"{stats['median']:.0f} / {stats['p90']:.0f}" if stats else "-"
+            cells.append(f" | {cell:>21}")
+        lines.append(name.ljust(width) + "".join(cells))
+
+    return lines
@@ -0,0 +1,264 @@
+"""
+Admin list-view performance at realistic data volumes.
+
+Seeds 10k properties, 100k leads and 10k deals (see `admin_dataset.py`),
+then times list render, pagination (next page and a deep page), column
+sort, search-box filtering and edit-view open for each collection, plus the
+custom admin components: `PropertyStatusCell`, `LeadStatusSelect` and the
+`AgentDashboard` view. Median/p90 go to the admin trend file.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+import pytest
+from playwright.sync_api import Page
+
+from tests.e2e.helpers.vitals import collect_web_vitals
+from tests.e2e.pages.admin_page import AdminPage
+from tests.perf.helpers import measure_ms, summarize
+
+
+# =============================================================================
+# MARKERS
+# =============================================================================
+
+pytestmark = [pytest.mark.perf, pytest.mark.slow]
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+# Payload's default page size in list views.
+DEFAULT_PAGE_SIZE = 10
+LEAD_STATUS_OPTION_COUNT = 8
+
+
+@dataclass(frozen=True)
+class ListScenario:
+    """Columns and search term exercised on one collection."""
+    sort_field: str
+    search: str
+
+
+LIST_SCENARIOS = {
+    "properties": ListScenario(sort_field="price", search="000042"),
+    "leads": ListScenario(sort_field="score", search="000042"),
+    "deals": ListScenario(sort_field="finalPrice", search="000042"),
+}
+
+LIST_ACTIONS = ("list", "next-page", "deep-page", "sort", "search", "edit")
+
+
+def _wait_for_edit_view(admin: AdminPage) -> None:
+    """Wait until the edit view form is rendered."""
+    admin.page.locator('.document-fields').or_(
+        admin.page.locator('form.collection-edit__form')
+    ).first.wait_for(state='visible', timeout=30000)
+    admin.page.wait_for_load_state('networkidle')
+
+
+def _build_list_action(
+    slug: str,
+    action: str,
+    scenario: ListScenario,
+    total_docs: int
+) -> Dict[str, Optional[Callable[[AdminPage], None]]]:
+    """Untimed preparation and timed step of a list scenario."""
+    def _open_list(admin: AdminPage) -> None:
+        admin.goto_collection(slug)
+        admin.wait_for_list()
+
+    def _deep_page(admin: AdminPage) -> None:
+        middle = max(1, total_docs // DEFAULT_PAGE_SIZE // 2)
+        admin.goto_collection_page(slug, middle)
+        admin.wait_for_list()
+
+    def _open_edit(admin: AdminPage) -> None:
+        admin.click_row(0)
+        _wait_for_edit_view(admin)
+
+    steps = {
+        "list": (None, _open_list),
+        "next-page": (_open_list, lambda admin: admin.go_to_next_page()),
+        "deep-page": (None, _deep_page),
+        "sort": (_open_list, lambda admin: admin.sort_by_column(scenario.sort_field, descending=True)),
+        "search": (_open_list, lambda admin: admin.search_list(scenario.search)),
+        "edit": (_open_list, _open_edit),
+    }
+    prepare, timed = steps[action]
+    return {"prepare": prepare, "timed": timed}
+
+
+def _measure(
+    open_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    iterations: int,
+    timed: Callable[[AdminPage], None],
+    prepare: Optional[Callable[[AdminPage], None]] = None
+) -> List[Dict[str, Any]]:
+    """Run one admin scenario `iterations` times on fresh authenticated pages."""
+    samples = []
+
+    for _ in range(iterations):
+        with open_page() as page:
+            admin = AdminPage(page, base_url)
+            if prepare:
+                prepare(admin)
+
+            duration = measure_ms(lambda: timed(admin))
+            samples.append({
+                "duration": duration,
+                "js_heap_used": collect_web_vitals(page).js_heap_used,
+            })
+
+    return samples
+
+
+def _store(
+    scenario: str,
+    samples: List[Dict[str, Any]],
+    results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> Dict[str, Any]:
+    """Summarize samples into the run results and the test report."""
+    summary = summarize(samples)
+    results[scenario] = summary
+    record_property("perf_summary", json.dumps(summary))
+    return summary
+
+
+# =============================================================================
+# TESTS - LIST VIEWS
+# =============================================================================
+
+@pytest.mark.parametrize("action", LIST_ACTIONS)
+@pytest.mark.parametrize("slug", list(LIST_SCENARIOS))
+def test_admin_list_view(
+    slug: str,
+    action: str,
+    admin_dataset: Dict[str, int],
+    admin_perf_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    admin_perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: Admin list view operations over the seeded volume.
+
+    Expected: Every iteration reaches the rendered list/edit view; median
+    and p90 durations are stored in the admin trend file.
+    """
+    steps = _build_list_action(slug, action, LIST_SCENARIOS[slug], admin_dataset[slug])
+    samples = _measure(
+        admin_perf_page,
+        base_url,
+        perf_iterations,
+        timed=steps["timed"],
+        prepare=steps["prepare"],
+    )
+
+    summary = _store(f"{slug}-{action}", samples, admin_perf_results, record_property)
+    assert summary["duration"]["n"] == perf_iterations
+
+
+# =============================================================================
+# TESTS - CUSTOM COMPONENTS
+# =============================================================================
+
+def test_property_status_cells_render(
+    admin_dataset: Dict[str, int],
+    admin_perf_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    admin_perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: PropertyStatusCell on a 100-row properties page.
+
+    Expected: Every row renders its status badge.
+    """
+    rendered: List[int] = []
+
+    def _open_large_page(admin: AdminPage) -> None:
+        admin.goto_collection_page("properties", 1, limit=100)
+        admin.wait_for_list()
+        rows = admin.get_table_row_count()
+        badges = admin.page.locator("table tbody [data-slot='badge']").count()
+        rendered.append(badges)
+        assert badges == rows, f"{rows} linhas, mas {badges} badges de status"
+
+    samples = _measure(admin_perf_page, base_url, perf_iterations, timed=_open_large_page)
+
+    _store("properties-status-cells-100", samples, admin_perf_results, record_property)
+    assert all(count > 0 for count in rendered)
+
+
+def test_lead_status_select_opens(
+    admin_dataset: Dict[str, int],
+    admin_perf_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    admin_perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: LeadStatusSelect on the lead edit view.
+
+    Expected: The select opens with every status option.
+    """
+    def _open_lead(admin: AdminPage) -> None:
+        admin.goto_collection("leads")
+        admin.wait_for_list()
+        admin.click_row(0)
+        _wait_for_edit_view(admin)
+
+    def _open_select(admin: AdminPage) -> None:
+        admin.page.get_by_role("combobox").filter(
+            has=admin.page.locator("[data-slot='select-value']")
+        ).first.click()
+        options = admin.page.get_by_role("option")
+        options.nth(LEAD_STATUS_OPTION_COUNT - 1).wait_for(state="visible")
+        assert options.count() == LEAD_STATUS_OPTION_COUNT
+
+    samples = _measure(
+        admin_perf_page,
+        base_url,
+        perf_iterations,
+        timed=_open_select,
+        prepare=_open_lead,
+    )
+
+    _store("leads-status-select-open", samples, admin_perf_results, record_property)
+
+
+def test_agent_dashboard_render(
+    admin_dataset: Dict[str, int],
+    admin_perf_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    admin_perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: AgentDashboard view with stats over the seeded volume.
+
+    Expected: The dashboard leaves its loading state and shows the stats cards.
+    """
+    def _open_dashboard(admin: AdminPage) -> None:
+        admin.goto_admin()
+        # The loading skeleton shares the layout classes; wait for the real view.
+        admin.page.locator(".pu-admin-dashboard:not(.pu-admin-dashboard--loading)").wait_for(
+            state="visible", timeout=60000
+        )
+        assert not admin.page.locator(".pu-admin-panel--error").is_visible(), (
+            "Dashboard falhou ao carregar estatísticas"
+        )
+
+    samples = _measure(admin_perf_page, base_url, perf_iterations, timed=_open_dashboard)
+
+    _store("admin-dashboard", samples, admin_perf_results, record_property)
@@ -0,0 +1,149 @@
+"""
+Throttled-device performance tests for public pages.
+
+Loads the home page, the listing (plain and filtered) and property detail
+pages on an emulated mid-tier phone with throttled CPU and network, several
+times each, and records median/p90 metrics in the trend file.
+"""
+
+import json
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+import pytest
+from playwright.sync_api import Page
+
+from tests.e2e.helpers.vitals import COLLECTOR, VITALS_MODE_COLLECT, collect_web_vitals
+from tests.e2e.pages.properties_page import PropertiesPage
+from tests.perf.helpers import summarize
+
+
+# =============================================================================
+# MARKERS
+# =============================================================================
+
+pytestmark = [pytest.mark.perf, pytest.mark.slow]
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+NAVIGATION_SCENARIOS = {
+    "home": "/",
+    "listing": "/imoveis",
+    "detail-apartamento-asa-sul": "/imoveis/apartamento-asa-sul-sqn-308",
+    "detail-cobertura-noroeste": "/imoveis/cobertura-noroeste-sqnw-111",
+    "detail-casa-lago-sul": "/imoveis/casa-lago-sul-shis-qi-25",
+}
+
+# Filters are client-side state, so filtered listings are measured as
+# "load /imoveis, then apply the filter" on the same document. On the
+# emulated phone the selects live in the "Filtros" sheet (lg:hidden).
+def _open_filter_sheet(listing: PropertiesPage) -> None:
+    """Open the mobile filter sheet."""
+    listing.page.get_by_role("button", name="Filtros").click()
+    listing.page.get_by_role("dialog").wait_for(state="visible")
+
+
+def _filter_in_sheet(placeholder: str, option: str) -> Callable[[PropertiesPage], None]:
+    """Scenario action selecting `option` in the sheet select with `placeholder`."""
+    def _action(listing: PropertiesPage) -> None:
+        _open_filter_sheet(listing)
+        dialog = listing.page.get_by_role("dialog")
+        dialog.get_by_role("combobox").filter(has_text=placeholder).click()
+        listing.page.get_by_role("option", name=option, exact=True).click()
+        listing.wait_for_timeout(500)
+    return _action
+
+
+FILTER_SCENARIOS: Dict[str, Callable[[PropertiesPage], None]] = {
+    "listing-filter-apartamento": _filter_in_sheet("Todos os tipos", "Apartamento"),
+    "listing-filter-aluguel": _filter_in_sheet("Comprar ou Alugar", "Alugar"),
+    "listing-search-asa-sul": lambda listing: listing.search_by_neighborhood("Asa Sul"),
+}
+
+
+def _measure(
+    open_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    path: str,
+    iterations: int,
+    action: Optional[Callable[[PropertiesPage], None]] = None
+) -> List[Dict[str, Any]]:
+    """Run one scenario `iterations` times on cold throttled pages."""
+    samples = []
+
+    for _ in range(iterations):
+        with open_page() as page:
+            listing = PropertiesPage(page, base_url)
+            # Throttled numbers are not comparable to the E2E budgets.
+            listing.vitals_mode = VITALS_MODE_COLLECT
+            listing.goto(path, collect_vitals=True)
+
+            if action:
+                action(listing)
+
+            samples.append(collect_web_vitals(page, path).to_dict())
+
+    COLLECTOR.drain()
+    return samples
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+@pytest.mark.parametrize("scenario", list(NAVIGATION_SCENARIOS))
+def test_page_load_under_throttling(
+    scenario: str,
+    throttled_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: Public page load on a throttled mobile device.
+
+    Expected: Every iteration paints content (FCP measured); median/p90
+    are stored in the trend file.
+    """
+    samples = _measure(throttled_page, base_url, NAVIGATION_SCENARIOS[scenario], perf_iterations)
+    summary = summarize(samples)
+
+    perf_results[scenario] = summary
+    record_property("perf_summary", json.dumps(summary))
+
+    assert summary.get("fcp", {}).get("n") == perf_iterations, (
+        f"FCP not measured in every iteration of {scenario}"
+    )
+
+
+@pytest.mark.parametrize("scenario", list(FILTER_SCENARIOS))
+def test_filtered_listing_under_throttling(
+    scenario: str,
+    throttled_page: Callable[[], ContextManager[Page]],
+    base_url: str,
+    perf_iterations: int,
+    perf_results: Dict[str, Dict[str, Any]],
+    record_property: Callable[[str, Any], None]
+) -> None:
+    """
+    Test: Listing filter interaction on a throttled mobile device.
+
+    Expected: Every iteration completes the filter; the slowest interaction
+    and long tasks are stored in the trend file.
+    """
+    samples = _measure(
+        throttled_page,
+        base_url,
+        "/imoveis",
+        perf_iterations,
+        action=FILTER_SCENARIOS[scenario],
+    )
+    summary = summarize(samples)
+
+    perf_results[scenario] = summary
+    record_property("perf_summary", json.dumps(summary))
+
+    assert len(samples) == perf_iterations
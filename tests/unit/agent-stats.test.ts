@@ -0,0 +1,82 @@
+/**
+ * Testes unitários do cache de estatísticas por corretor (lib/agent-stats.ts).
+ *
+ * O banco é um dublê que conta as consultas e devolve linhas vazias: cobrem
+ * o compartilhamento da carga entre misses simultâneos e o limite de
+ * entradas do cache (`AGENT_STATS_MAX_ENTRIES`).
+ *
+ * Uso:
+ *   pnpm test:unit
+ */
+import assert from 'node:assert/strict'
+import { afterEach, test } from 'node:test'
+import type { Payload } from 'payload'
+
+import { getAgentStats, getAgentStatsCacheSize, invalidateAgentStats } from '../../lib/agent-stats'
+
+// Consultas agrupadas de uma carga filtrada por corretor (leads, imóveis, negócios)
+const QUERIES_PER_LOAD = 3
+
+/** Payload com um `drizzle.all` que conta as chamadas e responde depois de um tick. */
+const createPayload = () => {
+  const calls = { count: 0 }
+  const payload = {
+    db: {
+      drizzle: {
+        all: async () => {
+          calls.count += 1
+          await new Promise((resolve) => setImmediate(resolve))
+          return []
+        },
+      },
+    },
+  } as unknown as Payload
+  return { payload, calls }
+}
+
+const clearCache = () => {
+  invalidateAgentStats(Array.from({ length: 100 }, (_, index) => index + 1))
+}
+
+afterEach(() => {
+  delete process.env.AGENT_STATS_MAX_ENTRIES
+  clearCache()
+})
+
+test('misses simultâneos do mesmo corretor compartilham uma carga', async () => {
+  const { payload, calls } = createPayload()
+
+  const results = await Promise.all([1, 2, 3].map(() => getAgentStats(payload, 7)))
+
+  assert.equal(calls.count, QUERIES_PER_LOAD)
+  assert.deepEqual(
+    results.map((result) => result.cached),
+    [false, false, false],
+  )
+  assert.equal((await getAgentStats(payload, 7)).cached, true)
+  assert.equal(calls.count, QUERIES_PER_LOAD)
+})
+
+test('invalidar o corretor durante a carga faz a próxima consulta recarregar', async () => {
+  const { payload, calls } = createPayload()
+
+  const first = getAgentStats(payload, 7)
+  invalidateAgentStats([7])
+  const second = getAgentStats(payload, 7)
+  await Promise.all([first, second])
+
+  assert.equal(calls.count, 2 * QUERIES_PER_LOAD)
+})
+
+test('o cache não passa de AGENT_STATS_MAX_ENTRIES e descarta os mais antigos', async () => {
+  process.env.AGENT_STATS_MAX_ENTRIES = '3'
+  const { payload } = createPayload()
+
+  for (let agentId = 1; agentId <= 10; agentId++) {
+    await getAgentStats(payload, agentId)
+  }
+
+  assert.equal(getAgentStatsCacheSize(), 3)
+  assert.equal((await getAgentStats(payload, 10)).cached, true)
+  assert.equal((await getAgentStats(payload, 1)).cached, false)
+})
@@ -0,0 +1,6 @@
+/**
+ * Ponto de entrada dos testes unitários (`pnpm test:unit`): `payload run`
+ * executa um único script, então cada arquivo de teste é importado aqui.
+ */
+import './view-counter.test'
+import './agent-stats.test'
@@ -0,0 +1,151 @@
+/**
+ * Testes unitários do buffer de visualizações (lib/view-counter.ts).
+ *
+ * O writer é um dublê em memória, então nada toca o banco: cobrem contagem,
+ * deduplicação por visitante, flush (periódico é desligado com um intervalo
+ * longo) e a devolução ao buffer quando o flush falha, limitada a
+ * `maxPendingViews`.
+ *
+ * Uso:
+ *   pnpm test:unit
+ */
+import assert from 'node:assert/strict'
+import { test } from 'node:test'
+
+import { ViewCountBuffer, type ViewIncrements } from '../../lib/view-counter'
+
+const NO_PERIODIC_FLUSH_MS = 60 * 60 * 1000
+
+interface Deferred {
+  promise: Promise<void>
+  resolve: () => void
+  reject: (error: Error) => void
+}
+
+const deferred = (): Deferred => {
+  let resolve!: () => void
+  let reject!: (error: Error) => void
+  const promise = new Promise<void>((res, rej) => {
+    resolve = res
+    reject = rej
+  })
+  return { promise, resolve, reject }
+}
+
+/** Buffer com writer que grava uma cópia de cada lote recebido. */
+const createBuffer = (
+  options: { maxPendingViews?: number; dedupeWindowMinutes?: number } = {},
+  write?: (increments: ViewIncrements) => Promise<void>,
+) => {
+  const writes: Array<Record<number, number>> = []
+  const buffer = new ViewCountBuffer(
+    write ??
+      (async (increments) => {
+        writes.push(Object.fromEntries(increments))
+      }),
+    { flushIntervalMs: NO_PERIODIC_FLUSH_MS, onError: () => {}, ...options },
+  )
+  return { buffer, writes }
+}
+
+test('record conta a visualização e flush grava um incremento por imóvel', async () => {
+  const { buffer, writes } = createBuffer()
+
+  assert.equal(buffer.record(1, 'visitante-a'), true)
+  assert.equal(buffer.record(1, 'visitante-b'), true)
+  assert.equal(buffer.record(2, 'visitante-a'), true)
+  assert.equal(buffer.pendingSize, 3)
+
+  await buffer.flush()
+
+  assert.deepEqual(writes, [{ 1: 2, 2: 1 }])
+  assert.equal(buffer.pendingSize, 0)
+  buffer.dispose()
+})
+
+test('flush sem visualizações pendentes não chama o writer', async () => {
+  const { buffer, writes } = createBuffer()
+
+  await buffer.flush()
+
+  assert.deepEqual(writes, [])
+  buffer.dispose()
+})
+
+test('mesmo visitante no mesmo imóvel conta uma vez dentro da janela', (t) => {
+  t.mock.timers.enable({ apis: ['Date'], now: 0 })
+  const { buffer } = createBuffer({ dedupeWindowMinutes: 30 })
+
+  assert.equal(buffer.record(1, 'visitante-a'), true)
+  assert.equal(buffer.record(1, 'visitante-a'), false)
+  // Outro imóvel, ou sem chave de visitante, não é deduplicado
+  assert.equal(buffer.record(2, 'visitante-a'), true)
+  assert.equal(buffer.record(1, null), true)
+  assert.equal(buffer.record(1, null), true)
+
+  t.mock.timers.tick(30 * 60 * 1000 + 1)
+
+  assert.equal(buffer.record(1, 'visitante-a'), true)
+  assert.equal(buffer.pendingSize, 5)
+  buffer.dispose()
+})
+
+test('atingir maxPendingViews dispara o flush', async () => {
+  const { buffer, writes } = createBuffer({ maxPendingViews: 3 })
+
+  buffer.record(1, null)
+  buffer.record(1, null)
+  assert.deepEqual(writes, [])
+
+  buffer.record(2, null)
+  await buffer.flush()
+
+  assert.deepEqual(writes, [{ 1: 2, 2: 1 }])
+  buffer.dispose()
+})
+
+test('flush que falha devolve os incrementos e o próximo flush os grava', async () => {
+  const writes: Array<Record<number, number>> = []
+  let failures = 1
+  const { buffer } = createBuffer({}, async (increments) => {
+    if (failures-- > 0) throw new Error('database is locked')
+    writes.push(Object.fromEntries(increments))
+  })
+
+  buffer.record(1, null)
+  buffer.record(2, null)
+  await buffer.flush()
+
+  assert.deepEqual(writes, [])
+  assert.equal(buffer.pendingSize, 2)
+  assert.equal(buffer.droppedViews, 0)
+
+  buffer.record(1, null)
+  await buffer.flush()
+
+  assert.deepEqual(writes, [{ 1: 2, 2: 1 }])
+  assert.equal(buffer.pendingSize, 0)
+  buffer.dispose()
+})
+
+test('devolução após falha respeita maxPendingViews e conta o descarte', async () => {
+  const write = deferred()
+  const { buffer } = createBuffer({ maxPendingViews: 3 }, () => write.promise)
+
+  buffer.record(1, null)
+  buffer.record(1, null)
+  buffer.record(2, null) // dispara o flush (3 pendentes), que fica em andamento
+  const flushing = buffer.flush()
+
+  buffer.record(3, null)
+  buffer.record(3, null)
+  assert.equal(buffer.pendingSize, 2)
+
+  write.reject(new Error('database is locked'))
+  await flushing
+
+  // Só cabe 1 das 3 visualizações do lote que falhou
+  assert.equal(buffer.pendingSize, 3)
+  assert.equal(buffer.droppedViews, 2)
+  buffer.dispose()
+})